@@ -3,15 +3,41 @@ from tkinter import ttk, messagebox, filedialog
 import json
 import os
 import re
+import threading
 from datetime import datetime
-import pandas as pd
 from ttkthemes import ThemedTk
-from sistema import SistemaSeguros
+from repositorio import RepositorioDados
+import exportacao
+from journal import JournalAlteracoes
+from gravacao import GravadorColecoes
+from utils import converter_data
+from lista_virtual import ListaVirtual
+from consulta_apolices import ConsultaApolices
 from usuarios_window import UsuariosWindow
 from cliente import Cliente
 from seguro import SeguroAutomovel, SeguroResidencial, SeguroVida
 
 class SeguroApp:
+    # Campo usado como chave de cada arquivo nas entradas do journal
+    CHAVES_ARQUIVOS = {
+        "clientes.json": "cpf",
+        "apolices.json": "numero_apolice",
+        "sinistros.json": "numero_apolice" # Um sinistro por apólice
+    }
+    INTERVALO_CHECKPOINT = 200 # Alterações no journal antes de regravar os arquivos JSON completos
+    ATRASO_FILTRO_MS = 200 # Espera após a última tecla antes de refazer a consulta da lista
+    INTERVALO_EXPORTACAO_MS = 200 # Intervalo de atualização da barra de progresso da exportação
+    INTERVALO_MONTAGEM_MS = 100 # Intervalo de verificação da montagem dos índices da lista de apólices
+    OPCAO_TODOS = "Todos"
+    TITULOS_COLUNAS = {
+        "numero_apolice": "Nº Apólice",
+        "nome": "Cliente",
+        "cpf": "CPF Cliente",
+        "tipo_seguro": "Tipo de Seguro",
+        "status_apolice": "Status",
+        "valor_assegurado": "Valor (R$)"
+    }
+
     def __init__(self, root, usuario_manager):
         self.root = root
         self.root.title("Sistema de Seguros Hierapolis - Apólices")
@@ -21,14 +47,21 @@ class SeguroApp:
         # Gerenciador de usuários
         self.usuario_manager = usuario_manager
         
-        # Inicializa o armazenamento de dados
-        self.sistema = SistemaSeguros()
-        self.lista_de_clientes_pessoais = []
-        self.lista_de_apolices = []
-        self.lista_de_sinistros = []
-        self.proximo_numero_apolice = 1  # Inicializa o contador do número da apólice
+        # Inicializa o armazenamento de dados: um único repositório em memória, indexado por chave,
+        # compartilhado com a janela de relatórios
+        self.repositorio = RepositorioDados()
+        # Journal de alterações: cada salvamento grava apenas o registro alterado
+        self.journal = JournalAlteracoes("alteracoes_interface.journal")
+        # Arquivos JSON completos são gravados por uma thread própria, sem travar a interface
+        self.gravador = GravadorColecoes(self.repositorio.gravar)
+        self.consulta_apolices = None # Índices da lista de apólices, montados em atualizar_lista
+        self._montagem_consulta = None # Montagem em andamento dos índices (thread, resultado)
+        self._pendencias_consulta = [] # (colecao, chave) alterados durante a montagem
+        self._exportacao = None # Estado da exportação em andamento (thread, progresso, janela)
         self.carregar_dados()  # Carrega dados do arquivo
-        self.indice_edicao = None  # Para rastrear a apólice em edição
+        self.repositorio.agregados() # Totais dos relatórios: calculados agora e mantidos a cada alteração
+        self.repositorio.observar(self._ao_alterar_repositorio)
+        self.indice_edicao = None  # Número (chave no repositório) da apólice em edição
         
         # Configurar Estilo Global para a Aplicação
         style = ttk.Style(self.root)
@@ -126,6 +159,9 @@ class SeguroApp:
         
         # Configurar acesso baseado no tipo de usuário
         self.configurar_acesso()
+        
+        # Incorporar o journal aos arquivos JSON ao fechar a janela
+        self.root.protocol("WM_DELETE_WINDOW", self.sair)
     
     def criar_menu(self):
         """Cria a barra de menu"""
@@ -136,8 +172,10 @@ class SeguroApp:
         file_menu = tk.Menu(menubar, tearoff=0)
         menubar.add_cascade(label="Arquivo", menu=file_menu)
         file_menu.add_command(label="Exportar para Excel", command=self.exportar_excel)
+        file_menu.add_command(label="Exportar para análise (Parquet)", command=lambda: self.exportar_analitico("parquet"))
+        file_menu.add_command(label="Exportar para análise (CSV)", command=lambda: self.exportar_analitico("csv"))
         file_menu.add_separator()
-        file_menu.add_command(label="Sair", command=self.root.quit)
+        file_menu.add_command(label="Sair", command=self.sair)
         
         # Menu Usuário
         user_menu = tk.Menu(menubar, tearoff=0)
@@ -183,50 +221,53 @@ class SeguroApp:
         usuario_atual = self.usuario_manager.get_usuario_atual()
         self.root.title(f"Sistema de Cadastro de Apólices de Seguro - {tipo_usuario}: {usuario_atual}")
     
+    def sair(self):
+        """Grava o checkpoint dos dados e fecha a aplicação"""
+        self._interromper_exportacao()
+        self._encerrar_gravacao()
+        self.root.quit()
+
     def fazer_logout(self):
         """Realiza o logout e fecha a aplicação"""
+        self._interromper_exportacao()
+        self._encerrar_gravacao()
         self.usuario_manager.logout()
         self.root.quit()
     
+    # Listas exibidas pela interface: são as do repositório (alterações passam por self.repositorio.salvar)
+    @property
+    def lista_de_clientes_pessoais(self):
+        return self.repositorio.clientes
+
+    @property
+    def lista_de_apolices(self):
+        return self.repositorio.apolices
+
+    @property
+    def lista_de_sinistros(self):
+        return self.repositorio.sinistros
+
     def carregar_dados(self):
         """Carrega dados dos arquivos JSON separados (clientes, apolices, sinistros).
            Realiza uma migração única do antigo seguros.json, se necessário."""
         
-        clientes_file = "clientes.json"
         apolices_file = "apolices.json"
-        sinistros_file = "sinistros.json"
         seguros_antigo_file = "seguros.json"
         seguros_migrado_file = "seguros.json.migrated"
 
         # Tenta carregar os arquivos novos
         try:
-            if os.path.exists(clientes_file):
-                with open(clientes_file, "r", encoding="utf-8") as f:
-                    self.lista_de_clientes_pessoais = json.load(f)
-            else:
-                self.lista_de_clientes_pessoais = []
-
-            if os.path.exists(apolices_file):
-                with open(apolices_file, "r", encoding="utf-8") as f:
-                    self.lista_de_apolices = json.load(f)
-            else:
-                self.lista_de_apolices = []
-
-            if os.path.exists(sinistros_file):
-                with open(sinistros_file, "r", encoding="utf-8") as f:
-                    self.lista_de_sinistros = json.load(f)
-            else:
-                self.lista_de_sinistros = []
+            self.repositorio.carregar()
+            self._reaplicar_journal()
             
             print(f"Dados carregados: {len(self.lista_de_clientes_pessoais)} clientes, "
                   f"{len(self.lista_de_apolices)} apólices, {len(self.lista_de_sinistros)} sinistros.")
 
         except Exception as e:
             messagebox.showerror("Erro ao Carregar Dados", f"Erro ao ler arquivos JSON: {e}")
-            # Inicializa listas como vazias em caso de erro grave na leitura
-            self.lista_de_clientes_pessoais = []
-            self.lista_de_apolices = []
-            self.lista_de_sinistros = []
+            # Inicializa as coleções como vazias em caso de erro grave na leitura
+            for colecao in self.repositorio.ARQUIVOS:
+                self.repositorio.definir_colecao(colecao, [])
 
         # Lógica de Migração Única do antigo seguros.json
         # Condição para migração: apolices.json não existe ou está vazio E seguros.json antigo existe
@@ -288,15 +329,15 @@ class SeguroApp:
                             }
                             novos_sinistros.append(sinistro_data)
                 
-                # Atualizar listas da instância com os dados migrados
-                self.lista_de_clientes_pessoais = novos_clientes
-                self.lista_de_apolices = novas_apolices
-                self.lista_de_sinistros = novos_sinistros
+                # Atualizar o repositório com os dados migrados
+                self.repositorio.definir_colecao("clientes", novos_clientes)
+                self.repositorio.definir_colecao("apolices", novas_apolices)
+                self.repositorio.definir_colecao("sinistros", novos_sinistros)
 
-                # Salvar os dados migrados nos novos arquivos
-                self._salvar_lista_em_json(self.lista_de_clientes_pessoais, clientes_file)
-                self._salvar_lista_em_json(self.lista_de_apolices, apolices_file)
-                self._salvar_lista_em_json(self.lista_de_sinistros, sinistros_file)
+                # Salvar os dados migrados nos novos arquivos (e esperar a gravação: o arquivo antigo é renomeado a seguir)
+                for colecao in self.repositorio.ARQUIVOS:
+                    self._gravar_colecao(colecao)
+                self.gravador.descarregar()
 
                 # Renomear o arquivo antigo para evitar nova migração
                 try:
@@ -313,17 +354,6 @@ class SeguroApp:
                 messagebox.showerror("Erro na Migração", f"Ocorreu um erro durante a migração de dados de {seguros_antigo_file}: {e_migracao}")
                 # Em caso de falha na migração, tentamos carregar os novos arquivos como estão (ou vazios)
         
-        # Determinar o próximo número de apólice com base nas apólices carregadas/migradas
-        if self.lista_de_apolices:
-            max_numero = 0
-            for apolice in self.lista_de_apolices:
-                if "numero_apolice" in apolice and isinstance(apolice["numero_apolice"], int):
-                    if apolice["numero_apolice"] > max_numero:
-                        max_numero = apolice["numero_apolice"]
-            self.proximo_numero_apolice = max_numero + 1
-        else:
-            self.proximo_numero_apolice = 1
-        
         # A lógica antiga de popular/atualizar clientes.json a partir de self.dados_clientes é removida
         # pois a migração e o novo processo de salvamento cuidarão disso.
 
@@ -441,12 +471,7 @@ class SeguroApp:
             # self.limpar_campos_cliente() # Função auxiliar se quiser limpar apenas campos do cliente
             return
 
-        cliente_encontrado = None
-        # Procurar o cliente em self.lista_de_clientes_pessoais
-        for cliente_data in self.lista_de_clientes_pessoais:
-            if cliente_data.get("cpf") == cpf_numerico:
-                cliente_encontrado = cliente_data
-                break
+        cliente_encontrado = self.repositorio.buscar_cliente(cpf_numerico)
         
         # Limpar campos de dados pessoais antes de preencher ou se não encontrar
         # para garantir que não haja dados de um cliente anterior.
@@ -475,20 +500,57 @@ class SeguroApp:
         # Frame principal da aba de visualização
         # self.tab_visualizacao já tem padding e estilo TFrame do __init__
 
+        # Barra de filtros: as consultas são feitas nos índices de ConsultaApolices, não nos itens do Treeview
+        self.frame_filtros = ttk.Frame(self.tab_visualizacao, style="TFrame")
+        self.frame_filtros.pack(fill="x", pady=(0,5))
+
+        ttk.Label(self.frame_filtros, text="Tipo:").pack(side=tk.LEFT, padx=(0,3))
+        self.filtro_tipo = ttk.Combobox(self.frame_filtros, values=[self.OPCAO_TODOS], state="readonly", width=12)
+        self.filtro_tipo.set(self.OPCAO_TODOS)
+        self.filtro_tipo.pack(side=tk.LEFT, padx=(0,8))
+
+        ttk.Label(self.frame_filtros, text="Status:").pack(side=tk.LEFT, padx=(0,3))
+        self.filtro_status = ttk.Combobox(self.frame_filtros, values=[self.OPCAO_TODOS], state="readonly", width=10)
+        self.filtro_status.set(self.OPCAO_TODOS)
+        self.filtro_status.pack(side=tk.LEFT, padx=(0,8))
+
+        ttk.Label(self.frame_filtros, text="Valor de:").pack(side=tk.LEFT, padx=(0,3))
+        self.filtro_valor_minimo = ttk.Entry(self.frame_filtros, width=12)
+        self.filtro_valor_minimo.pack(side=tk.LEFT, padx=(0,3))
+        ttk.Label(self.frame_filtros, text="até:").pack(side=tk.LEFT, padx=(0,3))
+        self.filtro_valor_maximo = ttk.Entry(self.frame_filtros, width=12)
+        self.filtro_valor_maximo.pack(side=tk.LEFT, padx=(0,8))
+
+        ttk.Label(self.frame_filtros, text="Buscar:").pack(side=tk.LEFT, padx=(0,3))
+        self.filtro_texto = ttk.Entry(self.frame_filtros, width=25)
+        self.filtro_texto.pack(side=tk.LEFT, fill="x", expand=True, padx=(0,8))
+
+        self.btn_limpar_filtros = ttk.Button(self.frame_filtros, text="Limpar", command=self.limpar_filtros,
+                                             style="Secondary.TButton", width=8)
+        self.btn_limpar_filtros.pack(side=tk.LEFT)
+
+        for combobox in (self.filtro_tipo, self.filtro_status):
+            combobox.bind("<<ComboboxSelected>>", self._agendar_filtro)
+        for entry in (self.filtro_valor_minimo, self.filtro_valor_maximo, self.filtro_texto):
+            entry.bind("<KeyRelease>", self._agendar_filtro)
+        self._filtro_agendado = None
+        self._ordenacao = ("numero_apolice", False) # (coluna, decrescente)
+
         # Frame para a lista de apólices (Treeview e Scrollbar)
         self.frame_lista = ttk.LabelFrame(self.tab_visualizacao, text="Apólices Cadastradas", style="TLabelframe", padding=(10,10))
         self.frame_lista.pack(fill="both", expand=True, padx=0, pady=(0,10)) # Removido padx daqui, já está no frame da aba
 
-        # Treeview para exibir as apólices
+        # Treeview para exibir as apólices. Com muitas apólices a lista passa ao modo virtual:
+        # só as linhas visíveis existem no Treeview e seus valores são lidos sob demanda.
         colunas = ("numero_apolice", "nome", "cpf", "tipo_seguro", "status_apolice", "valor_assegurado")
-        self.tree = ttk.Treeview(self.frame_lista, columns=colunas, show="headings", style="Treeview", selectmode="browse")
+        self.lista_apolices = ListaVirtual(self.frame_lista, colunas, self._valores_linha_apolice,
+                                           style="Treeview", selectmode="browse")
+        self.tree = self.lista_apolices.tree
 
-        self.tree.heading("numero_apolice", text="Nº Apólice")
-        self.tree.heading("nome", text="Cliente")
-        self.tree.heading("cpf", text="CPF Cliente")
-        self.tree.heading("tipo_seguro", text="Tipo de Seguro")
-        self.tree.heading("status_apolice", text="Status")
-        self.tree.heading("valor_assegurado", text="Valor (R$)")
+        # Clique no cabeçalho ordena pela coluna (de novo na mesma coluna inverte a ordem)
+        for coluna in colunas:
+            self.tree.heading(coluna, command=lambda c=coluna: self._ordenar_por(c))
+        self._atualizar_cabecalhos()
 
         # Ajustar a largura das colunas e alinhamento
         self.tree.column("numero_apolice", width=80, anchor=tk.CENTER)
@@ -498,11 +560,8 @@ class SeguroApp:
         self.tree.column("status_apolice", width=80, anchor=tk.CENTER)
         self.tree.column("valor_assegurado", width=100, anchor=tk.E) # Alinhado à direita para valor
 
-        scrollbar = ttk.Scrollbar(self.frame_lista, orient=tk.VERTICAL, command=self.tree.yview)
-        self.tree.configure(yscroll=scrollbar.set)
-
         self.tree.pack(side=tk.LEFT, fill="both", expand=True)
-        scrollbar.pack(side=tk.RIGHT, fill="y")
+        self.lista_apolices.scrollbar.pack(side=tk.RIGHT, fill="y")
 
         # Frame para botões de ação, organizado horizontalmente
         self.frame_acoes = ttk.Frame(self.tab_visualizacao, style="TFrame")
@@ -637,11 +696,7 @@ class SeguroApp:
     
     def validar_data(self, data):
         """Valida o formato da data"""
-        try:
-            datetime.strptime(data, "%d/%m/%Y")
-            return True
-        except ValueError:
-            return False
+        return converter_data(data) is not None
     
     def validar_email(self, email):
         """Valida o formato do email"""
@@ -679,14 +734,9 @@ class SeguroApp:
         if not data_fim_str or not self.validar_data(data_fim_str):
             messagebox.showerror("Erro", "Data final da apólice inválida ou não preenchida. Use o formato dd/mm/yyyy.")
             return
-        try:
-            data_inicio_obj = datetime.strptime(data_inicio_str, "%d/%m/%Y")
-            data_fim_obj = datetime.strptime(data_fim_str, "%d/%m/%Y")
-            if data_fim_obj <= data_inicio_obj:
-                messagebox.showerror("Erro", "Data final da apólice deve ser posterior à data de início.")
-                return
-        except ValueError:
-            messagebox.showerror("Erro", "Formato de data inválido para comparação.")
+        # As duas datas já foram validadas acima; a conversão fica em cache
+        if converter_data(data_fim_str) <= converter_data(data_inicio_str):
+            messagebox.showerror("Erro", "Data final da apólice deve ser posterior à data de início.")
             return
         if not valor_assegurado_str:
             messagebox.showerror("Erro", "Valor assegurado não preenchido.")
@@ -733,43 +783,20 @@ class SeguroApp:
 
         # 3. Lógica de Edição vs. Nova Apólice
         if self.indice_edicao is not None: # Editando apólice existente
-            apolice_existente = self.lista_de_apolices[self.indice_edicao]
+            apolice_existente = self.repositorio.buscar_apolice(self.indice_edicao)
             numero_apolice_final = apolice_existente.get("numero_apolice")
             dados_nova_apolice["numero_apolice"] = numero_apolice_final
             
             # Campos de cancelamento são parte da apólice, podem ser atualizados na edição
             dados_nova_apolice["data_cancelamento"] = apolice_existente.get("data_cancelamento") 
             dados_nova_apolice["motivo_cancelamento"] = apolice_existente.get("motivo_cancelamento")
-
-            self.lista_de_apolices[self.indice_edicao] = dados_nova_apolice
-            
-            # Atualizar dados do cliente em lista_de_clientes_pessoais
-            cliente_atualizado = False
-            for i, cliente in enumerate(self.lista_de_clientes_pessoais):
-                if cliente["cpf"] == cpf_cliente:
-                    self.lista_de_clientes_pessoais[i] = dados_cliente_pessoais
-                    cliente_atualizado = True
-                    break
-            if not cliente_atualizado: # Deveria existir, mas por segurança
-                self.lista_de_clientes_pessoais.append(dados_cliente_pessoais)
             
             mensagem_sucesso = "Apólice atualizada com sucesso!"
         
         else: # Nova apólice
-            numero_apolice_final = self.proximo_numero_apolice
+            # Próximo número a partir das apólices do repositório (maior número inteiro + 1)
+            numero_apolice_final = self.repositorio.proximo_numero_apolice()
             dados_nova_apolice["numero_apolice"] = numero_apolice_final
-            self.proximo_numero_apolice += 1
-            self.lista_de_apolices.append(dados_nova_apolice)
-
-            # Adicionar ou atualizar cliente em lista_de_clientes_pessoais
-            cliente_existia = False
-            for i, cliente in enumerate(self.lista_de_clientes_pessoais):
-                if cliente["cpf"] == cpf_cliente:
-                    self.lista_de_clientes_pessoais[i] = dados_cliente_pessoais # Atualiza se já existe
-                    cliente_existia = True
-                    break
-            if not cliente_existia:
-                self.lista_de_clientes_pessoais.append(dados_cliente_pessoais)
             
             # Lógica de cadastro de usuário (mantida como antes)
             try:
@@ -789,12 +816,11 @@ class SeguroApp:
                 return
             mensagem_sucesso = "Apólice cadastrada com sucesso!"
 
-        # 4. Salvar listas atualizadas nos arquivos JSON
-        self._salvar_lista_em_json(self.lista_de_clientes_pessoais, "clientes.json")
-        self._salvar_lista_em_json(self.lista_de_apolices, "apolices.json")
-        # Sinistros são salvos separadamente pela função gerenciar_sinistro
-
-        self.atualizar_lista() # Esta função precisará ser refatorada depois
+        # 4. Incluir ou substituir o cliente e a apólice no repositório (busca por chave). Cada alteração
+        # é registrada no journal, sem reescrever os arquivos inteiros, e aplicada só às linhas afetadas
+        # da lista (ver _ao_alterar_repositorio). Sinistros são salvos separadamente por gerenciar_sinistro.
+        self.repositorio.salvar("clientes", dados_cliente_pessoais)
+        self.repositorio.salvar("apolices", dados_nova_apolice)
         messagebox.showinfo("Sucesso", mensagem_sucesso)
         self.limpar_campos() # Esta função também precisará ser refatorada
 
@@ -830,59 +856,101 @@ class SeguroApp:
             # Habilitar edição do CPF se saiu do modo de edição
             self.cpf_entry.config(state='normal')
     
-    def _salvar_lista_em_json(self, lista, arquivo):
-        """Salva uma lista em um arquivo JSON"""
+    def _gravar_colecao(self, colecao):
+        """Agenda a gravação de uma coleção do repositório no seu arquivo JSON (em segundo plano;
+           alterações seguidas da mesma coleção resultam em uma única gravação)"""
+        self.gravador.marcar(colecao)
+
+    def _colecoes_por_arquivo(self):
+        """Associa cada arquivo JSON (nome usado nas entradas do journal) à coleção do repositório"""
+        return {arquivo: colecao for colecao, arquivo in self.repositorio.ARQUIVOS.items()}
+
+    def _ao_alterar_repositorio(self, colecao, anterior, registro):
+        """Toda alteração no repositório é registrada no journal
+           e aplicada à lista de apólices"""
+        self._registrar_alteracao(self.repositorio.ARQUIVOS[colecao], registro)
+        if self._montagem_consulta is not None:
+            self._alterar_durante_montagem(colecao, anterior, registro)
+            return
+        if self.consulta_apolices is None:
+            return
+        if colecao == "apolices":
+            self._atualizar_apolice_na_lista(registro.get("numero_apolice"), anterior is None)
+        elif colecao == "clientes" and anterior is not None and anterior.get("nome") != registro.get("nome"):
+            self._atualizar_cliente_na_lista(registro.get("cpf"))
+
+    def _registrar_alteracao(self, arquivo, registro):
+        """Registra no journal a alteração de um único registro do arquivo.
+           A cada INTERVALO_CHECKPOINT alterações os arquivos JSON completos são regravados."""
+        chave = registro.get(self.CHAVES_ARQUIVOS[arquivo])
         try:
-            with open(arquivo, "w", encoding="utf-8") as f:
-                json.dump(lista, f, ensure_ascii=False, indent=4)
-            print(f"Dados salvos com sucesso em {arquivo}")
+            self.journal.registrar(arquivo, chave, registro)
         except Exception as e:
-            print(f"Erro ao salvar dados em {arquivo}: {e}")
-            messagebox.showerror("Erro ao Salvar Dados", f"Não foi possível salvar os dados em {arquivo}: {e}")
+            print(f"Erro ao registrar alteração no journal: {e}. Salvando {arquivo} completo.")
+            self._gravar_colecao(self._colecoes_por_arquivo()[arquivo])
+            return
+        if self.journal.total_registros >= self.INTERVALO_CHECKPOINT:
+            self.checkpoint()
+
+    def _reaplicar_journal(self):
+        """Reaplica sobre o repositório carregado as alterações registradas desde o último checkpoint"""
+        colecoes = self._colecoes_por_arquivo()
+        total = 0
+        for operacao, arquivo, chave, registro in self.journal.ler_alteracoes():
+            if arquivo not in colecoes or operacao != "upsert":
+                print(f"Aviso: entrada de journal desconhecida ({operacao}, {arquivo}) ignorada.")
+                continue
+            # Inclusão ou substituição pela chave, O(1); a alteração já está no journal
+            self.repositorio.salvar(colecoes[arquivo], registro, notificar=False)
+            total += 1
+        if total:
+            print(f"{total} alterações reaplicadas a partir do journal {self.journal.arquivo}.")
+
+    def checkpoint(self):
+        """Grava os arquivos JSON completos em segundo plano. As alterações do journal até aqui são seladas
+           e descartadas quando as gravações terminam; até lá continuam sendo recuperadas na carga."""
+        if self.journal.total_registros == 0 and not self.journal.tem_selado:
+            return
+        selagem = self.journal.selar()
+        self.gravador.marcar(*self.repositorio.ARQUIVOS, ao_concluir=lambda: self.journal.descartar_selado(selagem))
+
+    def _encerrar_gravacao(self):
+        """Incorpora o journal aos arquivos JSON e espera as gravações em segundo plano terminarem"""
+        self.checkpoint()
+        falhas = self.gravador.encerrar()
+        if falhas:
+            arquivos = ", ".join(self.repositorio.ARQUIVOS[colecao] for colecao in falhas)
+            messagebox.showerror("Erro ao Salvar Dados",
+                                 f"Não foi possível salvar os dados em {arquivos}: {next(iter(falhas.values()))}\n"
+                                 "As alterações continuam no journal e serão recuperadas na próxima execução.")
 
     def atualizar_lista(self):
         """Atualiza a lista de apólices na aba de visualização, buscando dados do cliente em lista_de_clientes_pessoais."""
         try:
-            for item in self.tree.get_children():
-                self.tree.delete(item)
-            
             print(f"Atualizando lista. Total de apólices: {len(self.lista_de_apolices)}, Total de clientes: {len(self.lista_de_clientes_pessoais)}")
             
-            # Criar um dicionário de clientes para busca rápida por CPF
-            clientes_dict = {cliente.get("cpf"): cliente for cliente in self.lista_de_clientes_pessoais}
-
-            for i, apolice in enumerate(self.lista_de_apolices):
-                numero_apolice = apolice.get("numero_apolice", "N/A")
-                cpf_cliente_da_apolice = apolice.get("cpf_cliente")
-                tipo_seguro = apolice.get("tipo_seguro", "N/A")
-                status_apolice = apolice.get("status_apolice", "N/A")
-
-                nome_cliente_display = "Cliente não encontrado"
-                cpf_cliente_display_formatado = cpf_cliente_da_apolice if cpf_cliente_da_apolice else "N/A"
-
-                if cpf_cliente_da_apolice and cpf_cliente_da_apolice in clientes_dict:
-                    cliente_obj = clientes_dict[cpf_cliente_da_apolice]
-                    nome_cliente_display = cliente_obj.get("nome", "N/A")
-                    # Formatar CPF do cliente para exibição
-                    cpf_original = cliente_obj.get("cpf", "")
-                    if cpf_original.isdigit() and len(cpf_original) == 11:
-                        cpf_cliente_display_formatado = f"{cpf_original[:3]}.{cpf_original[3:6]}.{cpf_original[6:9]}-{cpf_original[9:]}"
-                    else:
-                        cpf_cliente_display_formatado = cpf_original
-                elif cpf_cliente_da_apolice:
-                    print(f"Aviso: Cliente com CPF {cpf_cliente_da_apolice} não encontrado para a apólice {numero_apolice}.")
-                
-                valores = (
-                    numero_apolice,
-                    nome_cliente_display,
-                    cpf_cliente_display_formatado,
-                    tipo_seguro,
-                    status_apolice
-                )
-                # print(f"Inserindo na Treeview: {valores}") # Descomente para depuração detalhada
-                self.tree.insert("", tk.END, values=valores)
-            
-            self.tree.update()
+            # Índices de ordenação e filtro sobre os dicionários do repositório (as linhas são montadas
+            # sob demanda por _valores_linha_apolice, com busca por chave nos mesmos dicionários).
+            # Todos são montados numa thread, sobre cópias dos dicionários; até terminarem a lista mostra as
+            # apólices na ordem do arquivo e a barra de filtros e a ordenação pelos cabeçalhos ficam desabilitadas.
+            self.consulta_apolices = None
+            self._pendencias_consulta = []
+            self._habilitar_filtros(False)
+            self.lista_apolices.definir_chaves(self.repositorio.apolices_por_numero)
+            self.frame_lista.configure(text=f"Apólices Cadastradas ({len(self.lista_apolices)}) - preparando filtros...")
+            apolices, clientes = dict(self.repositorio.apolices_por_numero), dict(self.repositorio.clientes_por_cpf)
+            resultado = {}
+            def montar():
+                try:
+                    consulta = ConsultaApolices(apolices, clientes)
+                    consulta.montar_indices()
+                    resultado["consulta"] = consulta
+                except Exception as e:
+                    resultado["erro"] = e
+            montagem = (threading.Thread(target=montar, daemon=True), resultado)
+            self._montagem_consulta = montagem
+            montagem[0].start()
+            self.root.after(self.INTERVALO_MONTAGEM_MS, self._acompanhar_montagem_consulta, montagem)
             
         except Exception as e:
             print(f"Erro ao atualizar lista: {str(e)}")
@@ -890,20 +958,201 @@ class SeguroApp:
             print(traceback.format_exc()) # Imprime o traceback completo para depuração
             messagebox.showerror("Erro", f"Erro ao atualizar lista: {str(e)}")
     
+    def _acompanhar_montagem_consulta(self, montagem):
+        """Ao fim da montagem, vincula os índices ao repositório, reaplica as alterações feitas enquanto isso
+           e habilita a barra de filtros"""
+        if montagem is not self._montagem_consulta:
+            return # Substituída por uma montagem mais recente
+        thread, resultado = montagem
+        if thread.is_alive():
+            self.root.after(self.INTERVALO_MONTAGEM_MS, self._acompanhar_montagem_consulta, montagem)
+            return
+        self._montagem_consulta = None
+        if "erro" in resultado:
+            print(f"Erro ao montar os índices da lista: {resultado['erro']}")
+            messagebox.showerror("Erro", f"Erro ao atualizar lista: {resultado['erro']}")
+            return
+        consulta = resultado["consulta"]
+        consulta.vincular(self.repositorio.apolices_por_numero, self.repositorio.clientes_por_cpf)
+        for colecao, chave in self._pendencias_consulta:
+            if colecao == "apolices":
+                consulta.atualizar_apolice(chave)
+            else:
+                consulta.atualizar_cliente(chave)
+        self._pendencias_consulta = []
+        self.consulta_apolices = consulta
+        self._habilitar_filtros(True)
+        self._atualizar_opcoes_filtros()
+        self._aplicar_filtros()
+
+    def _alterar_durante_montagem(self, colecao, anterior, registro):
+        """Guarda a alteração para os índices em montagem e já a mostra na lista (ainda na ordem do arquivo)"""
+        if colecao == "apolices":
+            numero_apolice = registro.get("numero_apolice")
+            self._pendencias_consulta.append(("apolices", numero_apolice))
+            if anterior is None:
+                self.lista_apolices.inserir_linha(numero_apolice)
+            else:
+                self.lista_apolices.atualizar_linha(numero_apolice)
+        elif colecao == "clientes" and anterior is not None and anterior.get("nome") != registro.get("nome"):
+            self._pendencias_consulta.append(("clientes", registro.get("cpf")))
+            self.lista_apolices.atualizar()
+
+    def _habilitar_filtros(self, habilitados):
+        for combobox in (self.filtro_tipo, self.filtro_status):
+            combobox.configure(state="readonly" if habilitados else "disabled")
+        for widget in (self.filtro_valor_minimo, self.filtro_valor_maximo, self.filtro_texto, self.btn_limpar_filtros):
+            widget.configure(state="normal" if habilitados else "disabled")
+
+    def _atualizar_opcoes_filtros(self):
+        self.filtro_tipo.configure(values=[self.OPCAO_TODOS] + self.consulta_apolices.valores_distintos("tipo_seguro"))
+        self.filtro_status.configure(values=[self.OPCAO_TODOS] + self.consulta_apolices.valores_distintos("status_apolice"))
+
+    def _atualizar_cabecalhos(self):
+        """Mostra ▲/▼ no cabeçalho da coluna usada na ordenação"""
+        coluna_ordenada, decrescente = self._ordenacao
+        for coluna, titulo in self.TITULOS_COLUNAS.items():
+            if coluna == coluna_ordenada:
+                titulo = f"{titulo} {'▼' if decrescente else '▲'}"
+            self.tree.heading(coluna, text=titulo)
+
+    def _ordenar_por(self, coluna):
+        if self.consulta_apolices is None:
+            return # Índices ainda em montagem
+        coluna_ordenada, decrescente = self._ordenacao
+        self._ordenacao = (coluna, not decrescente if coluna == coluna_ordenada else False)
+        self._atualizar_cabecalhos()
+        self._aplicar_filtros()
+
+    def _agendar_filtro(self, event=None):
+        """Refaz a consulta só quando o usuário para de digitar por ATRASO_FILTRO_MS"""
+        if self._filtro_agendado is not None:
+            self.root.after_cancel(self._filtro_agendado)
+        self._filtro_agendado = self.root.after(self.ATRASO_FILTRO_MS, self._aplicar_filtros)
+
+    def _valor_filtro(self, entry):
+        """Valor digitado no filtro (aceita '1.234,56'); vazio ou inválido não filtra"""
+        texto = entry.get().replace("R$", "").strip()
+        if not texto:
+            return None
+        try:
+            return float(texto.replace(".", "").replace(",", "."))
+        except ValueError:
+            return None
+
+    def _parametros_filtros(self):
+        """Filtros atuais, nos parâmetros de ConsultaApolices.consultar() e atende()"""
+        tipo, status = self.filtro_tipo.get(), self.filtro_status.get()
+        return {
+            "tipo": tipo if tipo != self.OPCAO_TODOS else None,
+            "status": status if status != self.OPCAO_TODOS else None,
+            "valor_minimo": self._valor_filtro(self.filtro_valor_minimo),
+            "valor_maximo": self._valor_filtro(self.filtro_valor_maximo),
+            "texto": self.filtro_texto.get()
+        }
+
+    def _aplicar_filtros(self):
+        """Consulta os índices com os filtros e a ordenação atuais e exibe o resultado na lista"""
+        self._filtro_agendado = None
+        if self.consulta_apolices is None:
+            return # Índices ainda em montagem; a consulta é feita ao terminarem
+        coluna, decrescente = self._ordenacao
+        numeros = self.consulta_apolices.consultar(ordenar_por=coluna, decrescente=decrescente, **self._parametros_filtros())
+        self.lista_apolices.definir_chaves(numeros)
+        self._atualizar_titulo_lista()
+
+    def _atualizar_titulo_lista(self):
+        exibidas, total = len(self.lista_apolices), len(self.consulta_apolices)
+        if exibidas == total:
+            self.frame_lista.configure(text=f"Apólices Cadastradas ({total})")
+        else:
+            self.frame_lista.configure(text=f"Apólices Cadastradas ({exibidas} de {total})")
+
+    def limpar_filtros(self):
+        self.filtro_tipo.set(self.OPCAO_TODOS)
+        self.filtro_status.set(self.OPCAO_TODOS)
+        for entry in (self.filtro_valor_minimo, self.filtro_valor_maximo, self.filtro_texto):
+            entry.delete(0, tk.END)
+        self._aplicar_filtros()
+
+    def _valores_linha_apolice(self, numero_apolice):
+        """Valores exibidos na lista para a apólice (consultados pela lista apenas para as linhas visíveis)"""
+        apolice = self.repositorio.apolices_por_numero[numero_apolice]
+        cpf_cliente_da_apolice = apolice.get("cpf_cliente")
+        tipo_seguro = apolice.get("tipo_seguro", "N/A")
+        status_apolice = apolice.get("status_apolice", "N/A")
+
+        nome_cliente_display = "Cliente não encontrado"
+        cpf_cliente_display_formatado = cpf_cliente_da_apolice if cpf_cliente_da_apolice else "N/A"
+
+        cliente_obj = self.repositorio.buscar_cliente(cpf_cliente_da_apolice) if cpf_cliente_da_apolice else None
+        if cliente_obj:
+            nome_cliente_display = cliente_obj.get("nome", "N/A")
+            # Formatar CPF do cliente para exibição
+            cpf_original = cliente_obj.get("cpf", "")
+            if cpf_original.isdigit() and len(cpf_original) == 11:
+                cpf_cliente_display_formatado = f"{cpf_original[:3]}.{cpf_original[3:6]}.{cpf_original[6:9]}-{cpf_original[9:]}"
+            else:
+                cpf_cliente_display_formatado = cpf_original
+
+        valor = apolice.get("valor_assegurado")
+        if isinstance(valor, (int, float)):
+            valor = f"{valor:,.2f}".replace(",", "TEMP").replace(".", ",").replace("TEMP", ".")
+        
+        return (
+            numero_apolice,
+            nome_cliente_display,
+            cpf_cliente_display_formatado,
+            tipo_seguro,
+            status_apolice,
+            valor if valor is not None else ""
+        )
+
+    def _atualizar_apolice_na_lista(self, numero_apolice, nova):
+        """Aplica à lista somente a alteração de uma apólice, sem refazer a consulta: a apólice é testada
+           contra os filtros ativos e a linha dela é atualizada, movida, removida ou inserida na posição da
+           ordenação atual (localizada por busca binária nos índices)."""
+        consulta = self.consulta_apolices
+        coluna, decrescente = self._ordenacao
+        exibidas = self.lista_apolices.chaves
+        posicao = None
+        if not nova:
+            # Posição da linha pela chave de ordenação anterior, antes de reindexar a apólice
+            posicao = consulta.posicao_na_lista(exibidas, numero_apolice, coluna, decrescente)
+            if posicao >= len(exibidas) or exibidas[posicao] != numero_apolice:
+                posicao = None # Não estava sendo exibida
+        consulta.atualizar_apolice(numero_apolice)
+        self._atualizar_opcoes_filtros()
+        atende = consulta.atende(numero_apolice, **self._parametros_filtros())
+        if posicao is not None and atende and consulta.em_ordem(exibidas, posicao, coluna, decrescente):
+            self.lista_apolices.atualizar_linha(numero_apolice)
+        else:
+            if posicao is not None:
+                self.lista_apolices.remover_linha(numero_apolice, posicao)
+            if atende:
+                self.lista_apolices.inserir_linha(
+                    numero_apolice, consulta.posicao_na_lista(exibidas, numero_apolice, coluna, decrescente))
+        self._atualizar_titulo_lista()
+
+    def _atualizar_cliente_na_lista(self, cpf):
+        """O nome do cliente mudou: cada apólice dele é reposicionada na lista como em _atualizar_apolice_na_lista
+           (o nome entra na ordenação e no filtro textual)"""
+        for numero_apolice in self.consulta_apolices.apolices_do_cliente(cpf):
+            self._atualizar_apolice_na_lista(numero_apolice, False)
+
+    def _numero_apolice_selecionado(self):
+        """Número (como texto) da apólice selecionada na lista, ou None"""
+        numero = self.lista_apolices.chave_selecionada()
+        return str(numero) if numero is not None else None
+    
     def ver_detalhes(self):
         """Mostra os detalhes da apólice selecionada em uma nova janela estilizada."""
-        item_selecionado = self.tree.selection()
-        if not item_selecionado:
+        numero_apolice_selecionado = self._numero_apolice_selecionado()
+        if numero_apolice_selecionado is None:
             messagebox.showwarning("Atenção", "Selecione uma apólice para ver os detalhes.", parent=self.root)
             return
 
-        # Obter o número da apólice da coluna correta
-        numero_apolice_selecionado = self.tree.item(item_selecionado[0], "values")[0]
-        apolice_obj = None
-        for ap in self.lista_de_apolices:
-            if str(ap.get("numero_apolice")) == str(numero_apolice_selecionado):
-                apolice_obj = ap
-                break
+        apolice_obj = self.repositorio.buscar_apolice(numero_apolice_selecionado)
         
         if not apolice_obj:
             messagebox.showerror("Erro", "Apólice não encontrada.", parent=self.root)
@@ -961,7 +1210,7 @@ class SeguroApp:
 
         add_detail_section("DADOS DO CLIENTE")
         cliente_cpf = apolice_obj.get("cpf_cliente")
-        cliente_info = next((c for c in self.lista_de_clientes_pessoais if c.get("cpf") == cliente_cpf), None)
+        cliente_info = self.repositorio.buscar_cliente(cliente_cpf)
         if cliente_info:
             add_detail_field("Nome", cliente_info.get("nome"))
             add_detail_field("CPF", cliente_info.get("cpf"))
@@ -1000,7 +1249,7 @@ class SeguroApp:
             text_widget.insert(tk.END, "\n")
         
         # Buscar e exibir dados do sinistro, se houver
-        sinistro_relacionado = next((s for s in self.lista_de_sinistros if str(s.get("numero_apolice")) == str(apolice_obj.get("numero_apolice"))), None)
+        sinistro_relacionado = self.repositorio.buscar_sinistro(apolice_obj.get("numero_apolice"))
         if sinistro_relacionado:
             add_detail_section("DADOS DO SINISTRO")
             add_detail_field("Data do Sinistro", sinistro_relacionado.get("data_sinistro"))
@@ -1017,26 +1266,12 @@ class SeguroApp:
 
     def editar_apolice(self):
         """Carrega os dados de uma apólice selecionada para edição"""
-        selection = self.tree.selection()
-        if not selection:
+        numero_apolice_selecionado = self._numero_apolice_selecionado()
+        if numero_apolice_selecionado is None:
             messagebox.showinfo("Aviso", "Selecione uma apólice para editar.")
             return
 
-        item_id = selection[0]
-        item_values = self.tree.item(item_id, "values")
-        if not item_values: # Verificar se item_values não está vazio
-            messagebox.showerror("Erro", "Não foi possível obter os valores da apólice selecionada.")
-            return
-            
-        numero_apolice_selecionado = str(item_values[0]) # Nº Apólice é a primeira coluna
-
-        apolice_para_editar = None
-        indice_encontrado = -1
-        for i, apolice_data in enumerate(self.lista_de_apolices):
-            if str(apolice_data.get("numero_apolice")) == numero_apolice_selecionado:
-                apolice_para_editar = apolice_data
-                indice_encontrado = i
-                break
+        apolice_para_editar = self.repositorio.buscar_apolice(numero_apolice_selecionado)
         
         if apolice_para_editar is None:
             messagebox.showerror("Erro", "Apólice não encontrada nos dados.")
@@ -1050,12 +1285,12 @@ class SeguroApp:
         # Limpar campos ANTES de preencher, mas sem resetar o indice_edicao ainda
         self.limpar_campos(limpar_indice_edicao=False) 
         
-        self.indice_edicao = indice_encontrado # Definir o índice de edição AGORA
+        self.indice_edicao = apolice_para_editar.get("numero_apolice") # Definir a apólice em edição AGORA
         self.btn_salvar.config(text="Atualizar Apólice")
 
         # Preencher dados do cliente associado à apólice
         cpf_cliente_apolice = apolice_para_editar.get("cpf_cliente")
-        cliente_info = next((c for c in self.lista_de_clientes_pessoais if c.get("cpf") == cpf_cliente_apolice), None)
+        cliente_info = self.repositorio.buscar_cliente(cpf_cliente_apolice)
 
         if cliente_info:
             self.cpf_entry.insert(0, cliente_info.get("cpf", ""))
@@ -1130,10 +1365,13 @@ class SeguroApp:
         self.tab_control.select(self.tab_cadastro)
     
     def exportar_excel(self):
-        """Exporta os dados para um arquivo Excel"""
+        """Exporta apólices, clientes e sinistros para um arquivo Excel, em segundo plano"""
         if not self.lista_de_apolices:
             messagebox.showinfo("Aviso", "Não há dados para exportar")
             return
+        if self._exportacao is not None:
+            messagebox.showinfo("Aviso", "Já existe uma exportação em andamento")
+            return
         
         # Pedir ao usuário onde salvar o arquivo
         file_path = filedialog.asksaveasfilename(
@@ -1144,25 +1382,91 @@ class SeguroApp:
         
         if not file_path:
             return  # Usuário cancelou
-        
-        try:
-            # Criar DataFrame e exportar
-            df = pd.DataFrame(self.lista_de_apolices)
-            
-            # Lidar com os dados específicos que estão aninhados
-            # Primeiro vamos expandir os dados específicos em colunas separadas
-            specific_data = pd.json_normalize(df['dados_especificos'].to_dict())
-            
-            # Remover a coluna de dados específicos e juntar com os dados específicos expandidos
-            df = df.drop('dados_especificos', axis=1)
-            df = pd.concat([df, specific_data], axis=1)
-            
-            # Exportar para Excel
-            df.to_excel(file_path, index=False)
-            
-            messagebox.showinfo("Sucesso", f"Dados exportados com sucesso para {file_path}")
-        except Exception as e:
-            messagebox.showerror("Erro", f"Erro ao exportar dados: {str(e)}")
+
+        self._exportar_em_segundo_plano(file_path, lambda progresso, cancelar:
+                                        exportacao.exportar_excel(file_path, self.repositorio, progresso, cancelar))
+
+    def exportar_analitico(self, formato):
+        """Exporta apólices (com os dados específicos em colunas tipadas), clientes e sinistros para análise,
+           em Parquet ou CSV dividido em blocos, em segundo plano"""
+        if not self.lista_de_apolices:
+            messagebox.showinfo("Aviso", "Não há dados para exportar")
+            return
+        if self._exportacao is not None:
+            messagebox.showinfo("Aviso", "Já existe uma exportação em andamento")
+            return
+        diretorio = filedialog.askdirectory(title=f"Diretório para a exportação ({formato.upper()})", mustexist=True)
+        if not diretorio:
+            return  # Usuário cancelou
+        self._exportar_em_segundo_plano(diretorio, lambda progresso, cancelar: exportacao.exportar_analitico(
+            diretorio, exportacao.tabelas_repositorio(self.repositorio), formato, progresso, cancelar))
+
+    def _exportar_em_segundo_plano(self, destino, tarefa):
+        """Executa tarefa(progresso, cancelar) em uma thread, com janela de progresso e botão para cancelar.
+           A tarefa retorna True se concluída e False se cancelada."""
+        # Janela de progresso (sem grab_set: a interface continua utilizável durante a exportação)
+        janela = tk.Toplevel(self.root)
+        janela.title("Exportando dados")
+        janela.resizable(False, False)
+        janela.transient(self.root)
+        frame = ttk.Frame(janela, padding=15)
+        frame.pack(fill=tk.BOTH, expand=True)
+        rotulo = ttk.Label(frame, text="Preparando a exportação...")
+        rotulo.pack(anchor=tk.W, pady=(0, 5))
+        barra = ttk.Progressbar(frame, mode="determinate", length=300)
+        barra.pack(fill=tk.X, pady=(0, 10))
+        cancelar = threading.Event()
+        botao_cancelar = ttk.Button(frame, text="Cancelar", command=cancelar.set, style="Secondary.TButton")
+        botao_cancelar.pack(anchor=tk.E)
+        janela.protocol("WM_DELETE_WINDOW", cancelar.set)
+
+        # Estado compartilhado com a thread; só a thread do Tk mexe nos widgets (lendo-o periodicamente)
+        estado = {"caminho": destino, "gravadas": 0, "total": 0, "concluida": None, "erro": None,
+                  "cancelar": cancelar, "janela": janela, "rotulo": rotulo, "barra": barra}
+
+        def progresso(gravadas, total):
+            estado["gravadas"], estado["total"] = gravadas, total
+
+        def executar():
+            try:
+                estado["concluida"] = tarefa(progresso, cancelar)
+            except Exception as e:
+                estado["erro"] = e
+
+        estado["thread"] = threading.Thread(target=executar, daemon=True)
+        self._exportacao = estado
+        estado["thread"].start()
+        self.root.after(self.INTERVALO_EXPORTACAO_MS, self._acompanhar_exportacao)
+
+    def _acompanhar_exportacao(self):
+        """Atualiza a barra de progresso e, ao fim da thread, informa o resultado"""
+        estado = self._exportacao
+        if estado is None:
+            return
+        if estado["thread"].is_alive():
+            if estado["total"]:
+                estado["barra"].configure(maximum=estado["total"], value=estado["gravadas"])
+                texto = f"{estado['gravadas']:,} de {estado['total']:,} linhas".replace(",", ".")
+                if estado["cancelar"].is_set():
+                    texto = "Cancelando..."
+                estado["rotulo"].configure(text=texto)
+            self.root.after(self.INTERVALO_EXPORTACAO_MS, self._acompanhar_exportacao)
+            return
+        self._exportacao = None
+        estado["janela"].destroy()
+        if estado["erro"] is not None:
+            messagebox.showerror("Erro", f"Erro ao exportar dados: {str(estado['erro'])}")
+        elif estado["concluida"]:
+            messagebox.showinfo("Sucesso", f"Dados exportados com sucesso para {estado['caminho']}")
+        else:
+            messagebox.showinfo("Aviso", "Exportação cancelada")
+
+    def _interromper_exportacao(self):
+        """Cancela a exportação em andamento e espera a thread remover o arquivo incompleto"""
+        if self._exportacao is not None:
+            self._exportacao["cancelar"].set()
+            self._exportacao["thread"].join()
+            self._exportacao = None
 
     def abrir_gerenciamento_usuarios(self):
         """Abre a janela de gerenciamento de usuários"""
@@ -1171,25 +1475,12 @@ class SeguroApp:
     def cancelar_apolice(self):
         """Cancela a apólice selecionada"""
         try:
-            selection = self.tree.selection()
-            if not selection:
+            numero_apolice_selecionado = self._numero_apolice_selecionado()
+            if numero_apolice_selecionado is None:
                 messagebox.showinfo("Aviso", "Selecione uma apólice para cancelar")
                 return
             
-            item = self.tree.item(selection[0])
-            valores = item.get("values", [])
-            
-            if not valores: # Verificar se valores não está vazio
-                messagebox.showerror("Erro", "Erro ao obter dados da apólice selecionada.")
-                return
-            
-            numero_apolice_selecionado = str(valores[0])  # Nº Apólice é a primeira coluna
-            
-            apolice_encontrada = None
-            for i, apolice_data in enumerate(self.lista_de_apolices):
-                if str(apolice_data.get("numero_apolice")) == numero_apolice_selecionado:
-                    apolice_encontrada = apolice_data
-                    break
+            apolice_encontrada = self.repositorio.buscar_apolice(numero_apolice_selecionado)
             
             if not apolice_encontrada:
                 messagebox.showerror("Erro", "Apólice não encontrada")
@@ -1205,14 +1496,14 @@ class SeguroApp:
                                      "Tem certeza que deseja cancelar esta apólice? Esta ação não pode ser desfeita."):
                 return
             
-            # Atualizar status da apólice
-            apolice_encontrada["status_apolice"] = "Cancelada"
-            apolice_encontrada["data_cancelamento"] = datetime.now().strftime("%d/%m/%Y")
-            apolice_encontrada["motivo_cancelamento"] = "Cancelamento solicitado pelo usuário"
+            # Atualizar status da apólice (novo registro: o repositório recebe a versão anterior e a nova)
+            apolice_cancelada = dict(apolice_encontrada)
+            apolice_cancelada["status_apolice"] = "Cancelada"
+            apolice_cancelada["data_cancelamento"] = datetime.now().strftime("%d/%m/%Y")
+            apolice_cancelada["motivo_cancelamento"] = "Cancelamento solicitado pelo usuário"
             
-            # Salvar alterações
-            self.salvar_dados()
-            self.atualizar_lista()
+            # Salvar alterações (journal e linha da lista, ver _ao_alterar_repositorio)
+            self.repositorio.salvar("apolices", apolice_cancelada)
             messagebox.showinfo("Sucesso", "Apólice cancelada com sucesso!")
             
         except Exception as e:
@@ -1223,25 +1514,18 @@ class SeguroApp:
     
     def gerenciar_sinistro(self):
         """Abre janela estilizada para gerenciar sinistro da apólice selecionada."""
-        selection = self.tree.selection()
-        if not selection:
+        numero_apolice_selecionado = self._numero_apolice_selecionado()
+        if numero_apolice_selecionado is None:
             messagebox.showwarning("Atenção", "Selecione uma apólice para gerenciar o sinistro.", parent=self.root)
             return
-
-        item_values = self.tree.item(selection[0], "values")
-        if not item_values:
-            messagebox.showerror("Erro", "Não foi possível obter os valores da apólice selecionada.", parent=self.root)
-            return
-            
-        numero_apolice_selecionado = str(item_values[0])
         
-        apolice_obj = next((ap for ap in self.lista_de_apolices if str(ap.get("numero_apolice")) == numero_apolice_selecionado), None)
+        apolice_obj = self.repositorio.buscar_apolice(numero_apolice_selecionado)
         if not apolice_obj:
             messagebox.showerror("Erro", "Apólice não encontrada.", parent=self.root)
             return
 
-        cliente_obj = next((cli for cli in self.lista_de_clientes_pessoais if cli.get("cpf") == apolice_obj.get("cpf_cliente")), None)
-        sinistro_existente = next((sin for sin in self.lista_de_sinistros if str(sin.get("numero_apolice")) == numero_apolice_selecionado), None)
+        cliente_obj = self.repositorio.buscar_cliente(apolice_obj.get("cpf_cliente"))
+        sinistro_existente = self.repositorio.buscar_sinistro(numero_apolice_selecionado)
 
         sinistro_window = tk.Toplevel(self.root)
         sinistro_window.title(f"Gerenciar Sinistro - Apólice {numero_apolice_selecionado}")
@@ -1316,20 +1600,10 @@ class SeguroApp:
                 "status_sinistro": status_sinistro_combobox.get()
             }
             
-            sinistro_idx_para_atualizar = -1
-            for i, sin in enumerate(self.lista_de_sinistros):
-                if str(sin.get("numero_apolice")) == numero_apolice_selecionado:
-                    sinistro_idx_para_atualizar = i
-                    break
-            
-            if sinistro_idx_para_atualizar != -1:
-                self.lista_de_sinistros[sinistro_idx_para_atualizar] = dados_novo_sinistro
-            else:
-                self.lista_de_sinistros.append(dados_novo_sinistro)
-            
-            self._salvar_lista_em_json(self.lista_de_sinistros, "sinistros.json")
+            # Inclui ou substitui o sinistro da apólice (um por apólice) e registra no journal
+            self.repositorio.salvar("sinistros", dados_novo_sinistro)
             messagebox.showinfo("Sucesso", "Informações do sinistro salvas com sucesso!", parent=sinistro_window)
-            self.atualizar_lista() # Atualiza a Treeview principal
+            # A lista principal não exibe dados do sinistro: nenhuma linha precisa ser atualizada
             sinistro_window.destroy()
         
         ttk.Button(btn_frame, text="Salvar Sinistro", command=salvar_sinistro_local, style="Sinistro.TButton").pack(side=tk.LEFT, padx=(0,5))
@@ -1340,7 +1614,7 @@ class SeguroApp:
     def abrir_relatorios(self):
         """Abre a janela de relatórios"""
         from relatorios import RelatoriosWindow
-        RelatoriosWindow(self.root)
+        RelatoriosWindow(self.root, self.repositorio) # Mesmos dados em memória, sem reler os arquivos
 
     def _formatar_data_entry(self, event, entry_widget):
         """Formata a entrada de data para dd/mm/yyyy automaticamente."""
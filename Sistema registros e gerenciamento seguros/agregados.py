@@ -0,0 +1,104 @@
+"""Totais usados pela janela de relatórios, mantidos incrementalmente pelo RepositorioDados.
+
+A cada inclusão ou alteração de apólice ou sinistro, a contribuição do registro anterior é desfeita e a
+do novo é somada, em O(1); a janela de relatórios apenas lê os totais prontos. AgregadosRelatorios.calcular()
+refaz tudo a partir dos registros e serve de verificação (ver RepositorioDados.verificar_agregados)."""
+
+def _centavos(valor):
+    """Valor em centavos (int): somas e subtrações de inteiros são exatas, então o total mantido
+       incrementalmente é igual ao recalculado, qualquer que seja a ordem das alterações"""
+    try:
+        return round(float(valor) * 100)
+    except (TypeError, ValueError):
+        return 0
+
+
+class AgregadosRelatorios:
+    """Valor segurado e quantidade de apólices por CPF, apólices por tipo_seguro e sinistros por status_sinistro.
+       Chaves cuja contagem chega a zero são removidas."""
+
+    # Campos de cada coleção que entram nos totais (alterações só em outros campos não custam nada)
+    CAMPOS = {
+        "apolices": ("cpf_cliente", "valor_assegurado", "tipo_seguro"),
+        "sinistros": ("status_sinistro",)
+    }
+
+    def __init__(self):
+        self.centavos_por_cpf = {}
+        self.apolices_por_cpf = {}
+        self.apolices_por_tipo = {}
+        self.sinistros_por_status = {}
+        self.total_sinistros = 0
+
+    @classmethod
+    def calcular(cls, apolices, sinistros):
+        """Recálculo completo a partir das listas de registros"""
+        agregados = cls()
+        # Mesmo resultado de _somar_apolice/_somar_sinistro com sinal 1, em um único laço por coleção
+        # (inclusões nunca zeram contagens, então não há chaves a remover)
+        apolices_por_cpf, centavos_por_cpf, apolices_por_tipo = \
+            agregados.apolices_por_cpf, agregados.centavos_por_cpf, agregados.apolices_por_tipo
+        for apolice in apolices:
+            cpf = apolice.get("cpf_cliente")
+            apolices_por_cpf[cpf] = apolices_por_cpf.get(cpf, 0) + 1
+            centavos_por_cpf[cpf] = centavos_por_cpf.get(cpf, 0) + _centavos(apolice.get("valor_assegurado", 0))
+            tipo = apolice.get("tipo_seguro")
+            apolices_por_tipo[tipo] = apolices_por_tipo.get(tipo, 0) + 1
+        sinistros_por_status = agregados.sinistros_por_status
+        for sinistro in sinistros:
+            status = sinistro.get("status_sinistro")
+            sinistros_por_status[status] = sinistros_por_status.get(status, 0) + 1
+        agregados.total_sinistros = sum(sinistros_por_status.values())
+        return agregados
+
+    @staticmethod
+    def _contar(contagens, chave, sinal):
+        total = contagens.get(chave, 0) + sinal
+        if total:
+            contagens[chave] = total
+        else:
+            del contagens[chave]
+
+    def _somar_apolice(self, apolice, sinal):
+        cpf = apolice.get("cpf_cliente")
+        self._contar(self.apolices_por_cpf, cpf, sinal)
+        if cpf in self.apolices_por_cpf:
+            self.centavos_por_cpf[cpf] = self.centavos_por_cpf.get(cpf, 0) + sinal * _centavos(apolice.get("valor_assegurado", 0))
+        else:
+            del self.centavos_por_cpf[cpf] # Última apólice do CPF
+        self._contar(self.apolices_por_tipo, apolice.get("tipo_seguro"), sinal)
+
+    def _somar_sinistro(self, sinistro, sinal):
+        self._contar(self.sinistros_por_status, sinistro.get("status_sinistro"), sinal)
+        self.total_sinistros += sinal
+
+    def aplicar(self, colecao, anterior, registro):
+        """Atualiza os totais com a alteração de um registro (anterior é None na inclusão).
+           O registro novo deve ser outro dicionário, não o anterior alterado no lugar."""
+        campos = self.CAMPOS.get(colecao)
+        if campos is None:
+            return # Clientes: os nomes são buscados no repositório na hora de exibir
+        if anterior is not None and all(anterior.get(campo) == registro.get(campo) for campo in campos):
+            return
+        somar = self._somar_apolice if colecao == "apolices" else self._somar_sinistro
+        if anterior is not None:
+            somar(anterior, -1)
+        somar(registro, 1)
+
+    def valor_por_cpf(self):
+        """Valor total segurado (R$) de cada CPF"""
+        return {cpf: centavos / 100 for cpf, centavos in self.centavos_por_cpf.items()}
+
+    def diferencas(self, outro):
+        """Descrição das divergências entre dois conjuntos de totais (lista vazia se forem iguais)"""
+        diferencas = []
+        for nome in ("centavos_por_cpf", "apolices_por_cpf", "apolices_por_tipo", "sinistros_por_status"):
+            meus, outros = getattr(self, nome), getattr(outro, nome)
+            chaves = [chave for chave in meus.keys() | outros.keys() if meus.get(chave) != outros.get(chave)]
+            if chaves:
+                exemplo = chaves[0]
+                diferencas.append(f"{nome}: {len(chaves)} chave(s) divergente(s), ex.: {exemplo!r} "
+                                  f"({meus.get(exemplo)} x {outros.get(exemplo)})")
+        if self.total_sinistros != outro.total_sinistros:
+            diferencas.append(f"total_sinistros: {self.total_sinistros} x {outro.total_sinistros}")
+        return diferencas
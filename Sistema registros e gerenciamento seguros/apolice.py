@@ -1,50 +1,74 @@
 from datetime import datetime
+from utils import internar, converter_data
 # Não precisamos mais importar Cliente e Seguro aqui se vamos usar IDs
 # from cliente import Cliente 
 # from seguro import Seguro
 
 class Apolice:
-    def __init__(self, numero, cliente_cpf, seguro_id, status="Ativa"):
+    __slots__ = ("numero", "cliente_cpf", "seguro_id", "_data_emissao", "data_emissao_obj", "status", "sinistros_ids",
+                 "cliente", "seguro", "premio", "motivo_cancelamento", "data_cancelamento",
+                 "versao", "versao_gravada")
+
+    def __init__(self, numero, cliente_cpf, seguro_id, status="Ativa", data_emissao=None):
         self.numero = numero
         self.cliente_cpf = cliente_cpf # Armazena o CPF do cliente
         self.seguro_id = seguro_id     # Armazena o ID do seguro
-        self.data_emissao = datetime.now().strftime("%d/%m/%Y")
-        self.status = status  # Ativa, Cancelada, Vencida
+        # Data atual só para apólices novas; na carga a data gravada é informada (from_dict)
+        self.data_emissao = data_emissao if data_emissao is not None else datetime.now().strftime("%d/%m/%Y")
+        self.status = internar(status)  # Ativa, Cancelada, Vencida
         self.sinistros_ids = [] # Lista de IDs de sinistros associados
         # Os objetos Cliente e Seguro serão carregados/associados pelo SistemaSeguros quando necessário
         self.cliente = None # Objeto Cliente carregado
         self.seguro = None  # Objeto Seguro carregado
-        self.sinistros = [] # Lista de objetos Sinistro carregados
+        # Os objetos Sinistro não são guardados na apólice: SistemaSeguros.buscar_sinistros_da_apolice os obtém pelos IDs
         self.premio = 0.0 # O prêmio pode ser calculado quando o seguro é associado
+        self.motivo_cancelamento = None
+        self.data_cancelamento = None
+        # Controle de alterações: versao é incrementada pelos métodos que alteram a apólice e versao_gravada
+        # é a versão persistida pelo SistemaSeguros (-1: ainda não gravada). Diferentes = registro alterado.
+        self.versao = 0
+        self.versao_gravada = -1
+
+    @property
+    def data_emissao(self):
+        return self._data_emissao
+
+    @data_emissao.setter
+    def data_emissao(self, valor):
+        # O texto (formato gravado nos arquivos) e a data já convertida são mantidos juntos
+        self._data_emissao = internar(valor)
+        self.data_emissao_obj = converter_data(valor)
 
     def __str__(self):
         return f"Apólice {self.numero} - Cliente CPF: {self.cliente_cpf} - Seguro ID: {self.seguro_id} - Status: {self.status}"
 
     def calcular_premio(self):
         if self.seguro: # Calcula apenas se o objeto seguro estiver carregado
-            self.premio = self.seguro.calcular_premio()
+            self.atualizar_premio(self.seguro.calcular_premio())
             return self.premio
         return 0.0
 
+    def atualizar_premio(self, premio):
+        """Define o prêmio; a apólice só é marcada como alterada se o valor mudar"""
+        if premio != self.premio:
+            self.premio = premio
+            self.versao += 1
+
     def adicionar_sinistro_id(self, sinistro_id):
         if sinistro_id not in self.sinistros_ids:
             self.sinistros_ids.append(sinistro_id)
+            self.versao += 1
     
-    # O método registrar_sinistro(sinistro_obj) pode ser removido ou adaptado
-    # se o SistemaSeguros vai gerenciar a adição de sinistros à lista global
-    # e apenas vincular por ID aqui.
-    # Por ora, vamos manter a lógica de adicionar o objeto sinistro se ele for passado,
-    # mas o fluxo principal em SistemaSeguros usará adicionar_sinistro_id.
+    # O fluxo principal em SistemaSeguros usa adicionar_sinistro_id; aqui só o ID do objeto é vinculado
     def registrar_sinistro(self, sinistro_obj):
-        if sinistro_obj and sinistro_obj.id not in self.sinistros_ids:
-            self.sinistros_ids.append(sinistro_obj.id)
-        if sinistro_obj and sinistro_obj not in self.sinistros:
-             self.sinistros.append(sinistro_obj) # Mantém a lista de objetos carregados também
+        if sinistro_obj:
+            self.adicionar_sinistro_id(sinistro_obj.id)
 
     def cancelar_apolice(self, motivo):
         self.status = "Cancelada"
         self.motivo_cancelamento = motivo
         self.data_cancelamento = datetime.now().strftime("%d/%m/%Y")
+        self.versao += 1
         print(f"Apólice {self.numero} cancelada.")
 
     def to_dict(self):
@@ -57,27 +81,26 @@ class Apolice:
             "status": self.status,
             "premio": self.premio,
             "sinistros_ids": self.sinistros_ids, # Salva a lista de IDs de sinistros
-            "motivo_cancelamento": getattr(self, 'motivo_cancelamento', None),
-            "data_cancelamento": getattr(self, 'data_cancelamento', None)
+            "motivo_cancelamento": self.motivo_cancelamento,
+            "data_cancelamento": self.data_cancelamento
         }
 
     @classmethod
     def from_dict(cls, data, cliente_obj, seguro_obj): # Recebe objetos cliente e seguro
-        apolice = cls(data["numero"], data["cliente_cpf"], data["seguro_id"], data["status"])
-        apolice.data_emissao = data["data_emissao"]
+        apolice = cls(data["numero"], data["cliente_cpf"], data["seguro_id"], data["status"], data["data_emissao"])
         apolice.premio = data.get("premio", 0.0)
         apolice.cliente = cliente_obj # Associa o objeto cliente carregado
         apolice.seguro = seguro_obj   # Associa o objeto seguro carregado
-        # Os sinistros_ids são carregados aqui, e os objetos Sinistro serão vinculados pelo SistemaSeguros
+        # Somente os IDs: os objetos Sinistro são obtidos pelo índice de sinistros do SistemaSeguros
         apolice.sinistros_ids = data.get("sinistros_ids", [])
-        apolice.motivo_cancelamento = data.get("motivo_cancelamento")
-        apolice.data_cancelamento = data.get("data_cancelamento")
-        # A lista apolice.sinistros (objetos) será preenchida pelo SistemaSeguros após carregar todos os sinistros
+        apolice.motivo_cancelamento = internar(data.get("motivo_cancelamento"))
+        apolice.data_cancelamento = internar(data.get("data_cancelamento"))
         return apolice
 
     def ativar(self):
         """Ativa a apólice"""
         self.status = "Ativa"
+        self.versao += 1
     
     def cancelar(self):
         """Cancela a apólice"""
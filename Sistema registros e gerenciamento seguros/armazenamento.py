@@ -0,0 +1,493 @@
+import json
+import os
+import sqlite3
+from concurrent.futures import ProcessPoolExecutor
+from leitura_json import iterar_lista_json
+
+# Coleções persistidas pelo SistemaSeguros e o campo que identifica cada registro
+COLECOES = ("clientes", "seguros", "sinistros", "apolices")
+CHAVES_COLECOES = {
+    "clientes": "cpf",
+    "seguros": "id",
+    "apolices": "numero",
+    "sinistros": "id"
+}
+
+class ArmazenamentoJSON:
+    """Persistência em arquivos JSON, um arquivo por coleção (formato original do sistema).
+       Não grava registros individuais: toda alteração reescreve o arquivo da coleção."""
+    suporta_gravacao_por_registro = False
+    suporta_consultas = False # Sem consultas indexadas: as buscas do SistemaSeguros usam os índices em memória
+    suporta_snapshot = True # Arquivos em um diretório: o SistemaSeguros pode gravar o snapshot ao lado deles
+    notifica_alteracoes = False # Sem observar(): os arquivos só mudam pelo próprio SistemaSeguros
+    limite_sinistros_por_apolice = None # Sem limite de sinistros por apólice
+    EXTENSAO = "json"
+    ARQUIVO_LOTE = "gravacao_lote.pendente" # Manifesto de um lote gravado e ainda não movido (ver salvar_lote)
+
+    def __init__(self, diretorio="."):
+        self.diretorio = diretorio
+        self._concluir_lote() # Um lote interrompido por queda é concluído antes de qualquer leitura
+
+    def caminho(self, colecao):
+        return os.path.join(self.diretorio, f"{colecao}.{self.EXTENSAO}")
+
+    def numero_nova_apolice(self, quantidade):
+        """Número da próxima apólice emitida pelo SistemaSeguros (quantidade = apólices existentes)"""
+        return f"AP-{quantidade + 1:04d}"
+
+    def _escrever(self, f, colecao, registros):
+        json.dump(registros, f, indent=4)
+
+    def _criar_vazio(self, caminho, colecao):
+        with open(caminho, "w", encoding="utf-8") as f:
+            self._escrever(f, colecao, [])
+
+    def carregar(self, colecao, criar_se_ausente=True):
+        """Retorna a lista de dicionários da coleção. Cria o arquivo vazio se ele não existir."""
+        caminho = self.caminho(colecao)
+        if not os.path.exists(caminho):
+            if criar_se_ausente:
+                self._criar_vazio(caminho, colecao)
+            return []
+        with open(caminho, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def iterar(self, colecao, criar_se_ausente=True):
+        """Percorre os dicionários da coleção sem manter o arquivo inteiro em memória (ver leitura_json.py).
+           Cria o arquivo vazio se ele não existir."""
+        caminho = self.caminho(colecao)
+        if not os.path.exists(caminho):
+            if criar_se_ausente:
+                self._criar_vazio(caminho, colecao)
+            return iter(())
+        return iterar_lista_json(caminho)
+
+    def salvar_colecao(self, colecao, registros):
+        """Reescreve o arquivo da coleção com a lista de dicionários informada. Retorna os bytes gravados."""
+        caminho = self.caminho(colecao)
+        with open(caminho, "w", encoding="utf-8") as f:
+            self._escrever(f, colecao, registros)
+        return os.path.getsize(caminho)
+
+    def salvar_lote(self, lote):
+        """Grava várias coleções ({colecao: lista de dicionários}) como uma única alteração: ou todos os
+           arquivos passam a ter o novo conteúdo, ou nenhum. Cada coleção é gravada (com fsync) em um arquivo
+           temporário; em seguida um manifesto com as coleções do lote é gravado e só então os temporários
+           substituem os arquivos. Se o processo cair durante as substituições, o manifesto faz o próximo
+           ArmazenamentoJSON concluí-las; sem manifesto, os temporários são descartados.
+           Retorna os bytes gravados por coleção ({colecao: tamanho do arquivo gravado})."""
+        temporarios = []
+        gravados = {}
+        try:
+            for colecao, registros in lote.items():
+                temporario = f"{self.caminho(colecao)}.lote"
+                temporarios.append(temporario)
+                with open(temporario, "w", encoding="utf-8") as f:
+                    self._escrever(f, colecao, registros)
+                    f.flush()
+                    os.fsync(f.fileno())
+                gravados[colecao] = os.path.getsize(temporario)
+            manifesto = os.path.join(self.diretorio, self.ARQUIVO_LOTE)
+            with open(f"{manifesto}.tmp", "w", encoding="utf-8") as f:
+                json.dump(list(lote), f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(f"{manifesto}.tmp", manifesto)
+        except BaseException:
+            for temporario in temporarios:
+                if os.path.exists(temporario):
+                    os.remove(temporario)
+            raise
+        self._concluir_lote()
+        return gravados
+
+    def _concluir_lote(self):
+        """Move para os arquivos definitivos os temporários de um lote cujo manifesto foi gravado
+           (pode ser repetido sem efeito). Sem manifesto, descarta temporários de um lote incompleto."""
+        manifesto = os.path.join(self.diretorio, self.ARQUIVO_LOTE)
+        if not os.path.exists(manifesto):
+            for colecao in COLECOES:
+                temporario = f"{self.caminho(colecao)}.lote"
+                if os.path.exists(temporario):
+                    os.remove(temporario)
+            return
+        with open(manifesto, "r", encoding="utf-8") as f:
+            colecoes = json.load(f)
+        for colecao in colecoes:
+            temporario = f"{self.caminho(colecao)}.lote"
+            if os.path.exists(temporario): # Ausente se já foi movido antes da queda
+                os.replace(temporario, self.caminho(colecao))
+        os.remove(manifesto)
+
+    def fechar(self):
+        pass
+
+
+BLOCO_LEITURA = 1 << 20 # Bytes de linhas decodificados de uma vez na leitura de JSON Lines
+
+def _ler_linhas(caminho, inicio, fim):
+    """Percorre as linhas de registros que começam entre os bytes inicio e fim do arquivo JSON Lines
+       (uma linha iniciada antes de inicio pertence ao intervalo anterior). Retorna tuplas
+       (número da linha no intervalo, registro, erro): registro é None e erro a descrição se a linha estiver corrompida.
+
+    As linhas são lidas em blocos de BLOCO_LEITURA bytes e cada bloco é decodificado por um único json.loads,
+    como a lista "[linha,linha,...]"; só um bloco que contenha alguma linha inválida é decodificado linha a linha."""
+    with open(caminho, "rb") as f:
+        f.seek(max(inicio - 1, 0))
+        if inicio > 0 and f.read(1) != b"\n":
+            f.readline() # Resto de uma linha do intervalo anterior
+        posicao = f.tell()
+        numero = 0
+        while posicao < fim:
+            bloco = f.read(min(BLOCO_LEITURA, fim - posicao))
+            if not bloco:
+                break
+            if not bloco.endswith(b"\n"):
+                bloco += f.readline() # Completa a última linha, iniciada dentro do intervalo
+            posicao += len(bloco)
+            linhas = bloco.split(b"\n")
+            if not linhas[-1]:
+                linhas.pop()
+            try:
+                registros = json.loads((b"[" + b",".join(linhas) + b"]").decode("utf-8"))
+            except ValueError: # JSON inválido, bytes que não são UTF-8 ou linha vazia
+                registros = None
+            if registros is not None and len(registros) == len(linhas) and all(type(r) is dict for r in registros):
+                for numero_linha, registro in enumerate(registros, numero + 1):
+                    yield numero_linha, registro, None
+                numero += len(linhas)
+                continue
+            for linha in linhas:
+                numero += 1
+                if not linha.strip():
+                    continue
+                try:
+                    # Decodificado explicitamente: json.loads(bytes) tentaria adivinhar a codificação (UTF-16...)
+                    registro = json.loads(linha.decode("utf-8"))
+                except ValueError as e:
+                    yield numero, None, str(e)
+                    continue
+                if type(registro) is dict:
+                    yield numero, registro, None
+                else:
+                    yield numero, None, "a linha não é um registro (objeto JSON)"
+
+def _ler_intervalo(caminho, inicio, fim):
+    """Executado nos processos: lê um intervalo do arquivo (ver _ler_linhas).
+       Retorna (registros, quantidade de linhas, [(número da linha no intervalo, erro)])."""
+    registros, corrompidas = [], []
+    numero = 0
+    for numero, registro, erro in _ler_linhas(caminho, inicio, fim):
+        if registro is None:
+            corrompidas.append((numero, erro))
+        else:
+            registros.append(registro)
+    return registros, numero, corrompidas
+
+
+class ArmazenamentoJSONL(ArmazenamentoJSON):
+    """Persistência em JSON Lines: um arquivo <colecao>.jsonl por coleção, com uma linha de cabeçalho
+       ({"formato", "versao", "colecao", "registros"}) seguida de um registro JSON por linha.
+
+    Como cada registro ocupa uma linha, o arquivo pode ser dividido em intervalos de bytes lidos em paralelo
+    (um ProcessPoolExecutor, a partir de LIMIAR_PARALELO bytes), e uma linha corrompida, inclusive a do
+    cabeçalho, é ignorada e informada (linhas_corrompidas) em vez de invalidar a coleção inteira. A gravação é a mesma do
+    ArmazenamentoJSON (salvar_colecao, e salvar_lote atômico)."""
+    EXTENSAO = "jsonl"
+    ARQUIVO_LOTE = "gravacao_lote_jsonl.pendente"
+    FORMATO = "sistema-seguros-jsonl"
+    VERSAO_FORMATO = 1
+    LIMIAR_PARALELO = 4 << 20 # Bytes de registros a partir dos quais a leitura é dividida entre processos
+    AVISOS_MAXIMOS = 10 # Linhas corrompidas informadas individualmente por coleção
+
+    def __init__(self, diretorio=".", processos=None):
+        super().__init__(diretorio)
+        self.processos = processos # Padrão: número de CPUs
+        self.linhas_corrompidas = {} # Coleção -> [(número da linha, erro)] da última leitura
+
+    def _escrever(self, f, colecao, registros):
+        cabecalho = {"formato": self.FORMATO, "versao": self.VERSAO_FORMATO, "colecao": colecao, "registros": len(registros)}
+        f.write(json.dumps(cabecalho) + "\n")
+        for registro in registros:
+            f.write(json.dumps(registro, ensure_ascii=False, separators=(",", ":")) + "\n")
+
+    def _ler_cabecalho(self, caminho):
+        """Retorna (cabeçalho, posição em bytes da primeira linha de registros, erro).
+           Um cabeçalho ilegível (ex.: linha truncada) não invalida a coleção, como qualquer linha corrompida:
+           o cabeçalho é None, erro descreve o problema e os registros são lidos a partir da linha seguinte.
+           Levanta ValueError se o arquivo for de outro formato ou de uma versão mais nova."""
+        with open(caminho, "rb") as f:
+            linha = f.readline()
+        try:
+            cabecalho = json.loads(linha.decode("utf-8"))
+        except ValueError as e:
+            return None, len(linha), f"cabeçalho ilegível: {e}"
+        if type(cabecalho) is not dict or "formato" not in cabecalho:
+            return None, len(linha), "cabeçalho ilegível: a linha não é o cabeçalho do formato"
+        if cabecalho["formato"] != self.FORMATO:
+            raise ValueError(f"{caminho} não tem o cabeçalho do formato {self.FORMATO}.")
+        if cabecalho.get("versao", 0) > self.VERSAO_FORMATO:
+            raise ValueError(f"{caminho} usa a versão {cabecalho['versao']} do formato; esta versão lê até a {self.VERSAO_FORMATO}.")
+        return cabecalho, len(linha), None
+
+    def _paralelo(self, caminho, inicio):
+        processos = self.processos or os.cpu_count() or 1
+        return processos > 1 and os.path.getsize(caminho) - inicio >= self.LIMIAR_PARALELO
+
+    def carregar(self, colecao, criar_se_ausente=True):
+        """Retorna a lista de dicionários da coleção, lida em paralelo se o arquivo for grande.
+           Cria o arquivo vazio se ele não existir."""
+        caminho = self.caminho(colecao)
+        if not os.path.exists(caminho):
+            if criar_se_ausente:
+                self._criar_vazio(caminho, colecao)
+            return []
+        cabecalho, inicio, erro = self._ler_cabecalho(caminho)
+        if not self._paralelo(caminho, inicio):
+            return list(self._iterar_linhas(colecao, caminho, cabecalho, inicio, erro))
+        processos = self.processos or os.cpu_count()
+        tamanho = os.path.getsize(caminho)
+        passo = -(-(tamanho - inicio) // processos)
+        limites = [(inicio + i * passo, min(inicio + (i + 1) * passo, tamanho)) for i in range(processos)]
+        with ProcessPoolExecutor(max_workers=processos) as executor:
+            resultados = executor.map(_ler_intervalo, [caminho] * len(limites), *zip(*limites))
+            # Os intervalos chegam na ordem do arquivo e são concatenados (a ordem dos registros é mantida)
+            registros = []
+            corrompidas = [] if erro is None else [(1, erro)]
+            linha_inicial = 1 # Linha do cabeçalho
+            for parte, linhas, erros in resultados:
+                registros.extend(parte)
+                corrompidas.extend((linha_inicial + numero, erro) for numero, erro in erros)
+                linha_inicial += linhas
+        self._informar(colecao, caminho, cabecalho, len(registros), corrompidas)
+        return registros
+
+    def iterar(self, colecao, criar_se_ausente=True):
+        """Percorre os dicionários da coleção linha a linha; arquivos grandes são lidos em paralelo (carregar)"""
+        caminho = self.caminho(colecao)
+        if not os.path.exists(caminho):
+            return iter(self.carregar(colecao, criar_se_ausente))
+        cabecalho, inicio, erro = self._ler_cabecalho(caminho)
+        if self._paralelo(caminho, inicio):
+            return iter(self.carregar(colecao, criar_se_ausente))
+        return self._iterar_linhas(colecao, caminho, cabecalho, inicio, erro)
+
+    def _iterar_linhas(self, colecao, caminho, cabecalho, inicio, erro_cabecalho=None):
+        corrompidas = [] if erro_cabecalho is None else [(1, erro_cabecalho)]
+        lidos = 0
+        for numero, registro, erro in _ler_linhas(caminho, inicio, os.path.getsize(caminho)):
+            if registro is None:
+                corrompidas.append((numero + 1, erro))
+            else:
+                lidos += 1
+                yield registro
+        self._informar(colecao, caminho, cabecalho, lidos, corrompidas)
+
+    def _informar(self, colecao, caminho, cabecalho, lidos, corrompidas):
+        """Registra e informa as linhas corrompidas e a diferença para a quantidade do cabeçalho
+           (sem cabeçalho legível, cabecalho é None e a quantidade não é conferida)"""
+        self.linhas_corrompidas[colecao] = corrompidas
+        for numero, erro in corrompidas[:self.AVISOS_MAXIMOS]:
+            print(f"Aviso: linha {numero} de {caminho} está corrompida e foi ignorada ({erro}).")
+        if len(corrompidas) > self.AVISOS_MAXIMOS:
+            print(f"Aviso: mais {len(corrompidas) - self.AVISOS_MAXIMOS} linhas corrompidas ignoradas em {caminho}.")
+        if cabecalho is None:
+            return
+        esperados = cabecalho.get("registros")
+        if esperados is not None and lidos + len(corrompidas) != esperados:
+            print(f"Aviso: o cabeçalho de {caminho} indica {esperados} registros, mas o arquivo tem {lidos + len(corrompidas)}.")
+
+
+class ArmazenamentoSQLite:
+    """Persistência em um banco SQLite (modo WAL).
+       Cada coleção é uma tabela com a chave primária, as colunas usadas em buscas (com índices secundários) e o
+       registro completo em JSON. Os buscar_* do SistemaSeguros consultam o banco por buscar() e buscar_por()."""
+    suporta_gravacao_por_registro = True
+    suporta_consultas = True
+    suporta_snapshot = False
+    notifica_alteracoes = False
+    limite_sinistros_por_apolice = None
+
+    # Colunas indexadas (além da chave primária) extraídas do registro de cada coleção
+    COLUNAS_INDEXADAS = {
+        "clientes": (),
+        "seguros": (),
+        "apolices": ("cliente_cpf", "seguro_id"),
+        "sinistros": ()
+    }
+
+    def __init__(self, caminho="seguros.db"):
+        self.caminho = caminho
+        self.conexao = sqlite3.connect(caminho)
+        self.conexao.execute("PRAGMA journal_mode=WAL")
+        self.conexao.execute("PRAGMA synchronous=NORMAL")
+        self._criar_tabelas()
+
+    def _criar_tabelas(self):
+        with self.conexao:
+            for colecao in COLECOES:
+                chave = CHAVES_COLECOES[colecao]
+                colunas = "".join(f", {coluna} TEXT" for coluna in self.COLUNAS_INDEXADAS[colecao])
+                self.conexao.execute(
+                    f"CREATE TABLE IF NOT EXISTS {colecao} ({chave} TEXT PRIMARY KEY{colunas}, dados TEXT NOT NULL)")
+                self._completar_colunas(colecao)
+                for coluna in self.COLUNAS_INDEXADAS[colecao]:
+                    self.conexao.execute(
+                        f"CREATE INDEX IF NOT EXISTS idx_{colecao}_{coluna} ON {colecao} ({coluna})")
+
+    def _completar_colunas(self, colecao):
+        """Bancos gravados sem as colunas indexadas (só chave e JSON) recebem as colunas, preenchidas a partir
+           do JSON das linhas em que ainda estão vazias"""
+        colunas = self.COLUNAS_INDEXADAS[colecao]
+        if not colunas:
+            return
+        existentes = {linha[1] for linha in self.conexao.execute(f"PRAGMA table_info({colecao})")}
+        for coluna in colunas:
+            if coluna not in existentes:
+                self.conexao.execute(f"ALTER TABLE {colecao} ADD COLUMN {coluna} TEXT")
+        vazias = " OR ".join(f"{coluna} IS NULL" for coluna in colunas)
+        linhas = self.conexao.execute(f"SELECT rowid, dados FROM {colecao} WHERE {vazias}").fetchall()
+        atribuicoes = ", ".join(f"{coluna} = ?" for coluna in colunas)
+        self.conexao.executemany(
+            f"UPDATE {colecao} SET {atribuicoes} WHERE rowid = ?",
+            [[json.loads(dados).get(coluna) for coluna in colunas] + [rowid] for rowid, dados in linhas])
+
+    def _colunas(self, colecao):
+        return (CHAVES_COLECOES[colecao],) + self.COLUNAS_INDEXADAS[colecao] + ("dados",)
+
+    def numero_nova_apolice(self, quantidade):
+        return f"AP-{quantidade + 1:04d}"
+
+    def _linha(self, colecao, registro):
+        valores = [registro.get(CHAVES_COLECOES[colecao])]
+        valores.extend(registro.get(coluna) for coluna in self.COLUNAS_INDEXADAS[colecao])
+        valores.append(json.dumps(registro, ensure_ascii=False, separators=(",", ":")))
+        return valores
+
+    def carregar(self, colecao, criar_se_ausente=True):
+        """Retorna a lista de dicionários da coleção, na ordem de inserção"""
+        cursor = self.conexao.execute(f"SELECT dados FROM {colecao} ORDER BY rowid")
+        return [json.loads(dados) for (dados,) in cursor]
+
+    def iterar(self, colecao, criar_se_ausente=True):
+        """Percorre os dicionários da coleção à medida que as linhas são lidas do banco"""
+        cursor = self.conexao.execute(f"SELECT dados FROM {colecao} ORDER BY rowid")
+        return (json.loads(dados) for (dados,) in cursor)
+
+    def salvar_registro(self, colecao, registro):
+        """Insere ou atualiza um único registro em uma transação própria.
+           Retorna o tamanho em bytes do registro gravado (o JSON da coluna dados)."""
+        colunas = self._colunas(colecao)
+        chave = CHAVES_COLECOES[colecao]
+        atualizacoes = ", ".join(f"{coluna} = excluded.{coluna}" for coluna in colunas[1:])
+        linha = self._linha(colecao, registro)
+        with self.conexao:
+            self.conexao.execute(
+                f"INSERT INTO {colecao} ({', '.join(colunas)}) VALUES ({', '.join('?' * len(colunas))}) "
+                f"ON CONFLICT({chave}) DO UPDATE SET {atualizacoes}",
+                linha)
+        return len(linha[-1].encode("utf-8"))
+
+    def salvar_colecao(self, colecao, registros):
+        """Substitui todo o conteúdo da tabela pela lista de dicionários informada.
+           Retorna o total em bytes dos registros gravados, como salvar_registro()."""
+        colunas = self._colunas(colecao)
+        total_bytes = 0
+        def linhas():
+            nonlocal total_bytes
+            for registro in registros:
+                linha = self._linha(colecao, registro)
+                total_bytes += len(linha[-1].encode("utf-8"))
+                yield linha
+        with self.conexao:
+            self.conexao.execute(f"DELETE FROM {colecao}")
+            self.conexao.executemany(
+                f"INSERT OR REPLACE INTO {colecao} ({', '.join(colunas)}) VALUES ({', '.join('?' * len(colunas))})",
+                linhas())
+        return total_bytes
+
+    def salvar_lote(self, lote):
+        """Insere ou atualiza os registros de várias coleções ({colecao: lista de dicionários}) em uma única
+           transação. Retorna os bytes gravados por coleção ({colecao: bytes}, como salvar_registro())."""
+        gravados = {}
+        with self.conexao:
+            for colecao, registros in lote.items():
+                colunas = self._colunas(colecao)
+                chave = CHAVES_COLECOES[colecao]
+                atualizacoes = ", ".join(f"{coluna} = excluded.{coluna}" for coluna in colunas[1:])
+                linhas = [self._linha(colecao, registro) for registro in registros]
+                gravados[colecao] = sum(len(linha[-1].encode("utf-8")) for linha in linhas)
+                self.conexao.executemany(
+                    f"INSERT INTO {colecao} ({', '.join(colunas)}) VALUES ({', '.join('?' * len(colunas))}) "
+                    f"ON CONFLICT({chave}) DO UPDATE SET {atualizacoes}",
+                    linhas)
+        return gravados
+
+    def buscar(self, colecao, chave):
+        """Busca um registro pela chave primária (consulta indexada); None se não existir"""
+        linha = self.conexao.execute(
+            f"SELECT dados FROM {colecao} WHERE {CHAVES_COLECOES[colecao]} = ?", (chave,)).fetchone()
+        return json.loads(linha[0]) if linha else None
+
+    def buscar_por(self, colecao, coluna, valor):
+        """Busca os registros cuja coluna indexada tem o valor informado, na ordem de inserção"""
+        if coluna not in self.COLUNAS_INDEXADAS[colecao]:
+            raise ValueError(f"Coluna {coluna} não é indexada na coleção {colecao}")
+        cursor = self.conexao.execute(
+            f"SELECT dados FROM {colecao} WHERE {coluna} = ? ORDER BY rowid", (valor,))
+        return [json.loads(dados) for (dados,) in cursor]
+
+    def fechar(self):
+        self.conexao.close()
+
+
+def criar_armazenamento(tipo="json", caminho=None):
+    """Cria o armazenamento pelo nome ("json", "jsonl" ou "sqlite"), para alternar entre eles em testes e benchmarks"""
+    if tipo == "json":
+        return ArmazenamentoJSON(caminho or ".")
+    elif tipo == "jsonl":
+        return ArmazenamentoJSONL(caminho or ".")
+    elif tipo == "sqlite":
+        return ArmazenamentoSQLite(caminho or "seguros.db")
+    raise ValueError(f"Tipo de armazenamento desconhecido: {tipo}")
+
+
+def importar_json_para_sqlite(diretorio_json=".", caminho_sqlite="seguros.db"):
+    """Importa de uma só vez os arquivos JSON do SistemaSeguros para um banco SQLite.
+       Retorna a quantidade de registros importados por coleção."""
+    origem = ArmazenamentoJSON(diretorio_json)
+    destino = ArmazenamentoSQLite(caminho_sqlite)
+    totais = {}
+    try:
+        for colecao in COLECOES:
+            registros = origem.carregar(colecao, criar_se_ausente=False)
+            destino.salvar_colecao(colecao, registros)
+            totais[colecao] = len(registros)
+    finally:
+        destino.fechar()
+    return totais
+
+
+def converter_json_para_jsonl(diretorio_json=".", diretorio_jsonl="."):
+    """Converte os arquivos JSON do SistemaSeguros para JSON Lines (ArmazenamentoJSONL), gravando as
+       coleções de uma só vez (salvar_lote). Retorna a quantidade de registros convertidos por coleção."""
+    origem = ArmazenamentoJSON(diretorio_json)
+    os.makedirs(diretorio_jsonl, exist_ok=True)
+    lote = {colecao: origem.carregar(colecao, criar_se_ausente=False) for colecao in COLECOES}
+    ArmazenamentoJSONL(diretorio_jsonl).salvar_lote(lote)
+    return {colecao: len(registros) for colecao, registros in lote.items()}
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Importa os arquivos JSON do sistema para um banco SQLite (ou converte para JSON Lines).")
+    parser.add_argument("--dados", default=".", help="Diretório com clientes.json, seguros.json, apolices.json e sinistros.json")
+    parser.add_argument("--banco", default="seguros.db", help="Caminho do banco SQLite de destino")
+    parser.add_argument("--jsonl", default=None, help="Converte para JSON Lines neste diretório, em vez de importar para SQLite")
+    args = parser.parse_args()
+    if args.jsonl:
+        for colecao, total in converter_json_para_jsonl(args.dados, args.jsonl).items():
+            print(f"{colecao}: {total} registros convertidos")
+    else:
+        for colecao, total in importar_json_para_sqlite(args.dados, args.banco).items():
+            print(f"{colecao}: {total} registros importados")
@@ -29,8 +29,7 @@ class UsuarioManager:
         with open(self.arquivo_usuarios, "w", encoding="utf-8") as file:
             json.dump(self.usuarios, file, ensure_ascii=False, indent=4)
     
-    def cadastrar_usuario(self, usuario, senha, tipo):
-        """Cadastra um novo usuário"""
+    def _validar_novo_usuario(self, usuario, senha, tipo):
         if not usuario or not senha:
             raise ValueError("Usuário e senha são obrigatórios")
         
@@ -39,10 +38,27 @@ class UsuarioManager:
         
         if tipo not in ["administrador", "usuario"]:
             raise ValueError("Tipo de usuário inválido")
-        
+    
+    def cadastrar_usuario(self, usuario, senha, tipo):
+        """Cadastra um novo usuário"""
+        self._validar_novo_usuario(usuario, senha, tipo)
         self.usuarios[usuario] = (senha, tipo)
         self.salvar_usuarios()
     
+    def cadastrar_usuarios_em_lote(self, usuarios):
+        """Cadastra vários usuários (tuplas usuario, senha, tipo) gravando o arquivo uma única vez.
+           Retorna a lista de (usuario, motivo) dos que não puderam ser cadastrados."""
+        recusados = []
+        for usuario, senha, tipo in usuarios:
+            try:
+                self._validar_novo_usuario(usuario, senha, tipo)
+            except ValueError as e:
+                recusados.append((usuario, str(e)))
+                continue
+            self.usuarios[usuario] = (senha, tipo)
+        self.salvar_usuarios()
+        return recusados
+    
     def remover_usuario(self, usuario):
         """Remove um usuário"""
         if usuario == "admin":
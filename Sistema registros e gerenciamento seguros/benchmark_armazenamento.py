@@ -0,0 +1,63 @@
+"""Compara os armazenamentos JSON, JSON Lines e SQLite do SistemaSeguros lado a lado.
+
+Uso: python benchmark_armazenamento.py [quantidade_de_clientes]
+Os dados são gerados em diretórios temporários; os arquivos do sistema não são tocados."""
+import os
+import random
+import sys
+import tempfile
+import time
+from armazenamento import criar_armazenamento
+from sistema import SistemaSeguros
+
+def gerar_cpf_valido(rng):
+    """Gera um CPF aleatório com dígitos verificadores válidos"""
+    digitos = [rng.randint(0, 9) for _ in range(9)]
+    for tamanho in (9, 10):
+        soma = sum(d * (tamanho + 1 - i) for i, d in enumerate(digitos[:tamanho]))
+        resto = soma % 11
+        digitos.append(0 if resto < 2 else 11 - resto)
+    return "".join(map(str, digitos))
+
+def executar(tipo, quantidade):
+    diretorio_anterior = os.getcwd()
+    with tempfile.TemporaryDirectory() as diretorio:
+        os.chdir(diretorio)
+        try:
+            caminho = os.path.join(diretorio, "seguros.db") if tipo == "sqlite" else None
+            sistema = SistemaSeguros(armazenamento=criar_armazenamento(tipo, caminho))
+            rng = random.Random(42)
+            cpfs = set()
+            while len(cpfs) < quantidade:
+                cpfs.add(gerar_cpf_valido(rng))
+
+            inicio = time.perf_counter()
+            for i, cpf in enumerate(cpfs):
+                cliente = sistema.cadastrar_cliente(f"Cliente {i}", cpf, "01/01/1980", f"Rua {i}", "11999999999", f"c{i}@mail.com")
+                seguro = sistema.criar_seguro_vida(100000, "01/01/2024", "01/01/2030", ["Beneficiário"], ["Morte"])
+                sistema.emitir_apolice(cliente, seguro)
+            tempo_escrita = time.perf_counter() - inicio
+
+            inicio = time.perf_counter()
+            SistemaSeguros(armazenamento=criar_armazenamento(tipo, caminho))
+            tempo_carga = time.perf_counter() - inicio
+            sistema.armazenamento.fechar()
+        finally:
+            os.chdir(diretorio_anterior)
+    return tempo_escrita, tempo_carga
+
+if __name__ == "__main__":
+    quantidade = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    # Silenciar as mensagens de sucesso impressas a cada cadastro
+    stdout_original = sys.stdout
+    resultados = {}
+    for tipo in ("json", "jsonl", "sqlite"):
+        sys.stdout = open(os.devnull, "w")
+        try:
+            resultados[tipo] = executar(tipo, quantidade)
+        finally:
+            sys.stdout.close()
+            sys.stdout = stdout_original
+    print(f"{quantidade} clientes + seguros + apólices")
+    for tipo, (tempo_escrita, tempo_carga) in resultados.items():
+        print(f"{tipo:>6}: escrita {tempo_escrita:.3f}s ({tempo_escrita / (3 * quantidade) * 1000:.3f} ms/operação), carga {tempo_carga:.3f}s")
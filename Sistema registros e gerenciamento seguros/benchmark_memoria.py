@@ -0,0 +1,93 @@
+"""Mede os bytes por registro dos modelos carregados em memória, antes e depois dos __slots__.
+
+Uso: python benchmark_memoria.py [quantidade_de_registros]
+O "antes" reproduz as classes originais: atributos em __dict__ e textos sem internar
+(cada registro lido do JSON com sua própria cópia de "Ativa", "Automóvel", datas, etc.)."""
+import gc
+import json
+import random
+import sys
+import tracemalloc
+from apolice import Apolice
+from cliente import Cliente
+from seguro import SeguroAutomovel, SeguroResidencial, SeguroVida
+from sinistro import Sinistro
+from benchmark_armazenamento import gerar_cpf_valido
+
+_classes_sem_slots = {}
+
+def _nomes_slots(cls):
+    nomes = []
+    for classe in reversed(cls.__mro__):
+        nomes.extend(classe.__dict__.get("__slots__", ()))
+    return nomes
+
+def sem_slots(obj):
+    """Copia o objeto para uma classe equivalente sem __slots__, com textos não internados"""
+    cls = type(obj)
+    if cls not in _classes_sem_slots:
+        _classes_sem_slots[cls] = type(f"{cls.__name__}SemSlots", (), {})
+    antigo = _classes_sem_slots[cls]()
+    for nome in _nomes_slots(cls):
+        if nome.endswith("_obj"):
+            continue # Datas convertidas não existiam nas classes originais
+        valor = getattr(obj, nome)
+        nome = nome.lstrip("_")
+        if type(valor) is str:
+            valor = valor.encode("utf-8").decode("utf-8") # Nova cópia, como a produzida pelo json.loads
+        elif type(valor) is list:
+            valor = [v.encode("utf-8").decode("utf-8") if type(v) is str else v for v in valor]
+        setattr(antigo, nome, valor)
+    return antigo
+
+def gerar_registros(quantidade, rng):
+    """Gera o texto JSON de cada coleção, como gravado pelo SistemaSeguros"""
+    datas = [f"{dia:02d}/{mes:02d}/{ano}" for ano in range(2020, 2026) for mes in range(1, 13) for dia in range(1, 29)]
+    clientes, seguros, apolices, sinistros = [], [], [], []
+    for i in range(quantidade):
+        cpf = gerar_cpf_valido(rng)
+        clientes.append(Cliente(f"Cliente {i}", cpf, rng.choice(datas), f"Rua {i}", "11999999999", f"c{i}@mail.com").to_dict())
+        tipo = i % 3
+        if tipo == 0:
+            seguro = SeguroAutomovel(f"S{i}", 50000.0, rng.choice(datas), rng.choice(datas), "Fiat", "Uno", 2015, f"ABC{i:04d}",
+                                     rng.choice(["Novo", "Semi novo", "Usado"]), rng.choice(["Pessoal", "Profissional"]), 2)
+        elif tipo == 1:
+            seguro = SeguroResidencial(f"S{i}", 300000.0, rng.choice(datas), rng.choice(datas), f"Rua {i}", 120.0, 400000.0,
+                                       rng.choice(["Alvenaria", "Madeira", "Modular"]))
+        else:
+            seguro = SeguroVida(f"S{i}", 100000.0, rng.choice(datas), rng.choice(datas), ["Beneficiário"], ["Morte", "Invalidez"])
+        seguros.append(seguro.to_dict())
+        apolice = Apolice(f"A{i}", cpf, f"S{i}", rng.choice(["Ativa", "Cancelada", "Vencida"]))
+        sinistro = Sinistro(f"N{i}", rng.choice(datas), "Colisão traseira", 1500.0, rng.choice(["Em Análise", "Aprovado"]))
+        apolice.sinistros_ids.append(sinistro.id)
+        apolices.append(apolice.to_dict())
+        sinistros.append(sinistro.to_dict())
+    return {
+        "clientes": (json.dumps(clientes), Cliente.from_dict),
+        "seguros": (json.dumps(seguros), lambda d: {"Automóvel": SeguroAutomovel, "Residencial": SeguroResidencial,
+                                                   "Vida": SeguroVida}[d["tipo"]].from_dict(d)),
+        "apolices": (json.dumps(apolices), lambda d: Apolice.from_dict(d, None, None)),
+        "sinistros": (json.dumps(sinistros), Sinistro.from_dict)
+    }
+
+def medir(texto, construir):
+    """Bytes retidos pelos objetos construídos a partir do JSON (os dicionários lidos são descartados)"""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        base = tracemalloc.get_traced_memory()[0]
+        objetos = [construir(d) for d in json.loads(texto)]
+        gc.collect()
+        return tracemalloc.get_traced_memory()[0] - base, len(objetos)
+    finally:
+        tracemalloc.stop()
+
+if __name__ == "__main__":
+    quantidade = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    colecoes = gerar_registros(quantidade, random.Random(42))
+    print(f"{quantidade} registros por coleção (bytes por registro)")
+    print(f"{'coleção':>10} {'antes':>10} {'depois':>10} {'redução':>8}")
+    for colecao, (texto, construir) in colecoes.items():
+        antes, total = medir(texto, lambda d: sem_slots(construir(d)))
+        depois, _ = medir(texto, construir)
+        print(f"{colecao:>10} {antes / total:>10.1f} {depois / total:>10.1f} {1 - depois / antes:>8.1%}")
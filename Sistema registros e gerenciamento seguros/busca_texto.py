@@ -0,0 +1,265 @@
+from bisect import bisect_left, insort
+import unicodedata
+from collections import Counter, defaultdict
+
+# Marcas combinantes (os acentos separados pela decomposição NFKD) do plano básico, para str.translate
+_SEM_ACENTOS = {codigo: None for codigo in range(0x10000) if unicodedata.combining(chr(codigo))}
+
+def normalizar_texto(texto):
+    """Converte para minúsculas, remove acentos e colapsa espaços"""
+    sem_acentos = unicodedata.normalize("NFKD", str(texto))
+    if not sem_acentos.isascii():
+        sem_acentos = sem_acentos.translate(_SEM_ACENTOS)
+        if not sem_acentos.isascii():
+            # Ainda pode haver marcas combinantes fora do plano básico
+            sem_acentos = "".join(c for c in sem_acentos if not unicodedata.combining(c))
+    return " ".join(sem_acentos.casefold().split())
+
+def _trigramas_palavra(palavra):
+    palavra = f"  {palavra} "
+    return frozenset(palavra[i:i + 3] for i in range(len(palavra) - 2))
+
+def _trigramas_palavras(palavras):
+    trigramas = set()
+    for palavra in palavras:
+        trigramas |= _trigramas_palavra(palavra)
+    return trigramas
+
+def extrair_trigramas(texto):
+    """Trigramas de cada palavra, com dois espaços antes e um depois (como o pg_trgm),
+       para que prefixos curtos como 'jo' também casem."""
+    return _trigramas_palavras(normalizar_texto(texto).split())
+
+_VAZIO = frozenset()
+
+
+class IndiceTrigramas:
+    """Índice invertido de trigramas para busca textual aproximada, sem distinção de acentos.
+
+    A pontuação é a fração dos trigramas da consulta presentes no documento; empates favorecem
+    documentos com menos trigramas (maior similaridade de Jaccard).
+
+    A busca não conta os trigramas em comum de todos os documentos das listas invertidas: os níveis de
+    trigramas em comum são percorridos do maior para o menor e, dentro de cada nível, os grupos de documentos
+    de mesma quantidade de trigramas do menor para o maior, parando quando já há `limite` resultados. O nível
+    completo (todos os trigramas da consulta) é a interseção das listas; um documento com ao menos k dos T
+    trigramas está em alguma das T - k + 1 listas menores, então os níveis seguintes só contam documentos
+    dessas listas. Consultas pouco seletivas examinam no máximo LIMITE_CANDIDATOS documentos."""
+    LIMITE_CANDIDATOS = 100000
+
+    def __init__(self):
+        # Os documentos são numerados internamente: os conjuntos guardam int, mais baratos que os doc_id
+        self._postings = {}      # trigrama -> set(número do documento)
+        self._numeros = {}       # doc_id -> número do documento
+        self._doc_ids = []       # número -> doc_id (None se removido)
+        self._palavras = {}      # número -> frozenset(palavras normalizadas)
+        self._tamanhos = {}      # número -> quantidade de trigramas
+        self._por_tamanho = {}   # quantidade de trigramas -> set(números)
+
+    def __len__(self):
+        return len(self._numeros)
+
+    def _definir_tamanho(self, numero, tamanho):
+        anterior = self._tamanhos.pop(numero, None)
+        if anterior is not None:
+            grupo = self._por_tamanho[anterior]
+            grupo.discard(numero)
+            if not grupo:
+                del self._por_tamanho[anterior]
+        if tamanho:
+            self._tamanhos[numero] = tamanho
+            self._por_tamanho.setdefault(tamanho, set()).add(numero)
+
+    def atualizar(self, doc_id, texto):
+        """Inclui o documento ou substitui o texto já indexado para ele"""
+        palavras = frozenset(normalizar_texto(texto).split())
+        numero = self._numeros.get(doc_id)
+        antigas = self._palavras.get(numero, _VAZIO)
+        if palavras == antigas:
+            return
+        if numero is None:
+            numero = self._numeros[doc_id] = len(self._doc_ids)
+            self._doc_ids.append(doc_id)
+        novos, antigos = _trigramas_palavras(palavras), _trigramas_palavras(antigas)
+        for trigrama in antigos - novos:
+            documentos = self._postings[trigrama]
+            documentos.discard(numero)
+            if not documentos:
+                del self._postings[trigrama]
+        for trigrama in novos - antigos:
+            self._postings.setdefault(trigrama, set()).add(numero)
+        self._definir_tamanho(numero, len(novos))
+        if palavras:
+            self._palavras[numero] = palavras
+        else:
+            del self._palavras[numero]
+            del self._numeros[doc_id]
+            self._doc_ids[numero] = None
+
+    def remover(self, doc_id):
+        self.atualizar(doc_id, "")
+
+    def carregar(self, documentos):
+        """Indexa de uma vez os pares (doc_id, texto) num índice vazio (mais rápido que atualizar um a um;
+           um doc_id repetido mantém o primeiro texto). Cada palavra distinta é normalizada e decomposta em
+           trigramas uma só vez, e as listas invertidas são montadas por palavra, com uniões de conjuntos."""
+        normalizadas = {} # Palavra como está no texto -> palavras normalizadas
+        documentos_por_palavra = defaultdict(list)
+        for doc_id, texto in documentos:
+            if doc_id in self._numeros:
+                continue
+            palavras = set()
+            for palavra in str(texto).split():
+                normalizada = normalizadas.get(palavra)
+                if normalizada is None:
+                    normalizada = normalizadas[palavra] = tuple(normalizar_texto(palavra).split())
+                palavras.update(normalizada)
+            if not palavras:
+                continue
+            numero = self._numeros[doc_id] = len(self._doc_ids)
+            self._doc_ids.append(doc_id)
+            self._palavras[numero] = palavras = frozenset(palavras)
+            for palavra in palavras:
+                documentos_por_palavra[palavra].append(numero)
+        trigramas_por_palavra = {}
+        postings = defaultdict(set)
+        for palavra, numeros in documentos_por_palavra.items():
+            trigramas_por_palavra[palavra] = trigramas = _trigramas_palavra(palavra)
+            for trigrama in trigramas:
+                postings[trigrama].update(numeros)
+        self._postings = dict(postings)
+        for numero, palavras in self._palavras.items():
+            self._definir_tamanho(numero, len(_VAZIO.union(*[trigramas_por_palavra[p] for p in palavras])))
+
+    def buscar(self, consulta, limite=20, similaridade_minima=0.5, filtro=None):
+        """Retorna até `limite` pares (doc_id, pontuacao) ordenados pela pontuação.
+           `filtro`, se informado, recebe o doc_id e decide se ele pode entrar no resultado."""
+        trigramas_consulta = extrair_trigramas(consulta)
+        if not trigramas_consulta or limite <= 0:
+            return []
+        total = len(trigramas_consulta)
+        minimo_em_comum = max(1, int(similaridade_minima * total + 0.999999))
+        listas = sorted((self._postings.get(trigrama, _VAZIO) for trigrama in trigramas_consulta), key=len)
+        resultado = []
+        # Completos (todos os trigramas): interseção das listas; se até a menor é grande, feita grupo a grupo
+        completos = listas[0].intersection(*listas[1:]) if len(listas[0]) * 4 <= len(self._tamanhos) else None
+        examinados = set()
+        pendentes = {} # (em_comum, tamanho) -> documentos já contados, de níveis ainda não percorridos
+        for em_comum in range(total, minimo_em_comum - 1, -1):
+            if em_comum < total:
+                # Documentos com em_comum trigramas estão em alguma das total - em_comum + 1 listas menores;
+                # as anteriores já foram examinadas por inteiro nos níveis acima
+                novos_nivel = (listas[0] | listas[1] if em_comum == total - 1 else listas[total - em_comum]) - examinados
+                if len(examinados) + len(novos_nivel) > self.LIMITE_CANDIDATOS:
+                    break
+            for tamanho in sorted(self._por_tamanho):
+                grupo = self._por_tamanho[tamanho]
+                if em_comum == total:
+                    tomados = grupo & completos if completos is not None else grupo.intersection(*listas)
+                    examinados |= tomados
+                else:
+                    novos = grupo & novos_nivel
+                    if novos:
+                        examinados |= novos
+                        contagem = Counter()
+                        for lista in listas:
+                            contagem.update(lista & novos)
+                        for numero, quantidade in contagem.items():
+                            if quantidade >= minimo_em_comum:
+                                pendentes.setdefault((quantidade, tamanho), []).append(numero)
+                    tomados = pendentes.pop((em_comum, tamanho), ())
+                if self._tomar(tomados, em_comum / total, resultado, limite, filtro):
+                    return resultado
+        return resultado
+
+    def _tomar(self, numeros, pontuacao, resultado, limite, filtro):
+        """Acrescenta ao resultado os documentos (de mesma pontuação e tamanho) até completar o limite.
+           Retorna True se o resultado está completo."""
+        for numero in numeros:
+            doc_id = self._doc_ids[numero]
+            if filtro is None or filtro(doc_id):
+                resultado.append((doc_id, pontuacao))
+                if len(resultado) >= limite:
+                    return True
+        return False
+
+def faixa_de_prefixo(ordenados, prefixo):
+    """(início, fim) da faixa de uma lista ordenada de textos em que todos começam com o prefixo"""
+    inicio = bisect_left(ordenados, prefixo)
+    return inicio, bisect_left(ordenados, prefixo + "\U0010ffff", inicio)
+
+
+class IndicePrefixos:
+    """Índice invertido de palavras para filtros "conforme se digita": cada palavra da consulta precisa ser
+    prefixo de alguma palavra do documento ('jo sil' casa com 'João da Silva'), sem distinção de acentos.
+
+    As palavras também ficam numa lista ordenada, em que as palavras com um mesmo prefixo formam uma faixa
+    contígua, localizada por busca binária. A lista é montada na primeira consulta e, depois disso,
+    mantida por inserção binária."""
+
+    def __init__(self):
+        self._postings = {}    # palavra -> set(doc_id)
+        self._documentos = {}  # doc_id -> frozenset(palavras)
+        self._palavras = None  # palavras indexadas, em ordem
+
+    def __len__(self):
+        return len(self._documentos)
+
+    def atualizar(self, doc_id, texto):
+        """Inclui o documento ou substitui o texto já indexado para ele"""
+        novas = frozenset(normalizar_texto(texto).split())
+        antigas = self._documentos.get(doc_id, frozenset())
+        for palavra in antigas - novas:
+            documentos = self._postings[palavra]
+            documentos.discard(doc_id)
+            if not documentos:
+                del self._postings[palavra]
+                if self._palavras is not None:
+                    del self._palavras[bisect_left(self._palavras, palavra)]
+        for palavra in novas - antigas:
+            documentos = self._postings.get(palavra)
+            if documentos is None:
+                documentos = self._postings[palavra] = set()
+                if self._palavras is not None:
+                    insort(self._palavras, palavra)
+            documentos.add(doc_id)
+        if novas:
+            self._documentos[doc_id] = novas
+        else:
+            self._documentos.pop(doc_id, None)
+
+    def remover(self, doc_id):
+        self.atualizar(doc_id, "")
+
+    def carregar(self, documentos):
+        """Indexa de uma vez os pares (doc_id, texto) num índice vazio (mais rápido que atualizar um a um).
+           Textos repetidos são normalizados uma só vez e compartilham o mesmo conjunto de palavras."""
+        postings = defaultdict(set)
+        palavras_por_texto = {}
+        for doc_id, texto in documentos:
+            palavras = palavras_por_texto.get(texto)
+            if palavras is None:
+                palavras = palavras_por_texto[texto] = frozenset(normalizar_texto(texto).split())
+            if palavras:
+                self._documentos[doc_id] = palavras
+                for palavra in palavras:
+                    postings[palavra].add(doc_id)
+        self._postings = dict(postings)
+        self._palavras = None
+
+    def documentos(self, consulta):
+        """Conjunto dos doc_ids em que todas as palavras da consulta aparecem como prefixo"""
+        prefixos = set(normalizar_texto(consulta).split())
+        if not prefixos:
+            return set()
+        if self._palavras is None:
+            self._palavras = sorted(self._postings)
+        resultado = None
+        # Prefixos mais longos costumam ser mais seletivos e reduzem logo o resultado
+        for prefixo in sorted(prefixos, key=len, reverse=True):
+            inicio, fim = faixa_de_prefixo(self._palavras, prefixo)
+            encontrados = set().union(*(self._postings[palavra] for palavra in self._palavras[inicio:fim]))
+            resultado = encontrados if resultado is None else resultado & encontrados
+            if not resultado:
+                break
+        return resultado
@@ -1,7 +1,10 @@
-from datetime import datetime
+from datetime import date
 import re
+from utils import internar, converter_data
 
 class Cliente:
+    __slots__ = ("nome", "cpf", "_data_nasc", "data_nasc_obj", "endereco", "telefone", "email", "versao", "versao_gravada")
+
     def __init__(self, nome, cpf, data_nasc, endereco, telefone, email):
         self.nome = nome
         self.cpf = ''.join(filter(str.isdigit, str(cpf)))
@@ -9,6 +12,18 @@ class Cliente:
         self.endereco = endereco
         self.telefone = telefone
         self.email = email
+        self.versao = 0 # Controle de alterações (ver Apolice.versao)
+        self.versao_gravada = -1
+    
+    @property
+    def data_nasc(self):
+        return self._data_nasc
+    
+    @data_nasc.setter
+    def data_nasc(self, valor):
+        # O texto (formato gravado nos arquivos) e a data já convertida são mantidos juntos
+        self._data_nasc = internar(valor)
+        self.data_nasc_obj = converter_data(valor)
     
     def validar_cpf(self):
         """Valida o CPF utilizando o algoritmo oficial brasileiro."""
@@ -45,15 +60,13 @@ class Cliente:
     
     def validar_data_nascimento(self):
         """Valida o formato da data de nascimento e se não é uma data futura."""
-        try:
-            data_nasc_obj = datetime.strptime(self.data_nasc, "%d/%m/%Y")
-            if data_nasc_obj.date() >= datetime.now().date():
-                print("Erro: Data de nascimento não pode ser hoje ou uma data futura.")
-                return False
-            return True
-        except ValueError:
+        if self.data_nasc_obj is None:
             print("Erro: Formato de data de nascimento inválido. Use DD/MM/AAAA.")
             return False
+        if self.data_nasc_obj >= date.today():
+            print("Erro: Data de nascimento não pode ser hoje ou uma data futura.")
+            return False
+        return True
     
     def to_dict(self):
         """Converte os dados do cliente para um dicionário"""
@@ -0,0 +1,301 @@
+from bisect import bisect_left, bisect_right, insort
+from busca_texto import IndicePrefixos, faixa_de_prefixo, normalizar_texto
+
+COLUNAS_ORDENAVEIS = ("numero_apolice", "nome", "cpf", "tipo_seguro", "status_apolice", "valor_assegurado")
+
+# Limites para consultas por faixa de valor: apólices sem valor numérico ficam antes de qualquer valor
+# e _MAIOR_DESEMPATE fica depois do desempate de qualquer número
+_SEM_VALOR = float("-inf")
+_MAIOR_DESEMPATE = (2,)
+
+def _desempate(numero):
+    """Chave de ordenação do número da apólice (int nos dados da interface, texto em dados antigos)"""
+    return (0, numero) if isinstance(numero, int) else (1, str(numero))
+
+def _em_ordem_de_numero(numeros):
+    try:
+        return sorted(numeros) # Todos int (ou todos texto): comparação direta, sem montar chaves
+    except TypeError:
+        return sorted(numeros, key=_desempate)
+
+
+class ConsultaApolices:
+    """Índices sobre as apólices exibidas na interface (dicionários de apolices.json), para ordenar e
+    filtrar a lista sem reordenar itens do Treeview.
+
+    - tipo e status: conjuntos de números por valor (filtro por igualdade);
+    - cada coluna ordenável: lista ordenada de (chave de ordenação, desempate, número), montada na primeira
+      ordenação pela coluna (ou em montar_indices) e mantida por inserção binária a cada alteração, junto com
+      a sequência dos números nessa mesma ordem;
+    - texto: índice de prefixos das palavras do nome do cliente e listas ordenadas dos CPFs e dos números
+      (cada palavra digitada precisa ser início de uma palavra do nome, do CPF ou do número), montados no
+      primeiro filtro textual (ou em montar_indices).
+
+    Os dicionários apolices_por_numero e clientes_por_cpf são os mesmos usados pela lista; após alterar uma
+    apólice ou cliente neles, chame atualizar_apolice() ou atualizar_cliente(). Para montar os índices fora
+    da thread da interface, crie a consulta sobre cópias dos dicionários, chame montar_indices() na outra
+    thread e, de volta, vincular() aos dicionários originais."""
+
+    def __init__(self, apolices_por_numero, clientes_por_cpf):
+        self.apolices_por_numero = apolices_por_numero
+        self.clientes_por_cpf = clientes_por_cpf
+        self._por_tipo = {}
+        self._por_status = {}
+        self._por_cpf = {}
+        self._indexados = {}      # número -> (tipo, status, cpf) indexados (para remover na alteração)
+        self._ordens = {}         # coluna -> lista ordenada de (chave, desempate, número)
+        self._chaves_ordem = {}   # coluna -> {número: chave usada em _ordens}
+        self._numeros_ordem = {}  # coluna -> [números na ordem de _ordens]
+        self._indice_texto = None     # nomes: palavra -> números das apólices
+        self._cpfs_texto = None       # CPFs normalizados, em ordem
+        self._cpf_por_texto = {}      # CPF normalizado -> CPF
+        self._numeros_texto = None    # números normalizados, em ordem
+        self._numero_por_texto = {}   # número normalizado -> número
+        for numero in apolices_por_numero:
+            self._indexar(numero)
+
+    def __len__(self):
+        return len(self._indexados)
+
+    def valores_distintos(self, campo):
+        """Valores existentes de tipo_seguro ou status_apolice (para os filtros da interface)"""
+        indice = self._por_tipo if campo == "tipo_seguro" else self._por_status
+        return sorted(valor for valor, numeros in indice.items() if numeros and valor is not None)
+
+    # --- Manutenção ---
+
+    def _indexar(self, numero):
+        apolice = self.apolices_por_numero[numero]
+        tipo, status, cpf = apolice.get("tipo_seguro"), apolice.get("status_apolice"), apolice.get("cpf_cliente")
+        self._por_tipo.setdefault(tipo, set()).add(numero)
+        self._por_status.setdefault(status, set()).add(numero)
+        if cpf not in self._por_cpf:
+            self._por_cpf[cpf] = set()
+            if self._cpfs_texto is not None:
+                texto = normalizar_texto(cpf or "")
+                insort(self._cpfs_texto, texto)
+                self._cpf_por_texto[texto] = cpf
+        self._por_cpf[cpf].add(numero)
+        self._indexados[numero] = (tipo, status, cpf)
+
+    def _desindexar(self, numero):
+        tipo, status, cpf = self._indexados.pop(numero)
+        self._por_tipo[tipo].discard(numero)
+        self._por_status[status].discard(numero)
+        self._por_cpf[cpf].discard(numero)
+        for coluna, ordem in self._ordens.items():
+            entrada = (self._chaves_ordem[coluna].pop(numero), _desempate(numero), numero)
+            posicao = bisect_left(ordem, entrada)
+            if posicao < len(ordem) and ordem[posicao][2] == numero:
+                del ordem[posicao]
+                del self._numeros_ordem[coluna][posicao]
+
+    def atualizar_apolice(self, numero):
+        """Reindexa uma apólice incluída, alterada ou removida de apolices_por_numero. O(log n) por coluna ordenada
+           (mais o deslocamento da lista na inserção)."""
+        novo = numero not in self._indexados
+        if not novo:
+            self._desindexar(numero)
+        if numero not in self.apolices_por_numero:
+            if self._indice_texto is not None and not novo: # Removida (uma apólice desconhecida não tem o que remover)
+                self._indice_texto.remover(numero)
+                texto = self._texto_numero(numero)
+                del self._numeros_texto[bisect_left(self._numeros_texto, texto)]
+                del self._numero_por_texto[texto]
+            return
+        self._indexar(numero)
+        for coluna, ordem in self._ordens.items():
+            chave = self._chave_ordenacao(numero, coluna)
+            self._chaves_ordem[coluna][numero] = chave
+            entrada = (chave, _desempate(numero), numero)
+            posicao = bisect_left(ordem, entrada)
+            ordem.insert(posicao, entrada)
+            self._numeros_ordem[coluna].insert(posicao, numero)
+        if self._indice_texto is not None:
+            self._indice_texto.atualizar(numero, self._nome_cliente(numero))
+            if novo:
+                texto = self._texto_numero(numero)
+                insort(self._numeros_texto, texto)
+                self._numero_por_texto[texto] = numero
+
+    def atualizar_cliente(self, cpf):
+        """Reindexa as apólices do cliente (o nome aparece na ordenação e no filtro textual)"""
+        for numero in self.apolices_do_cliente(cpf):
+            self.atualizar_apolice(numero)
+
+    def apolices_do_cliente(self, cpf):
+        return list(self._por_cpf.get(cpf, ()))
+
+    def montar_indices(self):
+        """Monta de uma vez a ordenação de todas as colunas e o índice textual, que de outro modo seriam
+           montados na primeira ordenação ou filtro que os usa. Não mexe nos dicionários: pode rodar numa thread."""
+        for coluna in COLUNAS_ORDENAVEIS:
+            self._ordem(coluna)
+        if self._indice_texto is None:
+            self._montar_indice_texto()
+
+    def vincular(self, apolices_por_numero, clientes_por_cpf):
+        """Passa a usar os dicionários informados (os originais, depois de montar os índices sobre cópias).
+           Apólices e clientes alterados neles desde a cópia precisam ser reindexados com atualizar_apolice()
+           e atualizar_cliente()."""
+        self.apolices_por_numero = apolices_por_numero
+        self.clientes_por_cpf = clientes_por_cpf
+
+    # --- Ordenação ---
+
+    def _chave_ordenacao(self, numero, coluna):
+        apolice = self.apolices_por_numero[numero]
+        if coluna == "numero_apolice":
+            return _desempate(numero)
+        if coluna == "valor_assegurado":
+            valor = apolice.get("valor_assegurado")
+            return float(valor) if isinstance(valor, (int, float)) else _SEM_VALOR
+        if coluna == "nome":
+            cliente = self.clientes_por_cpf.get(apolice.get("cpf_cliente"))
+            return (cliente.get("nome") or "").casefold() if cliente else ""
+        if coluna == "cpf":
+            return str(apolice.get("cpf_cliente") or "")
+        return str(apolice.get(coluna) or "").casefold()
+
+    def _ordem(self, coluna):
+        """Lista ordenada da coluna, montada na primeira vez em O(n log n)"""
+        if coluna not in self._ordens:
+            if coluna not in COLUNAS_ORDENAVEIS:
+                raise ValueError(f"Coluna não ordenável: {coluna}")
+            chaves = {numero: self._chave_ordenacao(numero, coluna) for numero in self._indexados}
+            self._chaves_ordem[coluna] = chaves
+            self._ordens[coluna] = sorted((chave, _desempate(numero), numero) for numero, chave in chaves.items())
+            self._numeros_ordem[coluna] = [entrada[2] for entrada in self._ordens[coluna]]
+        return self._ordens[coluna]
+
+    def _numeros_em_ordem(self, coluna):
+        self._ordem(coluna)
+        return self._numeros_ordem[coluna]
+
+    # --- Filtro textual ---
+
+    @staticmethod
+    def _texto_numero(numero):
+        return normalizar_texto(numero) if not isinstance(numero, int) else str(numero)
+
+    def _nome_cliente(self, numero):
+        cliente = self.clientes_por_cpf.get(self.apolices_por_numero[numero].get("cpf_cliente"))
+        return (cliente.get("nome") or "") if cliente else ""
+
+    def _montar_indice_texto(self):
+        self._indice_texto = IndicePrefixos()
+        self._indice_texto.carregar((numero, self._nome_cliente(numero)) for numero in self._indexados)
+        self._cpf_por_texto = {normalizar_texto(cpf or ""): cpf for cpf in self._por_cpf}
+        self._cpfs_texto = sorted(self._cpf_por_texto)
+        self._numero_por_texto = {self._texto_numero(numero): numero for numero in self._indexados}
+        self._numeros_texto = sorted(self._numero_por_texto)
+
+    def _numeros_por_palavra(self, palavra):
+        """Apólices em que a palavra é início de uma palavra do nome do cliente, do CPF ou do número"""
+        numeros = self._indice_texto.documentos(palavra)
+        inicio, fim = faixa_de_prefixo(self._cpfs_texto, palavra)
+        if fim > inicio:
+            numeros = numeros.union(*(self._por_cpf[self._cpf_por_texto[cpf]] for cpf in self._cpfs_texto[inicio:fim]))
+        inicio, fim = faixa_de_prefixo(self._numeros_texto, palavra)
+        if fim > inicio:
+            numeros = numeros.union(map(self._numero_por_texto.__getitem__, self._numeros_texto[inicio:fim]))
+        return numeros
+
+    def _numeros_por_texto(self, texto):
+        if self._indice_texto is None:
+            self._montar_indice_texto()
+        resultado = None
+        # Palavras mais longas costumam ser mais seletivas e reduzem logo o resultado
+        for palavra in sorted(set(normalizar_texto(texto).split()), key=len, reverse=True):
+            numeros = self._numeros_por_palavra(palavra)
+            resultado = numeros if resultado is None else resultado & numeros
+            if not resultado:
+                break
+        return resultado if resultado is not None else set()
+
+    # --- Uma apólice da lista exibida ---
+
+    def atende(self, numero, tipo=None, status=None, valor_minimo=None, valor_maximo=None, texto=None):
+        """Se a apólice passa nos filtros, pelos mesmos critérios de consultar(), olhando só para ela"""
+        apolice = self.apolices_por_numero.get(numero)
+        if apolice is None:
+            return False
+        if (tipo and apolice.get("tipo_seguro") != tipo) or (status and apolice.get("status_apolice") != status):
+            return False
+        if valor_minimo is not None or valor_maximo is not None:
+            valor = self._chave_ordenacao(numero, "valor_assegurado")
+            if valor == _SEM_VALOR or (valor_minimo is not None and valor < valor_minimo) \
+                    or (valor_maximo is not None and valor > valor_maximo):
+                return False
+        if texto and texto.strip():
+            palavras = normalizar_texto(self._nome_cliente(numero)).split()
+            palavras.append(normalizar_texto(apolice.get("cpf_cliente") or ""))
+            palavras.append(self._texto_numero(numero))
+            prefixos = set(normalizar_texto(texto).split())
+            if not prefixos or not all(any(palavra.startswith(prefixo) for palavra in palavras) for prefixo in prefixos):
+                return False
+        return True
+
+    def _chave_exibicao(self, numero, ordenar_por):
+        return self._chaves_ordem[ordenar_por][numero], _desempate(numero)
+
+    def posicao_na_lista(self, numeros, numero, ordenar_por="numero_apolice", decrescente=False):
+        """Posição da apólice em `numeros`, uma lista em ordem retornada por consultar() com a mesma ordenação
+           (e mantida em ordem depois): a posição dela, se estiver na lista, ou onde deve ser inserida.
+           Busca binária pelas chaves indexadas, O(log n); antes de atualizar_apolice() vale a chave anterior."""
+        self._ordem(ordenar_por)
+        alvo = self._chave_exibicao(numero, ordenar_por)
+        inicio, fim = 0, len(numeros)
+        while inicio < fim:
+            meio = (inicio + fim) // 2
+            chave = self._chave_exibicao(numeros[meio], ordenar_por)
+            if (chave > alvo) if decrescente else (chave < alvo):
+                inicio = meio + 1
+            else:
+                fim = meio
+        return inicio
+
+    def em_ordem(self, numeros, posicao, ordenar_por="numero_apolice", decrescente=False):
+        """Se numeros[posicao] continua em ordem entre as vizinhas (após atualizar_apolice() dela)"""
+        self._ordem(ordenar_por)
+        vizinhas = [self._chave_exibicao(numeros[i], ordenar_por) for i in (posicao - 1, posicao, posicao + 1)
+                    if 0 <= i < len(numeros)]
+        if decrescente:
+            vizinhas.reverse()
+        return all(anterior < seguinte for anterior, seguinte in zip(vizinhas, vizinhas[1:]))
+
+    # --- Consulta ---
+
+    def consultar(self, ordenar_por="numero_apolice", decrescente=False, tipo=None, status=None,
+                  valor_minimo=None, valor_maximo=None, texto=None):
+        """Retorna os números das apólices que passam em todos os filtros informados, na ordem pedida."""
+        conjuntos = []
+        if tipo:
+            conjuntos.append(self._por_tipo.get(tipo, set()))
+        if status:
+            conjuntos.append(self._por_status.get(status, set()))
+        if valor_minimo is not None or valor_maximo is not None:
+            ordem_valor = self._ordem("valor_assegurado")
+            inicio = bisect_left(ordem_valor, (valor_minimo,)) if valor_minimo is not None \
+                else bisect_right(ordem_valor, (_SEM_VALOR, _MAIOR_DESEMPATE))
+            fim = bisect_right(ordem_valor, (valor_maximo, _MAIOR_DESEMPATE)) if valor_maximo is not None else len(ordem_valor)
+            conjuntos.append(set(self._numeros_em_ordem("valor_assegurado")[inicio:fim]))
+        if texto and texto.strip():
+            conjuntos.append(self._numeros_por_texto(texto))
+
+        ordenados = self._numeros_em_ordem(ordenar_por)
+        if not conjuntos:
+            numeros = list(ordenados)
+        else:
+            conjuntos.sort(key=len)
+            candidatos = conjuntos[0].intersection(*conjuntos[1:])
+            if len(candidatos) * 4 < len(ordenados):
+                # Poucos resultados: ordenar só os candidatos sai mais barato que percorrer a coluna inteira.
+                # A ordenação é estável, então os empates na coluna ficam na ordem do número.
+                numeros = _em_ordem_de_numero(candidatos)
+                numeros.sort(key=self._chaves_ordem[ordenar_por].__getitem__)
+            else:
+                numeros = list(filter(candidatos.__contains__, ordenados))
+        if decrescente:
+            numeros.reverse()
+        return numeros
@@ -0,0 +1,365 @@
+"""Exportação dos dados da interface (apólices, clientes e sinistros) para planilha Excel.
+
+A planilha é gravada em fluxo (openpyxl em modo write_only): cada linha é montada a partir do registro e
+gravada em seguida, sem DataFrame nem cópias do conjunto de dados, então a memória usada pela exportação
+não depende da quantidade de linhas. Os campos de dados_especificos viram colunas como no json_normalize
+(subcampos unidos por '.') e cada apólice traz o nome do cliente ao lado do CPF.
+
+Para análise (notebooks, Spark, DuckDB) há também a exportação analítica em Parquet ou em CSV dividido em
+blocos: apólices (com os campos do seguro de cada tipo), clientes e sinistros no formato do SistemaSeguros,
+com colunas tipadas (datas, decimais, inteiros, categorias) e as apólices agrupadas por tipo_seguro.
+
+Nada aqui usa Tk: a interface executa a exportação em uma thread, recebe o progresso por callback e
+cancela por um threading.Event."""
+import csv
+import os
+import re
+import shutil
+import tempfile
+from datetime import datetime
+from busca_texto import normalizar_texto
+from repositorio import ArmazenamentoRepositorio
+from utils import converter_data
+
+ABAS = ("Apólices", "Clientes", "Sinistros")
+INTERVALO_PROGRESSO = 1000 # Linhas gravadas entre avisos de progresso (e verificações de cancelamento)
+
+def _achatar(dados, prefixo="", destino=None):
+    """Campos de um dicionário aninhado em um nível só: {"a": {"b": 1}} -> {"a.b": 1}"""
+    if destino is None:
+        destino = {}
+    for chave, valor in dados.items():
+        if isinstance(valor, dict):
+            _achatar(valor, f"{prefixo}{chave}.", destino)
+        else:
+            destino[f"{prefixo}{chave}"] = valor
+    return destino
+
+def _dados_especificos(apolice):
+    dados = apolice.get("dados_especificos")
+    return _achatar(dados) if isinstance(dados, dict) else {}
+
+def _colunas(registros, campos=None):
+    """Colunas na ordem em que aparecem pela primeira vez (como as do DataFrame da exportação anterior)"""
+    colunas = {}
+    for registro in registros:
+        for campo in (campos(registro) if campos else registro):
+            colunas[campo] = None
+    return list(colunas)
+
+def colunas_apolices(apolices):
+    """Colunas das apólices: campos do registro (com nome_cliente depois de cpf_cliente) e os dados específicos"""
+    colunas = [coluna for coluna in _colunas(apolices) if coluna != "dados_especificos"]
+    if "cpf_cliente" in colunas:
+        colunas.insert(colunas.index("cpf_cliente") + 1, "nome_cliente")
+    especificos = [coluna for coluna in _colunas(apolices, _dados_especificos) if coluna not in colunas]
+    return colunas + especificos
+
+def linhas_apolices(apolices, clientes_por_cpf, colunas):
+    """Valores de cada apólice na ordem das colunas, uma linha por vez"""
+    for apolice in apolices:
+        valores = _dados_especificos(apolice)
+        valores.update(apolice) # Campos da apólice prevalecem sobre dados específicos de mesmo nome
+        cliente = clientes_por_cpf.get(apolice.get("cpf_cliente"))
+        valores["nome_cliente"] = cliente.get("nome") if cliente else None
+        yield [valores.get(coluna) for coluna in colunas]
+
+def linhas_registros(registros, colunas):
+    for registro in registros:
+        yield [registro.get(coluna) for coluna in colunas]
+
+def _celula(valor, caracteres_invalidos):
+    """Valor aceito pelo openpyxl: textos sem caracteres de controle, listas e outros tipos como texto"""
+    if valor is None or isinstance(valor, (bool, int, float)):
+        return valor
+    return caracteres_invalidos.sub("", valor if isinstance(valor, str) else str(valor))
+
+def exportar_excel(caminho, repositorio, progresso=None, cancelar=None):
+    """Grava apólices, clientes e sinistros do repositório em abas de uma planilha .xlsx.
+       progresso(linhas gravadas, total de linhas) é chamado a cada INTERVALO_PROGRESSO linhas; se o
+       threading.Event cancelar for sinalizado, a exportação para e nenhum arquivo é deixado.
+       Retorna True se o arquivo foi gravado e False se a exportação foi cancelada. Erros de gravação
+       são propagados (o arquivo anterior, se existir, não é alterado)."""
+    from openpyxl import Workbook # Dependência opcional, necessária apenas para planilhas
+    from openpyxl.cell.cell import ILLEGAL_CHARACTERS_RE
+
+    # Fotografia das listas (só referências): alterações feitas na interface durante a exportação
+    # trocam os dicionários no repositório, sem mexer nos já listados aqui
+    apolices, clientes, sinistros = list(repositorio.apolices), list(repositorio.clientes), list(repositorio.sinistros)
+    clientes_por_cpf = repositorio.clientes_por_cpf
+    colunas = {"Apólices": colunas_apolices(apolices), "Clientes": _colunas(clientes), "Sinistros": _colunas(sinistros)}
+    linhas = {
+        "Apólices": linhas_apolices(apolices, clientes_por_cpf, colunas["Apólices"]),
+        "Clientes": linhas_registros(clientes, colunas["Clientes"]),
+        "Sinistros": linhas_registros(sinistros, colunas["Sinistros"])
+    }
+    total = len(apolices) + len(clientes) + len(sinistros)
+
+    planilha = Workbook(write_only=True)
+    temporario = f"{caminho}.tmp"
+    gravadas = 0
+    try:
+        for titulo in ABAS:
+            aba = planilha.create_sheet(titulo)
+            aba.append(colunas[titulo])
+            for valores in linhas[titulo]:
+                aba.append([_celula(valor, ILLEGAL_CHARACTERS_RE) for valor in valores])
+                gravadas += 1
+                if gravadas % INTERVALO_PROGRESSO == 0:
+                    if cancelar is not None and cancelar.is_set():
+                        return False
+                    if progresso:
+                        progresso(gravadas, total)
+        planilha.save(temporario)
+        os.replace(temporario, caminho)
+        if progresso:
+            progresso(gravadas, total)
+        return True
+    finally:
+        if os.path.exists(temporario):
+            os.remove(temporario)
+
+
+# --- Exportação analítica (Parquet ou CSV em blocos) ---
+
+# Colunas de cada tabela e seu tipo: texto, categoria (poucos valores distintos; dicionário no Parquet),
+# data, data_hora, decimal, inteiro ou lista (de textos). Campos de outros tipos de seguro ficam vazios.
+COLUNAS_ANALITICAS = {
+    "apolices": (
+        ("numero", "texto"), ("cliente_cpf", "texto"), ("cliente_nome", "texto"), ("tipo_seguro", "categoria"),
+        ("status", "categoria"), ("data_emissao", "data"), ("premio", "decimal"), ("valor_cobertura", "decimal"),
+        ("data_inicio", "data"), ("data_fim", "data"), ("data_cancelamento", "data"), ("motivo_cancelamento", "texto"),
+        # SeguroAutomovel
+        ("marca", "categoria"), ("modelo", "texto"), ("ano", "inteiro"), ("placa", "texto"),
+        ("estado_conservacao", "categoria"), ("uso_veiculo", "categoria"), ("num_condutores", "inteiro"),
+        # SeguroResidencial
+        ("endereco_imovel", "texto"), ("area", "decimal"), ("valor_venal", "decimal"), ("tipo_construcao", "categoria"),
+        # SeguroVida
+        ("beneficiarios", "lista"), ("tipos_cobertura", "lista")
+    ),
+    "clientes": (
+        ("cpf", "texto"), ("nome", "texto"), ("data_nascimento", "data"), ("endereco", "texto"),
+        ("telefone", "texto"), ("email", "texto")
+    ),
+    "sinistros": (
+        ("id", "texto"), ("numero_apolice", "texto"), ("data_ocorrencia", "data"), ("descricao", "texto"),
+        ("valor_prejuizo", "decimal"), ("status", "categoria"), ("data_registro", "data_hora")
+    )
+}
+COLUNA_PARTICAO = "tipo_seguro" # Tabelas com esta coluna têm um único tipo de seguro por grupo de linhas / arquivo CSV
+LINHAS_POR_GRUPO = 100000 # Linhas por grupo de linhas do Parquet e por arquivo CSV
+FORMATOS_ANALITICOS = ("parquet", "csv")
+
+def _texto(valor):
+    return None if valor is None else str(valor)
+
+def _decimal(valor):
+    try:
+        return float(valor)
+    except (TypeError, ValueError):
+        return None
+
+def _inteiro(valor):
+    try:
+        return int(valor)
+    except (TypeError, ValueError):
+        return None
+
+def _data_hora(valor):
+    try:
+        return datetime.strptime(valor, "%d/%m/%Y %H:%M:%S")
+    except (TypeError, ValueError):
+        return None
+
+def _lista(valor):
+    if isinstance(valor, list):
+        return [str(item) for item in valor]
+    return [str(valor)] if valor not in (None, "") else []
+
+_CONVERSORES = {
+    "texto": _texto, "categoria": _texto, "decimal": _decimal, "inteiro": _inteiro,
+    "data": converter_data, "data_hora": _data_hora, "lista": _lista
+}
+
+def _valor_csv(valor):
+    if valor is None:
+        return ""
+    if isinstance(valor, list):
+        return "; ".join(valor)
+    if hasattr(valor, "isoformat"):
+        return valor.isoformat() # Datas em ISO 8601, lidas como datas por pandas/DuckDB
+    return valor
+
+
+class _GravadorParquet:
+    """Um arquivo <tabela>.parquet; cada bloco recebido vira um grupo de linhas"""
+
+    def __init__(self, diretorio, tabela, colunas):
+        import pyarrow as pa # Dependência opcional, necessária apenas para Parquet
+        import pyarrow.parquet as pq
+        self._pa = pa
+        tipos = {
+            "texto": pa.string(), "categoria": pa.dictionary(pa.int32(), pa.string()), "decimal": pa.float64(),
+            "inteiro": pa.int64(), "data": pa.date32(), "data_hora": pa.timestamp("s"), "lista": pa.list_(pa.string())
+        }
+        self.colunas = colunas
+        self.esquema = pa.schema([(nome, tipos[tipo]) for nome, tipo in colunas])
+        self._escritor = pq.ParquetWriter(os.path.join(diretorio, f"{tabela}.parquet"), self.esquema)
+
+    def gravar(self, linhas, particao=None):
+        arrays = []
+        for (nome, tipo), valores in zip(self.colunas, zip(*linhas)):
+            if tipo == "categoria":
+                arrays.append(self._pa.array(valores, type=self._pa.string()).dictionary_encode())
+            else:
+                arrays.append(self._pa.array(valores, type=self.esquema.field(nome).type))
+        tabela = self._pa.Table.from_arrays(arrays, schema=self.esquema)
+        self._escritor.write_table(tabela, row_group_size=len(linhas))
+
+    def fechar(self):
+        self._escritor.close()
+
+
+class _GravadorCSV:
+    """Arquivos <tabela>[_<tipo de seguro>]_<n>.csv, um por bloco recebido, todos com cabeçalho"""
+
+    def __init__(self, diretorio, tabela, colunas):
+        self.diretorio = diretorio
+        self.tabela = tabela
+        self.cabecalho = [nome for nome, _ in colunas]
+        self.arquivos = {} # Prefixo do nome (tabela e tipo de seguro) -> arquivos gravados
+
+    def gravar(self, linhas, particao=None):
+        prefixo = self.tabela
+        if COLUNA_PARTICAO in self.cabecalho:
+            prefixo += "_" + normalizar_texto(particao or "sem tipo").replace(" ", "_")
+        self.arquivos[prefixo] = self.arquivos.get(prefixo, 0) + 1
+        caminho = os.path.join(self.diretorio, f"{prefixo}_{self.arquivos[prefixo]:05d}.csv")
+        with open(caminho, "w", encoding="utf-8", newline="") as f:
+            escritor = csv.writer(f)
+            escritor.writerow(self.cabecalho)
+            escritor.writerows([_valor_csv(valor) for valor in linha] for linha in linhas)
+
+    def fechar(self):
+        if not self.arquivos:
+            self.gravar([]) # Tabela vazia: só o cabeçalho, para que o conjunto de arquivos continue completo
+
+
+def _arquivos_anteriores(diretorio, tabela, formato):
+    if formato == "parquet":
+        padrao = re.compile(rf"{re.escape(tabela)}\.parquet")
+    else:
+        padrao = re.compile(rf"{re.escape(tabela)}(_[a-z0-9_]+)?_\d{{5}}\.csv")
+    return [nome for nome in os.listdir(diretorio) if padrao.fullmatch(nome)]
+
+def exportar_analitico(diretorio, tabelas, formato="parquet", progresso=None, cancelar=None, linhas_por_grupo=LINHAS_POR_GRUPO):
+    """Grava as tabelas em diretorio: <tabela>.parquet ou <tabela>[_<tipo>]_<n>.csv (UTF-8, ',', datas ISO).
+       tabelas: {nome em COLUNAS_ANALITICAS: (quantidade de linhas, dicionários das linhas)}, como retornado
+       por tabelas_repositorio() e tabelas_sistema(). As linhas são convertidas e gravadas em blocos de até
+       linhas_por_grupo; nas apólices cada bloco tem um único tipo_seguro, então as estatísticas de cada grupo
+       de linhas do Parquet permitem a leitores (pyarrow, DuckDB, Spark) pular os grupos dos outros tipos.
+       progresso e cancelar funcionam como em exportar_excel(). Os arquivos são gravados em um diretório
+       temporário e só substituem os da exportação anterior (do mesmo formato) ao final.
+       Retorna True se a exportação foi concluída e False se foi cancelada."""
+    if formato not in FORMATOS_ANALITICOS:
+        raise ValueError(f"Formato de exportação inválido: {formato}")
+    gravador_classe = _GravadorParquet if formato == "parquet" else _GravadorCSV
+    total = sum(quantidade for quantidade, _ in tabelas.values())
+    temporario = tempfile.mkdtemp(prefix=".exportacao_", dir=diretorio)
+    gravadas = 0
+    try:
+        for tabela, (_, linhas) in tabelas.items():
+            colunas = COLUNAS_ANALITICAS[tabela]
+            conversores = [(nome, _CONVERSORES[tipo]) for nome, tipo in colunas]
+            particionar = any(nome == COLUNA_PARTICAO for nome, _ in colunas)
+            gravador = gravador_classe(temporario, tabela, colunas)
+            pendentes = {} # Partição (tipo_seguro) -> linhas convertidas ainda não gravadas
+            try:
+                for linha in linhas:
+                    particao = linha.get(COLUNA_PARTICAO) if particionar else None
+                    bloco = pendentes.setdefault(particao, [])
+                    bloco.append([converter(linha.get(nome)) for nome, converter in conversores])
+                    if len(bloco) >= linhas_por_grupo:
+                        gravador.gravar(bloco, particao)
+                        del pendentes[particao]
+                    gravadas += 1
+                    if gravadas % INTERVALO_PROGRESSO == 0:
+                        if cancelar is not None and cancelar.is_set():
+                            return False
+                        if progresso:
+                            progresso(gravadas, total)
+                for particao, bloco in pendentes.items():
+                    gravador.gravar(bloco, particao)
+            finally:
+                gravador.fechar()
+        for tabela in tabelas:
+            for nome in _arquivos_anteriores(diretorio, tabela, formato):
+                os.remove(os.path.join(diretorio, nome))
+        for nome in os.listdir(temporario):
+            os.replace(os.path.join(temporario, nome), os.path.join(diretorio, nome))
+        if progresso:
+            progresso(gravadas, total)
+        return True
+    finally:
+        shutil.rmtree(temporario, ignore_errors=True)
+
+def _linha_apolice(apolice, seguro, cliente_nome):
+    """Apólice e seguro (formato do SistemaSeguros) em uma única linha"""
+    linha = dict(seguro)
+    linha["tipo_seguro"] = seguro.get("tipo")
+    linha.update(apolice)
+    linha["cliente_nome"] = cliente_nome
+    return linha
+
+def tabelas_repositorio(repositorio):
+    """Tabelas analíticas dos registros da interface, convertidos um a um para o formato do SistemaSeguros
+       (dados_especificos normalizados como em ArmazenamentoRepositorio)"""
+    adaptador = ArmazenamentoRepositorio(repositorio)
+    # Fotografia das listas (só referências), como em exportar_excel()
+    apolices, clientes, sinistros = list(repositorio.apolices), list(repositorio.clientes), list(repositorio.sinistros)
+    clientes_por_cpf = repositorio.clientes_por_cpf
+
+    def linhas_apolices():
+        for apolice in apolices:
+            cliente = clientes_por_cpf.get(apolice.get("cpf_cliente"))
+            yield _linha_apolice(adaptador.modelo("apolices", apolice), adaptador.modelo("seguros", apolice),
+                                 cliente.get("nome") if cliente else None)
+
+    def linhas_sinistros():
+        for sinistro in sinistros:
+            linha = adaptador.modelo("sinistros", sinistro)
+            linha["numero_apolice"] = sinistro.get("numero_apolice")
+            yield linha
+
+    return {
+        "apolices": (len(apolices), linhas_apolices()),
+        "clientes": (len(clientes), (adaptador.modelo("clientes", cliente) for cliente in clientes)),
+        "sinistros": (len(sinistros), linhas_sinistros())
+    }
+
+def tabelas_sistema(sistema):
+    """Tabelas analíticas dos objetos do SistemaSeguros (Apolice com seu Seguro e Cliente, Sinistro)"""
+    apolices, clientes, sinistros = list(sistema.apolices), list(sistema.clientes), list(sistema.sinistros)
+
+    def linhas_apolices():
+        # Apólices emitidas na sessão não têm os objetos vinculados: buscados pela chave, sem uma consulta por apólice
+        seguros = {seguro.id: seguro for seguro in sistema.seguros}
+        clientes_por_cpf = {cliente.cpf: cliente for cliente in clientes}
+        for apolice in apolices:
+            seguro = apolice.seguro or seguros.get(apolice.seguro_id)
+            cliente = apolice.cliente or clientes_por_cpf.get(apolice.cliente_cpf)
+            yield _linha_apolice(apolice.to_dict(), seguro.to_dict() if seguro is not None else {},
+                                 cliente.nome if cliente is not None else None)
+
+    def linhas_sinistros():
+        numero_por_sinistro = {sinistro_id: apolice.numero for apolice in apolices for sinistro_id in apolice.sinistros_ids}
+        for sinistro in sinistros:
+            linha = sinistro.to_dict()
+            linha["numero_apolice"] = numero_por_sinistro.get(sinistro.id)
+            yield linha
+
+    return {
+        "apolices": (len(apolices), linhas_apolices()),
+        "clientes": (len(clientes), (cliente.to_dict() for cliente in clientes)),
+        "sinistros": (len(sinistros), linhas_sinistros())
+    }
@@ -0,0 +1,88 @@
+"""Geração dos relatórios sem interface gráfica (agendamentos, servidores sem tela).
+
+Lê clientes.json, apolices.json e sinistros.json do diretório de dados, calcula os totais uma única vez
+(AgregadosRelatorios, em uma passada pelos registros) e grava, para cada relatório, a tabela em CSV e o
+gráfico em PNG e/ou PDF (backend Agg). Os relatórios são gerados em paralelo, um por processo.
+
+Uso:
+    python gerar_relatorios.py --dados . --saida relatorios --formatos csv,png,pdf"""
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from repositorio import RepositorioDados
+import preparacao_relatorios
+from preparacao_relatorios import RELATORIOS, FORMATOS
+
+_dados = {} # Dados de cada relatório no processo do pool (recebidos uma única vez, por _iniciar_processo)
+
+def _iniciar_processo(dados):
+    _dados.update(dados)
+
+def _gerar(nome, diretorio_saida, formatos):
+    return preparacao_relatorios.gerar_arquivos(nome, _dados[nome], diretorio_saida, formatos)
+
+def gerar_relatorios(diretorio_dados=".", diretorio_saida="relatorios", formatos=FORMATOS, nomes=None, processos=None):
+    """Gera os relatórios pedidos (padrão: todos). Retorna {nome do relatório: caminhos gravados}, ou None em caso de erro."""
+    nomes = list(nomes or RELATORIOS)
+    desconhecidos = [nome for nome in nomes if nome not in RELATORIOS]
+    if desconhecidos:
+        print(f"Relatório(s) desconhecido(s): {', '.join(desconhecidos)}. Disponíveis: {', '.join(RELATORIOS)}")
+        return None
+    formatos = [formato for formato in formatos if formato in FORMATOS]
+    if not formatos:
+        print(f"Nenhum formato válido. Disponíveis: {', '.join(FORMATOS)}")
+        return None
+
+    repositorio = RepositorioDados(diretorio_dados)
+    try:
+        repositorio.carregar()
+    except Exception as e:
+        print(f"Erro ao carregar os arquivos de dados de {diretorio_dados}: {e}")
+        return None
+    try:
+        os.makedirs(diretorio_saida, exist_ok=True)
+    except OSError as e:
+        print(f"Erro ao criar o diretório {diretorio_saida}: {e}")
+        return None
+
+    # Os dados de cada relatório (totais e nomes dos clientes) saem do processo principal, que tem o repositório;
+    # tabelas e gráficos são montados e gravados nos processos do pool. Os dados vão aos processos pelo
+    # inicializador: com fork (Linux) são herdados sem serialização, em vez de copiados a cada tarefa.
+    dados = {nome: RELATORIOS[nome][1](repositorio) for nome in nomes}
+    processos = processos or min(len(nomes), os.cpu_count() or 1)
+    resultado = {}
+    try:
+        if processos <= 1:
+            for nome in nomes:
+                resultado[nome] = preparacao_relatorios.gerar_arquivos(nome, dados[nome], diretorio_saida, formatos)
+        else:
+            with ProcessPoolExecutor(max_workers=processos, initializer=_iniciar_processo, initargs=(dados,)) as executor:
+                futures = {nome: executor.submit(_gerar, nome, diretorio_saida, formatos) for nome in nomes}
+                for nome, future in futures.items():
+                    resultado[nome] = future.result()
+    except Exception as e:
+        print(f"Erro ao gerar os relatórios em {diretorio_saida}: {e}")
+        return None
+    return resultado
+
+
+if __name__ == "__main__":
+    import argparse
+    import sys
+    parser = argparse.ArgumentParser(description="Gera os relatórios do sistema (tabelas CSV e gráficos PNG/PDF) sem interface gráfica.")
+    parser.add_argument("--dados", default=".", help="Diretório com clientes.json, apolices.json e sinistros.json (padrão: atual)")
+    parser.add_argument("--saida", default="relatorios", help="Diretório onde os arquivos são gravados (padrão: relatorios)")
+    parser.add_argument("--formatos", default=",".join(FORMATOS), help=f"Formatos separados por vírgula (padrão: {','.join(FORMATOS)})")
+    parser.add_argument("--relatorios", default=None, help=f"Relatórios separados por vírgula (padrão: todos - {','.join(RELATORIOS)})")
+    parser.add_argument("--processos", type=int, default=None, help="Processos usados na geração (padrão: um por relatório, até o número de CPUs)")
+    args = parser.parse_args()
+    inicio = time.perf_counter()
+    resultado = gerar_relatorios(args.dados, args.saida,
+                                 [formato.strip().lower() for formato in args.formatos.split(",") if formato.strip()],
+                                 [nome.strip() for nome in args.relatorios.split(",") if nome.strip()] if args.relatorios else None,
+                                 args.processos)
+    if resultado is None:
+        sys.exit(1)
+    for nome, caminhos in resultado.items():
+        print(f"{nome}: {', '.join(caminhos) if caminhos else 'sem dados'}")
+    print(f"Relatórios gerados em {time.perf_counter() - inicio:.2f}s.")
@@ -0,0 +1,115 @@
+"""Gravação dos arquivos de dados em segundo plano, fora da thread da interface.
+
+A interface apenas marca as coleções alteradas (marcar); uma thread dedicada espera ATRASO_S sem novas
+marcações (no máximo ESPERA_MAXIMA_S desde a primeira) e grava cada coleção marcada uma única vez, com o
+estado do momento da gravação: várias alterações seguidas resultam em uma só gravação por arquivo.
+Ao sair, descarregar() grava de imediato o que estiver pendente e espera terminar."""
+import threading
+import time
+
+class GravadorColecoes:
+    ATRASO_S = 0.5          # Espera após a última marcação antes de gravar
+    ESPERA_MAXIMA_S = 5.0   # Limite da espera, para que alterações contínuas não adiem a gravação indefinidamente
+
+    def __init__(self, gravar, nome="gravador-colecoes"):
+        """gravar(colecao) grava o estado atual da coleção; é chamado somente pela thread do gravador"""
+        self.gravar = gravar
+        self._condicao = threading.Condition()
+        self._pendentes = set()     # Coleções marcadas ainda não gravadas
+        self._falhas = {}           # Coleção -> último erro de gravação (regravada na próxima marcação ou descarga)
+        self._aguardando = []       # [geração mínima, coleções restantes, função] de cada ao_concluir
+        self._geracao = 0           # Lotes iniciados pela thread
+        self._gravando = False
+        self._primeira_marcacao = None
+        self._ultima_marcacao = None
+        self._imediato = False
+        self._encerrar = False
+        self._thread = threading.Thread(target=self._executar, name=nome, daemon=True)
+        self._thread.start()
+
+    def marcar(self, *colecoes, ao_concluir=None):
+        """Agenda a gravação das coleções. ao_concluir() é chamada (na thread do gravador) quando todas
+           tiverem sido gravadas com um estado posterior a esta marcação."""
+        with self._condicao:
+            agora = time.monotonic()
+            if not self._pendentes:
+                self._primeira_marcacao = agora
+            self._ultima_marcacao = agora
+            self._pendentes.update(colecoes)
+            self._pendentes.update(self._falhas)
+            if ao_concluir is not None:
+                self._aguardando.append([self._geracao + 1, set(colecoes), ao_concluir])
+            self._condicao.notify_all()
+
+    @property
+    def pendente(self):
+        with self._condicao:
+            return bool(self._pendentes) or self._gravando
+
+    def descarregar(self, tempo_limite=None):
+        """Grava de imediato as coleções pendentes (e as que falharam) e espera terminar.
+           Retorna {coleção: erro} das gravações que falharam (vazio se tudo foi gravado)."""
+        with self._condicao:
+            self._pendentes.update(self._falhas)
+            self._imediato = True
+            self._condicao.notify_all()
+            self._condicao.wait_for(lambda: not self._pendentes and not self._gravando, tempo_limite)
+            self._imediato = False
+            return dict(self._falhas)
+
+    def encerrar(self, tempo_limite=None):
+        """Descarrega as gravações pendentes e termina a thread. Retorna as falhas, como descarregar()."""
+        falhas = self.descarregar(tempo_limite)
+        with self._condicao:
+            self._encerrar = True
+            self._condicao.notify_all()
+        self._thread.join(tempo_limite)
+        return falhas
+
+    def _prazo(self):
+        """Instante em que as coleções pendentes devem ser gravadas"""
+        return min(self._ultima_marcacao + self.ATRASO_S, self._primeira_marcacao + self.ESPERA_MAXIMA_S)
+
+    def _executar(self):
+        while True:
+            with self._condicao:
+                while True:
+                    if self._pendentes and (self._imediato or time.monotonic() >= self._prazo()):
+                        break
+                    if self._encerrar and not self._pendentes:
+                        return
+                    espera = max(0.0, self._prazo() - time.monotonic()) if self._pendentes else None
+                    self._condicao.wait(espera)
+                lote, self._pendentes = self._pendentes, set()
+                self._geracao += 1
+                geracao = self._geracao
+                self._gravando = True
+
+            gravadas = set()
+            falhas = {}
+            for colecao in sorted(lote):
+                try:
+                    self.gravar(colecao)
+                    gravadas.add(colecao)
+                except Exception as e:
+                    print(f"Erro ao gravar {colecao} em segundo plano: {e}")
+                    falhas[colecao] = e
+
+            with self._condicao:
+                for colecao in gravadas:
+                    self._falhas.pop(colecao, None)
+                self._falhas.update(falhas)
+                concluidas = []
+                for espera in self._aguardando:
+                    if geracao >= espera[0]:
+                        espera[1] -= gravadas
+                        if not espera[1]:
+                            concluidas.append(espera)
+                self._aguardando = [espera for espera in self._aguardando if espera not in concluidas]
+                self._gravando = False
+                self._condicao.notify_all()
+            for _, _, funcao in concluidas:
+                try:
+                    funcao()
+                except Exception as e:
+                    print(f"Erro ao concluir gravação em segundo plano: {e}")
@@ -0,0 +1,212 @@
+"""Importação em lote de carteiras (clientes + seguros) a partir de arquivos CSV ou XLSX.
+
+Cada linha do arquivo gera um cliente (reaproveitado se o CPF já existir), um seguro e uma apólice.
+As linhas são lidas em fluxo e validadas em paralelo (ProcessPoolExecutor) com as mesmas regras
+de Cliente.validar_* e Seguro.validar_datas; a gravação fica a cargo de SistemaSeguros.importar_arquivo.
+
+Colunas (a primeira linha é o cabeçalho; maiúsculas e espaços nas pontas são ignorados):
+    nome, cpf, data_nascimento, endereco, telefone, email,
+    tipo_seguro (Automóvel, Residencial ou Vida), valor_cobertura, data_inicio, data_fim e, por tipo:
+    Automóvel: marca, modelo, ano, placa, estado_conservacao, uso_veiculo, num_condutores
+    Residencial: endereco_imovel, area, valor_venal, tipo_construcao
+    Vida: beneficiarios, tipos_cobertura (vários valores separados por ';')"""
+import contextlib
+import csv
+import io
+import os
+from collections import deque
+from itertools import chain, islice
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime
+from cliente import Cliente
+from seguro import SeguroAutomovel, SeguroResidencial, SeguroVida
+
+CAMPOS_CLIENTE = ("nome", "cpf", "data_nascimento", "endereco", "telefone", "email")
+CAMPOS_SEGURO = ("tipo_seguro", "valor_cobertura", "data_inicio", "data_fim")
+CAMPOS_POR_TIPO = {
+    "Automóvel": ("marca", "modelo", "ano", "placa", "estado_conservacao", "uso_veiculo", "num_condutores"),
+    "Residencial": ("endereco_imovel", "area", "valor_venal", "tipo_construcao"),
+    "Vida": ("beneficiarios", "tipos_cobertura")
+}
+# Nomes alternativos aceitos no cabeçalho
+SINONIMOS = {"tipo": "tipo_seguro", "data_nasc": "data_nascimento"}
+
+TAMANHO_LOTE = 1000 # Linhas enviadas de uma vez a cada processo
+
+def _texto(valor):
+    """Converte o valor de uma célula para o texto usado no sistema (datas como dd/mm/aaaa)"""
+    if valor is None:
+        return ""
+    if isinstance(valor, (datetime, date)):
+        return valor.strftime("%d/%m/%Y")
+    if isinstance(valor, float) and valor.is_integer():
+        valor = int(valor)
+    return str(valor).strip()
+
+def _normalizar_cabecalho(cabecalho):
+    nomes = []
+    for nome in cabecalho:
+        nome = _texto(nome).lower().replace(" ", "_")
+        nomes.append(SINONIMOS.get(nome, nome))
+    return nomes
+
+def _ler_csv(caminho):
+    with open(caminho, "r", encoding="utf-8-sig", newline="") as f:
+        # O separador é o mais frequente no cabeçalho (planilhas em português costumam exportar com ';')
+        primeira_linha = f.readline()
+        f.seek(0)
+        separador = max(",;\t", key=primeira_linha.count)
+        leitor = csv.reader(f, delimiter=separador)
+        cabecalho = _normalizar_cabecalho(next(leitor, []))
+        for numero_linha, valores in enumerate(leitor, 2):
+            if any(v.strip() for v in valores):
+                yield numero_linha, dict(zip(cabecalho, (v.strip() for v in valores)))
+
+def _ler_xlsx(caminho):
+    from openpyxl import load_workbook # Dependência opcional, necessária apenas para planilhas
+    planilha = load_workbook(caminho, read_only=True, data_only=True)
+    try:
+        linhas = planilha.active.iter_rows(values_only=True)
+        cabecalho = _normalizar_cabecalho(next(linhas, ()))
+        for numero_linha, valores in enumerate(linhas, 2):
+            textos = [_texto(v) for v in valores]
+            if any(textos):
+                yield numero_linha, dict(zip(cabecalho, textos))
+    finally:
+        planilha.close()
+
+def ler_linhas(caminho):
+    """Percorre o arquivo em fluxo, retornando (número da linha, {coluna: texto})"""
+    extensao = os.path.splitext(caminho)[1].lower()
+    if extensao == ".csv":
+        return _ler_csv(caminho)
+    if extensao in (".xlsx", ".xlsm"):
+        return _ler_xlsx(caminho)
+    raise ValueError(f"Formato de arquivo não suportado: {extensao} (use .csv ou .xlsx)")
+
+def _numero(dados, campo, motivos, conversor=float):
+    texto = dados.get(campo, "")
+    if conversor is float:
+        texto = texto.replace(",", ".") # Aceita vírgula decimal
+    try:
+        valor = conversor(texto)
+    except ValueError:
+        motivos.append(f"{campo} deve ser um número")
+        return None
+    if valor <= 0:
+        motivos.append(f"{campo} deve ser positivo")
+        return None
+    return valor
+
+def _lista(texto):
+    return [item.strip() for item in texto.split(";") if item.strip()]
+
+def validar_linha(dados):
+    """Valida uma linha do arquivo. Retorna (registro normalizado ou None, lista de motivos da rejeição)."""
+    motivos = []
+    tipo = dados.get("tipo_seguro", "")
+    obrigatorios = CAMPOS_CLIENTE + CAMPOS_SEGURO + CAMPOS_POR_TIPO.get(tipo, ())
+    for campo in obrigatorios:
+        if not dados.get(campo):
+            motivos.append(f"{campo} é obrigatório")
+    if tipo and tipo not in CAMPOS_POR_TIPO:
+        motivos.append(f"tipo_seguro '{tipo}' desconhecido (use {', '.join(CAMPOS_POR_TIPO)})")
+    if motivos:
+        return None, motivos
+
+    cliente = Cliente(dados["nome"], dados["cpf"], dados["data_nascimento"], dados["endereco"], dados["telefone"], dados["email"])
+    if len(cliente.cpf) != 11 or not cliente.validar_cpf():
+        motivos.append(f"CPF {dados['cpf']} é inválido")
+    if not cliente.validar_email():
+        motivos.append(f"Email '{dados['email']}' é inválido")
+    # Os validadores imprimem o motivo do erro; a mensagem é capturada para o relatório de rejeições
+    saida = io.StringIO()
+    with contextlib.redirect_stdout(saida):
+        data_nascimento_valida = cliente.validar_data_nascimento()
+    if not data_nascimento_valida:
+        motivos.append(saida.getvalue().strip().removeprefix("Erro: ") or "data_nascimento inválida")
+
+    valor_cobertura = _numero(dados, "valor_cobertura", motivos)
+    if tipo == "Automóvel":
+        num_condutores = _numero(dados, "num_condutores", motivos, int)
+        seguro = SeguroAutomovel(None, valor_cobertura, dados["data_inicio"], dados["data_fim"], dados["marca"], dados["modelo"],
+                                 dados["ano"], dados["placa"], dados["estado_conservacao"], dados["uso_veiculo"], num_condutores)
+    elif tipo == "Residencial":
+        area = _numero(dados, "area", motivos)
+        valor_venal = _numero(dados, "valor_venal", motivos)
+        seguro = SeguroResidencial(None, valor_cobertura, dados["data_inicio"], dados["data_fim"], dados["endereco_imovel"],
+                                   area, valor_venal, dados["tipo_construcao"])
+    else:
+        seguro = SeguroVida(None, valor_cobertura, dados["data_inicio"], dados["data_fim"],
+                            _lista(dados["beneficiarios"]), _lista(dados["tipos_cobertura"]))
+        if not seguro.beneficiarios or not seguro.tipos_cobertura:
+            motivos.append("beneficiarios e tipos_cobertura são obrigatórios")
+    if not seguro.validar_datas():
+        motivos.append(f"Datas do seguro inválidas ({dados['data_inicio']} - {dados['data_fim']})")
+
+    if motivos:
+        return None, motivos
+    return {"cliente": cliente.to_dict(), "seguro": seguro.to_dict()}, []
+
+def _validar_lote(lote):
+    """Executado nos processos: valida uma lista de (numero_linha, dados)"""
+    resultados = []
+    for numero_linha, dados in lote:
+        registro, motivos = validar_linha(dados)
+        resultados.append((numero_linha, registro, motivos))
+    return resultados
+
+def _lotes(linhas, tamanho):
+    lote = []
+    for linha in linhas:
+        lote.append(linha)
+        if len(lote) >= tamanho:
+            yield lote
+            lote = []
+    if lote:
+        yield lote
+
+def validar_arquivo(caminho, processos=None, tamanho_lote=TAMANHO_LOTE):
+    """Lê e valida o arquivo, retornando (numero_linha, registro ou None, motivos) na ordem do arquivo.
+
+    A leitura é em fluxo: no máximo 2 lotes por processo ficam em memória aguardando validação.
+    Com processos=1 (ou arquivos de um único lote) a validação é feita no próprio processo."""
+    lotes = _lotes(ler_linhas(caminho), tamanho_lote)
+    primeiros = list(islice(lotes, 2))
+    if len(primeiros) < 2 or processos == 1:
+        for lote in chain(primeiros, lotes):
+            yield from _validar_lote(lote)
+        return
+
+    janela = 2 * (processos or os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=processos) as executor:
+        pendentes = deque()
+        for lote in chain(primeiros, lotes):
+            if len(pendentes) >= janela:
+                yield from pendentes.popleft().result()
+            pendentes.append(executor.submit(_validar_lote, lote))
+        while pendentes:
+            yield from pendentes.popleft().result()
+
+
+if __name__ == "__main__":
+    import argparse
+    import sys
+    from auth import UsuarioManager
+    from sistema import SistemaSeguros
+    parser = argparse.ArgumentParser(description="Importa uma carteira de clientes e seguros (CSV ou XLSX) para o sistema.")
+    parser.add_argument("arquivo", help="Arquivo .csv ou .xlsx com uma apólice por linha")
+    parser.add_argument("--processos", type=int, default=None, help="Processos usados na validação (padrão: número de CPUs)")
+    parser.add_argument("--criar-usuarios", action="store_true", help="Cria um usuário (login = CPF) para cada cliente novo")
+    args = parser.parse_args()
+    sistema = SistemaSeguros()
+    resultado = sistema.importar_arquivo(args.arquivo, UsuarioManager() if args.criar_usuarios else None, args.processos)
+    if resultado is None:
+        sys.exit(1)
+    print(f"{resultado['aceitas']} linhas importadas, {len(resultado['rejeitadas'])} rejeitadas.")
+    for numero_linha, motivos in resultado["rejeitadas"]:
+        print(f"  linha {numero_linha}: {'; '.join(motivos)}")
+    if resultado["usuarios_recusados"]:
+        print(f"{len(resultado['usuarios_recusados'])} usuários não criados.")
+    for login, motivo in resultado["usuarios_recusados"]:
+        print(f"  usuário {login}: {motivo}")
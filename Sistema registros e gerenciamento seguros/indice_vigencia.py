@@ -0,0 +1,165 @@
+from bisect import bisect_right
+from datetime import date, datetime
+from utils import converter_data
+
+def data_para_ordinal(valor):
+    """Converte date/datetime ou texto 'dd/mm/YYYY' (ou ISO 'YYYY-MM-DD') para o ordinal do dia.
+       Retorna None se o valor não for uma data válida."""
+    if isinstance(valor, datetime):
+        return valor.date().toordinal()
+    if isinstance(valor, date):
+        return valor.toordinal()
+    if not isinstance(valor, str):
+        return None
+    data = converter_data(valor.strip())
+    if data is not None:
+        return data.toordinal()
+    try:
+        return datetime.strptime(valor.strip(), "%Y-%m-%d").toordinal()
+    except ValueError:
+        return None
+
+
+class _NoIntervalo:
+    """Nó de uma árvore de intervalos centrada"""
+    __slots__ = ("centro", "por_inicio", "por_fim", "esquerda", "direita")
+
+    def __init__(self, centro, intervalos):
+        self.centro = centro
+        self.por_inicio = intervalos # (inicio, fim, chave) em ordem crescente de início
+        self.por_fim = sorted(intervalos, key=lambda intervalo: intervalo[1], reverse=True)
+        self.esquerda = None
+        self.direita = None
+
+
+def _construir_arvore(intervalos):
+    """Constrói a árvore a partir de intervalos ordenados por início. O(n log n)."""
+    if not intervalos:
+        return None
+    # O centro é o início do intervalo mediano, então esse intervalo sempre fica no nó
+    centro = intervalos[len(intervalos) // 2][0]
+    esquerda, no, direita = [], [], []
+    for intervalo in intervalos:
+        if intervalo[1] < centro:
+            esquerda.append(intervalo)
+        elif intervalo[0] > centro:
+            direita.append(intervalo)
+        else:
+            no.append(intervalo)
+    raiz = _NoIntervalo(centro, no)
+    raiz.esquerda = _construir_arvore(esquerda)
+    raiz.direita = _construir_arvore(direita)
+    return raiz
+
+
+class IndiceVigencia:
+    """Índice de intervalos de vigência (início e fim inclusivos) para consultas por data.
+
+    Consultas "vigentes em uma data" e "vigentes em um período" custam O(log n + k).
+    Inclusões e alterações ficam fora da árvore (varridas linearmente) até a próxima
+    consulta em que elas passem de LIMITE_PENDENTES; nesse momento a árvore é reconstruída."""
+
+    LIMITE_PENDENTES = 256
+
+    def __init__(self):
+        self._raiz = None
+        self._inicios = []              # Inícios ordenados dos intervalos da árvore (consultas por período)
+        self._intervalos_por_inicio = []
+        self._na_arvore = {}            # chave -> (inicio, fim, chave) presentes na árvore
+        self._removidos = set()         # chaves da árvore cujo intervalo foi alterado ou removido
+        self._fora_da_arvore = {}       # chave -> (inicio, fim, chave) incluídos após a última reconstrução
+        self._pendentes = {}            # chave -> (inicio, fim) com datas ainda não convertidas
+
+    def __len__(self):
+        return len(self._na_arvore) - len(self._removidos) + len(self._fora_da_arvore) + len(self._pendentes)
+
+    def adicionar(self, chave, inicio, fim):
+        """Inclui ou substitui o intervalo da chave. As datas só são convertidas na próxima consulta."""
+        if chave in self._na_arvore:
+            self._removidos.add(chave)
+        self._fora_da_arvore.pop(chave, None)
+        self._pendentes[chave] = (inicio, fim)
+
+    def remover(self, chave):
+        if chave in self._na_arvore:
+            self._removidos.add(chave)
+        self._fora_da_arvore.pop(chave, None)
+        self._pendentes.pop(chave, None)
+
+    def _converter_pendentes(self):
+        for chave, (inicio, fim) in self._pendentes.items():
+            inicio_ord, fim_ord = data_para_ordinal(inicio), data_para_ordinal(fim)
+            if inicio_ord is None or fim_ord is None or fim_ord < inicio_ord:
+                print(f"Aviso: vigência inválida ({inicio} - {fim}) para {chave}; não indexada.")
+                continue
+            self._fora_da_arvore[chave] = (inicio_ord, fim_ord, chave)
+        self._pendentes.clear()
+
+    def _preparar(self):
+        """Converte as datas pendentes e reconstrói a árvore se houver alterações demais fora dela"""
+        self._converter_pendentes()
+        if len(self._fora_da_arvore) + len(self._removidos) > self.LIMITE_PENDENTES:
+            self.reconstruir()
+
+    def reconstruir(self):
+        """Reconstrói a árvore com todos os intervalos atuais. O(n log n)."""
+        self._converter_pendentes()
+        intervalos = [intervalo for chave, intervalo in self._na_arvore.items() if chave not in self._removidos]
+        intervalos.extend(self._fora_da_arvore.values())
+        intervalos.sort()
+        self._raiz = _construir_arvore(intervalos)
+        self._intervalos_por_inicio = intervalos
+        self._inicios = [intervalo[0] for intervalo in intervalos]
+        self._na_arvore = {intervalo[2]: intervalo for intervalo in intervalos}
+        self._removidos.clear()
+        self._fora_da_arvore.clear()
+
+    def vigentes_em(self, data):
+        """Retorna as chaves cujos intervalos contêm a data"""
+        ponto = data_para_ordinal(data)
+        if ponto is None:
+            raise ValueError(f"Data inválida: {data}")
+        self._preparar()
+        return self._contendo(ponto)
+
+    def _contendo(self, ponto):
+        encontrados = []
+        no = self._raiz
+        while no is not None:
+            if ponto < no.centro:
+                for intervalo in no.por_inicio:
+                    if intervalo[0] > ponto:
+                        break
+                    encontrados.append(intervalo[2])
+                no = no.esquerda
+            elif ponto > no.centro:
+                for intervalo in no.por_fim:
+                    if intervalo[1] < ponto:
+                        break
+                    encontrados.append(intervalo[2])
+                no = no.direita
+            else:
+                encontrados.extend(intervalo[2] for intervalo in no.por_inicio)
+                break
+        if self._removidos:
+            encontrados = [chave for chave in encontrados if chave not in self._removidos]
+        encontrados.extend(c for (i, f, c) in self._fora_da_arvore.values() if i <= ponto <= f)
+        return encontrados
+
+    def vigentes_entre(self, inicio, fim):
+        """Retorna as chaves cujos intervalos se sobrepõem ao período [inicio, fim]"""
+        inicio_ord, fim_ord = data_para_ordinal(inicio), data_para_ordinal(fim)
+        if inicio_ord is None or fim_ord is None:
+            raise ValueError(f"Período inválido: {inicio} - {fim}")
+        if fim_ord < inicio_ord:
+            return []
+        # Sobrepõem o período os que contêm o início mais os que começam depois dele e até o fim
+        self._preparar()
+        encontrados = self._contendo(inicio_ord)
+        primeiro = bisect_right(self._inicios, inicio_ord)
+        ultimo = bisect_right(self._inicios, fim_ord)
+        for intervalo in self._intervalos_por_inicio[primeiro:ultimo]:
+            if intervalo[2] not in self._removidos:
+                encontrados.append(intervalo[2])
+        encontrados.extend(c for (i, f, c) in self._fora_da_arvore.values() if inicio_ord < i <= fim_ord)
+        return encontrados
@@ -0,0 +1,95 @@
+import json
+import os
+import threading
+
+class JournalAlteracoes:
+    """Journal de alterações (append-only) usado no lugar de reescrever os arquivos JSON a cada mutação.
+
+    Cada alteração vira uma única linha compacta no arquivo do journal. Periodicamente o dono do
+    journal faz um checkpoint (grava os arquivos JSON completos) e chama limpar().
+
+    Para checkpoints em segundo plano: selar() separa as alterações registradas até agora em
+    <arquivo>.selado (novas alterações seguem para o journal vazio) e, depois que os arquivos JSON
+    tiverem sido gravados, descartar_selado() remove essa parte. Se o programa terminar antes, as
+    alterações seladas continuam sendo lidas por ler_alteracoes(), antes das demais."""
+
+    def __init__(self, arquivo, sincronizar=False):
+        self.arquivo = arquivo
+        self.sincronizar = sincronizar # Se True, força fsync a cada registro (mais lento, mais durável)
+        self.arquivo_selado = f"{arquivo}.selado"
+        self.selagens = 0 # Quantas vezes o journal foi selado (ver descartar_selado)
+        self._trava = threading.Lock() # selar() e descartar_selado() podem ser chamados de threads diferentes
+        self.total_registros = 0
+        if os.path.exists(self.arquivo):
+            # Conta as entradas pendentes de um journal anterior (ainda não incorporadas por checkpoint)
+            with open(self.arquivo, "r", encoding="utf-8") as f:
+                self.total_registros = sum(1 for linha in f if linha.strip())
+
+    @property
+    def tem_selado(self):
+        """Há alterações seladas ainda não descartadas (checkpoint em andamento ou interrompido)"""
+        return os.path.exists(self.arquivo_selado)
+
+    def registrar(self, colecao, chave, dados, operacao="upsert"):
+        """Acrescenta uma alteração ao final do journal. Retorna os bytes gravados."""
+        linha = json.dumps({"op": operacao, "c": colecao, "k": chave, "d": dados},
+                           ensure_ascii=False, separators=(",", ":")) + "\n"
+        with open(self.arquivo, "a", encoding="utf-8") as f:
+            f.write(linha)
+            if self.sincronizar:
+                f.flush()
+                os.fsync(f.fileno())
+        self.total_registros += 1
+        return len(linha.encode("utf-8"))
+
+    def ler_alteracoes(self):
+        """Percorre as alterações registradas, na ordem em que foram gravadas.
+           Retorna tuplas (operacao, colecao, chave, dados)."""
+        for arquivo in (self.arquivo_selado, self.arquivo): # As seladas são as mais antigas
+            if not os.path.exists(arquivo):
+                continue
+            with open(arquivo, "r", encoding="utf-8") as f:
+                for numero_linha, linha in enumerate(f, 1):
+                    if not linha.strip():
+                        continue
+                    try:
+                        entrada = json.loads(linha)
+                    except json.JSONDecodeError:
+                        # Uma linha truncada (queda durante a escrita) só pode ser a última; é descartada.
+                        print(f"Aviso: linha {numero_linha} do journal {arquivo} está corrompida e foi ignorada.")
+                        continue
+                    yield entrada.get("op", "upsert"), entrada["c"], entrada["k"], entrada.get("d")
+
+    def limpar(self):
+        """Descarta as alterações já incorporadas aos arquivos JSON (após um checkpoint)"""
+        with self._trava:
+            with open(self.arquivo, "w", encoding="utf-8"):
+                pass
+            if os.path.exists(self.arquivo_selado):
+                os.remove(self.arquivo_selado)
+            self.total_registros = 0
+
+    def selar(self):
+        """Separa as alterações registradas até agora (acrescentadas às de uma selagem anterior ainda não
+           descartada) e esvazia o journal. Retorna o número da selagem, a ser passado a descartar_selado()."""
+        with self._trava:
+            if os.path.exists(self.arquivo):
+                if os.path.exists(self.arquivo_selado):
+                    with open(self.arquivo, "r", encoding="utf-8") as origem, \
+                         open(self.arquivo_selado, "a", encoding="utf-8") as destino:
+                        destino.write(origem.read())
+                    with open(self.arquivo, "w", encoding="utf-8"):
+                        pass
+                else:
+                    os.replace(self.arquivo, self.arquivo_selado)
+            self.total_registros = 0
+            self.selagens += 1
+            return self.selagens
+
+    def descartar_selado(self, selagem):
+        """Remove as alterações seladas, já incorporadas aos arquivos JSON. Não faz nada se o journal foi
+           selado de novo depois da selagem informada: a parte selada inclui alterações mais recentes, que
+           serão descartadas pelo checkpoint correspondente."""
+        with self._trava:
+            if selagem == self.selagens and os.path.exists(self.arquivo_selado):
+                os.remove(self.arquivo_selado)
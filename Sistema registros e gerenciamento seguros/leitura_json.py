@@ -0,0 +1,77 @@
+"""Leitura incremental de arquivos JSON cujo conteúdo é uma lista (formato dos arquivos de dados).
+
+json.load mantém em memória, ao mesmo tempo, o texto inteiro do arquivo e todos os dicionários da lista.
+iterar_lista_json lê o arquivo em blocos e devolve um elemento por vez (JSONDecoder.raw_decode): quem
+consome pode convertê-lo (ex.: em objeto do modelo) e descartar o dicionário antes do próximo, e do texto
+só fica em memória o bloco em leitura."""
+import json
+import re
+
+TAMANHO_BLOCO = 1 << 16 # Caracteres lidos por vez
+
+_decodificador = json.JSONDecoder()
+_ESPACOS = re.compile(r"[ \t\n\r]*")
+
+def iterar_lista_json(caminho, tamanho_bloco=TAMANHO_BLOCO):
+    """Percorre os elementos da lista JSON gravada em caminho, na ordem do arquivo.
+       Conteúdo inválido (ou que não seja uma lista) levanta json.JSONDecodeError, como json.load."""
+    with open(caminho, "r", encoding="utf-8") as f:
+        buffer = f.read(tamanho_bloco)
+        fim_arquivo = not buffer
+        posicao = 0
+
+        def ler_mais(minimo):
+            # Descarta o que já foi consumido e acrescenta pelo menos `minimo` caracteres (se houver)
+            nonlocal buffer, posicao, fim_arquivo
+            bloco = f.read(minimo)
+            if not bloco:
+                fim_arquivo = True
+                return False
+            buffer = buffer[posicao:] + bloco
+            posicao = 0
+            return True
+
+        def proximo_caractere():
+            # Pula os espaços e retorna o próximo caractere significativo ("" no fim do arquivo)
+            nonlocal posicao
+            while True:
+                posicao = _ESPACOS.match(buffer, posicao).end()
+                if posicao < len(buffer) or not ler_mais(tamanho_bloco):
+                    return buffer[posicao:posicao + 1]
+
+        if proximo_caractere() != "[":
+            raise json.JSONDecodeError("Esperada uma lista JSON", buffer, posicao)
+        posicao += 1
+        if proximo_caractere() == "]":
+            posicao += 1
+        else:
+            decodificar = _decodificador.raw_decode
+            pular_espacos = _ESPACOS.match
+            while True:
+                try:
+                    elemento, fim = decodificar(buffer, posicao)
+                    # Um número cortado pelo fim do bloco ("2." de "2.5") também é decodificado:
+                    # o elemento só vale se for seguido do separador
+                    seguinte = pular_espacos(buffer, fim).end()
+                    separador = buffer[seguinte:seguinte + 1]
+                    completo = separador == "," or separador == "]" or fim_arquivo
+                except json.JSONDecodeError:
+                    if fim_arquivo:
+                        raise
+                    completo = False
+                if not completo:
+                    # Elemento incompleto no bloco: lê mais (dobrando o buffer, para que elementos grandes
+                    # não sejam decodificados de novo a cada bloco)
+                    ler_mais(max(tamanho_bloco, len(buffer) - posicao))
+                    posicao = pular_espacos(buffer, posicao).end() # Os espaços podem continuar no novo bloco
+                    continue
+                yield elemento
+                if separador == ",":
+                    posicao = pular_espacos(buffer, seguinte + 1).end()
+                elif separador == "]":
+                    posicao = seguinte + 1
+                    break
+                else:
+                    raise json.JSONDecodeError("Esperado ',' ou ']'", buffer, seguinte)
+        if proximo_caractere() != "":
+            raise json.JSONDecodeError("Conteúdo após o fim da lista", buffer, posicao)
@@ -0,0 +1,247 @@
+import tkinter as tk
+from tkinter import ttk
+
+class ListaVirtual:
+    """Treeview que, com muitas linhas, materializa apenas as visíveis (mais uma pequena margem).
+
+    A lista exibe chaves (ex.: números de apólice) na ordem passada a definir_chaves(); os valores
+    de cada linha são obtidos sob demanda por obter_valores(chave), direto do modelo em memória.
+    Até LIMITE_LISTA_COMPLETA linhas todas são inseridas no Treeview (rolagem nativa). Acima disso
+    o Treeview mantém só os itens da janela visível, reaproveitados a cada rolagem, e a barra de
+    rolagem passa a ser controlada pela lista.
+
+    Alterações pontuais (inserir_linha, atualizar_linha, remover_linha) mexem apenas no item afetado,
+    localizado pelo mapa chave -> item do Treeview, sem reconstruir a lista."""
+
+    LIMITE_LISTA_COMPLETA = 1000
+    MARGEM = 5             # Linhas materializadas além das visíveis
+    LINHAS_POR_RODA = 3    # Linhas roladas por movimento da roda do mouse
+
+    def __init__(self, master, colunas, obter_valores, **opcoes_tree):
+        self.obter_valores = obter_valores
+        self.tree = ttk.Treeview(master, columns=colunas, show="headings", **opcoes_tree)
+        self.scrollbar = ttk.Scrollbar(master, orient=tk.VERTICAL, command=self.tree.yview)
+        self.tree.configure(yscrollcommand=self.scrollbar.set)
+
+        self._chaves = []            # Chaves na ordem de exibição
+        self._posicoes = {}          # chave -> posição em _chaves (None: recalcular quando necessário)
+        self._virtual = False
+        self._inicio = 0             # Posição da primeira linha exibida (modo virtual)
+        self._itens = []             # Itens do Treeview reaproveitados (modo virtual)
+        self._chave_por_item = {}
+        self._item_por_chave = {}    # Apenas das linhas materializadas
+        self._chave_selecionada = None
+
+        self.tree.bind("<<TreeviewSelect>>", self._ao_selecionar, add="+")
+        self.tree.bind("<Configure>", self._ao_redimensionar, add="+")
+        for sequencia in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.tree.bind(sequencia, self._ao_rolar_roda)
+        for tecla in ("<Up>", "<Down>", "<Prior>", "<Next>", "<Home>", "<End>"):
+            self.tree.bind(tecla, self._ao_pressionar_tecla)
+
+    def __len__(self):
+        return len(self._chaves)
+
+    @property
+    def chaves(self):
+        """Chaves na ordem de exibição (somente leitura: altere com os métodos da lista)"""
+        return self._chaves
+
+    @property
+    def virtual(self):
+        return self._virtual
+
+    def definir_chaves(self, chaves):
+        """Substitui todas as linhas exibidas pelas chaves informadas, nesta ordem"""
+        self._chaves = list(chaves)
+        self._posicoes = {chave: posicao for posicao, chave in enumerate(self._chaves)}
+        if self._chave_selecionada not in self._posicoes:
+            self._chave_selecionada = None
+        itens = self.tree.get_children()
+        if itens:
+            self.tree.delete(*itens)
+        self._itens = []
+        self._chave_por_item = {}
+        self._item_por_chave = {}
+        self._virtual = len(self._chaves) > self.LIMITE_LISTA_COMPLETA
+
+        if self._virtual:
+            self.tree.configure(yscrollcommand="")
+            self.scrollbar.configure(command=self._ao_mover_barra)
+            self._redesenhar()
+            return
+        self.tree.configure(yscrollcommand=self.scrollbar.set)
+        self.scrollbar.configure(command=self.tree.yview)
+        for chave in self._chaves:
+            item = self.tree.insert("", tk.END, values=self.obter_valores(chave))
+            self._chave_por_item[item] = chave
+            self._item_por_chave[chave] = item
+            if chave == self._chave_selecionada:
+                self.tree.selection_set(item)
+
+    def _posicao(self, chave):
+        if self._posicoes is None:
+            self._posicoes = {c: posicao for posicao, c in enumerate(self._chaves)}
+        return self._posicoes.get(chave)
+
+    def inserir_linha(self, chave, posicao=None):
+        """Acrescenta uma linha (ao final ou na posição informada) sem reconstruir a lista"""
+        if posicao is None or posicao >= len(self._chaves):
+            posicao = len(self._chaves)
+            if self._posicoes is not None:
+                self._posicoes[chave] = posicao
+        else:
+            self._posicoes = None
+        self._chaves.insert(posicao, chave)
+        if self._virtual:
+            # Só há trabalho no Treeview se a nova linha cair na janela materializada
+            if posicao < self._inicio + len(self._itens) or len(self._itens) < self._linhas_visiveis() + self.MARGEM:
+                self._redesenhar()
+            else:
+                self._atualizar_barra()
+            return
+        if len(self._chaves) > self.LIMITE_LISTA_COMPLETA:
+            self.definir_chaves(self._chaves) # Passa ao modo virtual
+            return
+        item = self.tree.insert("", posicao, values=self.obter_valores(chave))
+        self._chave_por_item[item] = chave
+        self._item_por_chave[chave] = item
+
+    def atualizar_linha(self, chave):
+        """Relê do modelo os valores de uma linha; linhas não materializadas não custam nada"""
+        item = self._item_por_chave.get(chave)
+        if item is not None:
+            self.tree.item(item, values=self.obter_valores(chave))
+
+    def remover_linha(self, chave, posicao=None):
+        """Remove a linha da chave (na posição informada, se já conhecida, sem procurá-la)"""
+        if posicao is None or posicao >= len(self._chaves) or self._chaves[posicao] != chave:
+            posicao = self._posicao(chave)
+        if posicao is None:
+            return
+        del self._chaves[posicao]
+        self._posicoes = None
+        if self._chave_selecionada == chave:
+            self._chave_selecionada = None
+        if self._virtual:
+            if posicao < self._inicio + len(self._itens):
+                self._redesenhar()
+            else:
+                self._atualizar_barra()
+            return
+        item = self._item_por_chave.pop(chave)
+        del self._chave_por_item[item]
+        self.tree.delete(item)
+
+    def atualizar(self):
+        """Relê do modelo os valores das linhas materializadas"""
+        if self._virtual:
+            self._redesenhar()
+            return
+        for item, chave in self._chave_por_item.items():
+            self.tree.item(item, values=self.obter_valores(chave))
+
+    def chave_selecionada(self):
+        """Chave da linha selecionada (continua válida mesmo que a linha tenha saído da área visível)"""
+        return self._chave_selecionada
+
+    def _ao_selecionar(self, event=None):
+        selecao = self.tree.selection()
+        # No modo virtual a seleção do Treeview é limpa quando a linha sai da área visível;
+        # a chave selecionada só muda quando o usuário seleciona outra linha.
+        if selecao and selecao[0] in self._chave_por_item:
+            self._chave_selecionada = self._chave_por_item[selecao[0]]
+
+    # --- Modo virtual ---
+
+    def _linhas_visiveis(self):
+        estilo = self.tree.cget("style") or "Treeview"
+        altura_linha = int(ttk.Style(self.tree).lookup(estilo, "rowheight") or 20)
+        # Desconta aproximadamente uma linha para o cabeçalho
+        return max(1, self.tree.winfo_height() // altura_linha - 1)
+
+    def _redesenhar(self):
+        total = len(self._chaves)
+        visiveis = self._linhas_visiveis()
+        self._inicio = max(0, min(self._inicio, total - visiveis))
+        quantidade = min(visiveis + self.MARGEM, total - self._inicio)
+
+        while len(self._itens) < quantidade:
+            self._itens.append(self.tree.insert("", tk.END))
+        while len(self._itens) > quantidade:
+            self.tree.delete(self._itens.pop())
+
+        self._chave_por_item = {}
+        self._item_por_chave = {}
+        item_selecionado = None
+        for deslocamento, item in enumerate(self._itens):
+            chave = self._chaves[self._inicio + deslocamento]
+            self.tree.item(item, values=self.obter_valores(chave))
+            self._chave_por_item[item] = chave
+            self._item_por_chave[chave] = item
+            if chave == self._chave_selecionada:
+                item_selecionado = item
+        if item_selecionado is not None:
+            self.tree.selection_set(item_selecionado)
+            self.tree.focus(item_selecionado)
+        elif self.tree.selection():
+            self.tree.selection_remove(self.tree.selection())
+        self.tree.yview_moveto(0)
+        self._atualizar_barra(visiveis)
+
+    def _atualizar_barra(self, visiveis=None):
+        total = len(self._chaves)
+        if not total:
+            self.scrollbar.set(0.0, 1.0)
+            return
+        visiveis = visiveis or self._linhas_visiveis()
+        self.scrollbar.set(self._inicio / total, min(1.0, (self._inicio + visiveis) / total))
+
+    def _rolar_para(self, inicio):
+        inicio = max(0, inicio)
+        if inicio != self._inicio:
+            self._inicio = inicio
+            self._redesenhar()
+
+    def _ao_redimensionar(self, event=None):
+        if self._virtual:
+            self._redesenhar()
+
+    def _ao_mover_barra(self, *args):
+        """Comando da barra de rolagem no modo virtual ('moveto' fração ou 'scroll' n units/pages)"""
+        if args[0] == "moveto":
+            self._rolar_para(int(float(args[1]) * len(self._chaves)))
+        elif args[0] == "scroll":
+            passo = self._linhas_visiveis() if args[2] == "pages" else 1
+            self._rolar_para(self._inicio + int(args[1]) * passo)
+
+    def _ao_rolar_roda(self, event):
+        if not self._virtual:
+            return None
+        para_cima = event.num == 4 or getattr(event, "delta", 0) > 0
+        self._rolar_para(self._inicio + (-1 if para_cima else 1) * self.LINHAS_POR_RODA)
+        return "break"
+
+    def _ao_pressionar_tecla(self, event):
+        if not self._virtual or not self._chaves:
+            return None
+        visiveis = self._linhas_visiveis()
+        atual = self._posicao(self._chave_selecionada)
+        if atual is None:
+            atual = self._inicio - 1
+        deslocamentos = {"Up": -1, "Down": 1, "Prior": -visiveis, "Next": visiveis}
+        if event.keysym == "Home":
+            nova = 0
+        elif event.keysym == "End":
+            nova = len(self._chaves) - 1
+        else:
+            nova = atual + deslocamentos[event.keysym]
+        nova = max(0, min(nova, len(self._chaves) - 1))
+        self._chave_selecionada = self._chaves[nova]
+        # Mantém a linha selecionada dentro da área visível
+        if nova < self._inicio:
+            self._inicio = nova
+        elif nova >= self._inicio + visiveis:
+            self._inicio = nova - visiveis + 1
+        self._redesenhar()
+        return "break"
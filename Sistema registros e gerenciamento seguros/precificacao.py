@@ -0,0 +1,96 @@
+"""Cálculo em lote dos prêmios da carteira, com um passe vetorizado (NumPy) por tipo de seguro.
+
+As fórmulas são as de calcular_premio() de cada classe em seguro.py, com as operações de ponto
+flutuante na mesma ordem e os mesmos campos numéricos aceitos (int e float, ver _numeros), de modo que os
+resultados, e os seguros recusados por dados inválidos, são idênticos aos do cálculo um a um.
+Sem NumPy instalado, os prêmios são calculados um a um pelos próprios seguros."""
+from seguro import SeguroAutomovel, SeguroResidencial, SeguroVida
+
+def _numeros(np, valores):
+    """Coluna float64 de um campo numérico. calcular_premio() opera diretamente sobre o campo, então só
+       int e float são aceitos: outro valor (ex.: texto "1500") levanta TypeError, como no cálculo um a um."""
+    valores = list(valores)
+    for valor in valores:
+        if not isinstance(valor, (int, float)):
+            raise TypeError(f"valor não numérico: {valor!r}")
+    return np.array(valores, dtype=np.float64)
+
+def _premios_automovel(np, seguros):
+    valor = _numeros(np, (s.valor_cobertura for s in seguros))
+    estado = np.array([SeguroAutomovel.MULTIPLICADORES_ESTADO.get(s.estado_conservacao, SeguroAutomovel.MULTIPLICADOR_ESTADO_PADRAO)
+                       for s in seguros], dtype=np.float64)
+    uso = np.array([SeguroAutomovel.MULTIPLICADORES_USO.get(s.uso_veiculo, SeguroAutomovel.MULTIPLICADOR_USO_PADRAO)
+                    for s in seguros], dtype=np.float64)
+    condutores = _numeros(np, (s.num_condutores for s in seguros))
+    comercial = np.array([s.uso_veiculo == "Comercial" for s in seguros], dtype=bool)
+
+    premio = valor * 0.05
+    premio = premio * estado
+    premio *= uso
+    premio *= 1 + (condutores - 1) * 0.1
+    return np.where(comercial, premio * 1.2, premio)
+
+def _premios_residencial(np, seguros):
+    valor = _numeros(np, (s.valor_cobertura for s in seguros))
+    construcao = np.array([SeguroResidencial.MULTIPLICADORES_CONSTRUCAO.get(s.tipo_construcao, SeguroResidencial.MULTIPLICADOR_CONSTRUCAO_PADRAO)
+                           for s in seguros], dtype=np.float64)
+    area = _numeros(np, (s.area for s in seguros))
+    madeira = np.array([s.tipo_construcao == "Madeira" for s in seguros], dtype=bool)
+
+    premio = valor * 0.02
+    fator_area = 1 + (area / 1000)
+    premio = premio * construcao
+    premio *= fator_area
+    return np.where(madeira, premio * 1.3, premio)
+
+def _premios_vida(np, seguros):
+    valor = _numeros(np, (s.valor_cobertura for s in seguros))
+    coberturas = np.array([len(s.tipos_cobertura) for s in seguros], dtype=np.float64)
+
+    premio = valor * 0.03
+    premio = premio * (1 + (coberturas * 0.1))
+    return premio * 1.1
+
+# Cálculo vetorizado de cada tipo; subclasses não listadas aqui usam o próprio calcular_premio()
+CALCULOS_VETORIZADOS = {
+    SeguroAutomovel: _premios_automovel,
+    SeguroResidencial: _premios_residencial,
+    SeguroVida: _premios_vida
+}
+
+def _calcular_um(seguro, premios):
+    try:
+        premios[seguro.id] = seguro.calcular_premio()
+    except (TypeError, ValueError, NotImplementedError) as e:
+        print(f"Aviso: prêmio do seguro {seguro.id} não calculado: {e}")
+
+def calcular_premios(seguros):
+    """Calcula o prêmio de todos os seguros informados. Retorna {id do seguro: prêmio}.
+       Seguros com dados inválidos (ex.: valor não numérico) ficam fora do resultado."""
+    try:
+        import numpy as np
+    except ImportError:
+        print("Aviso: NumPy não está instalado; os prêmios serão calculados um a um.")
+        np = None
+
+    premios = {}
+    por_tipo = {cls: [] for cls in CALCULOS_VETORIZADOS}
+    for seguro in seguros:
+        lista = por_tipo.get(type(seguro))
+        if np is None or lista is None:
+            _calcular_um(seguro, premios)
+        else:
+            lista.append(seguro)
+
+    for cls, lista in por_tipo.items():
+        if not lista:
+            continue
+        try:
+            valores = CALCULOS_VETORIZADOS[cls](np, lista)
+        except (TypeError, ValueError):
+            # Algum registro com dado inválido: refaz o tipo um a um para isolar os registros com erro
+            for seguro in lista:
+                _calcular_um(seguro, premios)
+            continue
+        premios.update(zip((s.id for s in lista), valores.tolist()))
+    return premios
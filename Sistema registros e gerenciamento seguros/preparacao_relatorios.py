@@ -0,0 +1,220 @@
+"""Relatórios sem interface: dados de entrada, linhas das tabelas e gráficos (Matplotlib/Agg).
+
+As funções de entrada extraem do repositório os dados de cada relatório, a partir dos totais já agregados
+(ver agregados.py). As demais recebem somente esses dados simples e não usam Tk nem pyplot: os gráficos são
+matplotlib.figure.Figure desenhadas pelo backend Agg. Por isso podem ser executadas em outros processos
+(a janela de relatórios e gerar_relatorios.py usam um ProcessPoolExecutor) ou em servidores sem tela.
+Cada processo mantém uma única figura por relatório, limpa e redesenhada a cada preparação: atualizar
+os relatórios repetidas vezes não acumula figuras (sem pyplot, nenhuma figura fica registrada globalmente).
+
+Cada preparar_*() retorna {"linhas": [valores de cada linha da tabela], "png": bytes do gráfico ou None}."""
+import csv
+import io
+import os
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+TIPOS_SEGURO = ("Automóvel", "Residencial", "Vida")
+STATUS_SINISTRO = ("Em Análise", "Aprovado", "Negado")
+TOP_GRAFICO = 20 # Clientes exibidos no gráfico de valor segurado (os de maior valor)
+TOP_RANKING = 10 # Clientes exibidos no gráfico do ranking
+COR_PRIMARIA = "#007bff"
+
+_figuras = {} # Nome do relatório -> figura reaproveitada neste processo
+
+def _figura(nome, tamanho):
+    """Figura do relatório, criada na primeira preparação e limpa nas seguintes"""
+    figura = _figuras.get(nome)
+    if figura is None:
+        figura = _figuras[nome] = Figure(figsize=tamanho)
+        FigureCanvasAgg(figura)
+    else:
+        figura.clear()
+    return figura
+
+def rasterizar(figura):
+    """PNG da figura, desenhado pelo backend Agg"""
+    buffer = io.BytesIO()
+    figura.canvas.print_png(buffer)
+    return buffer.getvalue()
+
+# --- Entradas: dados de cada relatório a partir do repositório ---
+
+def nomes_clientes(repositorio, cpfs):
+    """Nome de cada CPF (busca no índice do repositório); mostra o CPF se o nome não for encontrado"""
+    clientes = repositorio.clientes_por_cpf
+    nomes = []
+    for cpf in cpfs:
+        cliente = clientes.get(cpf)
+        nome = cliente.get("nome") if cliente else None
+        nomes.append(nome or f"Cliente (CPF: {cpf})")
+    return nomes
+
+def entrada_valor_segurado(repositorio):
+    # Valores por CPF já somados pelo repositório (agregados mantidos a cada alteração)
+    valores = repositorio.agregados().valor_por_cpf()
+    return (list(zip(nomes_clientes(repositorio, valores), valores.values())),)
+
+def entrada_apolices_tipo(repositorio):
+    return (dict(repositorio.agregados().apolices_por_tipo),)
+
+def entrada_sinistros(repositorio):
+    agregados = repositorio.agregados()
+    return (dict(agregados.sinistros_por_status), agregados.total_sinistros)
+
+def entrada_ranking(repositorio):
+    apolices_por_cpf = {cpf: qtd for cpf, qtd in repositorio.agregados().apolices_por_cpf.items() if cpf}
+    return (list(zip(nomes_clientes(repositorio, apolices_por_cpf), apolices_por_cpf.values())),)
+
+# --- Dados das tabelas ---
+
+def contagem_por_tipo(apolices_por_tipo):
+    return {tipo: apolices_por_tipo.get(tipo, 0) for tipo in TIPOS_SEGURO}
+
+def contagem_por_status(sinistros_por_status):
+    return {status: sinistros_por_status.get(status, 0) for status in STATUS_SINISTRO}
+
+def ordenar_ranking(apolices_por_cliente):
+    """(nome, quantidade) do cliente com mais apólices para o com menos; empates mantêm a ordem recebida"""
+    return sorted(apolices_por_cliente, key=lambda x: x[1], reverse=True)
+
+def linhas_valor_segurado(valores_por_cliente):
+    return [(nome, round(valor, 2)) for nome, valor in valores_por_cliente]
+
+def linhas_apolices_tipo(apolices_por_tipo):
+    contagem = contagem_por_tipo(apolices_por_tipo)
+    return list(contagem.items()) if any(contagem.values()) else []
+
+def linhas_sinistros(sinistros_por_status, total_sinistros):
+    """Status, quantidade e percentual sobre o total de sinistros"""
+    if total_sinistros <= 0:
+        return []
+    return [(status, qtd, f"{qtd / total_sinistros * 100:.1f}%") for status, qtd in contagem_por_status(sinistros_por_status).items()]
+
+def linhas_ranking(apolices_por_cliente):
+    return [(f"{i}º", cliente, qtd) for i, (cliente, qtd) in enumerate(ordenar_ranking(apolices_por_cliente), 1)]
+
+# --- Figuras (None quando não há dados) ---
+
+def figura_valor_segurado(valores_por_cliente):
+    if not valores_por_cliente:
+        return None
+    # Com muitos clientes o gráfico mostra os de maior valor (a tabela continua completa)
+    maiores = sorted(valores_por_cliente, key=lambda x: x[1], reverse=True)[:TOP_GRAFICO]
+    titulo = "Valor Total Segurado por Cliente"
+    if len(valores_por_cliente) > TOP_GRAFICO:
+        titulo += f" (Top {TOP_GRAFICO})"
+    figura = _figura("valor_segurado", (8, 5))
+    ax = figura.add_subplot()
+    # Barras por posição: clientes homônimos (CPFs diferentes) continuam em barras separadas
+    ax.bar(range(len(maiores)), [valor for _, valor in maiores], color=COR_PRIMARIA)
+    ax.set_xticks(range(len(maiores)))
+    ax.set_xticklabels([nome for nome, _ in maiores], rotation=45, ha="right", fontsize=9)
+    ax.tick_params(axis="y", labelsize=9)
+    ax.set_title(titulo, fontsize=12)
+    ax.set_xlabel("Clientes", fontsize=10)
+    ax.set_ylabel("Valor (R$)", fontsize=10)
+    figura.tight_layout()
+    return figura
+
+def figura_apolices_tipo(apolices_por_tipo):
+    contagem = contagem_por_tipo(apolices_por_tipo)
+    if not any(contagem.values()):
+        return None
+    figura = _figura("apolices_tipo", (6, 5.5))
+    ax = figura.add_subplot()
+    cores_pizza = ['#007bff', '#17a2b8', '#28a745'] # Azul, Ciano, Verde
+    ax.pie(list(contagem.values()), labels=list(contagem.keys()), autopct='%1.1f%%', startangle=90,
+           colors=cores_pizza, textprops={'fontsize': 10})
+    ax.set_title("Distribuição de Apólices por Tipo", fontsize=12)
+    figura.tight_layout()
+    return figura
+
+def figura_sinistros(sinistros_por_status, total_sinistros):
+    contagem = contagem_por_status(sinistros_por_status)
+    if total_sinistros <= 0 or not any(contagem.values()):
+        return None
+    figura = _figura("sinistros", (6, 5))
+    ax = figura.add_subplot()
+    ax.bar(list(contagem.keys()), list(contagem.values()), color=COR_PRIMARIA)
+    ax.set_title("Quantidade de Sinistros por Status", fontsize=12)
+    ax.set_xlabel("Status", fontsize=10)
+    ax.set_ylabel("Quantidade", fontsize=10)
+    ax.tick_params(labelsize=9)
+    figura.tight_layout()
+    return figura
+
+def figura_ranking(apolices_por_cliente, ranking_ordenado=None):
+    if not apolices_por_cliente:
+        return None
+    if ranking_ordenado is None:
+        ranking_ordenado = ordenar_ranking(apolices_por_cliente)
+    top_n = ranking_ordenado[:TOP_RANKING][::-1] # Invertido para o barh (maior no topo)
+    figura = _figura("ranking", (8, 5))
+    ax = figura.add_subplot()
+    ax.barh(range(len(top_n)), [qtd for _, qtd in top_n], color=COR_PRIMARIA)
+    ax.set_yticks(range(len(top_n)))
+    ax.set_yticklabels([nome for nome, _ in top_n], fontsize=9)
+    ax.tick_params(axis="x", labelsize=9)
+    ax.set_title(f"Top {len(top_n)} Clientes por Número de Apólices", fontsize=12)
+    ax.set_xlabel("Quantidade de Apólices", fontsize=10)
+    figura.tight_layout()
+    return figura
+
+# --- Relatórios para a janela (tabela formatada + PNG) ---
+
+def _resultado(linhas, figura):
+    return {"linhas": linhas, "png": rasterizar(figura) if figura is not None else None}
+
+def preparar_valor_segurado(valores_por_cliente):
+    """valores_por_cliente: lista de (nome do cliente, valor total segurado)"""
+    linhas = [(nome, f"R$ {valor:,.2f}") for nome, valor in valores_por_cliente]
+    return _resultado(linhas, figura_valor_segurado(valores_por_cliente))
+
+def preparar_apolices_tipo(apolices_por_tipo):
+    """apolices_por_tipo: {tipo_seguro: quantidade}; o relatório mostra os tipos de TIPOS_SEGURO"""
+    return _resultado(linhas_apolices_tipo(apolices_por_tipo), figura_apolices_tipo(apolices_por_tipo))
+
+def preparar_sinistros(sinistros_por_status, total_sinistros):
+    """sinistros_por_status: {status_sinistro: quantidade}; o percentual é sobre o total de sinistros"""
+    return _resultado(linhas_sinistros(sinistros_por_status, total_sinistros),
+                      figura_sinistros(sinistros_por_status, total_sinistros))
+
+def preparar_ranking(apolices_por_cliente):
+    """apolices_por_cliente: lista de (nome do cliente, quantidade de apólices)"""
+    ranking_ordenado = ordenar_ranking(apolices_por_cliente)
+    linhas = [(f"{i}º", cliente, qtd) for i, (cliente, qtd) in enumerate(ranking_ordenado, 1)]
+    return _resultado(linhas, figura_ranking(apolices_por_cliente, ranking_ordenado))
+
+# --- Relatórios em arquivos (CSV e gráficos PNG/PDF) ---
+
+# Nome -> (cabeçalho da tabela, entrada, linhas, figura); linhas e figura recebem os dados retornados pela entrada
+RELATORIOS = {
+    "valor_segurado": (("Cliente", "Valor Total Segurado"), entrada_valor_segurado, linhas_valor_segurado, figura_valor_segurado),
+    "apolices_tipo": (("Tipo de Seguro", "Quantidade"), entrada_apolices_tipo, linhas_apolices_tipo, figura_apolices_tipo),
+    "sinistros": (("Status", "Quantidade", "Percentual"), entrada_sinistros, linhas_sinistros, figura_sinistros),
+    "ranking_clientes": (("Posição", "Cliente", "Quantidade de Apólices"), entrada_ranking, linhas_ranking, figura_ranking)
+}
+FORMATOS = ("csv", "png", "pdf")
+
+def gerar_arquivos(nome, dados, diretorio, formatos=FORMATOS):
+    """Grava os arquivos do relatório (<diretorio>/<nome>.csv/.png/.pdf). Retorna os caminhos gravados.
+       O gráfico não é gerado quando não há dados."""
+    cabecalho, _, funcao_linhas, funcao_figura = RELATORIOS[nome]
+    caminhos = []
+    if "csv" in formatos:
+        caminho = os.path.join(diretorio, f"{nome}.csv")
+        # ';' e BOM: o formato que planilhas em português abrem direto
+        with open(caminho, "w", encoding="utf-8-sig", newline="") as f:
+            escritor = csv.writer(f, delimiter=";")
+            escritor.writerow(cabecalho)
+            escritor.writerows(funcao_linhas(*dados))
+        caminhos.append(caminho)
+    formatos_grafico = [formato for formato in formatos if formato != "csv"]
+    figura = funcao_figura(*dados) if formatos_grafico else None
+    if figura is not None:
+        for formato in formatos_grafico:
+            caminho = os.path.join(diretorio, f"{nome}.{formato}")
+            figura.savefig(caminho, format=formato)
+            caminhos.append(caminho)
+    return caminhos
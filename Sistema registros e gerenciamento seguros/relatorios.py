@@ -1,76 +1,100 @@
 import tkinter as tk
 from tkinter import ttk
-import json
 from datetime import datetime
 import pandas as pd
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+import base64
+import os
+from concurrent.futures import ProcessPoolExecutor
 from tkinter import messagebox
+from repositorio import RepositorioDados
+import preparacao_relatorios
+
+_executor = None
+
+def _obter_executor():
+    """Processos que preparam os relatórios, criados na primeira janela e reaproveitados nas seguintes"""
+    global _executor
+    if _executor is None:
+        _executor = ProcessPoolExecutor(max_workers=min(RelatoriosWindow.ABAS, os.cpu_count() or 1))
+    return _executor
+
+class _AbaRelatorio:
+    """Estado de uma aba: widgets próprios (reaproveitados a cada atualização) e a preparação em andamento"""
+
+    def __init__(self, tree, graph_frame, progresso, barra, label_grafico, preparacao, linha_sem_dados, texto_sem_grafico):
+        self.tree = tree
+        self.graph_frame = graph_frame
+        self.progresso = progresso
+        self.barra = barra
+        self.label_grafico = label_grafico
+        self.preparacao = preparacao # () -> (função de preparacao_relatorios, argumentos), com os totais atuais
+        self.linha_sem_dados = linha_sem_dados
+        self.texto_sem_grafico = texto_sem_grafico
+        self.imagem = None     # PhotoImage do gráfico, atualizada no lugar
+        self.itens = []        # Itens da tabela, reaproveitados na atualização
+        self.future = None     # Preparação em andamento
+        self.atualizada = False
+        self.geracao = 0       # Descarta o preenchimento em lotes de um resultado substituído
+
 
 class RelatoriosWindow:
-    def __init__(self, parent):
+    ABAS = 4 # Relatórios que podem ser preparados em paralelo, um por aba
+    INTERVALO_VERIFICACAO_MS = 100 # Intervalo entre as verificações dos relatórios em preparação
+    LINHAS_POR_LOTE = 1000 # Linhas preenchidas nas tabelas a cada passagem do loop do Tk
+
+    def __init__(self, parent, repositorio=None):
         self.window = tk.Toplevel(parent)
         self.window.title("Relatórios do Sistema")
         self.window.geometry("800x600")
         
-        # Carregar dados
+        # Carregar dados (do repositório da interface, já em memória)
+        self.repositorio = repositorio
         self.carregar_dados()
         
+        barra_acoes = ttk.Frame(self.window)
+        barra_acoes.pack(fill='x', padx=10, pady=(5, 0))
+        ttk.Button(barra_acoes, text="Atualizar", command=self.atualizar).pack(side=tk.RIGHT)
+
         # Criar notebook para abas
         self.notebook = ttk.Notebook(self.window)
         self.notebook.pack(fill='both', expand=True, padx=10, pady=5)
         
-        # Criar abas para cada tipo de relatório
+        # Criar abas para cada tipo de relatório. Os dados e gráficos de uma aba só são preparados quando ela
+        # é exibida pela primeira vez (ou atualizada), em outros processos; enquanto isso a aba mostra um
+        # indicador de progresso (ver _verificar_resultados)
+        self._abas = {} # widget da aba -> _AbaRelatorio
+        self._verificacao_agendada = False
         self.criar_aba_valor_segurado()
         self.criar_aba_apolices_tipo()
         self.criar_aba_sinistros()
         self.criar_aba_ranking_clientes()
+        self.notebook.bind("<<NotebookTabChanged>>", self._ao_selecionar_aba)
+        self._ao_selecionar_aba()
     
     def carregar_dados(self):
-        """Carrega os dados dos arquivos JSON necessários (apolices, clientes, sinistros)"""
-        self.dados_apolices = []
-        self.dados_clientes = []
-        self.dados_sinistros = []
-
-        try:
-            with open("apolices.json", "r", encoding="utf-8") as file:
-                self.dados_apolices = json.load(file)
-        except FileNotFoundError:
-            messagebox.showerror("Erro", "Arquivo apolices.json não encontrado!")
-        except json.JSONDecodeError:
-            messagebox.showerror("Erro", "Erro ao decodificar o arquivo apolices.json!")
-        except Exception as e:
-            messagebox.showerror("Erro", f"Ocorreu um erro ao carregar apolices.json: {e}")
-
-        try:
-            with open("clientes.json", "r", encoding="utf-8") as file:
-                self.dados_clientes = json.load(file)
-        except FileNotFoundError:
-            messagebox.showerror("Erro", "Arquivo clientes.json não encontrado!")
-        except json.JSONDecodeError:
-            messagebox.showerror("Erro", "Erro ao decodificar o arquivo clientes.json!")
-        except Exception as e:
-            messagebox.showerror("Erro", f"Ocorreu um erro ao carregar clientes.json: {e}")
-
-        try:
-            with open("sinistros.json", "r", encoding="utf-8") as file:
-                self.dados_sinistros = json.load(file)
-        except FileNotFoundError:
-            # Não é um erro crítico se não houver sinistros, apenas exibir mensagem informativa
-            print("Arquivo sinistros.json não encontrado. Relatório de sinistros pode estar vazio.")
-        except json.JSONDecodeError:
-            messagebox.showerror("Erro", "Erro ao decodificar o arquivo sinistros.json!")
-        except Exception as e:
-            messagebox.showerror("Erro", f"Ocorreu um erro ao carregar sinistros.json: {e}")
-
+        """Obtém apólices, clientes e sinistros do repositório compartilhado com a interface.
+           Sem repositório (janela aberta fora da interface), os arquivos JSON são lidos uma única vez."""
+        if self.repositorio is None:
+            self.repositorio = RepositorioDados()
+            try:
+                self.repositorio.carregar()
+            except Exception as e:
+                messagebox.showerror("Erro", f"Ocorreu um erro ao carregar os arquivos de dados: {e}")
+
+        self.dados_apolices = self.repositorio.apolices
+        self.dados_clientes = self.repositorio.clientes
+        self.dados_sinistros = self.repositorio.sinistros
+        # Totais prontos (mantidos pelo repositório a cada alteração): abrir a janela não percorre os registros
+        self.agregados = self.repositorio.agregados()
+        
         # Para compatibilidade temporária, self.dados pode apontar para apólices,
         # mas o ideal é refatorar as abas para usar as listas específicas.
         self.dados = self.dados_apolices
     
-    def criar_aba_valor_segurado(self):
-        """Cria aba com relatório de valor total segurado por cliente"""
+    def _criar_aba(self, titulo, colunas, preparacao, linha_sem_dados, texto_sem_grafico):
+        """Cria a aba com a tabela (primeira linha) e o espaço do gráfico (segunda linha), sem preparar o relatório"""
         tab = ttk.Frame(self.notebook)
-        self.notebook.add(tab, text="Valor Segurado por Cliente")
+        self.notebook.add(tab, text=titulo)
 
         # Frame principal para a aba, que será dividido em duas linhas
         main_content_frame = ttk.Frame(tab)
@@ -79,255 +103,145 @@ class RelatoriosWindow:
         main_content_frame.rowconfigure(1, weight=1) # Linha do gráfico
         main_content_frame.columnconfigure(0, weight=1)
 
-        # Frame para a Treeview (tabela) - ocupará a primeira linha
         tree_frame = ttk.Frame(main_content_frame)
-        # Usar grid para posicionar na primeira linha
         tree_frame.grid(row=0, column=0, sticky="nsew", pady=(5, 2))
 
-        # Frame para o gráfico - ocupará a segunda linha
         graph_frame = ttk.Frame(main_content_frame)
-        # Usar grid para posicionar na segunda linha
         graph_frame.grid(row=1, column=0, sticky="nsew", pady=(2, 5))
 
         # Criar Treeview com Scrollbar
         tree_scrollbar = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL)
-        tree = ttk.Treeview(tree_frame, columns=("cliente", "valor"), show="headings", yscrollcommand=tree_scrollbar.set)
+        tree = ttk.Treeview(tree_frame, columns=[coluna for coluna, _ in colunas], show="headings", yscrollcommand=tree_scrollbar.set)
         tree_scrollbar.config(command=tree.yview)
-
-        tree.heading("cliente", text="Cliente")
-        tree.heading("valor", text="Valor Total Segurado")
+        for coluna, cabecalho in colunas:
+            tree.heading(coluna, text=cabecalho)
         
         tree_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         tree.pack(fill="both", expand=True, padx=(10,0), pady=5) # padx para não colar na scrollbar
 
-        # Mapear CPF para nome do cliente para facilitar a busca
-        clientes_map = {cliente["cpf"]: cliente["nome"] for cliente in self.dados_clientes if "cpf" in cliente and "nome" in cliente}
-
-        # Calcular valores
-        valores_por_cliente = {}
-        for apolice in self.dados_apolices:
-            cpf_cliente = apolice.get("cpf_cliente")
-            nome_cliente = clientes_map.get(cpf_cliente, f"Cliente (CPF: {cpf_cliente})") # Mostrar CPF se nome não encontrado
-            valor = float(apolice.get("valor_assegurado", 0))
-            
-            if nome_cliente in valores_por_cliente:
-                valores_por_cliente[nome_cliente] += valor
-            else:
-                valores_por_cliente[nome_cliente] = valor
-        
-        # Inserir dados na tabela
-        if valores_por_cliente:
-            for cliente, valor_total in valores_por_cliente.items():
-                tree.insert("", "end", values=(cliente, f"R$ {valor_total:,.2f}"))
+        # Indicador de progresso e gráfico (ou aviso de falta de dados), exibidos alternadamente
+        progresso = ttk.Frame(graph_frame)
+        ttk.Label(progresso, text="Gerando relatório...").pack(pady=(0, 5))
+        barra = ttk.Progressbar(progresso, mode="indeterminate", length=200)
+        barra.pack()
+        label_grafico = ttk.Label(graph_frame)
+
+        self._abas[str(tab)] = _AbaRelatorio(tree, graph_frame, progresso, barra, label_grafico, preparacao,
+                                             linha_sem_dados, texto_sem_grafico)
+
+    def _ao_selecionar_aba(self, event=None):
+        """Prepara a aba exibida se ela ainda não foi preparada (ou se foi marcada para atualização)"""
+        aba = self._abas.get(self.notebook.select())
+        if aba is not None and not aba.atualizada and aba.future is None:
+            self._preparar(aba)
+
+    def atualizar(self):
+        """Refaz os relatórios com os totais atuais: a aba exibida agora, as demais quando forem selecionadas"""
+        for aba in self._abas.values():
+            aba.atualizada = False
+        self._ao_selecionar_aba()
+
+    def _preparar(self, aba):
+        """Envia a preparação do relatório aos processos e mostra o indicador de progresso na aba"""
+        funcao, argumentos = aba.preparacao()
+        aba.label_grafico.pack_forget()
+        aba.progresso.pack(pady=20, padx=10)
+        aba.barra.start(15)
+        aba.future = _obter_executor().submit(funcao, *argumentos)
+        aba.atualizada = True
+        if not self._verificacao_agendada:
+            self._verificacao_agendada = True
+            self.window.after(self.INTERVALO_VERIFICACAO_MS, self._verificar_resultados)
+
+    def _verificar_resultados(self):
+        """Coloca nas abas os relatórios que ficaram prontos; o loop do Tk nunca espera pelos processos"""
+        self._verificacao_agendada = False
+        if not self.window.winfo_exists():
+            for aba in self._abas.values():
+                if aba.future is not None:
+                    aba.future.cancel()
+            return
+        pendentes = False
+        for aba in self._abas.values():
+            if aba.future is None:
+                continue
+            if not aba.future.done():
+                pendentes = True
+                continue
+            future, aba.future = aba.future, None
+            aba.barra.stop()
+            aba.progresso.pack_forget()
+            try:
+                self._exibir_resultado(aba, future.result())
+            except Exception as e:
+                print(f"Erro ao gerar relatório: {e}")
+                aba.label_grafico.configure(image="", text=f"Erro ao gerar o relatório: {e}")
+                aba.label_grafico.pack(pady=20, padx=10)
+        # A aba exibida pode ter sido marcada para atualização enquanto a preparação anterior terminava
+        self._ao_selecionar_aba()
+        if pendentes and not self._verificacao_agendada:
+            self._verificacao_agendada = True
+            self.window.after(self.INTERVALO_VERIFICACAO_MS, self._verificar_resultados)
+
+    def _exibir_resultado(self, aba, resultado):
+        """Atualiza a tabela e o gráfico da aba no lugar (mesmos itens e mesma imagem)"""
+        aba.geracao += 1
+        self._preencher_tabela(aba, resultado["linhas"] or [aba.linha_sem_dados], aba.geracao)
+        if resultado["png"] is None:
+            aba.label_grafico.configure(image="", text=aba.texto_sem_grafico)
+            aba.label_grafico.pack(pady=20, padx=10)
+            return
+        dados = base64.b64encode(resultado["png"]).decode("ascii")
+        if aba.imagem is None:
+            aba.imagem = tk.PhotoImage(master=aba.graph_frame, data=dados)
         else:
-            tree.insert("", "end", values=("Não há dados para exibir.", ""))
+            aba.imagem.configure(data=dados)
+        aba.label_grafico.configure(image=aba.imagem, text="")
+        aba.label_grafico.pack(fill="both", expand=True, padx=10, pady=5)
+
+    def _preencher_tabela(self, aba, linhas, geracao, inicio=0):
+        """Preenche a tabela em lotes, reaproveitando os itens existentes e devolvendo o controle ao loop
+           do Tk entre um lote e outro. Ao final, remove os itens que sobraram da versão anterior."""
+        if geracao != aba.geracao or not aba.tree.winfo_exists():
+            return
+        fim = min(inicio + self.LINHAS_POR_LOTE, len(linhas))
+        for posicao in range(inicio, fim):
+            if posicao < len(aba.itens):
+                aba.tree.item(aba.itens[posicao], values=linhas[posicao])
+            else:
+                aba.itens.append(aba.tree.insert("", "end", values=linhas[posicao]))
+        if fim < len(linhas):
+            self.window.after(1, self._preencher_tabela, aba, linhas, geracao, fim)
+        elif len(aba.itens) > len(linhas):
+            aba.tree.delete(*aba.itens[len(linhas):])
+            del aba.itens[len(linhas):]
 
-        # Criar gráfico
-        if valores_por_cliente:
-            # Ajustar o figsize para o novo layout
-            fig, ax = plt.subplots(figsize=(8, 5)) # Aumentar altura um pouco
-            nomes_clientes_grafico = list(valores_por_cliente.keys())
-            valores_grafico = list(valores_por_cliente.values())
-            
-            ax.bar(nomes_clientes_grafico, valores_grafico, color='#007bff') # Cor primária
-            ax.set_title("Valor Total Segurado por Cliente", fontsize=12)
-            ax.set_xlabel("Clientes", fontsize=10)
-            ax.set_ylabel("Valor (R$)", fontsize=10)
-            plt.xticks(rotation=45, ha='right', fontsize=9)
-            plt.yticks(fontsize=9)
-            fig.tight_layout() # Usar fig.tight_layout() para melhor ajuste
-            
-            canvas = FigureCanvasTkAgg(fig, graph_frame) # Adicionar ao graph_frame
-            canvas.draw()
-            canvas.get_tk_widget().pack(fill="both", expand=True, padx=10, pady=5)
-        else:
-            label_sem_dados = ttk.Label(graph_frame, text="Não há dados suficientes para gerar o gráfico.")
-            label_sem_dados.pack(pady=20, padx=10)
+    # --- Relatórios: cada aba informa a função de preparacao_relatorios e a entrada que extrai os dados do repositório ---
+
+    def criar_aba_valor_segurado(self):
+        """Cria aba com relatório de valor total segurado por cliente"""
+        def preparacao():
+            return preparacao_relatorios.preparar_valor_segurado, preparacao_relatorios.entrada_valor_segurado(self.repositorio)
+        self._criar_aba("Valor Segurado por Cliente", (("cliente", "Cliente"), ("valor", "Valor Total Segurado")), preparacao,
+                        ("Não há dados para exibir.", ""), "Não há dados suficientes para gerar o gráfico.")
     
     def criar_aba_apolices_tipo(self):
         """Cria aba com relatório de apólices por tipo de seguro"""
-        tab = ttk.Frame(self.notebook)
-        self.notebook.add(tab, text="Apólices por Tipo")
-
-        main_content_frame = ttk.Frame(tab)
-        main_content_frame.pack(fill="both", expand=True)
-        main_content_frame.rowconfigure(0, weight=1)
-        main_content_frame.rowconfigure(1, weight=1)
-        main_content_frame.columnconfigure(0, weight=1)
-
-        tree_frame = ttk.Frame(main_content_frame)
-        tree_frame.grid(row=0, column=0, sticky="nsew", pady=(5,2))
-
-        graph_frame = ttk.Frame(main_content_frame)
-        graph_frame.grid(row=1, column=0, sticky="nsew", pady=(2,5))
-        
-        # Contar apólices por tipo
-        contagem = {"Automóvel": 0, "Residencial": 0, "Vida": 0}
-        for apolice in self.dados_apolices: 
-            tipo = apolice.get("tipo_seguro")
-            if tipo in contagem:
-                contagem[tipo] = contagem.get(tipo, 0) + 1
-        
-        # Criar Treeview com Scrollbar
-        tree_scrollbar = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL)
-        tree = ttk.Treeview(tree_frame, columns=("tipo", "quantidade"), show="headings", yscrollcommand=tree_scrollbar.set)
-        tree_scrollbar.config(command=tree.yview)
-
-        tree.heading("tipo", text="Tipo de Seguro")
-        tree.heading("quantidade", text="Quantidade")
-        
-        tree_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        tree.pack(fill="both", expand=True, padx=(10,0), pady=5)
-        
-        if any(contagem.values()):
-            for tipo, qtd in contagem.items():
-                tree.insert("", "end", values=(tipo, qtd))
-        else:
-            tree.insert("", "end", values=("Não há dados para exibir.", ""))
-        
-        # Criar gráfico de pizza apenas se houver dados
-        if any(contagem.values()):
-            fig, ax = plt.subplots(figsize=(6, 5.5)) # Ajustar tamanho
-            cores_pizza = ['#007bff', '#17a2b8', '#28a745'] # Azul, Ciano, Verde
-            ax.pie(contagem.values(), labels=contagem.keys(), autopct='%1.1f%%', startangle=90, colors=cores_pizza, textprops={'fontsize': 10})
-            ax.set_title("Distribuição de Apólices por Tipo", fontsize=12)
-            fig.tight_layout()
-            
-            canvas = FigureCanvasTkAgg(fig, graph_frame)
-            canvas.draw()
-            canvas.get_tk_widget().pack(fill="both", expand=True, padx=10, pady=5)
-        else:
-            label_sem_dados = ttk.Label(graph_frame, text="Não há dados de apólices para gerar este relatório.")
-            label_sem_dados.pack(pady=20, padx=10)
+        def preparacao():
+            return preparacao_relatorios.preparar_apolices_tipo, preparacao_relatorios.entrada_apolices_tipo(self.repositorio)
+        self._criar_aba("Apólices por Tipo", (("tipo", "Tipo de Seguro"), ("quantidade", "Quantidade")), preparacao,
+                        ("Não há dados para exibir.", ""), "Não há dados de apólices para gerar este relatório.")
     
     def criar_aba_sinistros(self):
         """Cria aba com relatório de sinistros"""
-        tab = ttk.Frame(self.notebook)
-        self.notebook.add(tab, text="Sinistros")
-
-        main_content_frame = ttk.Frame(tab)
-        main_content_frame.pack(fill="both", expand=True)
-        main_content_frame.rowconfigure(0, weight=1)
-        main_content_frame.rowconfigure(1, weight=1)
-        main_content_frame.columnconfigure(0, weight=1)
-
-        tree_frame = ttk.Frame(main_content_frame)
-        tree_frame.grid(row=0, column=0, sticky="nsew", pady=(5,2))
-
-        graph_frame = ttk.Frame(main_content_frame)
-        graph_frame.grid(row=1, column=0, sticky="nsew", pady=(2,5))
-        
-        sinistros_por_status = {"Em Análise": 0, "Aprovado": 0, "Negado": 0}
-        total_sinistros = 0
-        
-        for sinistro in self.dados_sinistros:
-            status = sinistro.get("status_sinistro")
-            if status in sinistros_por_status:
-                sinistros_por_status[status] += 1
-            total_sinistros += 1
-        
-        # Criar Treeview com Scrollbar
-        tree_scrollbar = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL)
-        tree = ttk.Treeview(tree_frame, columns=("status", "quantidade", "percentual"), show="headings", yscrollcommand=tree_scrollbar.set)
-        tree_scrollbar.config(command=tree.yview)
-
-        tree.heading("status", text="Status")
-        tree.heading("quantidade", text="Quantidade")
-        tree.heading("percentual", text="Percentual")
-        
-        tree_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        tree.pack(fill="both", expand=True, padx=(10,0), pady=5)
-        
-        if total_sinistros > 0:
-            for status, qtd in sinistros_por_status.items():
-                percentual = (qtd / total_sinistros * 100) if total_sinistros > 0 else 0
-                tree.insert("", "end", values=(status, qtd, f"{percentual:.1f}%"))
-        else:
-            tree.insert("", "end", values=("Não há dados para exibir.", "", ""))
-        
-        if total_sinistros > 0:
-            fig, ax = plt.subplots(figsize=(6, 5)) # Ajustar tamanho
-            ax.bar(sinistros_por_status.keys(), sinistros_por_status.values(), color='#007bff')
-            ax.set_title("Quantidade de Sinistros por Status", fontsize=12)
-            ax.set_xlabel("Status", fontsize=10)
-            ax.set_ylabel("Quantidade", fontsize=10)
-            plt.xticks(fontsize=9)
-            plt.yticks(fontsize=9)
-            fig.tight_layout()
-            
-            canvas = FigureCanvasTkAgg(fig, graph_frame)
-            canvas.draw()
-            canvas.get_tk_widget().pack(fill="both", expand=True, padx=10, pady=5)
-        else:
-            label_sem_dados = ttk.Label(graph_frame, text="Não há dados de sinistros para gerar o relatório.")
-            label_sem_dados.pack(pady=20, padx=10)
+        def preparacao():
+            return preparacao_relatorios.preparar_sinistros, preparacao_relatorios.entrada_sinistros(self.repositorio)
+        self._criar_aba("Sinistros", (("status", "Status"), ("quantidade", "Quantidade"), ("percentual", "Percentual")), preparacao,
+                        ("Não há dados para exibir.", "", ""), "Não há dados de sinistros para gerar o relatório.")
     
     def criar_aba_ranking_clientes(self):
         """Cria aba com ranking de clientes por número de apólices"""
-        tab = ttk.Frame(self.notebook)
-        self.notebook.add(tab, text="Ranking de Clientes")
-
-        main_content_frame = ttk.Frame(tab)
-        main_content_frame.pack(fill="both", expand=True)
-        main_content_frame.rowconfigure(0, weight=1)
-        main_content_frame.rowconfigure(1, weight=1)
-        main_content_frame.columnconfigure(0, weight=1)
-
-        tree_frame = ttk.Frame(main_content_frame)
-        tree_frame.grid(row=0, column=0, sticky="nsew", pady=(5,2))
-
-        graph_frame = ttk.Frame(main_content_frame)
-        graph_frame.grid(row=1, column=0, sticky="nsew", pady=(2,5))
-
-        clientes_map = {cliente["cpf"]: cliente["nome"] for cliente in self.dados_clientes if "cpf" in cliente and "nome" in cliente}
-
-        apolices_por_cpf = {}
-        for apolice in self.dados_apolices:
-            cpf_cliente = apolice.get("cpf_cliente")
-            if cpf_cliente:
-                apolices_por_cpf[cpf_cliente] = apolices_por_cpf.get(cpf_cliente, 0) + 1
-        
-        ranking_com_nomes = []
-        for cpf, qtd in apolices_por_cpf.items():
-            nome_cliente = clientes_map.get(cpf, f"Cliente (CPF: {cpf})")
-            ranking_com_nomes.append((nome_cliente, qtd))
-
-        ranking_ordenado = sorted(ranking_com_nomes, key=lambda x: x[1], reverse=True)
-        
-        # Criar Treeview com Scrollbar
-        tree_scrollbar = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL)
-        tree = ttk.Treeview(tree_frame, columns=("posicao", "cliente", "quantidade"), show="headings", yscrollcommand=tree_scrollbar.set)
-        tree_scrollbar.config(command=tree.yview)
-        
-        tree.heading("posicao", text="Posição")
-        tree.heading("cliente", text="Cliente")
-        tree.heading("quantidade", text="Quantidade de Apólices")
-        
-        tree_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        tree.pack(fill="both", expand=True, padx=(10,0), pady=5)
-        
-        if ranking_ordenado:
-            for i, (cliente, qtd) in enumerate(ranking_ordenado, 1):
-                tree.insert("", "end", values=(f"{i}º", cliente, qtd))
-        else:
-            tree.insert("", "end", values=("", "Não há dados para exibir.", ""))
-        
-        if ranking_ordenado:
-            fig, ax = plt.subplots(figsize=(8, 5)) # Ajustar tamanho
-            top_n = ranking_ordenado[:10] # Limitar ao top N para o gráfico
-            clientes_grafico = [x[0] for x in top_n][::-1] # Inverter para o barh
-            quantidades_grafico = [x[1] for x in top_n][::-1] # Inverter para o barh
-            
-            ax.barh(clientes_grafico, quantidades_grafico, color='#007bff')
-            ax.set_title(f"Top {len(top_n)} Clientes por Número de Apólices", fontsize=12)
-            ax.set_xlabel("Quantidade de Apólices", fontsize=10)
-            plt.xticks(fontsize=9)
-            plt.yticks(fontsize=9)
-            fig.tight_layout()
-            
-            canvas = FigureCanvasTkAgg(fig, graph_frame)
-            canvas.draw()
-            canvas.get_tk_widget().pack(fill="both", expand=True, padx=10, pady=5)
-        else:
-            label_sem_dados = ttk.Label(graph_frame, text="Não há dados para gerar o ranking de clientes.")
-            label_sem_dados.pack(pady=20, padx=10) 
\ No newline at end of file
+        def preparacao():
+            return preparacao_relatorios.preparar_ranking, preparacao_relatorios.entrada_ranking(self.repositorio)
+        self._criar_aba("Ranking de Clientes", (("posicao", "Posição"), ("cliente", "Cliente"), ("quantidade", "Quantidade de Apólices")),
+                        preparacao, ("", "Não há dados para exibir.", ""), "Não há dados para gerar o ranking de clientes.")
\ No newline at end of file
@@ -0,0 +1,527 @@
+"""Repositório único dos dados da interface (clientes.json, apolices.json e sinistros.json).
+
+Os arquivos são lidos uma vez e mantidos em memória com índices por chave:
+    clientes por CPF, apólices por número e sinistros pelo número da apólice (um sinistro por apólice).
+A interface e a janela de relatórios usam a mesma instância, de modo que abrir um relatório não relê nem
+reinterpreta os arquivos. A carga usa o snapshot binário (snapshot.py, interface.snapshot no mesmo diretório),
+regravado a cada gravar(), para as coleções cujos arquivos não mudaram desde então.
+ArmazenamentoRepositorio apresenta os mesmos registros no formato do SistemaSeguros (usado pelas exportações e
+por quem quiser montar um SistemaSeguros sobre os dados da interface: ele lê e grava os registros do repositório
+e acompanha as alterações feitas pela interface)."""
+import json
+import os
+import threading
+from agregados import AgregadosRelatorios
+from leitura_json import iterar_lista_json
+from snapshot import gravar_snapshot, ler_snapshot, impressao_arquivo, arquivo_inalterado
+
+class RepositorioDados:
+    ARQUIVOS = {
+        "clientes": "clientes.json",
+        "apolices": "apolices.json",
+        "sinistros": "sinistros.json"
+    }
+    # Campo que identifica cada registro da coleção
+    CHAVES = {
+        "clientes": "cpf",
+        "apolices": "numero_apolice",
+        "sinistros": "numero_apolice" # Um sinistro por apólice
+    }
+    ARQUIVO_SNAPSHOT = "interface.snapshot"
+
+    def __init__(self, diretorio=".", snapshot=True):
+        self.diretorio = diretorio
+        self.arquivo_snapshot = os.path.join(diretorio, self.ARQUIVO_SNAPSHOT) if snapshot else None
+        # Conteúdo de cada arquivo na última leitura ou gravação: (registros, impressao_arquivo), gravado no snapshot
+        self._gravados = {}
+        self._trava_snapshot = threading.Lock()
+        self._registros = {colecao: [] for colecao in self.ARQUIVOS}
+        self._indices = {colecao: {} for colecao in self.ARQUIVOS}   # chave -> registro
+        self._posicoes = {colecao: {} for colecao in self.ARQUIVOS}  # chave -> posição na lista
+        self._observadores = []
+        self._agregados = None # Totais dos relatórios, calculados no primeiro uso
+        self._maior_numero_apolice = 0 # Maior número (inteiro) de apólice, ver proximo_numero_apolice()
+
+    # Listas e índices expostos diretamente (somente leitura: alterações passam por salvar())
+    @property
+    def clientes(self):
+        return self._registros["clientes"]
+
+    @property
+    def apolices(self):
+        return self._registros["apolices"]
+
+    @property
+    def sinistros(self):
+        return self._registros["sinistros"]
+
+    @property
+    def clientes_por_cpf(self):
+        return self._indices["clientes"]
+
+    @property
+    def apolices_por_numero(self):
+        return self._indices["apolices"]
+
+    @property
+    def sinistros_por_apolice(self):
+        return self._indices["sinistros"]
+
+    def caminho(self, colecao):
+        return os.path.join(self.diretorio, self.ARQUIVOS[colecao])
+
+    def _chave(self, colecao, registro):
+        chave = registro.get(self.CHAVES[colecao])
+        # O número da apólice é int em apolices.json e texto em sinistros.json; sinistros são indexados pelo texto
+        return str(chave) if colecao == "sinistros" else chave
+
+    def carregar(self):
+        """Lê as três coleções (arquivos ausentes ficam vazios): do snapshot as que não mudaram desde a última
+           gravação, dos arquivos JSON as demais. Erros de leitura dos arquivos são propagados."""
+        do_snapshot = self._ler_snapshot()
+        for colecao in self.ARQUIVOS:
+            caminho = self.caminho(colecao)
+            impressao = impressao_arquivo(caminho)
+            registros = do_snapshot.get(colecao)
+            if registros is None:
+                # Lidos registro a registro (leitura_json): o texto do arquivo não fica inteiro em memória
+                registros = iterar_lista_json(caminho) if impressao is not None else ()
+            self.definir_colecao(colecao, registros)
+            with self._trava_snapshot:
+                self._gravados[colecao] = (list(self._registros[colecao]), impressao)
+        if len(do_snapshot) < len(self.ARQUIVOS):
+            self.gravar_snapshot() # A próxima carga já encontra o snapshot
+
+    def _ler_snapshot(self):
+        """{colecao: registros} do snapshot cujos arquivos não mudaram desde que ele foi gravado (um stat por arquivo)"""
+        if not self.arquivo_snapshot or not os.path.exists(self.arquivo_snapshot):
+            return {}
+        try:
+            colecoes, arquivos = ler_snapshot(self.arquivo_snapshot)
+        except (ValueError, OSError) as e:
+            print(f"Aviso: snapshot {self.arquivo_snapshot} ignorado: {e}")
+            return {}
+        return {colecao: registros for colecao, registros in colecoes.items()
+                if colecao in self.ARQUIVOS and colecao in arquivos
+                and arquivo_inalterado(self.caminho(colecao), arquivos[colecao])}
+
+    def gravar_snapshot(self):
+        """Grava o snapshot com o conteúdo de cada arquivo na última leitura ou gravação (não com os registros em
+           memória, que podem ter alterações ainda não gravadas). Retorna os bytes gravados, ou None se não houver
+           snapshot ou a gravação falhar; a falha não afeta os arquivos JSON."""
+        if not self.arquivo_snapshot:
+            return None
+        with self._trava_snapshot:
+            try:
+                return gravar_snapshot(self.arquivo_snapshot,
+                                       {colecao: registros for colecao, (registros, _) in self._gravados.items()},
+                                       {colecao: impressao for colecao, (_, impressao) in self._gravados.items()})
+            except (ValueError, TypeError, OSError) as e:
+                print(f"Erro ao gravar o snapshot {self.arquivo_snapshot}: {e}")
+                return None
+
+    def definir_colecao(self, colecao, registros):
+        """Substitui todos os registros da coleção e reconstrói seus índices (sem notificar observadores)"""
+        lista = []
+        indice = {}
+        posicoes = {}
+        for registro in registros:
+            chave = self._chave(colecao, registro)
+            if chave in posicoes:
+                lista[posicoes[chave]] = registro # Chave repetida: prevalece o último registro
+            else:
+                posicoes[chave] = len(lista)
+                lista.append(registro)
+            indice[chave] = registro
+        # Substituição no próprio objeto: quem guardou referências às listas e índices continua válido
+        self._registros[colecao][:] = lista
+        self._indices[colecao].clear()
+        self._indices[colecao].update(indice)
+        self._posicoes[colecao] = posicoes
+        if colecao == "apolices":
+            self._maior_numero_apolice = max((chave for chave in indice if _numero_inteiro(chave)), default=0)
+        if colecao in AgregadosRelatorios.CAMPOS:
+            self._agregados = None # Recalculados no próximo uso
+
+    def observar(self, funcao):
+        """Registra funcao(colecao, anterior, registro), chamada após cada salvar() com notificação"""
+        self._observadores.append(funcao)
+
+    def salvar(self, colecao, registro, notificar=True):
+        """Inclui ou substitui (pela chave) um registro em O(1). Retorna o registro anterior ou None.
+           Para alterar um registro, passe um novo dicionário: o anterior é usado para atualizar os agregados."""
+        chave = self._chave(colecao, registro)
+        posicoes = self._posicoes[colecao]
+        anterior = self._indices[colecao].get(chave)
+        if chave in posicoes:
+            self._registros[colecao][posicoes[chave]] = registro
+        else:
+            posicoes[chave] = len(self._registros[colecao])
+            self._registros[colecao].append(registro)
+        self._indices[colecao][chave] = registro
+        if colecao == "apolices" and _numero_inteiro(chave) and chave > self._maior_numero_apolice:
+            self._maior_numero_apolice = chave
+        if self._agregados is not None:
+            self._agregados.aplicar(colecao, anterior, registro)
+        if notificar:
+            for funcao in self._observadores:
+                funcao(colecao, anterior, registro)
+        return anterior
+
+    def gravar(self, colecao):
+        """Reescreve o arquivo JSON da coleção com os registros em memória e atualiza o snapshot. Pode ser chamado
+           de outra thread: grava uma cópia da lista (os registros não são alterados no lugar, ver salvar()) em um
+           arquivo temporário que só então substitui o anterior, que nunca fica gravado pela metade."""
+        registros = list(self._registros[colecao])
+        caminho = self.caminho(colecao)
+        temporario = f"{caminho}.tmp"
+        try:
+            with open(temporario, "w", encoding="utf-8") as f:
+                json.dump(registros, f, ensure_ascii=False, indent=4)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temporario, caminho)
+        finally:
+            if os.path.exists(temporario):
+                os.remove(temporario)
+        with self._trava_snapshot:
+            self._gravados[colecao] = (registros, impressao_arquivo(caminho))
+        self.gravar_snapshot()
+
+    def proximo_numero_apolice(self):
+        """Número da próxima apólice: a interface numera as apólices com inteiros sequenciais
+           (números em outro formato, como os "AP-0001" do SistemaSeguros, não contam)"""
+        return self._maior_numero_apolice + 1
+
+    def agregados(self):
+        """Totais dos relatórios (AgregadosRelatorios): calculados uma vez e mantidos a cada salvar()"""
+        if self._agregados is None:
+            self._agregados = AgregadosRelatorios.calcular(self.apolices, self.sinistros)
+        return self._agregados
+
+    def verificar_agregados(self):
+        """Compara os totais mantidos incrementalmente com um recálculo completo. Retorna as divergências."""
+        if self._agregados is None:
+            return []
+        return self._agregados.diferencas(AgregadosRelatorios.calcular(self.apolices, self.sinistros))
+
+    # --- Buscas por chave, O(1) ---
+
+    def buscar_cliente(self, cpf):
+        return self._indices["clientes"].get(cpf)
+
+    def buscar_apolice(self, numero):
+        """Aceita o número como int ou como texto (ex.: vindo de um Treeview ou de sinistros.json)"""
+        apolice = self._indices["apolices"].get(numero)
+        if apolice is None and isinstance(numero, str) and numero.isdigit():
+            apolice = self._indices["apolices"].get(int(numero))
+        return apolice
+
+    def buscar_sinistro(self, numero_apolice):
+        """Sinistro registrado para a apólice, ou None"""
+        return self._indices["sinistros"].get(str(numero_apolice))
+
+
+def _numero_inteiro(chave):
+    return isinstance(chave, int) and not isinstance(chave, bool)
+
+def _primeiro(dados, *campos, padrao=""):
+    """Valor do primeiro campo presente: os dados específicos gravados pela interface mudaram de nome entre versões"""
+    for campo in campos:
+        if dados.get(campo) not in (None, ""):
+            return dados[campo]
+    return padrao
+
+def _numero(valor, padrao=0.0):
+    """Converte números gravados como texto no formato brasileiro ('750.000,00')"""
+    if isinstance(valor, (int, float)):
+        return valor
+    texto = str(valor).strip()
+    if "," in texto:
+        texto = texto.replace(".", "").replace(",", ".")
+    try:
+        return float(texto)
+    except ValueError:
+        return padrao
+
+def _itens(valor):
+    if isinstance(valor, list):
+        return valor
+    return [item.strip() for item in str(valor).split(",") if item.strip()]
+
+
+class ArmazenamentoRepositorio:
+    """Armazenamento do SistemaSeguros sobre um RepositorioDados já carregado (mesma interface de
+    ArmazenamentoJSON/ArmazenamentoSQLite), para montar um SistemaSeguros sobre os registros da interface.
+
+    Cada apólice da interface é vista pelo sistema como uma apólice (numero = numero_apolice) mais um seguro
+    com id igual ao número, montado a partir de tipo_seguro, vigência, valor_assegurado e dados_especificos;
+    o sinistro da apólice recebe o id igual ao número. As gravações do sistema voltam ao repositório como
+    alterações dos registros da interface: seguros e sinistros novos ficam pendentes até a apólice que os
+    referencia ser gravada. salvar_colecao() inclui ou substitui registros, sem excluir os ausentes.
+
+    A interface guarda um sinistro por apólice: limite_sinistros_por_apolice = 1 faz o SistemaSeguros recusar um
+    segundo sinistro, e gravar um sinistro diferente para uma apólice que já tem um levanta ValueError.
+    As apólices emitidas pelo sistema recebem números da interface (numero_nova_apolice).
+
+    Alterações feitas no repositório por outros (a interface) são repassadas, já no formato do sistema, a quem
+    chamou observar(): o SistemaSeguros substitui seus objetos por eles e continua igual aos registros da interface."""
+    suporta_gravacao_por_registro = True
+    suporta_consultas = False
+    suporta_snapshot = False
+    notifica_alteracoes = True
+    limite_sinistros_por_apolice = 1
+
+    def __init__(self, repositorio):
+        self.repositorio = repositorio
+        self._numero_por_seguro = {}    # id do seguro -> número da apólice
+        self._numero_por_sinistro = {}  # id do sinistro -> número da apólice
+        self._seguros_pendentes = {}    # id -> dados de seguros ainda sem apólice
+        self._sinistros_pendentes = {}  # id -> dados de sinistros ainda sem apólice
+        self._sinistro_por_numero = {}  # número da apólice (texto) -> id do sinistro gravado para ela
+        self._ultimo_numero = 0         # Último número entregue por numero_nova_apolice()
+        self._observadores = []
+        self._gravando = False          # Dentro de salvar_registro: a alteração é do próprio sistema
+
+    # Coleção do SistemaSeguros -> coleção da interface de onde vêm os registros
+    ORIGENS = {"clientes": "clientes", "seguros": "apolices", "apolices": "apolices", "sinistros": "sinistros"}
+
+    def carregar(self, colecao, criar_se_ausente=True):
+        return list(self.iterar(colecao, criar_se_ausente))
+
+    def iterar(self, colecao, criar_se_ausente=True):
+        """Dicionários da coleção no formato do sistema, montados um a um a partir dos registros da interface"""
+        if colecao not in self.ORIGENS:
+            return iter(())
+        origem = getattr(self.repositorio, self.ORIGENS[colecao])
+        # Seguros e sinistros que o sistema pode regravar: id -> número da apólice de origem
+        if colecao == "seguros":
+            self._numero_por_seguro.update((str(a.get("numero_apolice")), a.get("numero_apolice")) for a in origem)
+        elif colecao == "sinistros":
+            self._numero_por_sinistro.update((str(s.get("numero_apolice")), s.get("numero_apolice")) for s in origem)
+        return (self.modelo(colecao, registro) for registro in origem)
+
+    def observar(self, funcao):
+        """Registra funcao(colecao, dados), chamada com os dicionários do sistema de cada registro alterado no
+           repositório por outros que não este armazenamento. O repositório só é observado a partir daqui:
+           adaptadores usados apenas para converter registros (ex.: exportações) não ficam registrados nele."""
+        if not self._observadores:
+            self.repositorio.observar(self._ao_alterar_repositorio)
+        self._observadores.append(funcao)
+
+    def _ao_alterar_repositorio(self, colecao, anterior, registro):
+        if self._gravando:
+            return
+        numero = registro.get("numero_apolice")
+        if colecao == "clientes":
+            alteracoes = [("clientes", registro)]
+        elif colecao == "apolices":
+            self._numero_por_seguro[str(numero)] = numero
+            alteracoes = [("seguros", registro), ("apolices", registro)] # A apólice é vinculada ao seguro novo
+        else:
+            self._numero_por_sinistro[str(numero)] = numero
+            alteracoes = [("sinistros", registro)]
+            apolice = self.repositorio.buscar_apolice(numero)
+            if anterior is None and apolice is not None:
+                alteracoes.append(("apolices", apolice)) # sinistros_ids da apólice passa a ter o sinistro
+        for colecao_sistema, origem in alteracoes:
+            dados = self.modelo(colecao_sistema, origem)
+            for funcao in self._observadores:
+                funcao(colecao_sistema, dados)
+
+    def numero_nova_apolice(self, quantidade):
+        """Número de uma apólice emitida pelo sistema: o próximo inteiro da interface (não repete números já
+           entregues e ainda não gravados no repositório, ex.: dentro de uma transação)"""
+        numero = max(self.repositorio.proximo_numero_apolice(), self._ultimo_numero + 1)
+        self._ultimo_numero = numero
+        return numero
+
+    def modelo(self, colecao, registro):
+        """Dicionário da coleção do SistemaSeguros correspondente a um registro da interface
+           (seguros e apolices são montados a partir da mesma apólice da interface). Não altera o estado
+           do armazenamento: serve também para percorrer os registros no formato do sistema (ex.: exportações)."""
+        if colecao == "clientes":
+            return self._cliente_modelo(registro)
+        if colecao == "seguros":
+            return self._seguro_modelo(registro)
+        if colecao == "apolices":
+            return self._apolice_modelo(registro)
+        return self._sinistro_modelo(registro)
+
+    # --- Registros da interface -> dicionários do SistemaSeguros ---
+
+    @staticmethod
+    def _cliente_modelo(cliente):
+        campos = ("nome", "cpf", "data_nascimento", "endereco", "telefone", "email")
+        return {campo: cliente.get(campo) or "" for campo in campos}
+
+    def _seguro_modelo(self, apolice):
+        numero = apolice.get("numero_apolice")
+        tipo = apolice.get("tipo_seguro")
+        dados = apolice.get("dados_especificos") or {}
+        seguro = {
+            "id": str(numero),
+            "tipo": tipo,
+            "valor_cobertura": _numero(apolice.get("valor_assegurado", 0.0)),
+            "data_inicio": apolice.get("data_inicio_apolice", ""),
+            "data_fim": apolice.get("data_fim_apolice", "")
+        }
+        if tipo == "Automóvel":
+            condutores = _primeiro(dados, "num_condutores", "condutores", "condutores_separar_por_vírgula_se_mais_de_um")
+            seguro.update({
+                "marca": _primeiro(dados, "marca"),
+                "modelo": _primeiro(dados, "modelo"),
+                "ano": _primeiro(dados, "ano"),
+                "placa": _primeiro(dados, "placa"),
+                "estado_conservacao": _primeiro(dados, "estado_conservacao", "conservacao", "estado_de_conservação"),
+                "uso_veiculo": _primeiro(dados, "uso_veiculo", "uso", "uso_principal"),
+                "num_condutores": condutores if isinstance(condutores, int) else max(1, len(_itens(condutores)))
+            })
+        elif tipo == "Residencial":
+            seguro.update({
+                "endereco_imovel": _primeiro(dados, "endereco_imovel", "endereço_do_imóvel"),
+                "area": _numero(_primeiro(dados, "area", "área_construída_m²", padrao=0.0)),
+                "valor_venal": _numero(_primeiro(dados, "valor_venal", "valor_venal_r$", padrao=0.0)),
+                "tipo_construcao": _primeiro(dados, "tipo_construcao", "tipo_de_construção")
+            })
+        elif tipo == "Vida":
+            coberturas = dados.get("tipos_cobertura")
+            if coberturas is None:
+                # Coberturas marcadas na interface: "<cobertura>_var": True
+                coberturas = [campo[:-len("_var")] for campo, marcada in dados.items() if campo.endswith("_var") and marcada]
+            seguro.update({
+                "beneficiarios": _itens(_primeiro(dados, "beneficiarios", "beneficiários_separar_por_vírgula")),
+                "tipos_cobertura": coberturas
+            })
+        return seguro
+
+    def _apolice_modelo(self, apolice):
+        numero = apolice.get("numero_apolice")
+        dados = {
+            "numero": numero,
+            "cliente_cpf": apolice.get("cpf_cliente"),
+            "seguro_id": str(numero),
+            "status": apolice.get("status_apolice", "Ativa"),
+            "data_emissao": apolice.get("data_emissao") or apolice.get("data_inicio_apolice", ""),
+            "premio": apolice.get("premio", 0.0),
+            "sinistros_ids": [str(numero)] if self.repositorio.buscar_sinistro(numero) else []
+        }
+        for campo in ("motivo_cancelamento", "data_cancelamento"):
+            if campo in apolice:
+                dados[campo] = apolice[campo]
+        return dados
+
+    def _sinistro_modelo(self, sinistro):
+        numero = sinistro.get("numero_apolice")
+        dados = {
+            "id": str(numero),
+            "data_ocorrencia": sinistro.get("data_sinistro", ""),
+            "descricao": sinistro.get("descricao_sinistro", ""),
+            "valor_prejuizo": _numero(sinistro.get("valor_prejuizo", 0.0)),
+            "status": sinistro.get("status_sinistro", "Em Análise")
+        }
+        if "data_registro" in sinistro:
+            dados["data_registro"] = sinistro["data_registro"]
+        return dados
+
+    # --- Dicionários do SistemaSeguros -> registros da interface ---
+
+    def salvar_registro(self, colecao, registro):
+        self._gravando = True
+        try:
+            self._salvar_registro(colecao, registro)
+        finally:
+            self._gravando = False
+
+    def _salvar_registro(self, colecao, registro):
+        if colecao == "clientes":
+            cliente = dict(self.repositorio.buscar_cliente(registro["cpf"]) or {})
+            cliente.update(registro)
+            self.repositorio.salvar("clientes", cliente)
+        elif colecao == "seguros":
+            numero = self._numero_por_seguro.get(registro["id"])
+            if numero is None:
+                self._seguros_pendentes[registro["id"]] = registro
+            else:
+                self._gravar_apolice(numero, seguro=registro)
+        elif colecao == "sinistros":
+            numero = self._numero_por_sinistro.get(registro["id"])
+            if numero is None:
+                self._sinistros_pendentes[registro["id"]] = registro
+            else:
+                self._verificar_sinistro(numero, registro["id"])
+                self._gravar_sinistro(numero, registro)
+        elif colecao == "apolices":
+            numero = registro["numero"]
+            sinistros_ids = registro.get("sinistros_ids", [])
+            # Verificado antes de qualquer gravação, para não deixar a apólice gravada sem o sinistro
+            for sinistro_id in sinistros_ids:
+                if sinistro_id in self._sinistros_pendentes:
+                    self._verificar_sinistro(numero, sinistro_id)
+            seguro = self._seguros_pendentes.pop(registro["seguro_id"], None)
+            self._numero_por_seguro[registro["seguro_id"]] = numero
+            self._gravar_apolice(numero, apolice=registro, seguro=seguro)
+            for sinistro_id in sinistros_ids:
+                self._numero_por_sinistro[sinistro_id] = numero
+                sinistro = self._sinistros_pendentes.pop(sinistro_id, None)
+                if sinistro is not None:
+                    self._gravar_sinistro(numero, sinistro)
+
+    def salvar_colecao(self, colecao, registros):
+        for registro in registros:
+            self.salvar_registro(colecao, registro)
+
+    def salvar_lote(self, lote):
+        # Alterações em memória: a interface grava os arquivos (RepositorioDados.gravar), nada é gravado aqui
+        for colecao, registros in lote.items():
+            self.salvar_colecao(colecao, registros)
+        return dict.fromkeys(lote, 0)
+
+    def _gravar_apolice(self, numero, apolice=None, seguro=None):
+        registro = dict(self.repositorio.buscar_apolice(numero) or {"numero_apolice": numero, "dados_especificos": {}})
+        if apolice is not None:
+            registro.update({
+                "cpf_cliente": apolice["cliente_cpf"],
+                "status_apolice": apolice["status"],
+                "data_emissao": apolice["data_emissao"],
+                "premio": apolice.get("premio", 0.0)
+            })
+            for campo in ("motivo_cancelamento", "data_cancelamento"):
+                if apolice.get(campo) is not None:
+                    registro[campo] = apolice[campo]
+        if seguro is not None:
+            registro.update({
+                "tipo_seguro": seguro["tipo"],
+                "valor_assegurado": seguro["valor_cobertura"],
+                "data_inicio_apolice": seguro["data_inicio"],
+                "data_fim_apolice": seguro["data_fim"]
+            })
+            especificos = {campo: valor for campo, valor in seguro.items()
+                           if campo not in ("id", "tipo", "valor_cobertura", "data_inicio", "data_fim")}
+            registro["dados_especificos"] = {**(registro.get("dados_especificos") or {}), **especificos}
+        self.repositorio.salvar("apolices", registro)
+
+    def _verificar_sinistro(self, numero, sinistro_id):
+        """Levanta ValueError se a apólice já tem um sinistro diferente (sinistros.json é indexado pelo
+           número da apólice: gravar o novo substituiria o anterior)"""
+        atual = self._sinistro_por_numero.get(str(numero))
+        if atual is None and self.repositorio.buscar_sinistro(numero) is not None:
+            atual = str(numero) # Sinistro lido da interface (id = número da apólice)
+        if atual is not None and atual != sinistro_id:
+            raise ValueError(f"A apólice {numero} já tem o sinistro {atual}; a interface guarda um sinistro por apólice.")
+
+    def _gravar_sinistro(self, numero, sinistro):
+        self._sinistro_por_numero[str(numero)] = sinistro["id"]
+        registro = dict(self.repositorio.buscar_sinistro(numero) or {})
+        registro.update({
+            "numero_apolice": str(numero),
+            "data_sinistro": sinistro["data_ocorrencia"],
+            "descricao_sinistro": sinistro["descricao"],
+            "status_sinistro": sinistro["status"],
+            "valor_prejuizo": sinistro["valor_prejuizo"],
+            "data_registro": sinistro.get("data_registro")
+        })
+        self.repositorio.salvar("sinistros", registro)
+
+    def fechar(self):
+        pass
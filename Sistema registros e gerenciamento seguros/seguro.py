@@ -1,12 +1,35 @@
-from datetime import datetime
+from utils import internar, converter_data
 
 class Seguro:
+    __slots__ = ("id", "valor_cobertura", "_data_inicio", "data_inicio_obj", "_data_fim", "data_fim_obj", "tipo", "versao", "versao_gravada")
+
     def __init__(self, id_seguro, valor_cobertura, data_inicio, data_fim, tipo_seguro="Seguro"):
         self.id = id_seguro
         self.valor_cobertura = valor_cobertura
         self.data_inicio = data_inicio
         self.data_fim = data_fim
-        self.tipo = tipo_seguro
+        self.tipo = internar(tipo_seguro)
+        self.versao = 0 # Controle de alterações (ver Apolice.versao)
+        self.versao_gravada = -1
+    
+    # As datas são mantidas como texto 'dd/mm/aaaa' (formato gravado) e como date, convertidas uma única vez
+    @property
+    def data_inicio(self):
+        return self._data_inicio
+    
+    @data_inicio.setter
+    def data_inicio(self, valor):
+        self._data_inicio = internar(valor)
+        self.data_inicio_obj = converter_data(valor)
+    
+    @property
+    def data_fim(self):
+        return self._data_fim
+    
+    @data_fim.setter
+    def data_fim(self, valor):
+        self._data_fim = internar(valor)
+        self.data_fim_obj = converter_data(valor)
     
     def calcular_premio(self):
         """Método abstrato para cálculo do prêmio do seguro"""
@@ -14,12 +37,9 @@ class Seguro:
     
     def validar_datas(self):
         """Valida as datas de início e fim do seguro"""
-        try:
-            inicio = datetime.strptime(self.data_inicio, "%d/%m/%Y")
-            fim = datetime.strptime(self.data_fim, "%d/%m/%Y")
-            return fim > inicio
-        except ValueError:
+        if self.data_inicio_obj is None or self.data_fim_obj is None:
             return False
+        return self.data_fim_obj > self.data_inicio_obj
     
     def to_dict(self):
         """Converte os dados do seguro para um dicionário"""
@@ -43,36 +63,40 @@ class Seguro:
         )
 
 class SeguroAutomovel(Seguro):
+    __slots__ = ("marca", "modelo", "ano", "placa", "estado_conservacao", "uso_veiculo", "num_condutores")
+
+    # Ajustes baseados no estado de conservação
+    MULTIPLICADORES_ESTADO = {
+        "Novo": 1.0,
+        "Semi novo": 1.2,
+        "Usado": 1.4
+    }
+    MULTIPLICADOR_ESTADO_PADRAO = 1.4
+
+    # Ajustes baseados no uso do veículo
+    MULTIPLICADORES_USO = {
+        "Pessoal": 1.0,
+        "Compartilhado": 1.3,
+        "Profissional": 1.5
+    }
+    MULTIPLICADOR_USO_PADRAO = 1.5
+
     def __init__(self, id_seguro, valor_cobertura, data_inicio, data_fim, marca, modelo, ano, placa, estado_conservacao, uso_veiculo, num_condutores):
         super().__init__(id_seguro, valor_cobertura, data_inicio, data_fim, tipo_seguro="Automóvel")
-        self.marca = marca
-        self.modelo = modelo
+        self.marca = internar(marca)
+        self.modelo = internar(modelo)
         self.ano = ano
         self.placa = placa
-        self.estado_conservacao = estado_conservacao
-        self.uso_veiculo = uso_veiculo
+        self.estado_conservacao = internar(estado_conservacao)
+        self.uso_veiculo = internar(uso_veiculo)
         self.num_condutores = num_condutores
     
     def calcular_premio(self):
         """Calcula o prêmio do seguro baseado nas características do veículo"""
         premio_base = self.valor_cobertura * 0.05  # 5% do valor de cobertura
         
-        # Ajustes baseados no estado de conservação
-        multiplicadores_estado = {
-            "Novo": 1.0,
-            "Semi novo": 1.2,
-            "Usado": 1.4
-        }
-        
-        # Ajustes baseados no uso do veículo
-        multiplicadores_uso = {
-            "Pessoal": 1.0,
-            "Compartilhado": 1.3,
-            "Profissional": 1.5
-        }
-        
-        premio = premio_base * multiplicadores_estado.get(self.estado_conservacao, 1.4)
-        premio *= multiplicadores_uso.get(self.uso_veiculo, 1.5)
+        premio = premio_base * self.MULTIPLICADORES_ESTADO.get(self.estado_conservacao, self.MULTIPLICADOR_ESTADO_PADRAO)
+        premio *= self.MULTIPLICADORES_USO.get(self.uso_veiculo, self.MULTIPLICADOR_USO_PADRAO)
         premio *= (1 + (self.num_condutores - 1) * 0.1)  # +10% por condutor adicional
         
         if self.uso_veiculo == "Comercial":
@@ -111,28 +135,31 @@ class SeguroAutomovel(Seguro):
         )
 
 class SeguroResidencial(Seguro):
+    __slots__ = ("endereco_imovel", "area", "valor_venal", "tipo_construcao")
+
+    # Ajustes baseados no tipo de construção
+    MULTIPLICADORES_CONSTRUCAO = {
+        "Alvenaria": 1.0,
+        "Madeira": 1.5,
+        "Modular": 1.2
+    }
+    MULTIPLICADOR_CONSTRUCAO_PADRAO = 1.5
+
     def __init__(self, id_seguro, valor_cobertura, data_inicio, data_fim, endereco_imovel, area, valor_venal, tipo_construcao):
         super().__init__(id_seguro, valor_cobertura, data_inicio, data_fim, tipo_seguro="Residencial")
         self.endereco_imovel = endereco_imovel
         self.area = area
         self.valor_venal = valor_venal
-        self.tipo_construcao = tipo_construcao
+        self.tipo_construcao = internar(tipo_construcao)
     
     def calcular_premio(self):
         """Calcula o prêmio do seguro baseado nas características do imóvel"""
         premio_base = self.valor_cobertura * 0.02  # 2% do valor de cobertura
         
-        # Ajustes baseados no tipo de construção
-        multiplicadores_construcao = {
-            "Alvenaria": 1.0,
-            "Madeira": 1.5,
-            "Modular": 1.2
-        }
-        
         # Ajuste baseado na área
         fator_area = 1 + (self.area / 1000)  # +0.1% a cada 10m²
         
-        premio = premio_base * multiplicadores_construcao.get(self.tipo_construcao, 1.5)
+        premio = premio_base * self.MULTIPLICADORES_CONSTRUCAO.get(self.tipo_construcao, self.MULTIPLICADOR_CONSTRUCAO_PADRAO)
         premio *= fator_area
         
         if self.tipo_construcao == "Madeira":
@@ -165,10 +192,13 @@ class SeguroResidencial(Seguro):
         )
 
 class SeguroVida(Seguro):
+    __slots__ = ("beneficiarios", "tipos_cobertura")
+
     def __init__(self, id_seguro, valor_cobertura, data_inicio, data_fim, beneficiarios, tipos_cobertura):
         super().__init__(id_seguro, valor_cobertura, data_inicio, data_fim, tipo_seguro="Vida")
         self.beneficiarios = beneficiarios
-        self.tipos_cobertura = tipos_cobertura
+        # Pode ser lista ou texto (ver SistemaSeguros.criar_seguro_vida); só os itens de listas são internados
+        self.tipos_cobertura = [internar(tipo) for tipo in tipos_cobertura] if isinstance(tipos_cobertura, list) else tipos_cobertura
     
     def calcular_premio(self):
         """Calcula o prêmio do seguro baseado nas coberturas selecionadas"""
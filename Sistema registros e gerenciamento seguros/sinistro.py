@@ -1,14 +1,30 @@
-from datetime import datetime
+from datetime import date, datetime
+from utils import internar, converter_data
 # from apolice import Apolice # Removido para evitar dependência circular, será ajustado na classe SistemaSeguros
 
 class Sinistro:
-    def __init__(self, id_sinistro, data_ocorrencia, descricao, valor_prejuizo, status="Em Análise"):
+    __slots__ = ("id", "_data_ocorrencia", "data_ocorrencia_obj", "descricao", "valor_prejuizo", "status", "data_registro", "versao", "versao_gravada")
+
+    def __init__(self, id_sinistro, data_ocorrencia, descricao, valor_prejuizo, status="Em Análise", data_registro=None):
         self.id = id_sinistro
         self.data_ocorrencia = data_ocorrencia
         self.descricao = descricao
         self.valor_prejuizo = float(valor_prejuizo)
-        self.status = status
-        self.data_registro = datetime.now().strftime("%d/%m/%Y %H:%M:%S")
+        self.status = internar(status)
+        # Data atual só para sinistros novos: na carga a data gravada é usada (sem formatar a hora a cada registro)
+        self.data_registro = data_registro if data_registro is not None else datetime.now().strftime("%d/%m/%Y %H:%M:%S")
+        self.versao = 0 # Controle de alterações (ver Apolice.versao)
+        self.versao_gravada = -1
+    
+    @property
+    def data_ocorrencia(self):
+        return self._data_ocorrencia
+    
+    @data_ocorrencia.setter
+    def data_ocorrencia(self, valor):
+        # O texto (formato gravado nos arquivos) e a data já convertida são mantidos juntos
+        self._data_ocorrencia = internar(valor)
+        self.data_ocorrencia_obj = converter_data(valor)
     
     def __str__(self):
         return f"Sinistro ID: {self.id} - {self.data_ocorrencia}: {self.descricao} - Prejuízo: R${self.valor_prejuizo:.2f} - Status: {self.status}"
@@ -16,22 +32,23 @@ class Sinistro:
     def aprovar(self):
         """Aprova o sinistro"""
         self.status = "Aprovado"
+        self.versao += 1
     
     def recusar(self):
         """Recusa o sinistro"""
         self.status = "Recusado"
+        self.versao += 1
     
     def validar_data_ocorrencia(self, apolice):
         """Verifica se a data de ocorrência não é futura e está dentro da vigência da apólice."""
-        try:
-            data_ocorr_obj = datetime.strptime(self.data_ocorrencia, "%d/%m/%Y")
-            # Verifica se a data de ocorrência não é futura
-            if data_ocorr_obj.date() > datetime.now().date():
-                print("Erro: Data de ocorrência do sinistro não pode ser uma data futura.")
-                return False
-        except ValueError as e:
+        data_ocorr_obj = self.data_ocorrencia_obj
+        if data_ocorr_obj is None:
             print(f"Erro: Formato da data de ocorrência do sinistro inválido ({self.data_ocorrencia}). Use DD/MM/AAAA.")
             return False
+        # Verifica se a data de ocorrência não é futura
+        if data_ocorr_obj > date.today():
+            print("Erro: Data de ocorrência do sinistro não pode ser uma data futura.")
+            return False
         
         if not hasattr(apolice, 'seguro') or not apolice.seguro: 
             print("Aviso: Objeto seguro não encontrado na apólice para validação completa de data do sinistro.")
@@ -41,18 +58,18 @@ class Sinistro:
             return True 
 
         try:
-            # data_ocorr_obj já foi convertida e validada acima
-            data_inicio_apolice = datetime.strptime(apolice.seguro.data_inicio, "%d/%m/%Y")
-            data_fim_apolice = datetime.strptime(apolice.seguro.data_fim, "%d/%m/%Y")
+            # As datas do seguro já foram convertidas ao criar/carregar o seguro
+            data_inicio_apolice = apolice.seguro.data_inicio_obj
+            data_fim_apolice = apolice.seguro.data_fim_obj
+            if data_inicio_apolice is None or data_fim_apolice is None:
+                # Datas da apólice inválidas, o que é menos provável se já foram validadas antes.
+                print(f"Erro ao converter datas da apólice para validação do sinistro: {apolice.seguro.data_inicio} - {apolice.seguro.data_fim}")
+                return False
             
             if not (data_inicio_apolice <= data_ocorr_obj <= data_fim_apolice):
                 print(f"Erro: Data de ocorrência ({self.data_ocorrencia}) fora da vigência da apólice ({apolice.seguro.data_inicio} - {apolice.seguro.data_fim}).")
                 return False
             return True
-        except ValueError as e:
-            # Este erro de ValueError seria para as datas da apólice, o que é menos provável se já foram validadas antes.
-            print(f"Erro ao converter datas da apólice para validação do sinistro: {e}")
-            return False
         except AttributeError as e:
             print(f"Erro ao acessar atributos de data da apólice/seguro durante validação do sinistro: {e}")
             return False
@@ -75,7 +92,7 @@ class Sinistro:
             data["data_ocorrencia"],
             data["descricao"],
             data["valor_prejuizo"],
-            data.get("status", "Em Análise") # .get para retrocompatibilidade se status não existir
+            data.get("status", "Em Análise"), # .get para retrocompatibilidade se status não existir
+            data.get("data_registro") # Ausente em arquivos antigos: data atual
         )
-        sinistro.data_registro = data.get("data_registro", datetime.now().strftime("%d/%m/%Y %H:%M:%S"))
         return sinistro 
\ No newline at end of file
@@ -1,19 +1,66 @@
+from contextlib import contextmanager
 from datetime import datetime
 import json
 import os
+import threading
 from cliente import Cliente
 from seguro import Seguro, SeguroAutomovel, SeguroResidencial, SeguroVida
 from apolice import Apolice
 from sinistro import Sinistro
+from journal import JournalAlteracoes
+from armazenamento import ArmazenamentoJSON, CHAVES_COLECOES
+from indice_vigencia import IndiceVigencia
+from busca_texto import IndiceTrigramas
+from precificacao import calcular_premios
+from importacao import validar_arquivo
+from exportacao import exportar_analitico, tabelas_sistema
+from snapshot import gravar_snapshot, ler_snapshot, impressao_arquivo, arquivo_inalterado
 import uuid # Adicionar para gerar IDs únicos
 
 class SistemaSeguros:
-    def __init__(self):
+    # Campo usado como chave de cada coleção (journal e armazenamento)
+    CHAVES_COLECOES = CHAVES_COLECOES
+    COLECOES_TEXTO = ("clientes", "seguros", "sinistros") # Coleções da busca textual (buscar_texto)
+    ARQUIVO_SNAPSHOT = "dados.snapshot" # Gravado no diretório dos arquivos de dados (ver snapshot.py)
+
+    def __init__(self, armazenamento=None, modo_journal=False, arquivo_journal="alteracoes.journal", intervalo_checkpoint=500,
+                 snapshot=True):
         self.clientes = []
         self.seguros = []  # Adicionado para armazenar seguros
         self.apolices = []
         self.sinistros = [] # Adicionado para armazenar sinistros
+        # Índices hash de cada coleção (chave -> posição na lista) e números das apólices de cada CPF
+        self._indices = {colecao: {} for colecao in self.CHAVES_COLECOES}
+        self._apolices_por_cpf = {}
+        self._indice_vigencia = IndiceVigencia() # Vigência (início/fim do seguro) de cada apólice
+        # Índice de trigramas da busca textual, montado numa thread após cada carga (ver _iniciar_indice_texto)
+        self._indice_texto = None
+        self._trava_texto = threading.Lock()
+        self._geracao_texto = 0 # Incrementada a cada carga; montagens de cargas anteriores são descartadas
+        self._pendencias_texto = [] # (colecao, registro) alterados durante a montagem
+        self._montagem_texto = None
+        # Camada de persistência: ArmazenamentoJSON (padrão, arquivos no diretório atual), ArmazenamentoJSONL
+        # (uma linha por registro, leitura em paralelo) ou ArmazenamentoSQLite
+        self.armazenamento = armazenamento if armazenamento is not None else ArmazenamentoJSON()
+        # No modo journal cada mutação acrescenta uma linha ao journal em vez de reescrever o JSON inteiro;
+        # a cada intervalo_checkpoint alterações os arquivos JSON completos são regravados.
+        self.journal = JournalAlteracoes(arquivo_journal) if modo_journal else None
+        self.intervalo_checkpoint = intervalo_checkpoint
+        # Gravações por coleção (ver estatisticas_gravacao); coleções sem alterações não são regravadas
+        self._estatisticas = {colecao: {"gravacoes": 0, "ignoradas": 0, "registros": 0, "bytes": 0, "bytes_ultima": 0,
+                                        "entradas_journal": 0, "bytes_journal": 0}
+                              for colecao in self.CHAVES_COLECOES}
+        self._em_transacao = False # Dentro de transacao() as gravações ficam para o final
+        # Snapshot binário gravado após cada gravação completa dos arquivos e usado na carga para as coleções
+        # cujos arquivos não mudaram desde então (somente para armazenamentos em arquivos: JSON e JSON Lines)
+        self.arquivo_snapshot = None
+        if snapshot and self.armazenamento.suporta_snapshot:
+            self.arquivo_snapshot = os.path.join(self.armazenamento.diretorio, self.ARQUIVO_SNAPSHOT)
+        self._dados_snapshot = {}
         self.carregar_dados()
+        if self.armazenamento.notifica_alteracoes:
+            # Armazenamento compartilhado (ArmazenamentoRepositorio): registros alterados por outros chegam aqui
+            self.armazenamento.observar(self._aplicar_alteracao_externa)
     
     def cadastrar_cliente(self, nome, cpf, data_nasc, endereco, telefone, email):
         """Cadastra um novo cliente no sistema"""
@@ -47,7 +94,7 @@ class SistemaSeguros:
         
         # 4. Verificar duplicidade usando o CPF limpo
         # c.cpf nos objetos Cliente já está armazenado como string limpa de 11 dígitos
-        if any(c.cpf == cpf_limpo for c in self.clientes):
+        if cpf_limpo in self._indices["clientes"]:
             print(f"Erro: CPF {cpf_limpo} já cadastrado.")
             return None
         
@@ -68,10 +115,10 @@ class SistemaSeguros:
         # 6. Se todas as validações passaram, agora sim criamos o objeto final e adicionamos.
         # (Poderíamos reutilizar cliente_para_validacao, mas recriar é mais explícito se houvesse mais lógica)
         cliente_final = Cliente(nome, cpf_limpo, data_nasc, endereco, telefone, email)
-        self.clientes.append(cliente_final)
+        self._adicionar("clientes", cliente_final)
         
         print(f"Cliente {nome} (CPF: {cpf_limpo}) cadastrado com sucesso!")
-        self.salvar_clientes()
+        self._persistir("clientes", cliente_final)
         return cliente_final
     
     def criar_seguro_automovel(self, valor_cobertura, data_inicio, data_fim, marca, modelo, 
@@ -112,8 +159,8 @@ class SistemaSeguros:
         if not seguro.validar_datas():
             print("Erro: Datas do seguro inválidas.")
             return None
-        self.seguros.append(seguro)
-        self.salvar_seguros() # Salva apenas seguros
+        self._adicionar("seguros", seguro)
+        self._persistir("seguros", seguro) # Salva apenas seguros
         return seguro
 
     def criar_seguro_residencial(self, valor_cobertura, data_inicio, data_fim, 
@@ -141,8 +188,8 @@ class SistemaSeguros:
         if not seguro.validar_datas():
             print("Erro: Datas do seguro inválidas.")
             return None
-        self.seguros.append(seguro)
-        self.salvar_seguros() # Salva apenas seguros
+        self._adicionar("seguros", seguro)
+        self._persistir("seguros", seguro) # Salva apenas seguros
         return seguro
 
     def criar_seguro_vida(self, valor_cobertura, data_inicio, data_fim, beneficiarios, tipos_cobertura):
@@ -167,8 +214,8 @@ class SistemaSeguros:
         if not seguro.validar_datas():
             print("Erro: Datas do seguro inválidas.")
             return None
-        self.seguros.append(seguro)
-        self.salvar_seguros() # Salva apenas seguros
+        self._adicionar("seguros", seguro)
+        self._persistir("seguros", seguro) # Salva apenas seguros
         return seguro
 
     def emitir_apolice(self, cliente, seguro):
@@ -176,10 +223,15 @@ class SistemaSeguros:
         if not cliente or not seguro:
             print("Erro: Cliente ou Seguro inválido para emitir apólice.")
             return None
-        numero_apolice = f"AP-{len(self.apolices) + 1:04d}" 
+        numero_apolice = self.armazenamento.numero_nova_apolice(len(self.apolices)) # Formato de cada armazenamento
         apolice = Apolice(numero_apolice, cliente.cpf, seguro.id) # Usar IDs/referências
-        self.apolices.append(apolice)
-        self.salvar_apolices() # Salva apenas apolices
+        apolice.seguro = seguro
+        try:
+            apolice.calcular_premio()
+        except (TypeError, ValueError, NotImplementedError) as e:
+            print(f"Aviso: prêmio da apólice {numero_apolice} não calculado: {e}")
+        self._adicionar("apolices", apolice)
+        self._persistir("apolices", apolice) # Salva apenas apolices
         print(f"Apólice {numero_apolice} emitida para o cliente {cliente.nome}.")
         return apolice
 
@@ -212,6 +264,11 @@ class SistemaSeguros:
         if not apolice_obj:
             print(f"Erro: Apólice com número {apolice.numero if isinstance(apolice, Apolice) else apolice} não encontrada.")
             return None
+        limite = self.armazenamento.limite_sinistros_por_apolice # Ex.: os dados da interface guardam um sinistro por apólice
+        if limite is not None and len(apolice_obj.sinistros_ids) >= limite:
+            print(f"Erro: A apólice {apolice_obj.numero} já tem {len(apolice_obj.sinistros_ids)} sinistro(s); "
+                  f"o armazenamento aceita no máximo {limite} por apólice.")
+            return None
             
         seguro_obj = self.buscar_seguro_por_id(apolice_obj.seguro_id)
         if not seguro_obj:
@@ -227,203 +284,682 @@ class SistemaSeguros:
             return None
             
         apolice_obj.adicionar_sinistro_id(sinistro.id) # Adiciona o ID do sinistro à apólice
-        self.sinistros.append(sinistro) # Adiciona o sinistro à lista principal de sinistros
-        self.salvar_sinistros()
-        self.salvar_apolices() # Salvar apólices pois o sinistro_id foi adicionado
+        self._adicionar("sinistros", sinistro) # Adiciona o sinistro à lista principal de sinistros
+        self._persistir("sinistros", sinistro)
+        self._persistir("apolices", apolice_obj) # Salvar apólices pois o sinistro_id foi adicionado
         print(f"Sinistro {sinistro_id} registrado para a apólice {apolice_obj.numero}.")
         return sinistro
 
+    def recalcular_premios(self):
+        """Recalcula o prêmio de todas as apólices em lote (ver precificacao.py) e grava as apólices de uma vez.
+           Retorna a quantidade de apólices atualizadas."""
+        seguros = {}
+        for apolice in self.apolices:
+            seguro = apolice.seguro or self._buscar_indexado("seguros", apolice.seguro_id)
+            if seguro:
+                seguros[seguro.id] = seguro
+        premios = calcular_premios(seguros.values())
+        atualizadas = 0
+        for apolice in self.apolices:
+            premio = premios.get(apolice.seguro_id)
+            if premio is not None:
+                apolice.atualizar_premio(premio) # Só marca a apólice como alterada se o prêmio mudar
+                atualizadas += 1
+        if self.journal:
+            self.checkpoint() # Entradas antigas do journal sobrescreveriam os prêmios novos ao recarregar
+        else:
+            self.salvar_apolices() # Grava somente se algum prêmio mudou
+        return atualizadas
+
+    def importar_arquivo(self, caminho, usuario_manager=None, processos=None, senha_padrao="12345"):
+        """Importa uma carteira de um arquivo CSV/XLSX (formato descrito em importacao.py).
+
+        As linhas são validadas em paralelo; as aceitas geram cliente (se o CPF ainda não existir),
+        seguro e apólice, e cada arquivo de dados é gravado uma única vez ao final. Com usuario_manager,
+        cria um usuário (login = CPF) para cada cliente novo, também com uma única gravação.
+        Retorna {"aceitas": n, "rejeitadas": [(numero_linha, [motivos])], "usuarios_recusados": [(login, motivo)]}
+        ou None se o arquivo não puder ser lido (nesse caso nada é importado). Os clientes cujo usuário foi
+        recusado (ex.: login já existente) são importados mesmo assim, mas ficam sem acesso novo."""
+        aceitas, rejeitadas = [], []
+        try:
+            for numero_linha, registro, motivos in validar_arquivo(caminho, processos):
+                if registro is None:
+                    rejeitadas.append((numero_linha, motivos))
+                else:
+                    aceitas.append(registro)
+        except FileNotFoundError:
+            print(f"Erro: Arquivo {caminho} não encontrado.")
+            return None
+        except (ValueError, ImportError, OSError) as e:
+            print(f"Erro ao importar {caminho}: {e}")
+            return None
+
+        novos_clientes, novos_seguros, novas_apolices = [], [], []
+        for registro in aceitas:
+            cliente = self.buscar_cliente_por_cpf(registro["cliente"]["cpf"])
+            if cliente is None:
+                cliente = Cliente.from_dict(registro["cliente"])
+                self._adicionar("clientes", cliente)
+                novos_clientes.append(cliente)
+            dados_seguro = registro["seguro"]
+            dados_seguro["id"] = str(uuid.uuid4())
+            seguro = self._seguro_from_dict(dados_seguro)
+            self._adicionar("seguros", seguro)
+            novos_seguros.append(seguro)
+            apolice = Apolice(self.armazenamento.numero_nova_apolice(len(self.apolices)), cliente.cpf, seguro.id)
+            apolice.cliente = cliente
+            apolice.seguro = seguro
+            self._adicionar("apolices", apolice)
+            novas_apolices.append(apolice)
+
+        if novas_apolices:
+            premios = calcular_premios(novos_seguros)
+            for apolice in novas_apolices:
+                apolice.premio = premios.get(apolice.seguro_id, 0.0)
+            if self.journal:
+                self.checkpoint()
+            else:
+                self.salvar_clientes()
+                self.salvar_seguros()
+                self.salvar_apolices()
+        usuarios_recusados = []
+        if usuario_manager is not None and novos_clientes:
+            usuarios_recusados = usuario_manager.cadastrar_usuarios_em_lote(
+                (cliente.cpf, senha_padrao, "usuario") for cliente in novos_clientes)
+        print(f"Importação de {caminho}: {len(novas_apolices)} apólices importadas, {len(rejeitadas)} linhas rejeitadas.")
+        return {"aceitas": len(novas_apolices), "rejeitadas": rejeitadas, "usuarios_recusados": usuarios_recusados}
+
+    def exportar_analitico(self, diretorio, formato="parquet"):
+        """Exporta apólices (com os campos de cada tipo de seguro), clientes e sinistros para análise,
+        em Parquet ou em CSV dividido em blocos (ver exportacao.exportar_analitico).
+        Retorna True se os arquivos foram gravados ou None em caso de erro."""
+        try:
+            os.makedirs(diretorio, exist_ok=True)
+            exportar_analitico(diretorio, tabelas_sistema(self), formato)
+        except (ValueError, ImportError, OSError) as e:
+            print(f"Erro ao exportar para {diretorio}: {e}")
+            return None
+        print(f"Dados exportados em {formato} para {diretorio}.")
+        return True
+
     def buscar_cliente_por_cpf(self, cpf):
         """Busca um cliente pelo CPF"""
         cpf_filtrado = ''.join(filter(str.isdigit, cpf))
-        for cliente in self.clientes:
-            if cliente.cpf == cpf_filtrado:
-                return cliente
-        return None
+        return self._buscar("clientes", cpf_filtrado)
 
     def buscar_apolice_por_numero(self, numero):
         """Busca uma apólice pelo número"""
-        for apolice in self.apolices:
-            if apolice.numero == numero:
-                return apolice
-        return None
+        return self._buscar("apolices", numero)
 
     def buscar_apolices_por_cliente(self, cpf):
         """Busca todas as apólices de um cliente pelo CPF"""
         cliente = self.buscar_cliente_por_cpf(cpf)
-        if cliente: # cliente é um objeto Cliente
-            # Compara o cliente_cpf armazenado na apólice com o cpf do objeto cliente encontrado
-            return [apolice for apolice in self.apolices if apolice.cliente_cpf == cliente.cpf]
-        return []
+        if not cliente: # cliente é um objeto Cliente
+            return []
+        if self._consultar_armazenamento():
+            return self._objetos_armazenados("apolices", self.armazenamento.buscar_por("apolices", "cliente_cpf", cliente.cpf))
+        return [self._buscar_indexado("apolices", numero) for numero in self._apolices_por_cpf.get(cliente.cpf, [])]
+
+    def buscar_apolices_por_seguro(self, seguro_id):
+        """Busca as apólices de um seguro (consulta indexada no SQLite; nos demais armazenamentos percorre a lista)"""
+        if self._consultar_armazenamento():
+            return self._objetos_armazenados("apolices", self.armazenamento.buscar_por("apolices", "seguro_id", seguro_id))
+        return [apolice for apolice in self.apolices if apolice.seguro_id == seguro_id]
 
     def buscar_seguro_por_id(self, seguro_id):
         """Busca um seguro pelo ID"""
-        for s in self.seguros:
-            if s.id == seguro_id:
-                return s
-        return None
+        return self._buscar("seguros", seguro_id)
 
     def buscar_sinistro_por_id(self, sinistro_id):
         """Busca um sinistro pelo ID"""
-        for s in self.sinistros:
-            if s.id == sinistro_id:
-                return s
-        return None
+        return self._buscar("sinistros", sinistro_id)
+
+    def buscar_sinistros_da_apolice(self, apolice):
+        """Busca os sinistros de uma apólice (objeto ou número) pelos IDs guardados nela"""
+        if not isinstance(apolice, Apolice):
+            apolice = self.buscar_apolice_por_numero(apolice)
+            if apolice is None:
+                return []
+        sinistros = (self._buscar("sinistros", sinistro_id) for sinistro_id in apolice.sinistros_ids)
+        return [sinistro for sinistro in sinistros if sinistro is not None]
+
+    def buscar_apolices_vigentes_em(self, data):
+        """Busca as apólices em vigor na data (date ou 'dd/mm/aaaa')"""
+        return [self._buscar_indexado("apolices", numero) for numero in self._indice_vigencia.vigentes_em(data)]
+
+    def buscar_apolices_vigentes_entre(self, data_inicio, data_fim):
+        """Busca as apólices cuja vigência se sobrepõe ao período informado (datas inclusivas)"""
+        return [self._buscar_indexado("apolices", numero)
+                for numero in self._indice_vigencia.vigentes_entre(data_inicio, data_fim)]
+
+    def buscar_texto(self, consulta, colecoes=None, limite=20):
+        """Busca aproximada (sem acentos, por trechos) em nome/endereço de clientes, endereço do imóvel,
+           placa do veículo e descrição de sinistros. Retorna pares (registro, pontuacao), melhores primeiro.
+           `colecoes` restringe a busca, ex.: ("clientes",)."""
+        if self._indice_texto is None and self._montagem_texto is not None:
+            self._montagem_texto.join() # Montagem em andamento
+        if self._indice_texto is None: # A montagem em segundo plano falhou: monta aqui
+            self._montar_indice_texto(self._descartar_indice_texto(), self._copiar_colecoes_texto())
+        filtro = (lambda doc_id: doc_id[0] in colecoes) if colecoes else None
+        return [(self._buscar_indexado(colecao, chave), pontuacao)
+                for (colecao, chave), pontuacao in self._indice_texto.buscar(consulta, limite=limite, filtro=filtro)]
+
+    def _indexar_texto(self, colecao, registro):
+        """Atualiza o registro no índice textual; durante a montagem ele fica pendente"""
+        if colecao not in self.COLECOES_TEXTO:
+            return
+        with self._trava_texto:
+            if self._indice_texto is None:
+                self._pendencias_texto.append((colecao, registro))
+                return
+        self._indice_texto.atualizar(*self._documento_texto(colecao, registro))
+
+    def _documento_texto(self, colecao, registro):
+        """Par (doc_id, texto) do registro no índice textual"""
+        if colecao == "clientes":
+            texto = f"{registro.nome} {registro.endereco}"
+        elif colecao == "seguros":
+            texto = getattr(registro, "endereco_imovel", None) or getattr(registro, "placa", None) or ""
+        else:
+            texto = registro.descricao
+        return (colecao, getattr(registro, self.CHAVES_COLECOES[colecao])), texto
+
+    def _descartar_indice_texto(self):
+        """Descarta o índice textual e invalida montagens em andamento; retorna a nova geração"""
+        with self._trava_texto:
+            self._geracao_texto += 1
+            self._indice_texto = None
+            self._pendencias_texto = []
+            return self._geracao_texto
+
+    def _copiar_colecoes_texto(self):
+        return [(colecao, list(getattr(self, colecao))) for colecao in self.COLECOES_TEXTO]
+
+    def _iniciar_indice_texto(self):
+        """Monta o índice textual numa thread, a partir de cópias das listas, para que nem a carga nem a
+           primeira busca esperem por ele. Alterações feitas enquanto isso ficam pendentes e são aplicadas
+           ao final; buscar_texto espera a montagem terminar."""
+        geracao = self._descartar_indice_texto()
+        self._montagem_texto = threading.Thread(target=self._montar_indice_texto, name="indice-texto", daemon=True,
+                                                args=(geracao, self._copiar_colecoes_texto()))
+        self._montagem_texto.start()
+
+    def _montar_indice_texto(self, geracao, colecoes):
+        indice = IndiceTrigramas()
+        indice.carregar(self._documento_texto(colecao, registro) for colecao, registros in colecoes for registro in registros)
+        with self._trava_texto:
+            if geracao != self._geracao_texto:
+                return # Os dados foram recarregados durante a montagem
+            for colecao, registro in self._pendencias_texto:
+                indice.atualizar(*self._documento_texto(colecao, registro))
+            self._pendencias_texto = []
+            self._indice_texto = indice
+
+    def _buscar_indexado(self, colecao, chave):
+        posicao = self._indices[colecao].get(chave)
+        if posicao is None:
+            return None
+        return getattr(self, colecao)[posicao]
+
+    def _consultar_armazenamento(self):
+        # Dentro de transacao() as gravações ficam para o final: o banco ainda não tem as alterações
+        return self.armazenamento.suporta_consultas and not self._em_transacao
+
+    def _buscar(self, colecao, chave):
+        """Busca pela chave dos buscar_*: consulta indexada no armazenamento (SQLite) ou índice em memória.
+           Registros que não chegaram ao banco (gravação que falhou) ainda são encontrados em memória."""
+        if self._consultar_armazenamento():
+            registro = self._objeto_armazenado(colecao, self.armazenamento.buscar(colecao, chave))
+            if registro is not None:
+                return registro
+        return self._buscar_indexado(colecao, chave)
+
+    def _objetos_armazenados(self, colecao, registros):
+        objetos = (self._objeto_armazenado(colecao, dados) for dados in registros)
+        return [objeto for objeto in objetos if objeto is not None]
+
+    def _objeto_armazenado(self, colecao, dados):
+        """Objeto de um registro lido do armazenamento. Se ele já está em memória retorna esse objeto, para que
+           alterações e gravações continuem valendo para ele; um registro gravado por outro processo depois da
+           carga é acrescentado à coleção."""
+        if dados is None:
+            return None
+        registro = self._buscar_indexado(colecao, dados.get(self.CHAVES_COLECOES[colecao]))
+        if registro is None:
+            if colecao == "apolices": # Cliente e seguro da apólice também podem ser novos
+                self._buscar("clientes", dados.get("cliente_cpf"))
+                self._buscar("seguros", dados.get("seguro_id"))
+            registro = self._registro_de_dicionario(colecao, dados)
+            if registro is None:
+                return None
+            self._adicionar(colecao, registro)
+            registro.versao_gravada = registro.versao
+        return registro
+
+    def _adicionar(self, colecao, registro):
+        """Acrescenta o registro à coleção mantendo os índices atualizados"""
+        lista = getattr(self, colecao)
+        self._indices[colecao][getattr(registro, self.CHAVES_COLECOES[colecao])] = len(lista)
+        lista.append(registro)
+        if colecao == "apolices":
+            self._apolices_por_cpf.setdefault(registro.cliente_cpf, []).append(registro.numero)
+            self._indexar_vigencia(registro)
+        else:
+            self._indexar_texto(colecao, registro)
+
+    def _indexar_vigencia(self, apolice):
+        seguro = apolice.seguro or self._buscar_indexado("seguros", apolice.seguro_id)
+        if seguro:
+            # Datas já convertidas; se inválidas, o texto é repassado para o índice registrar o aviso
+            self._indice_vigencia.adicionar(apolice.numero, seguro.data_inicio_obj or seguro.data_inicio,
+                                            seguro.data_fim_obj or seguro.data_fim)
+
+    def _reconstruir_indices(self, colecao):
+        """Reconstrói os índices de uma coleção a partir da lista (após carregar os dados)"""
+        campo_chave = self.CHAVES_COLECOES[colecao]
+        indice = {}
+        for posicao, registro in enumerate(getattr(self, colecao)):
+            indice.setdefault(getattr(registro, campo_chave), posicao) # Em chaves duplicadas vale a primeira
+        self._indices[colecao] = indice
+        if colecao == "apolices":
+            self._apolices_por_cpf = {}
+            self._indice_vigencia = IndiceVigencia()
+            for numero, posicao in indice.items():
+                self._apolices_por_cpf.setdefault(self.apolices[posicao].cliente_cpf, []).append(numero)
+                self._indexar_vigencia(self.apolices[posicao])
 
     def carregar_dados(self):
-        """Carrega os dados de clientes, seguros, apólices e sinistros de arquivos JSON"""
+        """Carrega os dados de clientes, seguros, apólices e sinistros de arquivos JSON.
+           Os registros são lidos um a um (armazenamento.iterar) e convertidos em objetos à medida que chegam,
+           sem manter o texto do arquivo nem a lista de dicionários inteira em memória."""
+        self._descartar_indice_texto() # Remontado ao final da carga
+        # Coleções cujos arquivos conferem com o snapshot vêm dele, sem interpretar os arquivos
+        self._dados_snapshot = self._ler_snapshot()
+        # Os índices de cada coleção são montados logo após a carga, pois as apólices são vinculadas por eles
         self._carregar_clientes()
+        self._reconstruir_indices("clientes")
         self._carregar_seguros()
+        self._reconstruir_indices("seguros")
         self._carregar_sinistros() # Carregar sinistros antes de apólices para referência
+        self._reconstruir_indices("sinistros")
         self._carregar_apolices() # Apólices referenciam clientes, seguros e sinistros
+        self._reconstruir_indices("apolices")
+        self._dados_snapshot = {}
+        # O que veio do armazenamento já está gravado; registros do journal (objetos novos) ficam pendentes
+        for colecao in self.CHAVES_COLECOES:
+            for registro in getattr(self, colecao):
+                registro.versao_gravada = registro.versao
+        if self.journal:
+            self._reaplicar_journal() # Alterações posteriores ao último checkpoint
+        self._iniciar_indice_texto()
+
+    def _registros_armazenados(self, colecao):
+        """Dicionários da coleção: do snapshot, se ele foi lido, ou do armazenamento"""
+        registros = self._dados_snapshot.pop(colecao, None)
+        return registros if registros is not None else self.armazenamento.iterar(colecao)
+
+    def _ler_snapshot(self):
+        """Coleções do snapshot cujos arquivos de dados não mudaram desde que ele foi gravado (mesma
+           impressao_arquivo: um stat por arquivo); as demais (ou todas, sem snapshot) são lidas dos arquivos."""
+        if not self.arquivo_snapshot or not os.path.exists(self.arquivo_snapshot):
+            return {}
+        try:
+            colecoes, arquivos = ler_snapshot(self.arquivo_snapshot)
+        except (ValueError, OSError) as e:
+            print(f"Aviso: snapshot {self.arquivo_snapshot} ignorado: {e}")
+            return {}
+        return {colecao: registros for colecao, registros in colecoes.items()
+                if colecao in arquivos and arquivo_inalterado(self.armazenamento.caminho(colecao), arquivos[colecao])}
+
+    def gravar_snapshot(self):
+        """Grava o snapshot com as coleções sem registros pendentes de gravação (iguais aos arquivos); as que têm
+           alterações só no journal ficam de fora e são lidas dos arquivos na próxima carga. Chamado após cada
+           gravação completa (_salvar_colecao, _salvar_lote). Retorna os bytes gravados, ou None se não houver
+           snapshot ou a gravação falhar."""
+        if not self.arquivo_snapshot:
+            return None
+        try:
+            colecoes = {colecao: [registro.to_dict() for registro in getattr(self, colecao)]
+                        for colecao in self.CHAVES_COLECOES
+                        if all(registro.versao_gravada == registro.versao for registro in getattr(self, colecao))}
+            arquivos = {colecao: impressao_arquivo(self.armazenamento.caminho(colecao)) for colecao in colecoes}
+            return gravar_snapshot(self.arquivo_snapshot, colecoes, arquivos)
+        except (ValueError, TypeError, OSError) as e:
+            print(f"Erro ao gravar o snapshot {self.arquivo_snapshot}: {e}")
+            return None
 
     def _carregar_clientes(self):
-        if os.path.exists("clientes.json"):
-            try:
-                with open("clientes.json", "r") as f:
-                    clientes_data = json.load(f)
-                    self.clientes = [Cliente.from_dict(c) for c in clientes_data]
-            except json.JSONDecodeError:
-                print("Erro ao decodificar clientes.json.")
-                self.clientes = []
-            except Exception as e:
-                print(f"Erro ao carregar clientes.json: {e}")
-                self.clientes = []
-        else:
+        try:
+            clientes_data = self._registros_armazenados("clientes")
+            self.clientes = [Cliente.from_dict(c) for c in clientes_data]
+        except json.JSONDecodeError:
+            print("Erro ao decodificar clientes.json.")
+            self.clientes = []
+        except Exception as e:
+            print(f"Erro ao carregar clientes: {e}")
             self.clientes = []
-            # Criar o arquivo se não existir
-            with open("clientes.json", "w") as f:
-                json.dump([], f)
 
     def _carregar_seguros(self):
-        if os.path.exists("seguros.json"):
-            try:
-                with open("seguros.json", "r") as f:
-                    seguros_data = json.load(f)
-                    temp_seguros = []
-                    for s_data in seguros_data:
-                        tipo_seguro = s_data.get("tipo")
-                        seguro_obj = None
-                        if tipo_seguro == "Automóvel":
-                            seguro_obj = SeguroAutomovel.from_dict(s_data)
-                        elif tipo_seguro == "Residencial":
-                            seguro_obj = SeguroResidencial.from_dict(s_data)
-                        elif tipo_seguro == "Vida":
-                            seguro_obj = SeguroVida.from_dict(s_data)
-                        else: 
-                            seguro_obj = Seguro.from_dict(s_data)
-                        if seguro_obj:
-                            temp_seguros.append(seguro_obj)
-                    self.seguros = temp_seguros
-            except json.JSONDecodeError:
-                print("Erro ao decodificar seguros.json.")
-                self.seguros = []
-            except Exception as e:
-                print(f"Erro ao carregar seguros.json: {e}")
-                self.seguros = []
-        else:
+        try:
+            seguros_data = self._registros_armazenados("seguros")
+            temp_seguros = []
+            for s_data in seguros_data:
+                seguro_obj = self._seguro_from_dict(s_data)
+                if seguro_obj:
+                    temp_seguros.append(seguro_obj)
+            self.seguros = temp_seguros
+        except json.JSONDecodeError:
+            print("Erro ao decodificar seguros.json.")
+            self.seguros = []
+        except Exception as e:
+            print(f"Erro ao carregar seguros: {e}")
             self.seguros = []
-            with open("seguros.json", "w") as f:
-                json.dump([], f)
 
     def _carregar_sinistros(self):
-        if os.path.exists("sinistros.json"):
-            try:
-                with open("sinistros.json", "r") as f:
-                    sinistros_data = json.load(f)
-                    self.sinistros = [Sinistro.from_dict(s) for s in sinistros_data]
-            except json.JSONDecodeError:
-                print("Erro ao decodificar sinistros.json.")
-                self.sinistros = []
-            except Exception as e:
-                print(f"Erro ao carregar sinistros.json: {e}")
-                self.sinistros = []
-        else:
+        try:
+            sinistros_data = self._registros_armazenados("sinistros")
+            self.sinistros = [Sinistro.from_dict(s) for s in sinistros_data]
+        except json.JSONDecodeError:
+            print("Erro ao decodificar sinistros.json.")
+            self.sinistros = []
+        except Exception as e:
+            print(f"Erro ao carregar sinistros: {e}")
             self.sinistros = []
-            with open("sinistros.json", "w") as f:
-                json.dump([], f)
 
     def _carregar_apolices(self):
-        if os.path.exists("apolices.json"):
-            try:
-                with open("apolices.json", "r") as f:
-                    apolices_data = json.load(f)
-                    temp_apolices = []
-                    for ap_data in apolices_data:
-                        cliente_cpf = ap_data.get("cliente_cpf")
-                        seguro_id = ap_data.get("seguro_id")
-                        
-                        cliente_obj = self.buscar_cliente_por_cpf(cliente_cpf)
-                        seguro_obj = self.buscar_seguro_por_id(seguro_id)
-
-                        if cliente_obj and seguro_obj:
-                            # Passar os objetos reais para o from_dict da Apolice, se necessário,
-                            # ou apenas os IDs e o from_dict lida com a busca (precisa de acesso ao sistema ou listas)
-                            # A abordagem atual do from_dict da Apolice precisará ser ajustada
-                            apolice = Apolice.from_dict(ap_data, cliente_obj, seguro_obj) # Ajustar Apolice.from_dict
-                            
-                            # Recuperar e vincular sinistros
-                            sinistros_ids_na_apolice = ap_data.get("sinistros_ids", [])
-                            for sinistro_id in sinistros_ids_na_apolice:
-                                sinistro_obj = self.buscar_sinistro_por_id(sinistro_id)
-                                if sinistro_obj:
-                                    # Apolice deve ter um método para adicionar o objeto sinistro, não o ID aqui
-                                    if not hasattr(apolice, 'sinistros'): # Garantir que a lista exista
-                                        apolice.sinistros = []
-                                    if sinistro_obj not in apolice.sinistros: # Evitar duplicatas se já carregado de alguma forma
-                                        apolice.sinistros.append(sinistro_obj)
-                                else:
-                                    print(f"Aviso: Sinistro com ID {sinistro_id} referenciado pela apólice {apolice.numero} não encontrado.")
-                            temp_apolices.append(apolice)
-                        else:
-                            if not cliente_obj:
-                                print(f"Cliente CPF {cliente_cpf} não encontrado para apólice {ap_data.get('numero')}. Pulando.")
-                            if not seguro_obj:
-                                print(f"Seguro ID {seguro_id} não encontrado para apólice {ap_data.get('numero')}. Pulando.")
-                    self.apolices = temp_apolices
-            except json.JSONDecodeError:
-                print("Erro ao decodificar apolices.json.")
-                self.apolices = []
-            except Exception as e:
-                print(f"Erro ao carregar apolices.json: {e}")
-                self.apolices = []
-        else:
+        try:
+            apolices_data = self._registros_armazenados("apolices")
+            temp_apolices = []
+            for ap_data in apolices_data:
+                apolice = self._montar_apolice(ap_data)
+                if apolice:
+                    temp_apolices.append(apolice)
+            self.apolices = temp_apolices
+        except json.JSONDecodeError:
+            print("Erro ao decodificar apolices.json.")
             self.apolices = []
-            with open("apolices.json", "w") as f:
-                json.dump([], f)
+        except Exception as e:
+            print(f"Erro ao carregar apolices: {e}")
+            self.apolices = []
+
+    def _seguro_from_dict(self, s_data):
+        """Instancia a subclasse de Seguro correspondente ao campo 'tipo' do dicionário"""
+        tipo_seguro = s_data.get("tipo")
+        if tipo_seguro == "Automóvel":
+            return SeguroAutomovel.from_dict(s_data)
+        elif tipo_seguro == "Residencial":
+            return SeguroResidencial.from_dict(s_data)
+        elif tipo_seguro == "Vida":
+            return SeguroVida.from_dict(s_data)
+        return Seguro.from_dict(s_data)
 
-    def salvar_dados(self):
-        """Salva todos os dados (clientes, seguros, apólices, sinistros)"""
-        self.salvar_clientes()
-        self.salvar_seguros()
-        self.salvar_apolices()
-        self.salvar_sinistros()
+    def _registro_de_dicionario(self, colecao, dados):
+        """Objeto da coleção a partir do dicionário gravado (None se a apólice não puder ser montada)"""
+        if colecao == "clientes":
+            return Cliente.from_dict(dados)
+        elif colecao == "seguros":
+            return self._seguro_from_dict(dados)
+        elif colecao == "sinistros":
+            return Sinistro.from_dict(dados)
+        return self._montar_apolice(dados)
 
-    def salvar_clientes(self):
+    def _montar_apolice(self, ap_data):
+        """Cria a Apolice a partir do dicionário, vinculando cliente, seguro e sinistros já carregados"""
+        cliente_cpf = ap_data.get("cliente_cpf")
+        seguro_id = ap_data.get("seguro_id")
+        
+        # Na carga (e para registros lidos por _objeto_armazenado) a apólice é vinculada pelos índices em memória
+        cliente_obj = self._buscar_indexado("clientes", cliente_cpf)
+        seguro_obj = self._buscar_indexado("seguros", seguro_id)
+
+        if not cliente_obj or not seguro_obj:
+            if not cliente_obj:
+                print(f"Cliente CPF {cliente_cpf} não encontrado para apólice {ap_data.get('numero')}. Pulando.")
+            if not seguro_obj:
+                print(f"Seguro ID {seguro_id} não encontrado para apólice {ap_data.get('numero')}. Pulando.")
+            return None
+
+        apolice = Apolice.from_dict(ap_data, cliente_obj, seguro_obj)
+        
+        # Os sinistros ficam só como IDs na apólice (ver buscar_sinistros_da_apolice); aqui apenas são conferidos
+        for sinistro_id in apolice.sinistros_ids:
+            if sinistro_id not in self._indices["sinistros"]:
+                print(f"Aviso: Sinistro com ID {sinistro_id} referenciado pela apólice {apolice.numero} não encontrado.")
+        return apolice
+
+    def _reaplicar_journal(self):
+        """Reaplica sobre os dados carregados as alterações registradas no journal desde o último checkpoint.
+           As entradas são upserts por chave, então reaplicar uma alteração já incorporada é inofensivo."""
+        total = 0
+        for operacao, colecao, chave, dados in self.journal.ler_alteracoes():
+            if colecao not in self.CHAVES_COLECOES or operacao != "upsert":
+                print(f"Aviso: entrada de journal desconhecida ({operacao}, {colecao}) ignorada.")
+                continue
+            registro = self._registro_de_dicionario(colecao, dados)
+            if registro is None:
+                continue
+            self._substituir_ou_adicionar(colecao, chave, registro)
+            total += 1
+        if total:
+            print(f"{total} alterações reaplicadas a partir do journal {self.journal.arquivo}.")
+
+    def _aplicar_alteracao_externa(self, colecao, dados):
+        """Substitui (ou acrescenta) o objeto de um registro alterado no armazenamento por outro usuário dele,
+           como na reaplicação do journal. O objeto novo já está gravado; as apólices do cliente passam a
+           referenciar o cliente novo."""
+        registro = self._registro_de_dicionario(colecao, dados)
+        if registro is None:
+            return
+        chave = getattr(registro, self.CHAVES_COLECOES[colecao])
+        self._substituir_ou_adicionar(colecao, chave, registro)
+        registro.versao_gravada = registro.versao
+        if colecao == "clientes":
+            for numero in self._apolices_por_cpf.get(chave, []):
+                self._buscar_indexado("apolices", numero).cliente = registro
+
+    def _substituir_ou_adicionar(self, colecao, chave, registro):
+        """Substitui o registro com a mesma chave na coleção ou o acrescenta ao final"""
+        posicao = self._indices[colecao].get(chave)
+        if posicao is None:
+            self._adicionar(colecao, registro)
+            return
+        lista = getattr(self, colecao)
+        if colecao == "apolices" and lista[posicao].cliente_cpf != registro.cliente_cpf:
+            self._apolices_por_cpf[lista[posicao].cliente_cpf].remove(chave)
+            self._apolices_por_cpf.setdefault(registro.cliente_cpf, []).append(chave)
+        lista[posicao] = registro
+        if colecao == "apolices":
+            self._indexar_vigencia(registro)
+        else:
+            self._indexar_texto(colecao, registro)
+
+    def _persistir(self, colecao, registro):
+        """Persiste a alteração de um registro da coleção.
+           Com armazenamento por registro (SQLite) ou no modo journal grava somente o registro alterado;
+           caso contrário reescreve o arquivo da coleção (se o registro de fato mudou desde a última gravação)."""
+        if self._em_transacao:
+            return # O registro continua pendente e é gravado ao final da transação
+        estatisticas = self._estatisticas[colecao]
+        if self.armazenamento.suporta_gravacao_por_registro:
+            if registro.versao_gravada == registro.versao:
+                estatisticas["ignoradas"] += 1
+                return
+            try:
+                gravados = self.armazenamento.salvar_registro(colecao, registro.to_dict()) or 0
+            except Exception as e:
+                print(f"Erro ao salvar registro de {colecao}: {e}")
+                return
+            registro.versao_gravada = registro.versao
+            self._contabilizar(colecao, 1, gravados)
+            return
+        if not self.journal:
+            getattr(self, f"salvar_{colecao}")()
+            return
+        chave = getattr(registro, self.CHAVES_COLECOES[colecao])
         try:
-            with open("clientes.json", "w") as f:
-                json.dump([c.to_dict() for c in self.clientes], f, indent=4)
+            gravados = self.journal.registrar(colecao, chave, registro.to_dict())
         except Exception as e:
-            print(f"Erro ao salvar clientes.json: {e}")
+            print(f"Erro ao registrar alteração no journal: {e}. Gravando os arquivos completos (checkpoint).")
+            # Gravar só a coleção deixaria no journal entradas antigas deste registro, que seriam
+            # reaplicadas sobre os dados novos na próxima carga: o checkpoint grava tudo e esvazia o journal
+            self.checkpoint()
+            return
+        # O registro continua pendente (versao_gravada inalterada): o próximo checkpoint regrava a coleção
+        estatisticas["entradas_journal"] += 1
+        estatisticas["bytes_journal"] += gravados
+        if self.journal.total_registros >= self.intervalo_checkpoint:
+            self.checkpoint()
 
-    def salvar_seguros(self):
+    def _contabilizar(self, colecao, registros, gravados):
+        estatisticas = self._estatisticas[colecao]
+        estatisticas["gravacoes"] += 1
+        estatisticas["registros"] += registros
+        estatisticas["bytes"] += gravados
+        estatisticas["bytes_ultima"] = gravados
+
+    def _salvar_colecao(self, colecao, forcar=False):
+        """Grava a coleção se algum registro foi incluído ou alterado desde a última gravação.
+           Com armazenamento por registro grava somente os registros alterados; nos arquivos JSON reescreve
+           a coleção inteira. forcar=True grava tudo mesmo sem alterações (ex.: após editar atributos
+           diretamente, sem os métodos que incrementam a versão). Retorna os bytes gravados."""
+        if self._em_transacao:
+            return 0 # Gravado ao final da transação
+        registros = getattr(self, colecao)
+        alterados = registros if forcar else [r for r in registros if r.versao_gravada != r.versao]
+        if not alterados:
+            self._estatisticas[colecao]["ignoradas"] += 1
+            return 0
         try:
-            with open("seguros.json", "w") as f:
-                json.dump([s.to_dict() for s in self.seguros], f, indent=4)
+            if self.armazenamento.suporta_gravacao_por_registro:
+                # Não há exclusões no sistema: gravar os alterados equivale a substituir a coleção
+                gravados = sum(self.armazenamento.salvar_registro(colecao, r.to_dict()) or 0 for r in alterados)
+            else:
+                alterados = registros
+                gravados = self.armazenamento.salvar_colecao(colecao, [r.to_dict() for r in registros]) or 0
         except Exception as e:
-            print(f"Erro ao salvar seguros.json: {e}")
-    
-    def salvar_apolices(self):
+            print(f"Erro ao salvar {colecao}: {e}")
+            return 0
+        for registro in alterados:
+            registro.versao_gravada = registro.versao
+        self._contabilizar(colecao, len(alterados), gravados)
+        self.gravar_snapshot()
+        return gravados
+
+    def estatisticas_gravacao(self):
+        """Gravações de cada coleção desde a carga: {colecao: {"gravacoes", "ignoradas" (sem alterações,
+           nada gravado), "registros" e "bytes" gravados no armazenamento, "bytes_ultima" (última gravação),
+           "entradas_journal", "bytes_journal"}}"""
+        return {colecao: dict(estatisticas) for colecao, estatisticas in self._estatisticas.items()}
+
+    def _salvar_lote(self):
+        """Grava de uma só vez todas as coleções com registros pendentes (armazenamento.salvar_lote: uma
+           transação no SQLite, substituição atômica dos arquivos JSON). Levanta a exceção se a gravação falhar."""
+        lote, gravar = {}, {}
+        for colecao in self.CHAVES_COLECOES:
+            registros = getattr(self, colecao)
+            alterados = [r for r in registros if r.versao_gravada != r.versao]
+            if not alterados:
+                self._estatisticas[colecao]["ignoradas"] += 1
+                continue
+            if not self.armazenamento.suporta_gravacao_por_registro:
+                alterados = registros
+            gravar[colecao] = alterados
+            lote[colecao] = [r.to_dict() for r in alterados]
+        if not lote:
+            return 0
+        gravados = self.armazenamento.salvar_lote(lote) or {} # Bytes gravados por coleção
+        for colecao, alterados in gravar.items():
+            for registro in alterados:
+                registro.versao_gravada = registro.versao
+            self._contabilizar(colecao, len(alterados), gravados.get(colecao, 0))
+        self.gravar_snapshot()
+        return sum(gravados.values())
+
+    def checkpoint(self, propagar_erros=False):
+        """Incorpora o journal aos arquivos JSON completos e o esvazia.
+           As coleções alteradas são gravadas juntas e atomicamente; se a gravação falhar o journal é mantido
+           (e, com propagar_erros=True, como no final de transacao(), a exceção é repassada)."""
+        if self._em_transacao:
+            return # A transação grava tudo ao final
         try:
-            with open("apolices.json", "w") as f:
-                # Certifique-se que Apolice.to_dict() usa seguro_id e sinistros_ids
-                json.dump([ap.to_dict() for ap in self.apolices], f, indent=4)
+            self._salvar_lote()
         except Exception as e:
-            print(f"Erro ao salvar apolices.json: {e}")
+            if propagar_erros:
+                raise
+            print(f"Erro ao gravar os dados no checkpoint: {e}")
+            return
+        if self.journal:
+            self.journal.limpar()
+
+    def verificar_integridade(self):
+        """Verifica as referências dos registros pendentes de gravação: cliente, seguro e sinistros de cada
+           apólice alterada devem existir, e cada sinistro novo deve pertencer a uma apólice.
+           Retorna a lista de problemas encontrados (vazia se não houver)."""
+        problemas = []
+        referenciados = set()
+        for apolice in self.apolices:
+            if apolice.versao_gravada == apolice.versao:
+                continue
+            if self._buscar_indexado("clientes", apolice.cliente_cpf) is None:
+                problemas.append(f"Apólice {apolice.numero}: cliente {apolice.cliente_cpf} não encontrado.")
+            if self._buscar_indexado("seguros", apolice.seguro_id) is None:
+                problemas.append(f"Apólice {apolice.numero}: seguro {apolice.seguro_id} não encontrado.")
+            for sinistro_id in apolice.sinistros_ids:
+                referenciados.add(sinistro_id)
+                if self._buscar_indexado("sinistros", sinistro_id) is None:
+                    problemas.append(f"Apólice {apolice.numero}: sinistro {sinistro_id} não encontrado.")
+        for sinistro in self.sinistros:
+            if sinistro.versao_gravada == -1 and sinistro.id not in referenciados:
+                problemas.append(f"Sinistro {sinistro.id} não pertence a nenhuma apólice alterada.")
+        return problemas
+
+    @contextmanager
+    def transacao(self):
+        """Agrupa várias operações em uma única gravação:
+
+            with sistema.transacao():
+                cliente = sistema.cadastrar_cliente(...)
+                seguro = sistema.criar_seguro_vida(...)
+                sistema.emitir_apolice(cliente, seguro)
 
-    def salvar_sinistros(self):
+        Dentro do bloco nada é gravado (nem no journal). Ao sair, as referências dos registros alterados são
+        verificadas (verificar_integridade) e é feito um checkpoint: todas as coleções alteradas são gravadas
+        juntas, atomicamente, e o journal e o snapshot são atualizados. Se o bloco levantar uma exceção, a verificação falhar
+        (ValueError) ou a gravação falhar, os dados em memória são recarregados do armazenamento, desfazendo
+        as alterações da transação, e a exceção é repassada: objetos obtidos dentro do bloco deixam de valer.
+        Transações aninhadas fazem parte da mais externa."""
+        if self._em_transacao:
+            yield self
+            return
+        self._em_transacao = True
         try:
-            with open("sinistros.json", "w") as f:
-                json.dump([s.to_dict() for s in self.sinistros], f, indent=4)
-        except Exception as e:
-            print(f"Erro ao salvar sinistros.json: {e}") 
\ No newline at end of file
+            yield self
+            problemas = self.verificar_integridade()
+            if problemas:
+                raise ValueError("Integridade violada: " + " ".join(problemas))
+            self._em_transacao = False
+            self.checkpoint(propagar_erros=True)
+        except BaseException as e:
+            self._em_transacao = False
+            print(f"Transação desfeita: {e}")
+            self.carregar_dados()
+            raise
+
+    def salvar_dados(self, forcar=False):
+        """Salva os dados alterados (clientes, seguros, apólices, sinistros); coleções sem alterações são
+           mantidas como estão. Retorna o total de bytes gravados."""
+        return (self.salvar_clientes(forcar) + self.salvar_seguros(forcar) +
+                self.salvar_apolices(forcar) + self.salvar_sinistros(forcar))
+
+    def salvar_clientes(self, forcar=False):
+        return self._salvar_colecao("clientes", forcar)
+
+    def salvar_seguros(self, forcar=False):
+        return self._salvar_colecao("seguros", forcar)
+    
+    def salvar_apolices(self, forcar=False):
+        # Certifique-se que Apolice.to_dict() usa seguro_id e sinistros_ids
+        return self._salvar_colecao("apolices", forcar)
+
+    def salvar_sinistros(self, forcar=False):
+        return self._salvar_colecao("sinistros", forcar)
\ No newline at end of file
@@ -0,0 +1,246 @@
+"""Snapshot binário das coleções do SistemaSeguros e da interface, para carregar os dados sem interpretar os arquivos JSON.
+
+O SistemaSeguros e o RepositorioDados gravam o snapshot ao lado dos arquivos de dados sempre que regravam
+um arquivo inteiro e o usam na carga enquanto os arquivos JSON não forem alterados (o snapshot guarda tamanho,
+data de modificação, inode e data de alteração do inode de cada um, obtidos com um único stat, sem ler o arquivo;
+a data de alteração do inode não pode ser restaurada por quem edita o arquivo). Se não conferirem, os arquivos
+JSON são lidos normalmente. Sem pickle: só struct, array e JSON.
+
+Formato (inteiros little-endian):
+    cabeçalho: MAGICO, versão (H), CRC32 do conteúdo (I), tamanho do conteúdo (Q)
+    conteúdo:  metadados em JSON (coleções, colunas e seus tipos, arquivos de origem), precedidos do tamanho (Q);
+               tabela de textos: tamanho de cada texto (array I) e os textos UTF-8 concatenados;
+               colunas de cada coleção, na ordem dos metadados.
+
+Cada coleção é gravada por colunas (um campo dos registros por coluna):
+    "S" texto:           código na tabela de textos (array I); cada texto distinto é gravado uma única vez
+    "N" número:          array d, mais um estado por linha (float, int, None ou campo ausente) quando necessário
+    "L" lista de textos: tamanho de cada lista (array I) e os códigos dos textos (array I)
+    "J" outros valores:  o JSON do valor, como texto da tabela
+Os códigos 0 e 1 da tabela de textos representam None e campo ausente."""
+import json
+import os
+import struct
+import sys
+import zlib
+from array import array
+from itertools import accumulate
+
+MAGICO = b"SGSNAP"
+VERSAO = 3 # 3: impressão dos arquivos de origem por stat (tamanho, datas e inode), sem CRC do conteúdo
+_CABECALHO = struct.Struct("<6sHIQ")
+_TAMANHO = struct.Struct("<Q")
+
+_AUSENTE = object() # Campo que não existe no registro (seguros de tipos diferentes têm campos diferentes)
+_NENHUM_CODIGO, _AUSENTE_CODIGO = 0, 1
+_NUMERO_FLOAT, _NUMERO_INT, _NUMERO_NENHUM, _NUMERO_AUSENTE = 0, 1, 2, 3
+_LISTA_NENHUMA, _LISTA_AUSENTE = 0xFFFFFFFF, 0xFFFFFFFE
+_MAIOR_INTEIRO_EXATO = 2 ** 53 # Inteiros representados sem perda em um double
+
+def impressao_arquivo(caminho):
+    """[tamanho, data de modificação em ns, inode, data de alteração do inode em ns] do arquivo, ou None se ele
+       não existir. A data de alteração do inode muda a cada gravação ou substituição do arquivo, mesmo que
+       tamanho e data de modificação sejam mantidos (datas de baixa resolução, os.utime após uma edição externa)."""
+    try:
+        estado = os.stat(caminho)
+    except FileNotFoundError:
+        return None
+    return [estado.st_size, estado.st_mtime_ns, estado.st_ino, estado.st_ctime_ns]
+
+def arquivo_inalterado(caminho, impressao):
+    """Se o arquivo ainda corresponde à impressao_arquivo gravada (só o stat: o conteúdo não é lido)"""
+    return impressao_arquivo(caminho) == impressao
+
+# --- Gravação ---
+
+def _tipo_coluna(valores):
+    tipo = None
+    for valor in valores:
+        if valor is None or valor is _AUSENTE:
+            continue
+        classe = type(valor)
+        if classe is str:
+            atual = "S"
+        elif classe is float or (classe is int and -_MAIOR_INTEIRO_EXATO <= valor <= _MAIOR_INTEIRO_EXATO):
+            atual = "N"
+        elif classe is list and all(type(item) is str for item in valor):
+            atual = "L"
+        else:
+            return "J"
+        if tipo is None:
+            tipo = atual
+        elif tipo != atual:
+            return "J"
+    return tipo or "S"
+
+def _bytes_array(dados):
+    if sys.byteorder == "big":
+        dados = array(dados.typecode, dados)
+        dados.byteswap()
+    return _TAMANHO.pack(len(dados)) + dados.tobytes()
+
+def gravar_snapshot(caminho, colecoes, arquivos=None):
+    """Grava o snapshot de colecoes ({nome: lista de dicionários}); arquivos ({nome: impressao_arquivo})
+       identifica os arquivos de origem. A gravação é atômica (arquivo temporário + renomeação).
+       Retorna os bytes gravados."""
+    textos = {None: _NENHUM_CODIGO, _AUSENTE: _AUSENTE_CODIGO}
+    def codigo(texto):
+        valor = textos.get(texto)
+        if valor is None:
+            valor = textos[texto] = len(textos)
+        return valor
+
+    metadados = {"colecoes": [], "arquivos": arquivos or {}}
+    partes = []
+    for nome, registros in colecoes.items():
+        campos = {}
+        for registro in registros:
+            for campo in registro:
+                campos.setdefault(campo, None)
+        colunas = []
+        for campo in campos:
+            valores = [registro.get(campo, _AUSENTE) for registro in registros]
+            tipo = _tipo_coluna(valores)
+            if tipo == "S":
+                partes.append(_bytes_array(array("I", map(codigo, valores))))
+            elif tipo == "N":
+                numeros = array("d", (valor if type(valor) in (int, float) else 0.0 for valor in valores))
+                estados = bytes(_NUMERO_FLOAT if type(valor) is float else _NUMERO_INT if type(valor) is int
+                                else _NUMERO_NENHUM if valor is None else _NUMERO_AUSENTE for valor in valores)
+                partes.append(_bytes_array(numeros))
+                # Os estados só são gravados se algum valor não for float (o caso comum de valores monetários)
+                partes.append(_bytes_array(array("B", estados if any(estados) else b"")))
+            elif tipo == "L":
+                tamanhos = array("I", (len(valor) if type(valor) is list else
+                                       _LISTA_NENHUMA if valor is None else _LISTA_AUSENTE for valor in valores))
+                itens = array("I", (codigo(item) for valor in valores if type(valor) is list for item in valor))
+                partes.append(_bytes_array(tamanhos))
+                partes.append(_bytes_array(itens))
+            else:
+                partes.append(_bytes_array(array("I", (
+                    codigo(valor if valor is None or valor is _AUSENTE else json.dumps(valor, ensure_ascii=False))
+                    for valor in valores))))
+            colunas.append([campo, tipo])
+        metadados["colecoes"].append({"nome": nome, "registros": len(registros), "colunas": colunas})
+
+    lista_textos = list(textos)[2:]
+    # Tamanhos em caracteres: na leitura o bloco é decodificado de uma vez e fatiado
+    tabela = _bytes_array(array("I", map(len, lista_textos)))
+    bloco_textos = "".join(lista_textos).encode("utf-8", "surrogatepass")
+    texto_metadados = json.dumps(metadados, ensure_ascii=False).encode("utf-8")
+    conteudo = b"".join([_TAMANHO.pack(len(texto_metadados)), texto_metadados,
+                         tabela, _TAMANHO.pack(len(bloco_textos)), bloco_textos] + partes)
+
+    temporario = f"{caminho}.tmp"
+    try:
+        with open(temporario, "wb") as f:
+            f.write(_CABECALHO.pack(MAGICO, VERSAO, zlib.crc32(conteudo), len(conteudo)))
+            f.write(conteudo)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporario, caminho)
+    finally:
+        if os.path.exists(temporario):
+            os.remove(temporario)
+    return _CABECALHO.size + len(conteudo)
+
+# --- Leitura ---
+
+class _Leitor:
+    def __init__(self, conteudo):
+        self.conteudo = memoryview(conteudo)
+        self.posicao = 0
+
+    def bytes(self, tamanho):
+        if self.posicao + tamanho > len(self.conteudo):
+            raise ValueError("Snapshot truncado.")
+        inicio = self.posicao
+        self.posicao += tamanho
+        return self.conteudo[inicio:self.posicao]
+
+    def tamanho(self):
+        return _TAMANHO.unpack(self.bytes(_TAMANHO.size))[0]
+
+    def array(self, tipo):
+        dados = array(tipo)
+        quantidade = self.tamanho()
+        dados.frombytes(self.bytes(quantidade * dados.itemsize))
+        if sys.byteorder == "big":
+            dados.byteswap()
+        return dados
+
+def ler_snapshot(caminho):
+    """Lê o snapshot. Retorna ({nome: iterador dos dicionários}, {nome: impressao_arquivo dos arquivos de origem}).
+       As colunas são decodificadas na leitura; cada dicionário só é montado ao ser consumido, para que quem
+       converte os registros em objetos não mantenha todos os dicionários em memória ao mesmo tempo.
+       Levanta ValueError se o arquivo não for um snapshot desta versão ou estiver corrompido (checksum)."""
+    with open(caminho, "rb") as f:
+        cabecalho = f.read(_CABECALHO.size)
+        if len(cabecalho) != _CABECALHO.size:
+            raise ValueError(f"{caminho} não é um snapshot.")
+        magico, versao, crc, tamanho = _CABECALHO.unpack(cabecalho)
+        if magico != MAGICO:
+            raise ValueError(f"{caminho} não é um snapshot.")
+        if versao != VERSAO:
+            raise ValueError(f"{caminho} usa a versão {versao} do snapshot; esta versão lê a {VERSAO}.")
+        conteudo = f.read()
+    if len(conteudo) != tamanho or zlib.crc32(conteudo) != crc:
+        raise ValueError(f"Snapshot {caminho} corrompido (checksum não confere).")
+
+    leitor = _Leitor(conteudo)
+    metadados = json.loads(bytes(leitor.bytes(leitor.tamanho())).decode("utf-8"))
+    tamanhos = leitor.array("I")
+    bloco = bytes(leitor.bytes(leitor.tamanho())).decode("utf-8", "surrogatepass")
+    fins = list(accumulate(tamanhos))
+    tabela = [None, _AUSENTE]
+    tabela.extend(bloco[inicio:fim] for inicio, fim in zip([0] + fins, fins))
+    texto = tabela.__getitem__
+
+    colecoes = {}
+    for colecao in metadados["colecoes"]:
+        quantidade = colecao["registros"]
+        nomes, colunas = [], []
+        tem_ausentes = False
+        for campo, tipo in colecao["colunas"]:
+            if tipo == "S":
+                valores = list(map(texto, leitor.array("I")))
+            elif tipo == "N":
+                numeros = leitor.array("d")
+                estados = leitor.array("B")
+                if not estados:
+                    valores = numeros.tolist()
+                else:
+                    valores = [numero if estado == _NUMERO_FLOAT else int(numero) if estado == _NUMERO_INT
+                               else None if estado == _NUMERO_NENHUM else _AUSENTE
+                               for numero, estado in zip(numeros, estados)]
+            elif tipo == "L":
+                tamanhos_listas = leitor.array("I")
+                itens = list(map(texto, leitor.array("I")))
+                valores = []
+                inicio = 0
+                for tamanho_lista in tamanhos_listas:
+                    if tamanho_lista == _LISTA_NENHUMA:
+                        valores.append(None)
+                    elif tamanho_lista == _LISTA_AUSENTE:
+                        valores.append(_AUSENTE)
+                    else:
+                        valores.append(itens[inicio:inicio + tamanho_lista]) # Lista nova para cada registro
+                        inicio += tamanho_lista
+            else:
+                valores = [json.loads(valor) if type(valor) is str else valor
+                           for valor in map(texto, leitor.array("I"))]
+            if len(valores) != quantidade:
+                raise ValueError(f"Snapshot {caminho} inconsistente na coluna {campo} de {colecao['nome']}.")
+            tem_ausentes = tem_ausentes or _AUSENTE in valores
+            nomes.append(campo)
+            colunas.append(valores)
+        colecoes[colecao["nome"]] = _registros(nomes, colunas, quantidade, tem_ausentes)
+    return colecoes, metadados["arquivos"]
+
+def _registros(nomes, colunas, quantidade, tem_ausentes):
+    """Monta os dicionários de uma coleção a partir das colunas, um por vez"""
+    if not colunas:
+        return ({} for _ in range(quantidade))
+    if tem_ausentes:
+        return ({campo: valor for campo, valor in zip(nomes, linha) if valor is not _AUSENTE} for linha in zip(*colunas))
+    return (dict(zip(nomes, linha)) for linha in zip(*colunas))
@@ -0,0 +1,19 @@
+"""Funções comuns aos testes"""
+
+
+def cpf_valido(base):
+    """CPF de 11 dígitos com os dígitos verificadores corretos a partir de um número de até 9 dígitos"""
+    digitos = [int(d) for d in f"{base:09d}"]
+    for tamanho in (9, 10):
+        soma = sum(d * (tamanho + 1 - i) for i, d in enumerate(digitos[:tamanho]))
+        resto = soma * 10 % 11
+        digitos.append(0 if resto == 10 else resto)
+    return "".join(map(str, digitos))
+
+
+def cadastrar_apolice(sistema, base_cpf, valor=100000.0):
+    """Cadastra cliente, seguro de vida e apólice; retorna a apólice"""
+    cliente = sistema.cadastrar_cliente(f"Cliente {base_cpf}", cpf_valido(base_cpf), "01/01/1980", "Rua A, 1",
+                                        "11999999999", f"cliente{base_cpf}@exemplo.com")
+    seguro = sistema.criar_seguro_vida(valor, "01/01/2024", "31/12/2030", ["Beneficiário"], ["Morte"])
+    return sistema.emitir_apolice(cliente, seguro)
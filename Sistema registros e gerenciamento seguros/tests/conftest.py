@@ -0,0 +1,20 @@
+import os
+import sys
+
+import pytest
+
+# Os módulos do sistema ficam no diretório acima de tests/ e são importados pelo nome (import sistema)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from armazenamento import ArmazenamentoJSON
+from sistema import SistemaSeguros
+
+
+@pytest.fixture
+def criar_sistema(tmp_path):
+    """Cria um SistemaSeguros com os arquivos de dados (e o journal) em tmp_path"""
+    def criar(**opcoes):
+        opcoes.setdefault("armazenamento", ArmazenamentoJSON(str(tmp_path)))
+        opcoes.setdefault("arquivo_journal", str(tmp_path / "alteracoes.journal"))
+        return SistemaSeguros(**opcoes)
+    return criar
@@ -0,0 +1,74 @@
+import random
+
+import pytest
+
+from repositorio import RepositorioDados
+
+CPFS = [f"{i:011d}" for i in range(12)]
+TIPOS = ["Vida", "Automóvel", "Residencial"]
+STATUS = ["Em Análise", "Aprovado", "Negado"]
+VALORES = [0, 1500000.0, 0.1, 0.2, 99.99, "250000.5", "abc", None] # Texto e ausentes contam como zero
+
+
+def _valor_centavos(valor):
+    try:
+        return round(float(valor) * 100)
+    except (TypeError, ValueError):
+        return 0
+
+
+def _forca_bruta(repositorio):
+    """Totais recontados diretamente dos registros, sem AgregadosRelatorios"""
+    valores, quantidades, tipos, status = {}, {}, {}, {}
+    for apolice in repositorio.apolices:
+        cpf = apolice["cpf_cliente"]
+        valores[cpf] = valores.get(cpf, 0) + _valor_centavos(apolice.get("valor_assegurado"))
+        quantidades[cpf] = quantidades.get(cpf, 0) + 1
+        tipos[apolice["tipo_seguro"]] = tipos.get(apolice["tipo_seguro"], 0) + 1
+    for sinistro in repositorio.sinistros:
+        status[sinistro["status_sinistro"]] = status.get(sinistro["status_sinistro"], 0) + 1
+    return valores, quantidades, tipos, status
+
+
+@pytest.mark.parametrize("semente", range(10))
+def test_agregados_iguais_ao_recalculo(tmp_path, semente):
+    gerador = random.Random(semente)
+    repositorio = RepositorioDados(str(tmp_path))
+    repositorio.carregar()
+    repositorio.agregados() # Mantidos incrementalmente a partir daqui
+    for passo in range(1500):
+        operacao = gerador.random()
+        numero = gerador.randrange(1, 200) # Números repetidos substituem a apólice anterior
+        if operacao < 0.6:
+            repositorio.salvar("apolices", {"numero_apolice": numero, "cpf_cliente": gerador.choice(CPFS),
+                                            "tipo_seguro": gerador.choice(TIPOS),
+                                            "valor_assegurado": gerador.choice(VALORES),
+                                            "status_apolice": gerador.choice(["Ativa", "Cancelada"])})
+        elif operacao < 0.7 and repositorio.buscar_apolice(numero):
+            # Alteração só de campos que não entram nos totais
+            repositorio.salvar("apolices", {**repositorio.buscar_apolice(numero), "status_apolice": "Cancelada"})
+        else:
+            repositorio.salvar("sinistros", {"numero_apolice": str(numero), "status_sinistro": gerador.choice(STATUS),
+                                             "descricao_sinistro": "Colisão"})
+        if passo % 100 == 0:
+            assert repositorio.verificar_agregados() == []
+    assert repositorio.verificar_agregados() == []
+
+    valores, quantidades, tipos, status = _forca_bruta(repositorio)
+    agregados = repositorio.agregados()
+    assert agregados.centavos_por_cpf == valores
+    assert agregados.valor_por_cpf() == {cpf: centavos / 100 for cpf, centavos in valores.items()}
+    assert agregados.apolices_por_cpf == quantidades
+    assert agregados.apolices_por_tipo == tipos
+    assert agregados.sinistros_por_status == status
+    assert agregados.total_sinistros == len(repositorio.sinistros)
+
+
+def test_verificador_aponta_divergencia(tmp_path):
+    repositorio = RepositorioDados(str(tmp_path))
+    repositorio.carregar()
+    repositorio.salvar("apolices", {"numero_apolice": 1, "cpf_cliente": CPFS[0], "tipo_seguro": "Vida", "valor_assegurado": 10})
+    agregados = repositorio.agregados()
+    assert repositorio.verificar_agregados() == []
+    agregados.apolices_por_tipo["Vida"] += 1 # Total corrompido
+    assert len(repositorio.verificar_agregados()) == 1
@@ -0,0 +1,66 @@
+import json
+import sqlite3
+
+from armazenamento import ArmazenamentoSQLite
+from auxiliares import cadastrar_apolice, cpf_valido
+
+
+def test_sqlite_grava_por_registro_e_recarrega(criar_sistema, tmp_path):
+    caminho = str(tmp_path / "seguros.db")
+    sistema = criar_sistema(armazenamento=ArmazenamentoSQLite(caminho))
+    apolice = cadastrar_apolice(sistema, 10)
+    sistema.registrar_sinistro(apolice, "10/05/2025", "Internação", 5000)
+    sistema.armazenamento.fechar()
+
+    recarregado = criar_sistema(armazenamento=ArmazenamentoSQLite(caminho))
+    copia = recarregado.buscar_apolice_por_numero(apolice.numero)
+    assert copia.to_dict() == apolice.to_dict()
+    assert [s.to_dict() for s in recarregado.sinistros] == [s.to_dict() for s in sistema.sinistros]
+    recarregado.armazenamento.fechar()
+
+
+def test_sqlite_consultas_usam_os_indices(tmp_path):
+    armazenamento = ArmazenamentoSQLite(str(tmp_path / "seguros.db"))
+    for coluna in ("cliente_cpf", "seguro_id"):
+        plano = armazenamento.conexao.execute(
+            f"EXPLAIN QUERY PLAN SELECT dados FROM apolices WHERE {coluna} = ? ORDER BY rowid", ("1",)).fetchall()
+        assert f"idx_apolices_{coluna}" in " ".join(str(linha[-1]) for linha in plano)
+    plano = armazenamento.conexao.execute("EXPLAIN QUERY PLAN SELECT dados FROM sinistros WHERE id = ?", ("1",)).fetchall()
+    assert "INDEX" in " ".join(str(linha[-1]) for linha in plano)
+    armazenamento.fechar()
+
+
+def test_sqlite_buscas_consultam_o_banco(criar_sistema, tmp_path):
+    caminho = str(tmp_path / "seguros.db")
+    sistema = criar_sistema(armazenamento=ArmazenamentoSQLite(caminho))
+    # Outro processo grava no mesmo banco depois que o sistema carregou os dados
+    outro = criar_sistema(armazenamento=ArmazenamentoSQLite(caminho), arquivo_journal=str(tmp_path / "outro.journal"))
+    apolice = cadastrar_apolice(outro, 20)
+    sinistro = outro.registrar_sinistro(apolice, "10/05/2025", "Internação", 5000)
+    assert sistema.apolices == []
+
+    cliente = sistema.buscar_cliente_por_cpf(cpf_valido(20))
+    assert cliente.to_dict() == outro.buscar_cliente_por_cpf(cpf_valido(20)).to_dict()
+    assert sistema.buscar_cliente_por_cpf(cpf_valido(20)) is cliente # O mesmo objeto nas buscas seguintes
+    encontradas = sistema.buscar_apolices_por_cliente(cpf_valido(20))
+    assert [a.to_dict() for a in encontradas] == [outro.buscar_apolice_por_numero(apolice.numero).to_dict()]
+    assert sistema.buscar_apolices_por_seguro(apolice.seguro_id) == encontradas
+    assert [s.id for s in sistema.buscar_sinistros_da_apolice(apolice.numero)] == [sinistro.id]
+    assert sistema.buscar_cliente_por_cpf(cpf_valido(21)) is None
+    sistema.armazenamento.fechar()
+    outro.armazenamento.fechar()
+
+
+def test_sqlite_banco_sem_colunas_indexadas_e_completado(tmp_path):
+    caminho = str(tmp_path / "seguros.db")
+    conexao = sqlite3.connect(caminho)
+    conexao.execute("CREATE TABLE apolices (numero TEXT PRIMARY KEY, dados TEXT NOT NULL)")
+    conexao.execute("INSERT INTO apolices VALUES (?, ?)",
+                    ("AP-0001", json.dumps({"numero": "AP-0001", "cliente_cpf": "123", "seguro_id": "S1"})))
+    conexao.commit()
+    conexao.close()
+
+    armazenamento = ArmazenamentoSQLite(caminho)
+    assert [a["numero"] for a in armazenamento.buscar_por("apolices", "cliente_cpf", "123")] == ["AP-0001"]
+    assert [a["numero"] for a in armazenamento.buscar_por("apolices", "seguro_id", "S1")] == ["AP-0001"]
+    armazenamento.fechar()
@@ -0,0 +1,102 @@
+import random
+import threading
+
+import pytest
+
+import busca_texto
+from busca_texto import IndiceTrigramas, extrair_trigramas
+from auxiliares import cadastrar_apolice, cpf_valido
+
+PALAVRAS = ["João", "joana", "Silva", "silveira", "Maria", "mário", "Rua", "rua", "Avenida", "Granada", "granadas",
+            "Tiradentes", "124", "12", "1240", "São", "sao", "Paulo", "paula", "Jo"]
+CONSULTAS = ["joao silva", "rua", "jo", "rua granada 124", "sao paulo", "maria", "xyz", "tiradentes 12", "granada",
+             "silv", "avenida sao joao 1240"]
+
+
+def _chaves_forca_bruta(textos, consulta, limite, filtro=None):
+    """(pontuação, desempate) dos melhores documentos, comparando a consulta com todos os textos"""
+    trigramas_consulta = extrair_trigramas(consulta)
+    total = len(trigramas_consulta)
+    minimo = max(1, int(0.5 * total + 0.999999))
+    chaves = []
+    for doc_id, texto in textos.items():
+        trigramas = extrair_trigramas(texto)
+        em_comum = len(trigramas & trigramas_consulta)
+        if trigramas and em_comum >= minimo and (filtro is None or filtro(doc_id)):
+            chaves.append((em_comum / total, em_comum / (total + len(trigramas) - em_comum)))
+    return sorted(chaves, reverse=True)[:limite]
+
+
+def _chaves(indice, textos, consulta, limite, filtro=None):
+    trigramas_consulta = extrair_trigramas(consulta)
+    chaves = []
+    for doc_id, pontuacao in indice.buscar(consulta, limite=limite, filtro=filtro):
+        trigramas = extrair_trigramas(textos[doc_id])
+        em_comum = len(trigramas & trigramas_consulta)
+        assert pontuacao == em_comum / len(trigramas_consulta)
+        chaves.append((pontuacao, em_comum / (len(trigramas_consulta) + len(trigramas) - em_comum)))
+    return chaves
+
+
+def _texto(gerador):
+    return " ".join(gerador.choice(PALAVRAS) for _ in range(gerador.randrange(1, 6)))
+
+
+@pytest.mark.parametrize("semente", range(4))
+def test_busca_igual_a_forca_bruta(semente):
+    gerador = random.Random(semente)
+    textos = {i: _texto(gerador) for i in range(400)}
+    indice = IndiceTrigramas()
+    indice.carregar(textos.items())
+    # Alterações depois da carga em lote: textos trocados, removidos e documentos novos
+    for _ in range(300):
+        doc_id = gerador.randrange(500)
+        if gerador.random() < 0.2:
+            indice.remover(doc_id)
+            textos.pop(doc_id, None)
+        else:
+            textos[doc_id] = _texto(gerador)
+            indice.atualizar(doc_id, textos[doc_id])
+    assert len(indice) == len(textos)
+
+    def pares(doc_id):
+        return doc_id % 2 == 0
+    for consulta in CONSULTAS:
+        for limite in (1, 5, 20, 1000):
+            assert _chaves(indice, textos, consulta, limite) == _chaves_forca_bruta(textos, consulta, limite)
+        assert _chaves(indice, textos, consulta, 10, pares) == _chaves_forca_bruta(textos, consulta, 10, pares)
+
+
+def test_limite_de_candidatos_mantem_pontuacoes_corretas(monkeypatch):
+    gerador = random.Random(9)
+    textos = {i: _texto(gerador) for i in range(300)}
+    indice = IndiceTrigramas()
+    indice.carregar(textos.items())
+    monkeypatch.setattr(indice, "LIMITE_CANDIDATOS", 5)
+    for consulta in CONSULTAS:
+        chaves = _chaves(indice, textos, consulta, 20)
+        assert chaves == sorted(chaves, reverse=True)
+        esperadas = _chaves_forca_bruta(textos, consulta, 20)
+        assert chaves == esperadas[:len(chaves)]
+
+
+def test_sistema_indexa_alteracoes_feitas_durante_a_montagem(criar_sistema, monkeypatch):
+    sistema = criar_sistema(snapshot=False)
+    cadastrar_apolice(sistema, 10)
+    liberar = threading.Event()
+    carregar = IndiceTrigramas.carregar
+    def carregar_devagar(indice, documentos):
+        liberar.wait(5)
+        carregar(indice, documentos)
+    monkeypatch.setattr(busca_texto.IndiceTrigramas, "carregar", carregar_devagar)
+
+    recarregado = criar_sistema(snapshot=False)
+    assert recarregado._indice_texto is None # Montagem em andamento
+    recarregado.cadastrar_cliente("Josefina Granada", cpf_valido(11), "01/01/1990", "Avenida Tiradentes, 50",
+                                  "11988887777", "josefina@exemplo.com")
+    liberar.set()
+
+    encontrados = recarregado.buscar_texto("josefina granada", colecoes=("clientes",))
+    assert encontrados[0][0].cpf == cpf_valido(11)
+    assert encontrados[0][1] == 1.0
+    assert recarregado.buscar_texto("cliente 10")[0][0].cpf == cpf_valido(10)
@@ -0,0 +1,96 @@
+import random
+
+import pytest
+
+from consulta_apolices import COLUNAS_ORDENAVEIS, ConsultaApolices
+
+NOMES = ["Ana Souza", "João Silva", "Maria Oliveira", "José Santos", "Joana Lima"]
+TIPOS = ["Vida", "Automóvel", "Residencial"]
+STATUS = ["Ativa", "Cancelada"]
+
+
+def _apolice(gerador, numero, cpfs):
+    return {"numero_apolice": numero, "cpf_cliente": gerador.choice(cpfs), "tipo_seguro": gerador.choice(TIPOS),
+            "status_apolice": gerador.choice(STATUS), "valor_assegurado": gerador.choice([1000.0, 250000.5, 7, None])}
+
+
+def _consultas(consulta):
+    resultados = []
+    for coluna in COLUNAS_ORDENAVEIS:
+        for decrescente in (False, True):
+            resultados.append(consulta.consultar(ordenar_por=coluna, decrescente=decrescente))
+    for texto in ("jo", "silva", "000", "1", "maria oli"):
+        resultados.append(consulta.consultar(ordenar_por="nome", texto=texto))
+    resultados.append(consulta.consultar(tipo="Vida", status="Ativa", valor_minimo=500, valor_maximo=300000))
+    return resultados
+
+
+def test_indices_montados_sobre_copias_e_vinculados():
+    gerador = random.Random(3)
+    cpfs = [f"{i:011d}" for i in range(8)]
+    clientes = {cpf: {"cpf": cpf, "nome": gerador.choice(NOMES)} for cpf in cpfs}
+    apolices = {numero: _apolice(gerador, numero, cpfs) for numero in range(1, 300)}
+
+    # Montagem sobre cópias (como na thread da interface), enquanto os dicionários originais mudam
+    consulta = ConsultaApolices(dict(apolices), dict(clientes))
+    consulta.montar_indices()
+    alterados = []
+    for numero in gerador.sample(range(1, 300), 40) + list(range(300, 320)):
+        apolices[numero] = _apolice(gerador, numero, cpfs)
+        alterados.append(("apolices", numero))
+    for numero in gerador.sample(range(1, 300), 10):
+        del apolices[numero]
+        alterados.append(("apolices", numero))
+    for cpf in cpfs[:3]:
+        clientes[cpf] = {"cpf": cpf, "nome": gerador.choice(NOMES) + " Neto"}
+        alterados.append(("clientes", cpf))
+
+    consulta.vincular(apolices, clientes)
+    for colecao, chave in alterados:
+        if colecao == "apolices":
+            consulta.atualizar_apolice(chave)
+        else:
+            consulta.atualizar_cliente(chave)
+    assert len(consulta) == len(apolices)
+    assert _consultas(consulta) == _consultas(ConsultaApolices(apolices, clientes))
+
+
+def _aplicar_alteracao(consulta, exibidas, numero, nova, coluna, decrescente, filtros):
+    """Mesmo procedimento de _atualizar_apolice_na_lista da interface, sobre uma lista simples"""
+    posicao = None
+    if not nova:
+        posicao = consulta.posicao_na_lista(exibidas, numero, coluna, decrescente)
+        if posicao >= len(exibidas) or exibidas[posicao] != numero:
+            posicao = None
+    consulta.atualizar_apolice(numero)
+    atende = consulta.atende(numero, **filtros)
+    if posicao is not None and atende and consulta.em_ordem(exibidas, posicao, coluna, decrescente):
+        return
+    if posicao is not None:
+        del exibidas[posicao]
+    if atende:
+        exibidas.insert(consulta.posicao_na_lista(exibidas, numero, coluna, decrescente), numero)
+
+
+FILTROS = [{}, {"tipo": "Vida"}, {"status": "Ativa", "valor_minimo": 500}, {"valor_maximo": 1000},
+           {"texto": "jo"}, {"texto": "0000 silva"}, {"tipo": "Automóvel", "texto": "1"}]
+
+
+@pytest.mark.parametrize("coluna", COLUNAS_ORDENAVEIS)
+@pytest.mark.parametrize("decrescente", [False, True])
+def test_alteracao_de_uma_apolice_mantem_a_lista_filtrada_e_ordenada(coluna, decrescente):
+    gerador = random.Random(f"{coluna} {decrescente}")
+    cpfs = [f"{i:011d}" for i in range(6)]
+    clientes = {cpf: {"cpf": cpf, "nome": gerador.choice(NOMES)} for cpf in cpfs}
+    apolices = {numero: _apolice(gerador, numero, cpfs) for numero in range(1, 120)}
+    consulta = ConsultaApolices(apolices, clientes)
+    for filtros in FILTROS:
+        exibidas = consulta.consultar(ordenar_por=coluna, decrescente=decrescente, **filtros)
+        for _ in range(60):
+            if gerador.random() < 0.2:
+                numero, nova = max(apolices) + 1, True
+            else:
+                numero, nova = gerador.choice(list(apolices)), False
+            apolices[numero] = _apolice(gerador, numero, cpfs)
+            _aplicar_alteracao(consulta, exibidas, numero, nova, coluna, decrescente, filtros)
+            assert exibidas == consulta.consultar(ordenar_por=coluna, decrescente=decrescente, **filtros)
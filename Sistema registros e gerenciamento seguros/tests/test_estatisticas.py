@@ -0,0 +1,47 @@
+import json
+import os
+
+from armazenamento import ArmazenamentoSQLite
+from auxiliares import cadastrar_apolice
+
+
+def test_lote_registra_os_bytes_de_cada_arquivo(criar_sistema):
+    sistema = criar_sistema()
+    with sistema.transacao():
+        for base in range(40, 45):
+            cadastrar_apolice(sistema, base)
+    estatisticas = sistema.estatisticas_gravacao()
+    for colecao in ("clientes", "seguros", "apolices"):
+        tamanho = os.path.getsize(sistema.armazenamento.caminho(colecao))
+        assert estatisticas[colecao]["bytes_ultima"] == tamanho
+        assert estatisticas[colecao]["gravacoes"] == 1
+        assert estatisticas[colecao]["registros"] == 5
+    assert estatisticas["sinistros"]["gravacoes"] == 0
+
+
+def test_colecoes_sem_alteracao_nao_sao_regravadas(criar_sistema):
+    sistema = criar_sistema()
+    apolice = cadastrar_apolice(sistema, 46)
+    antes = sistema.estatisticas_gravacao()
+    sistema.registrar_sinistro(apolice, "10/05/2025", "Internação", 5000)
+    sistema.salvar_dados()
+    depois = sistema.estatisticas_gravacao()
+    for colecao in ("clientes", "seguros"):
+        assert depois[colecao]["gravacoes"] == antes[colecao]["gravacoes"]
+        assert depois[colecao]["ignoradas"] == antes[colecao]["ignoradas"] + 1
+    for colecao in ("sinistros", "apolices"):
+        assert depois[colecao]["gravacoes"] == antes[colecao]["gravacoes"] + 1
+        assert depois[colecao]["bytes_ultima"] == os.path.getsize(sistema.armazenamento.caminho(colecao))
+
+
+def test_lote_no_sqlite_registra_os_bytes_dos_registros(criar_sistema, tmp_path):
+    sistema = criar_sistema(armazenamento=ArmazenamentoSQLite(str(tmp_path / "seguros.db")))
+    with sistema.transacao():
+        apolice = cadastrar_apolice(sistema, 47)
+        sistema.registrar_sinistro(apolice, "10/05/2025", "Internação", 5000)
+    estatisticas = sistema.estatisticas_gravacao()
+    for colecao in ("clientes", "seguros", "apolices", "sinistros"):
+        registro = getattr(sistema, colecao)[0].to_dict()
+        tamanho = len(json.dumps(registro, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+        assert estatisticas[colecao]["bytes_ultima"] == tamanho
+    sistema.armazenamento.fechar()
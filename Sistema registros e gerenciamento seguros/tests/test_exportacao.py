@@ -0,0 +1,87 @@
+import csv
+import os
+import threading
+
+import pytest
+
+from auxiliares import cadastrar_apolice, cpf_valido
+from exportacao import COLUNAS_ANALITICAS, exportar_analitico, tabelas_sistema
+
+
+def _sistema_com_carteira(criar_sistema):
+    sistema = criar_sistema()
+    with sistema.transacao():
+        for base in range(70, 76):
+            apolice = cadastrar_apolice(sistema, base, 1000.0 * base)
+            if base % 2:
+                sistema.registrar_sinistro(apolice, "10/05/2025", f"Sinistro {base}", 500)
+        cliente = sistema.buscar_cliente_por_cpf(cpf_valido(70))
+        seguro = sistema.criar_seguro_residencial(300000, "01/01/2024", "01/01/2026", "Rua B, 2", 80, 250000, "Alvenaria")
+        sistema.emitir_apolice(cliente, seguro)
+    return sistema
+
+
+def _ler_csv(diretorio, prefixo):
+    linhas = []
+    for nome in sorted(os.listdir(diretorio)):
+        if nome.startswith(prefixo) and nome.endswith(".csv"):
+            with open(os.path.join(diretorio, nome), encoding="utf-8", newline="") as f:
+                linhas.append((nome, list(csv.DictReader(f))))
+    return linhas
+
+
+def test_csv_em_blocos_por_tipo_de_seguro(criar_sistema, tmp_path):
+    sistema = _sistema_com_carteira(criar_sistema)
+    destino = tmp_path / "exportacao"
+    os.makedirs(destino)
+    assert exportar_analitico(str(destino), tabelas_sistema(sistema), "csv", linhas_por_grupo=4)
+
+    arquivos = _ler_csv(str(destino), "apolices_")
+    # Seis apólices de vida em blocos de até 4 linhas e a residencial em arquivo próprio
+    assert [(nome, len(linhas)) for nome, linhas in arquivos] == \
+           [("apolices_residencial_00001.csv", 1), ("apolices_vida_00001.csv", 4), ("apolices_vida_00002.csv", 2)]
+    for nome, linhas in arquivos:
+        assert {linha["tipo_seguro"] for linha in linhas} == {"Residencial" if "residencial" in nome else "Vida"}
+        assert list(linhas[0]) == [coluna for coluna, _ in COLUNAS_ANALITICAS["apolices"]]
+    vida = {linha["numero"]: linha for _, linhas in arquivos for linha in linhas}
+    apolice = sistema.apolices[0]
+    assert vida[apolice.numero]["cliente_nome"] == sistema.buscar_cliente_por_cpf(apolice.cliente_cpf).nome
+    assert vida[apolice.numero]["data_inicio"] == "2024-01-01" # Datas em ISO 8601
+    assert vida[apolice.numero]["tipos_cobertura"] == "Morte"
+
+    sinistros = [linha for _, linhas in _ler_csv(str(destino), "sinistros_") for linha in linhas]
+    assert sorted(linha["numero_apolice"] for linha in sinistros) == \
+           sorted(a.numero for a in sistema.apolices if a.sinistros_ids)
+    clientes = [linha for _, linhas in _ler_csv(str(destino), "clientes_") for linha in linhas]
+    assert len(clientes) == len(sistema.clientes)
+
+
+def test_nova_exportacao_substitui_a_anterior(criar_sistema, tmp_path):
+    sistema = _sistema_com_carteira(criar_sistema)
+    assert exportar_analitico(str(tmp_path), tabelas_sistema(sistema), "csv", linhas_por_grupo=2)
+    assert exportar_analitico(str(tmp_path), tabelas_sistema(sistema), "csv")
+    assert [nome for nome, _ in _ler_csv(str(tmp_path), "apolices_")] == \
+           ["apolices_residencial_00001.csv", "apolices_vida_00001.csv"]
+
+
+def test_cancelamento_nao_deixa_arquivos(criar_sistema, tmp_path, monkeypatch):
+    monkeypatch.setattr("exportacao.INTERVALO_PROGRESSO", 1)
+    sistema = _sistema_com_carteira(criar_sistema)
+    destino = tmp_path / "exportacao"
+    os.makedirs(destino)
+    cancelar = threading.Event()
+    cancelar.set()
+    assert exportar_analitico(str(destino), tabelas_sistema(sistema), "csv", cancelar=cancelar) is False
+    assert os.listdir(destino) == []
+
+
+def test_parquet_com_colunas_tipadas(criar_sistema, tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    sistema = _sistema_com_carteira(criar_sistema)
+    assert exportar_analitico(str(tmp_path), tabelas_sistema(sistema), "parquet", linhas_por_grupo=4)
+    arquivo = pq.ParquetFile(str(tmp_path / "apolices.parquet"))
+    assert arquivo.metadata.num_rows == len(sistema.apolices)
+    assert arquivo.metadata.num_row_groups == 3
+    tabela = arquivo.read()
+    assert str(tabela.schema.field("data_inicio").type) == "date32[day]"
+    assert str(tabela.schema.field("premio").type) == "double"
@@ -0,0 +1,82 @@
+import threading
+import time
+
+from gravacao import GravadorColecoes
+
+
+class _Destino:
+    """Registra as gravações; a primeira de cada coleção em falhar_uma_vez levanta OSError"""
+
+    def __init__(self, falhar_uma_vez=()):
+        self.gravacoes = []
+        self.falhar = set(falhar_uma_vez)
+        self.trava = threading.Lock()
+
+    def gravar(self, colecao):
+        if colecao in self.falhar:
+            self.falhar.discard(colecao)
+            raise OSError("disco cheio")
+        with self.trava:
+            self.gravacoes.append(colecao)
+
+
+def test_marcacoes_seguidas_resultam_em_uma_gravacao():
+    destino = _Destino()
+    gravador = GravadorColecoes(destino.gravar)
+    gravador.ATRASO_S = 0.05
+    for _ in range(50):
+        gravador.marcar("apolices")
+        gravador.marcar("clientes", "apolices")
+    limite = time.monotonic() + 5
+    while gravador.pendente and time.monotonic() < limite:
+        time.sleep(0.01)
+    assert sorted(destino.gravacoes) == ["apolices", "clientes"]
+    assert not gravador.pendente
+    assert gravador.encerrar(tempo_limite=5) == {}
+
+
+def test_descarregar_grava_sem_esperar_o_atraso():
+    destino = _Destino()
+    gravador = GravadorColecoes(destino.gravar)
+    gravador.ATRASO_S = 60
+    gravador.marcar("sinistros")
+    assert gravador.descarregar(tempo_limite=5) == {}
+    assert destino.gravacoes == ["sinistros"]
+    gravador.encerrar(tempo_limite=5)
+
+
+def test_alteracoes_continuas_nao_adiam_a_gravacao_indefinidamente():
+    destino = _Destino()
+    gravador = GravadorColecoes(destino.gravar)
+    gravador.ATRASO_S = 0.2
+    gravador.ESPERA_MAXIMA_S = 0.3
+    limite = time.monotonic() + 1.0
+    while time.monotonic() < limite and not destino.gravacoes:
+        gravador.marcar("apolices") # Sempre antes de ATRASO_S
+        time.sleep(0.02)
+    assert destino.gravacoes == ["apolices"]
+    gravador.encerrar(tempo_limite=5)
+
+
+def test_falha_mantida_e_regravada():
+    destino = _Destino(falhar_uma_vez=["clientes"])
+    gravador = GravadorColecoes(destino.gravar)
+    gravador.marcar("clientes", "apolices")
+    falhas = gravador.descarregar(tempo_limite=5)
+    assert list(falhas) == ["clientes"]
+    assert destino.gravacoes == ["apolices"]
+    assert gravador.descarregar(tempo_limite=5) == {}
+    assert destino.gravacoes == ["apolices", "clientes"]
+    gravador.encerrar(tempo_limite=5)
+
+
+def test_ao_concluir_depois_de_gravadas_todas_as_colecoes():
+    destino = _Destino(falhar_uma_vez=["sinistros"])
+    gravador = GravadorColecoes(destino.gravar)
+    concluido = threading.Event()
+    gravador.marcar("apolices", "sinistros", ao_concluir=concluido.set)
+    gravador.descarregar(tempo_limite=5)
+    assert not concluido.is_set() # sinistros falhou
+    gravador.descarregar(tempo_limite=5)
+    assert concluido.wait(5)
+    gravador.encerrar(tempo_limite=5)
@@ -0,0 +1,31 @@
+import csv
+
+from auth import UsuarioManager
+from auxiliares import cpf_valido
+
+CABECALHO = ["nome", "cpf", "data_nascimento", "endereco", "telefone", "email", "tipo_seguro", "valor_cobertura",
+             "data_inicio", "data_fim", "beneficiarios", "tipos_cobertura"]
+
+
+def _linha(base, valor="100000"):
+    return [f"Cliente {base}", cpf_valido(base), "01/01/1980", "Rua A, 1", "11999999999", f"c{base}@exemplo.com",
+            "Vida", valor, "01/01/2024", "31/12/2030", "Ana", "Morte;Invalidez"]
+
+
+def test_importacao_informa_usuarios_recusados(criar_sistema, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path) # usuarios.json é gravado no diretório atual
+    caminho = tmp_path / "carteira.csv"
+    with open(caminho, "w", newline="", encoding="utf-8") as f:
+        escritor = csv.writer(f)
+        escritor.writerow(CABECALHO)
+        escritor.writerows([_linha(1), _linha(2), _linha(3, valor="abc")])
+    usuarios = UsuarioManager()
+    usuarios.cadastrar_usuario(cpf_valido(2), "senha", "usuario") # Login do segundo cliente já existe
+
+    sistema = criar_sistema()
+    resultado = sistema.importar_arquivo(str(caminho), usuarios, processos=1)
+
+    assert resultado["aceitas"] == 2
+    assert [numero_linha for numero_linha, _ in resultado["rejeitadas"]] == [4]
+    assert [login for login, _ in resultado["usuarios_recusados"]] == [cpf_valido(2)]
+    assert cpf_valido(1) in UsuarioManager().usuarios
@@ -0,0 +1,62 @@
+import random
+from datetime import date, timedelta
+
+import pytest
+
+from indice_vigencia import IndiceVigencia
+
+BASE = date(2020, 1, 1)
+
+
+def _data(dias):
+    return BASE + timedelta(days=dias)
+
+
+@pytest.mark.parametrize("semente", range(10))
+def test_consultas_iguais_a_forca_bruta(semente):
+    gerador = random.Random(semente)
+    indice = IndiceVigencia()
+    indice.LIMITE_PENDENTES = gerador.choice([0, 8, 256]) # Árvore reconstruída com frequências diferentes
+    intervalos = {}
+    for passo in range(600):
+        operacao = gerador.random()
+        if operacao < 0.7 or not intervalos:
+            chave = gerador.randrange(300) # Chaves repetidas substituem o intervalo anterior
+            inicio = gerador.randrange(2000)
+            fim = inicio + gerador.randrange(400)
+            # Datas como date ou como texto, os dois formatos aceitos
+            if gerador.random() < 0.5:
+                indice.adicionar(chave, _data(inicio), _data(fim))
+            else:
+                indice.adicionar(chave, _data(inicio).strftime("%d/%m/%Y"), _data(fim).strftime("%d/%m/%Y"))
+            intervalos[chave] = (inicio, fim)
+        elif operacao < 0.8:
+            chave = gerador.choice(list(intervalos))
+            indice.remover(chave)
+            del intervalos[chave]
+        elif operacao < 0.9:
+            ponto = gerador.randrange(-50, 2450)
+            esperado = {c for c, (i, f) in intervalos.items() if i <= ponto <= f}
+            encontrados = indice.vigentes_em(_data(ponto))
+            assert len(encontrados) == len(set(encontrados))
+            assert set(encontrados) == esperado
+        else:
+            inicio = gerador.randrange(-50, 2450)
+            fim = inicio + gerador.randrange(-10, 300)
+            esperado = {c for c, (i, f) in intervalos.items() if i <= fim and f >= inicio} if fim >= inicio else set()
+            encontrados = indice.vigentes_entre(_data(inicio), _data(fim))
+            assert len(encontrados) == len(set(encontrados))
+            assert set(encontrados) == esperado
+        if passo % 100 == 0:
+            indice.reconstruir()
+        assert len(indice) == len(intervalos)
+
+
+def test_vigencia_invalida_nao_indexada():
+    indice = IndiceVigencia()
+    indice.adicionar("invertida", "31/12/2025", "01/01/2025")
+    indice.adicionar("texto", "amanhã", "01/01/2025")
+    indice.adicionar("valida", "01/01/2025", "31/12/2025")
+    assert indice.vigentes_em("15/06/2025") == ["valida"]
+    with pytest.raises(ValueError):
+        indice.vigentes_em("32/01/2025")
@@ -0,0 +1,51 @@
+from auxiliares import cadastrar_apolice
+
+
+def test_alteracoes_reaplicadas_do_journal(criar_sistema):
+    sistema = criar_sistema(modo_journal=True, snapshot=False)
+    apolice = cadastrar_apolice(sistema, 1)
+    sistema.registrar_sinistro(apolice, "10/05/2025", "Internação", 5000)
+    # Nenhum checkpoint ainda: os arquivos de dados não têm os registros, só o journal
+    assert sistema.journal.total_registros == 5
+    assert sistema.armazenamento.carregar("apolices") == []
+
+    recarregado = criar_sistema(modo_journal=True, snapshot=False)
+    apolice_recarregada = recarregado.buscar_apolice_por_numero(apolice.numero)
+    assert apolice_recarregada is not None
+    assert apolice_recarregada.sinistros_ids == apolice.sinistros_ids
+    assert recarregado.buscar_sinistro_por_id(apolice.sinistros_ids[0]).descricao == "Internação"
+
+
+def test_checkpoint_esvazia_journal(criar_sistema):
+    sistema = criar_sistema(modo_journal=True, snapshot=False)
+    apolice = cadastrar_apolice(sistema, 2)
+    sistema.checkpoint()
+    assert sistema.journal.total_registros == 0
+    assert [a["numero"] for a in sistema.armazenamento.carregar("apolices")] == [apolice.numero]
+
+
+def test_entrada_truncada_no_fim_do_journal_ignorada(criar_sistema):
+    sistema = criar_sistema(modo_journal=True, snapshot=False)
+    apolice = cadastrar_apolice(sistema, 3)
+    with open(sistema.journal.arquivo, "a", encoding="utf-8") as f:
+        f.write('{"op":"upsert","c":"apolices","k":"AP-9')  # Queda no meio da escrita
+
+    recarregado = criar_sistema(modo_journal=True, snapshot=False)
+    assert [a.numero for a in recarregado.apolices] == [apolice.numero]
+
+
+def test_falha_no_journal_nao_deixa_entradas_antigas(criar_sistema, monkeypatch):
+    sistema = criar_sistema(modo_journal=True, snapshot=False)
+    apolice = cadastrar_apolice(sistema, 4)
+    sistema.registrar_sinistro(apolice, "10/05/2025", "Primeiro", 1000)
+
+    def falhar(*args, **kwargs):
+        raise OSError("disco cheio")
+    monkeypatch.setattr(sistema.journal, "registrar", falhar)
+    sistema.registrar_sinistro(apolice, "11/05/2025", "Segundo", 2000)
+    assert sistema.journal.total_registros == 0
+
+    # A versão antiga da apólice (um sinistro) não pode ser reaplicada sobre a gravada (dois sinistros)
+    recarregado = criar_sistema(modo_journal=True, snapshot=False)
+    assert len(recarregado.buscar_apolice_por_numero(apolice.numero).sinistros_ids) == 2
+    assert len(recarregado.sinistros) == 2
@@ -0,0 +1,84 @@
+import random
+
+import pytest
+
+from armazenamento import ArmazenamentoJSONL
+from auxiliares import cadastrar_apolice
+
+
+def _registros(quantidade, semente=0):
+    gerador = random.Random(semente)
+    return [{"id": str(i), "nome": gerador.choice(["Ana", "São João", "😀", "x" * 90]), "valor": gerador.uniform(0, 1e6),
+             "itens": [gerador.randrange(100) for _ in range(gerador.randrange(4))]} for i in range(quantidade)]
+
+
+def _corromper(caminho, numeros):
+    """Substitui as linhas indicadas (1 = cabeçalho) por conteúdo inválido"""
+    with open(caminho, "rb") as f:
+        linhas = f.read().split(b"\n")
+    for numero in numeros:
+        linhas[numero - 1] = b'{"id": "cortado", "nome": "A'
+    with open(caminho, "wb") as f:
+        f.write(b"\n".join(linhas))
+
+
+@pytest.mark.parametrize("processos", [1, 3])
+def test_ida_e_volta(tmp_path, processos):
+    armazenamento = ArmazenamentoJSONL(str(tmp_path), processos=processos)
+    armazenamento.LIMIAR_PARALELO = 0 if processos > 1 else ArmazenamentoJSONL.LIMIAR_PARALELO
+    registros = _registros(500)
+    armazenamento.salvar_colecao("clientes", registros)
+    assert armazenamento.carregar("clientes") == registros
+    assert list(armazenamento.iterar("clientes")) == registros
+    assert armazenamento.linhas_corrompidas["clientes"] == []
+
+
+@pytest.mark.parametrize("processos", [1, 4])
+def test_linhas_corrompidas_ignoradas_e_informadas(tmp_path, processos, monkeypatch, capsys):
+    armazenamento = ArmazenamentoJSONL(str(tmp_path), processos=processos)
+    armazenamento.LIMIAR_PARALELO = 0 if processos > 1 else ArmazenamentoJSONL.LIMIAR_PARALELO
+    monkeypatch.setattr("armazenamento.BLOCO_LEITURA", 256) # Vários blocos por intervalo
+    registros = _registros(300, semente=1)
+    armazenamento.salvar_colecao("clientes", registros)
+    corrompidas = [2, 77, 150, 301]
+    _corromper(armazenamento.caminho("clientes"), corrompidas)
+
+    esperados = [r for i, r in enumerate(registros, 2) if i not in corrompidas]
+    assert armazenamento.carregar("clientes") == esperados
+    assert [numero for numero, _ in armazenamento.linhas_corrompidas["clientes"]] == corrompidas
+    assert "linha 77" in capsys.readouterr().out
+
+
+@pytest.mark.parametrize("processos", [1, 2])
+def test_cabecalho_ilegivel_nao_descarta_os_registros(tmp_path, processos):
+    armazenamento = ArmazenamentoJSONL(str(tmp_path), processos=processos)
+    armazenamento.LIMIAR_PARALELO = 0 if processos > 1 else ArmazenamentoJSONL.LIMIAR_PARALELO
+    registros = _registros(50, semente=2)
+    armazenamento.salvar_colecao("clientes", registros)
+    _corromper(armazenamento.caminho("clientes"), [1])
+    assert armazenamento.carregar("clientes") == registros
+    assert [numero for numero, _ in armazenamento.linhas_corrompidas["clientes"]] == [1]
+
+
+def test_cabecalho_truncado_mantem_a_colecao_no_sistema(criar_sistema, tmp_path):
+    sistema = criar_sistema(armazenamento=ArmazenamentoJSONL(str(tmp_path)), snapshot=False)
+    for base in range(60, 63):
+        cadastrar_apolice(sistema, base)
+    caminho = sistema.armazenamento.caminho("clientes")
+    with open(caminho, "rb") as f:
+        conteudo = f.read()
+    with open(caminho, "wb") as f:
+        f.write(conteudo[:10] + conteudo[conteudo.index(b"\n"):]) # Cabeçalho cortado
+
+    recarregado = criar_sistema(armazenamento=ArmazenamentoJSONL(str(tmp_path)), snapshot=False)
+    assert len(recarregado.clientes) == 3
+    recarregado.salvar_clientes(forcar=True)
+    assert len(ArmazenamentoJSONL(str(tmp_path)).carregar("clientes")) == 3
+
+
+def test_arquivo_de_outro_formato_recusado(tmp_path):
+    armazenamento = ArmazenamentoJSONL(str(tmp_path))
+    with open(armazenamento.caminho("clientes"), "w", encoding="utf-8") as f:
+        f.write('{"formato": "outro", "versao": 1}\n{"id": "1"}\n')
+    with pytest.raises(ValueError):
+        armazenamento.carregar("clientes")
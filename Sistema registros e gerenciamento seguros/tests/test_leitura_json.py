@@ -0,0 +1,63 @@
+import json
+import random
+
+import pytest
+
+from leitura_json import iterar_lista_json
+
+
+def _elemento(gerador, profundidade=0):
+    tipo = gerador.randrange(8 if profundidade < 2 else 5)
+    if tipo == 0:
+        return gerador.choice(["", "a", "São Paulo", "aspas \" e \\ barra", "😀", "\n\t", "x" * 70])
+    if tipo == 1:
+        return gerador.randint(-10 ** 12, 10 ** 12)
+    if tipo == 2:
+        return gerador.choice([0.0, -1.5, 2.5e-8, 1e300, gerador.uniform(-1e6, 1e6)])
+    if tipo == 3:
+        return gerador.choice([None, True, False])
+    if tipo == 4:
+        return 12345678901234567890 # Números longos: os mais sujeitos a serem cortados no fim do bloco
+    if tipo == 5:
+        return [_elemento(gerador, profundidade + 1) for _ in range(gerador.randrange(4))]
+    return {f"c{i}": _elemento(gerador, profundidade + 1) for i in range(gerador.randrange(4))}
+
+
+def _gravar(caminho, texto):
+    with open(caminho, "w", encoding="utf-8", newline="") as f:
+        f.write(texto)
+
+
+@pytest.mark.parametrize("semente", range(15))
+def test_igual_a_json_load_em_qualquer_tamanho_de_bloco(tmp_path, semente):
+    gerador = random.Random(semente)
+    elementos = [_elemento(gerador) for _ in range(gerador.randrange(0, 40))]
+    formato = semente % 3
+    if formato == 0:
+        texto = json.dumps(elementos, ensure_ascii=False, indent=4)
+    elif formato == 1:
+        texto = json.dumps(elementos, separators=(",", ":"))
+    else:
+        texto = "\r\n  " + json.dumps(elementos, ensure_ascii=False, indent=2).replace("\n", "\r\n") + "  \r\n"
+    caminho = str(tmp_path / "dados.json")
+    _gravar(caminho, texto)
+    for tamanho_bloco in (1, 2, 3, 7, 16, 61, 1 << 16):
+        assert list(iterar_lista_json(caminho, tamanho_bloco)) == elementos
+
+
+def test_numeros_cortados_no_fim_do_bloco(tmp_path):
+    # Cada número é cortado em todas as posições possíveis por algum dos tamanhos de bloco
+    elementos = [2.5, 10, -3.25e10, 1234567, 0.001, 7]
+    caminho = str(tmp_path / "dados.json")
+    _gravar(caminho, "[2.5, 10 ,-3.25e10,\n 1234567   ,0.001,7]")
+    for tamanho_bloco in range(1, 40):
+        assert list(iterar_lista_json(caminho, tamanho_bloco)) == elementos
+
+
+@pytest.mark.parametrize("texto", ["", "{}", "[1, 2", "[1 2]", "[1,]", "[1] [2]", "[\"aberta]", "[1, 2] x"])
+def test_conteudo_invalido(tmp_path, texto):
+    caminho = str(tmp_path / "dados.json")
+    _gravar(caminho, texto)
+    for tamanho_bloco in (1, 4, 1 << 16):
+        with pytest.raises(json.JSONDecodeError):
+            list(iterar_lista_json(caminho, tamanho_bloco))
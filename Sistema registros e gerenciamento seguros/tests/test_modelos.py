@@ -0,0 +1,34 @@
+import pytest
+
+from apolice import Apolice
+from auxiliares import cadastrar_apolice
+from cliente import Cliente
+from seguro import SeguroAutomovel, SeguroResidencial, SeguroVida
+from sinistro import Sinistro
+
+
+@pytest.mark.parametrize("objeto", [
+    Cliente("Ana", "52998224725", "01/01/1980", "Rua A", "119", "ana@exemplo.com"),
+    SeguroAutomovel("1", 1000, "01/01/2024", "01/01/2025", "Marca", "Modelo", 2020, "ABC1D23", "Novo", "Pessoal", 1),
+    SeguroResidencial("2", 1000, "01/01/2024", "01/01/2025", "Rua B", 80, 300000, "Alvenaria"),
+    SeguroVida("3", 1000, "01/01/2024", "01/01/2025", ["Ana"], ["Morte"]),
+    Apolice("AP-0001", "52998224725", "3"),
+    Sinistro("4", "01/06/2024", "Colisão", 500),
+])
+def test_modelos_sem_dicionario_por_instancia(objeto):
+    assert not hasattr(objeto, "__dict__")
+
+
+def test_apolice_guarda_somente_os_ids_dos_sinistros(criar_sistema):
+    sistema = criar_sistema()
+    apolice = cadastrar_apolice(sistema, 50)
+    primeiro = sistema.registrar_sinistro(apolice, "10/05/2025", "Internação", 5000)
+    segundo = sistema.registrar_sinistro(apolice.numero, "11/05/2025", "Cirurgia", 8000)
+    assert not hasattr(apolice, "sinistros")
+    assert apolice.sinistros_ids == [primeiro.id, segundo.id]
+    assert sistema.buscar_sinistros_da_apolice(apolice) == [primeiro, segundo]
+
+    recarregado = criar_sistema()
+    sinistros = recarregado.buscar_sinistros_da_apolice(apolice.numero)
+    assert [s.descricao for s in sinistros] == ["Internação", "Cirurgia"]
+    assert recarregado.buscar_sinistros_da_apolice("inexistente") == []
@@ -0,0 +1,62 @@
+import random
+
+import pytest
+
+from precificacao import calcular_premios
+from seguro import SeguroAutomovel, SeguroResidencial, SeguroVida
+
+pytest.importorskip("numpy")
+
+# Valores como chegam dos arquivos JSON e da interface; calcular_premio() só aceita números (texto levanta TypeError)
+VALIDOS = [1000, 250000.75, 0.1, 2 ** 60, True]
+INVALIDOS = ["1500", "1500.50", "abc", "", None, [100]]
+
+
+def _seguros(gerador, quantidade, invalidos):
+    def escolher(*opcoes):
+        return gerador.choice(list(opcoes) + (INVALIDOS if invalidos else []))
+    seguros = []
+    for i in range(quantidade):
+        valor = escolher(*VALIDOS)
+        tipo = gerador.randrange(3)
+        if tipo == 0:
+            seguro = SeguroAutomovel(f"A{i}", valor, "01/01/2024", "01/01/2025", "Marca", "Modelo", 2020, "ABC1D23",
+                                     gerador.choice(["Novo", "Semi novo", "Usado", "Outro"]),
+                                     gerador.choice(["Pessoal", "Comercial", "Profissional"]),
+                                     escolher(1, 3, 2.0))
+        elif tipo == 1:
+            seguro = SeguroResidencial(f"R{i}", valor, "01/01/2024", "01/01/2025", "Rua B", escolher(80, 120.5),
+                                       300000, gerador.choice(["Alvenaria", "Madeira", "Modular", "Outro"]))
+        else:
+            seguro = SeguroVida(f"V{i}", valor, "01/01/2024", "01/01/2025", ["Ana"],
+                                gerador.choice([["Morte"], ["Morte", "Invalidez"], "Morte, Invalidez"]))
+        seguros.append(seguro)
+    return seguros
+
+
+def _premios_um_a_um(seguros):
+    premios = {}
+    for seguro in seguros:
+        try:
+            premios[seguro.id] = seguro.calcular_premio()
+        except (TypeError, ValueError):
+            pass
+    return premios
+
+
+@pytest.mark.parametrize("invalidos", [False, True])
+@pytest.mark.parametrize("semente", range(5))
+def test_lote_identico_ao_calculo_um_a_um(semente, invalidos):
+    seguros = _seguros(random.Random(semente), 300, invalidos)
+    premios = calcular_premios(seguros)
+    # Mesmos prêmios, bit a bit, e os mesmos seguros recusados por dados inválidos
+    assert premios == _premios_um_a_um(seguros)
+    assert (len(premios) < len(seguros)) == invalidos
+
+
+def test_texto_recusado_como_no_calculo_um_a_um():
+    texto = SeguroVida("1", "1500.50", "01/01/2024", "01/01/2025", ["Ana"], ["Morte"])
+    numero = SeguroVida("2", 1500.5, "01/01/2024", "01/01/2025", ["Ana"], ["Morte"])
+    with pytest.raises(TypeError):
+        texto.calcular_premio()
+    assert calcular_premios([texto, numero]) == {"2": numero.calcular_premio()}
@@ -0,0 +1,131 @@
+import os
+import shutil
+
+import pytest
+
+from repositorio import ArmazenamentoRepositorio, RepositorioDados
+from sistema import SistemaSeguros
+
+DIRETORIO_DADOS = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture
+def repositorio(tmp_path):
+    """Repositório carregado com uma cópia dos arquivos de exemplo da interface"""
+    for arquivo in RepositorioDados.ARQUIVOS.values():
+        shutil.copy(os.path.join(DIRETORIO_DADOS, arquivo), tmp_path / arquivo)
+    repositorio = RepositorioDados(str(tmp_path))
+    repositorio.carregar()
+    return repositorio
+
+
+def _recarregar(repositorio):
+    """Grava os arquivos da interface e monta repositório e sistema novos a partir deles"""
+    for colecao in repositorio.ARQUIVOS:
+        repositorio.gravar(colecao)
+    novo = RepositorioDados(repositorio.diretorio)
+    novo.carregar()
+    return novo, SistemaSeguros(armazenamento=ArmazenamentoRepositorio(novo))
+
+
+def test_registros_da_interface_no_formato_do_sistema(repositorio):
+    sistema = SistemaSeguros(armazenamento=ArmazenamentoRepositorio(repositorio))
+    assert len(sistema.apolices) == len(repositorio.apolices)
+    assert len(sistema.sinistros) == len(repositorio.sinistros)
+    for registro in repositorio.apolices:
+        apolice = sistema.buscar_apolice_por_numero(registro["numero_apolice"])
+        assert apolice.cliente_cpf == registro["cpf_cliente"]
+        assert sistema.buscar_seguro_por_id(apolice.seguro_id).tipo == registro["tipo_seguro"]
+        assert bool(apolice.sinistros_ids) == (repositorio.buscar_sinistro(registro["numero_apolice"]) is not None)
+
+
+def test_sinistro_ida_e_volta(repositorio):
+    sistema = SistemaSeguros(armazenamento=ArmazenamentoRepositorio(repositorio))
+    sinistro = sistema.registrar_sinistro(1, "01/06/2025", "Internação", 5000)
+    assert sinistro is not None
+    assert repositorio.buscar_sinistro(1)["descricao_sinistro"] == "Internação"
+
+    _, recarregado = _recarregar(repositorio)
+    apolice = recarregado.buscar_apolice_por_numero(1)
+    assert apolice.sinistros_ids == ["1"]
+    copia = recarregado.buscar_sinistro_por_id("1")
+    assert (copia.data_ocorrencia, copia.descricao, copia.valor_prejuizo, copia.data_registro) == \
+           (sinistro.data_ocorrencia, sinistro.descricao, sinistro.valor_prejuizo, sinistro.data_registro)
+
+
+def test_segundo_sinistro_da_apolice_recusado(repositorio):
+    sistema = SistemaSeguros(armazenamento=ArmazenamentoRepositorio(repositorio))
+    assert sistema.registrar_sinistro(1, "01/06/2025", "Incêndio", 5000) is not None
+    assert sistema.registrar_sinistro(1, "02/06/2025", "Roubo", 3000) is None
+    assert sistema.registrar_sinistro(3, "02/06/2025", "Roubo", 3000) is None # Já tinha sinistro nos arquivos
+    assert repositorio.buscar_sinistro(1)["descricao_sinistro"] == "Incêndio"
+    assert len(sistema.buscar_apolice_por_numero(1).sinistros_ids) == 1
+
+
+def test_sinistro_diferente_para_a_mesma_apolice_levanta_erro(repositorio):
+    armazenamento = ArmazenamentoRepositorio(repositorio)
+    sistema = SistemaSeguros(armazenamento=armazenamento)
+    anterior = repositorio.buscar_sinistro(3)
+    apolice = sistema.buscar_apolice_por_numero(3).to_dict()
+    apolice["sinistros_ids"].append("outro")
+    armazenamento.salvar_registro("sinistros", {"id": "outro", "data_ocorrencia": "02/06/2025", "descricao": "Roubo",
+                                                "valor_prejuizo": 1.0, "status": "Em Análise"})
+    with pytest.raises(ValueError):
+        armazenamento.salvar_registro("apolices", apolice)
+    assert repositorio.buscar_sinistro(3) is anterior
+
+
+def test_apolices_emitidas_recebem_numeros_da_interface(repositorio):
+    proximo = repositorio.proximo_numero_apolice()
+    sistema = SistemaSeguros(armazenamento=ArmazenamentoRepositorio(repositorio))
+    cliente = sistema.buscar_cliente_por_cpf(repositorio.apolices[0]["cpf_cliente"])
+    with sistema.transacao():
+        # Dentro da transação nada chega ao repositório: os números entregues também não podem se repetir
+        primeira = sistema.emitir_apolice(cliente, sistema.criar_seguro_vida(1000, "01/01/2025", "01/01/2030", ["Ana"], ["Morte"]))
+        segunda = sistema.emitir_apolice(cliente, sistema.criar_seguro_vida(2000, "01/01/2025", "01/01/2030", ["Ana"], ["Morte"]))
+    assert (primeira.numero, segunda.numero) == (proximo, proximo + 1)
+    assert repositorio.proximo_numero_apolice() == proximo + 2
+
+    registro = repositorio.buscar_apolice(proximo)
+    assert (registro["cpf_cliente"], registro["tipo_seguro"], registro["valor_assegurado"]) == (cliente.cpf, "Vida", 1000)
+    _, recarregado = _recarregar(repositorio)
+    seguro = recarregado.buscar_seguro_por_id(str(proximo))
+    assert (seguro.tipo, seguro.valor_cobertura, seguro.data_fim, seguro.tipos_cobertura) == ("Vida", 1000, "01/01/2030", ["Morte"])
+    assert recarregado.buscar_apolice_por_numero(proximo).premio == primeira.premio
+
+
+def test_sistema_acompanha_as_alteracoes_da_interface(repositorio):
+    sistema = SistemaSeguros(armazenamento=ArmazenamentoRepositorio(repositorio))
+    cpf = repositorio.buscar_apolice(1)["cpf_cliente"]
+
+    # Alterações da interface: registros novos salvos no repositório, como em salvar_apolice e gerenciar_sinistro
+    repositorio.salvar("clientes", {**repositorio.buscar_cliente(cpf), "nome": "Nome Alterado"})
+    assert sistema.buscar_cliente_por_cpf(cpf).nome == "Nome Alterado"
+    assert sistema.buscar_apolice_por_numero(1).cliente is sistema.buscar_cliente_por_cpf(cpf)
+
+    repositorio.salvar("apolices", {**repositorio.buscar_apolice(1), "valor_assegurado": 2000000.0, "data_fim_apolice": "23/05/2026"})
+    apolice = sistema.buscar_apolice_por_numero(1)
+    assert apolice.seguro is sistema.buscar_seguro_por_id("1")
+    assert apolice.seguro.valor_cobertura == 2000000.0
+    assert apolice in sistema.buscar_apolices_vigentes_em("01/01/2026")
+    assert apolice not in sistema.buscar_apolices_vigentes_em("01/01/2027")
+
+    numero = repositorio.proximo_numero_apolice()
+    repositorio.salvar("apolices", {**repositorio.buscar_apolice(1), "numero_apolice": numero})
+    repositorio.salvar("sinistros", {"numero_apolice": str(numero), "data_sinistro": "01/06/2025",
+                                     "descricao_sinistro": "Internação", "status_sinistro": "Em Análise",
+                                     "valor_prejuizo": 5000.0})
+    assert sistema.buscar_apolice_por_numero(numero).sinistros_ids == [str(numero)]
+    assert sistema.buscar_sinistros_da_apolice(numero)[0].descricao == "Internação"
+    assert [a.numero for a in sistema.buscar_apolices_por_cliente(cpf)] == [1, numero]
+
+    # As gravações do próprio sistema não voltam para ele: os objetos continuam os mesmos
+    sinistro = sistema.registrar_sinistro(2, "02/06/2025", "Roubo", 3000)
+    assert sistema.buscar_sinistro_por_id(sinistro.id) is sinistro
+    assert repositorio.buscar_sinistro(2)["descricao_sinistro"] == "Roubo"
+
+
+def test_adaptador_so_observa_o_repositorio_quando_observado(repositorio):
+    observadores = len(repositorio._observadores)
+    ArmazenamentoRepositorio(repositorio).carregar("apolices") # Só conversão, como nas exportações
+    assert len(repositorio._observadores) == observadores
@@ -0,0 +1,177 @@
+import builtins
+import json
+import os
+import random
+import shutil
+
+import pytest
+
+import leitura_json
+import repositorio as modulo_repositorio
+from armazenamento import ArmazenamentoJSON
+from auxiliares import cadastrar_apolice, cpf_valido
+from repositorio import RepositorioDados
+from snapshot import arquivo_inalterado, gravar_snapshot, impressao_arquivo, ler_snapshot
+
+TEXTOS = ["", "a", "Ação", "São Paulo", "😀", "linha\nnova", "x" * 300]
+
+
+def _valor(gerador):
+    tipo = gerador.randrange(8)
+    if tipo == 0:
+        return gerador.choice(TEXTOS)
+    if tipo == 1:
+        return gerador.randint(-10 ** 6, 10 ** 6)
+    if tipo == 2:
+        return gerador.uniform(-1e9, 1e9)
+    if tipo == 3:
+        return None
+    if tipo == 4:
+        return [gerador.choice(TEXTOS) for _ in range(gerador.randrange(4))]
+    if tipo == 5:
+        return 2 ** 70 # Inteiro que não cabe em um double
+    if tipo == 6:
+        return {"aninhado": [1, "dois", None]}
+    return gerador.choice([True, False])
+
+
+def _colecoes(gerador):
+    campos = [f"campo{i}" for i in range(6)]
+    colecoes = {}
+    for nome in ("clientes", "seguros", "apolices", "sinistros"):
+        registros = []
+        for _ in range(gerador.randrange(0, 50)):
+            # Campos ausentes em parte dos registros, como os seguros de tipos diferentes
+            registros.append({campo: _valor(gerador) for campo in campos if gerador.random() < 0.8})
+        # Colunas de um só tipo, que usam as codificações compactas (texto, número, lista)
+        for i, registro in enumerate(registros):
+            registro.update({"id": f"id{i}", "valor": float(i) / 3, "inteiro": i, "lista": ["a", str(i)]})
+        colecoes[nome] = registros
+    return colecoes
+
+
+@pytest.mark.parametrize("semente", range(20))
+def test_ida_e_volta(tmp_path, semente):
+    colecoes = _colecoes(random.Random(semente))
+    caminho = str(tmp_path / "dados.snapshot")
+    arquivos = {"clientes": [10, 20, 30], "apolices": None}
+    gravar_snapshot(caminho, colecoes, arquivos)
+    lidas, arquivos_lidos = ler_snapshot(caminho)
+    assert arquivos_lidos == arquivos
+    lidas = {nome: list(registros) for nome, registros in lidas.items()}
+    assert lidas == colecoes
+    # Mesmos tipos (int continua int, bool continua bool)
+    assert json.dumps(lidas, sort_keys=True) == json.dumps(colecoes, sort_keys=True)
+
+
+def test_snapshot_corrompido_recusado(tmp_path):
+    caminho = str(tmp_path / "dados.snapshot")
+    gravar_snapshot(caminho, _colecoes(random.Random(1)))
+    with open(caminho, "r+b") as f:
+        f.seek(-3, os.SEEK_END)
+        byte = f.read(1)
+        f.seek(-3, os.SEEK_END)
+        f.write(bytes([byte[0] ^ 0xFF]))
+    with pytest.raises(ValueError):
+        ler_snapshot(caminho)
+
+
+def test_sistema_carrega_do_snapshot(criar_sistema, monkeypatch):
+    sistema = criar_sistema()
+    apolice = cadastrar_apolice(sistema, 20) # Cada gravação completa dos arquivos regrava o snapshot
+    assert os.path.exists(sistema.arquivo_snapshot)
+
+    def nao_ler(*args, **kwargs):
+        raise AssertionError("os arquivos JSON não deveriam ser lidos")
+    monkeypatch.setattr(ArmazenamentoJSON, "iterar", nao_ler)
+    recarregado = criar_sistema()
+    assert recarregado.buscar_apolice_por_numero(apolice.numero).to_dict() == apolice.to_dict()
+
+
+def test_alteracao_com_mesmo_tamanho_e_data_invalida_snapshot(criar_sistema):
+    sistema = criar_sistema()
+    apolice = cadastrar_apolice(sistema, 21)
+    sistema.checkpoint()
+    caminho = sistema.armazenamento.caminho("apolices")
+    estado = os.stat(caminho)
+    with open(caminho, "r", encoding="utf-8") as f:
+        texto = f.read()
+    # Edição externa que mantém o tamanho do arquivo e a data de modificação
+    alterado = texto.replace('"Ativa"', '"Ativo"')
+    assert alterado != texto and len(alterado) == len(texto)
+    with open(caminho, "w", encoding="utf-8") as f:
+        f.write(alterado)
+    os.utime(caminho, ns=(estado.st_atime_ns, estado.st_mtime_ns))
+
+    recarregado = criar_sistema()
+    assert recarregado.buscar_apolice_por_numero(apolice.numero).status == "Ativo"
+
+
+def test_colecoes_alteradas_no_journal_lidas_dos_arquivos(criar_sistema, monkeypatch):
+    sistema = criar_sistema(modo_journal=True)
+    apolice = cadastrar_apolice(sistema, 22)
+    sistema.checkpoint()
+    sistema.cadastrar_cliente("Cliente Novo", cpf_valido(23), "01/01/1990", "Rua B, 2", "11999990000", "novo@exemplo.com")
+    sistema.gravar_snapshot() # Clientes com alteração só no journal: fora do snapshot
+
+    lidas = []
+    iterar = ArmazenamentoJSON.iterar
+    def iterar_registrando(armazenamento, colecao, *args, **kwargs):
+        lidas.append(colecao)
+        return iterar(armazenamento, colecao, *args, **kwargs)
+    monkeypatch.setattr(ArmazenamentoJSON, "iterar", iterar_registrando)
+    recarregado = criar_sistema(modo_journal=True)
+    assert lidas == ["clientes"]
+    assert recarregado.buscar_cliente_por_cpf(cpf_valido(23)).nome == "Cliente Novo"
+    assert recarregado.buscar_apolice_por_numero(apolice.numero).to_dict() == apolice.to_dict()
+
+
+def test_impressao_conferida_sem_ler_o_arquivo(tmp_path, monkeypatch):
+    caminho = str(tmp_path / "clientes.json")
+    with open(caminho, "w", encoding="utf-8") as f:
+        f.write("[]")
+    impressao = impressao_arquivo(caminho)
+
+    def nao_abrir(*args, **kwargs):
+        raise AssertionError("o conteúdo do arquivo não deveria ser lido")
+    monkeypatch.setattr(builtins, "open", nao_abrir)
+    assert arquivo_inalterado(caminho, impressao)
+    monkeypatch.undo()
+    os.replace(caminho, caminho + ".antigo") # Mesmo conteúdo, outro arquivo
+    shutil.copy2(caminho + ".antigo", caminho)
+    assert not arquivo_inalterado(caminho, impressao)
+
+
+def test_repositorio_carrega_do_snapshot(tmp_path, monkeypatch):
+    repositorio = RepositorioDados(str(tmp_path))
+    repositorio.carregar()
+    repositorio.salvar("clientes", {"cpf": "1", "nome": "Ana"})
+    repositorio.salvar("apolices", {"numero_apolice": 1, "cpf_cliente": "1", "valor_assegurado": 1000.0,
+                                    "dados_especificos": {"placa": "ABC1234", "coberturas": [True, None]}})
+    for colecao in repositorio.ARQUIVOS:
+        repositorio.gravar(colecao)
+    repositorio.salvar("clientes", {"cpf": "2", "nome": "Bruno"}) # Ainda não gravado: fica fora do snapshot
+
+    def nao_ler(*args, **kwargs):
+        raise AssertionError("os arquivos JSON não deveriam ser lidos")
+    monkeypatch.setattr(modulo_repositorio, "iterar_lista_json", nao_ler)
+    recarregado = RepositorioDados(str(tmp_path))
+    recarregado.carregar()
+    assert recarregado.clientes == [{"cpf": "1", "nome": "Ana"}]
+    assert recarregado.apolices == repositorio.apolices
+    assert recarregado.proximo_numero_apolice() == 2
+    monkeypatch.undo()
+
+    # Arquivo editado fora da interface: somente ele é relido
+    with open(repositorio.caminho("clientes"), "w", encoding="utf-8") as f:
+        json.dump([{"cpf": "3", "nome": "Carla"}], f)
+    lidos = []
+    def iterar_registrando(caminho):
+        lidos.append(os.path.basename(caminho))
+        return leitura_json.iterar_lista_json(caminho)
+    monkeypatch.setattr(modulo_repositorio, "iterar_lista_json", iterar_registrando)
+    recarregado = RepositorioDados(str(tmp_path))
+    recarregado.carregar()
+    assert lidos == ["clientes.json"]
+    assert recarregado.clientes == [{"cpf": "3", "nome": "Carla"}]
+    assert recarregado.apolices == repositorio.apolices
@@ -0,0 +1,121 @@
+import json
+import os
+
+import pytest
+
+from armazenamento import ArmazenamentoJSON, ArmazenamentoSQLite
+from auxiliares import cadastrar_apolice, cpf_valido
+
+
+def _conteudo_arquivos(diretorio):
+    conteudo = {}
+    for nome in sorted(os.listdir(diretorio)):
+        if nome.endswith(".json"):
+            with open(os.path.join(diretorio, nome), "rb") as f:
+                conteudo[nome] = f.read()
+    return conteudo
+
+
+def test_transacao_grava_tudo_de_uma_vez(criar_sistema, monkeypatch):
+    sistema = criar_sistema()
+    lotes = []
+    salvar_lote = sistema.armazenamento.salvar_lote
+    monkeypatch.setattr(sistema.armazenamento, "salvar_lote", lambda lote: lotes.append(list(lote)) or salvar_lote(lote))
+    colecoes = []
+    monkeypatch.setattr(sistema.armazenamento, "salvar_colecao", lambda colecao, registros: colecoes.append(colecao))
+    with sistema.transacao():
+        apolice = cadastrar_apolice(sistema, 30)
+        sistema.registrar_sinistro(apolice, "10/05/2025", "Internação", 5000)
+    assert lotes == [["clientes", "seguros", "apolices", "sinistros"]]
+    assert colecoes == [] # Nenhuma gravação fora do lote
+
+    recarregado = criar_sistema()
+    assert recarregado.buscar_apolice_por_numero(apolice.numero).to_dict() == apolice.to_dict()
+
+
+@pytest.mark.parametrize("modo_journal", [False, True])
+def test_excecao_desfaz_a_transacao(criar_sistema, tmp_path, modo_journal):
+    sistema = criar_sistema(modo_journal=modo_journal)
+    anterior = cadastrar_apolice(sistema, 31)
+    sistema.checkpoint()
+    arquivos = _conteudo_arquivos(tmp_path)
+
+    with pytest.raises(RuntimeError):
+        with sistema.transacao():
+            cadastrar_apolice(sistema, 32)
+            sistema.registrar_sinistro(anterior, "10/05/2025", "Internação", 5000)
+            raise RuntimeError("falha no meio da transação")
+
+    assert _conteudo_arquivos(tmp_path) == arquivos
+    assert [a.numero for a in sistema.apolices] == [anterior.numero]
+    assert sistema.buscar_cliente_por_cpf(cpf_valido(32)) is None
+    assert sistema.buscar_apolice_por_numero(anterior.numero).sinistros_ids == []
+    assert sistema.sinistros == []
+    if modo_journal:
+        assert sistema.journal.total_registros == 0
+
+
+def test_integridade_violada_desfaz_a_transacao(criar_sistema, tmp_path):
+    sistema = criar_sistema()
+    cadastrar_apolice(sistema, 33)
+    arquivos = _conteudo_arquivos(tmp_path)
+    with pytest.raises(ValueError, match="Integridade"):
+        with sistema.transacao():
+            apolice = cadastrar_apolice(sistema, 34)
+            apolice.adicionar_sinistro_id("inexistente")
+    assert _conteudo_arquivos(tmp_path) == arquivos
+    assert sistema.buscar_cliente_por_cpf(cpf_valido(34)) is None
+
+
+def test_falha_na_gravacao_desfaz_a_transacao(criar_sistema, tmp_path, monkeypatch):
+    sistema = criar_sistema(armazenamento=ArmazenamentoSQLite(str(tmp_path / "seguros.db")))
+    cadastrar_apolice(sistema, 35)
+
+    def falhar(lote):
+        raise OSError("disco cheio")
+    monkeypatch.setattr(sistema.armazenamento, "salvar_lote", falhar)
+    with pytest.raises(OSError):
+        with sistema.transacao():
+            cadastrar_apolice(sistema, 36)
+    assert len(sistema.apolices) == 1
+    assert sistema.buscar_cliente_por_cpf(cpf_valido(36)) is None
+    sistema.armazenamento.fechar()
+
+
+def test_lote_interrompido_concluido_ou_descartado(tmp_path):
+    armazenamento = ArmazenamentoJSON(str(tmp_path))
+    armazenamento.salvar_lote({"clientes": [{"cpf": "1"}], "apolices": [{"numero": "AP-0001"}]})
+
+    # Queda depois do manifesto: um arquivo já movido, o outro ainda temporário
+    with open(armazenamento.caminho("apolices") + ".lote", "w", encoding="utf-8") as f:
+        json.dump([{"numero": "AP-0002"}], f)
+    with open(armazenamento.caminho("clientes") + ".lote", "w", encoding="utf-8") as f:
+        json.dump([{"cpf": "2"}], f)
+    os.replace(armazenamento.caminho("clientes") + ".lote", armazenamento.caminho("clientes"))
+    with open(os.path.join(str(tmp_path), ArmazenamentoJSON.ARQUIVO_LOTE), "w", encoding="utf-8") as f:
+        json.dump(["clientes", "apolices"], f)
+    armazenamento = ArmazenamentoJSON(str(tmp_path))
+    assert armazenamento.carregar("clientes") == [{"cpf": "2"}]
+    assert armazenamento.carregar("apolices") == [{"numero": "AP-0002"}]
+
+    # Queda antes do manifesto: os temporários são descartados e os arquivos ficam como estavam
+    with open(armazenamento.caminho("apolices") + ".lote", "w", encoding="utf-8") as f:
+        json.dump([{"numero": "AP-0003"}], f)
+    armazenamento = ArmazenamentoJSON(str(tmp_path))
+    assert armazenamento.carregar("apolices") == [{"numero": "AP-0002"}]
+    assert not os.path.exists(armazenamento.caminho("apolices") + ".lote")
+
+
+def test_transacao_atualiza_o_snapshot(criar_sistema, monkeypatch):
+    sistema = criar_sistema(modo_journal=True)
+    cadastrar_apolice(sistema, 37)
+    sistema.checkpoint()
+    with sistema.transacao():
+        apolice = cadastrar_apolice(sistema, 38)
+    assert sistema.journal.total_registros == 0
+
+    def nao_ler(*args, **kwargs):
+        raise AssertionError("o snapshot deveria estar atualizado")
+    monkeypatch.setattr(ArmazenamentoJSON, "iterar", nao_ler)
+    recarregado = criar_sistema(modo_journal=True)
+    assert recarregado.buscar_apolice_por_numero(apolice.numero).to_dict() == apolice.to_dict()
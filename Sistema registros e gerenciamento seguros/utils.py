@@ -1 +1,31 @@
-# Funções auxiliares (validação, formatação, etc.) 
\ No newline at end of file
+# Funções auxiliares (validação, formatação, etc.)
+import sys
+from datetime import date
+from functools import lru_cache
+
+def internar(valor):
+    """Interna textos repetidos (tipos, status, datas) para que todos os registros compartilhem
+       o mesmo objeto str. Valores que não são texto são retornados sem alteração."""
+    if type(valor) is str:
+        return sys.intern(valor)
+    return valor
+
+@lru_cache(maxsize=65536)
+def converter_data(texto):
+    """Converte 'dd/mm/aaaa' em date (mesmas regras de strptime com "%d/%m/%Y"), ou None se inválida.
+
+    O resultado fica em cache: as datas se repetem muito entre os registros e cada uma é convertida
+    uma única vez; registros com a mesma data compartilham o mesmo objeto date."""
+    if type(texto) is not str:
+        return None
+    partes = texto.split("/")
+    if len(partes) != 3:
+        return None
+    dia, mes, ano = partes
+    if not (0 < len(dia) <= 2 and 0 < len(mes) <= 2 and len(ano) == 4
+            and dia.isdigit() and mes.isdigit() and ano.isdigit() and dia.isascii() and mes.isascii() and ano.isascii()):
+        return None
+    try:
+        return date(int(ano), int(mes), int(dia))
+    except ValueError:
+        return None